@@ -0,0 +1,117 @@
+"""
+Benchmark: fixed daily scraping vs adaptive scrape planning.
+
+Simulates a season of rankings lists whose changes follow a Poisson
+process: a few volatile lists (competition season) change several times
+a week, most change now and then, and some barely move. The fixed
+schedule scrapes every list once a day; the adaptive schedule runs
+several times a day and spends the same daily budget of list scrapes
+on the lists most likely to have changed, learning each list's change
+rate from what its previous scrapes found. The benchmark reports the
+scrapes made, the mean delay between a change and the scrape that sees
+it, and the share of time lists were stale.
+
+Usage:
+    python benchmarks/bench_adaptive_schedule.py [--lists 60] [--days 120] [--runs 4]
+"""
+
+import argparse
+import math
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings  # noqa: E402
+from src.core.services import freshness_from_history, plan_scrapes  # noqa: E402
+
+START = datetime(2026, 3, 1, 2, 0)
+
+
+def simulate_changes(n_lists: int, n_days: int, seed: int = 42) -> list[list[datetime]]:
+    """Draw the change times of each list over the season."""
+    rng = random.Random(seed)
+    changes = []
+    for i in range(n_lists):
+        # 15% volatile, 55% occasional, 30% nearly static (changes per day)
+        rate = 1.5 if i < n_lists * 0.15 else 0.2 if i < n_lists * 0.7 else 0.02
+        times, t = [], 0.0
+        while True:
+            t += rng.expovariate(rate)
+            if t >= n_days:
+                break
+            times.append(START + timedelta(days=t))
+        changes.append(times)
+    return changes
+
+
+def run_schedule(changes: list[list[datetime]], n_days: int, runs: int, adaptive: bool) -> dict:
+    """Replay a schedule over the season and measure the freshness of the lists."""
+    n_lists = len(changes)
+    history: dict[int, list[tuple[datetime, bool]]] = {i: [] for i in range(n_lists)}
+    seen = [0] * n_lists  # Changes already seen by a scrape
+    delays = []
+    scrapes = 0
+    step = timedelta(hours=24 / runs)
+    budget = math.ceil(n_lists / runs)
+    now = START
+    while now < START + timedelta(days=n_days):
+        if adaptive:
+            freshness = freshness_from_history(
+                history, list(range(n_lists)), now, settings.scheduler_change_half_life_days
+            )
+            due = [
+                f.key
+                for f in plan_scrapes(
+                    freshness,
+                    now,
+                    budget,
+                    settings.scheduler_max_interval_days,
+                    settings.scheduler_min_change_probability,
+                )
+            ]
+        else:
+            due = range(n_lists)
+        for i in due:
+            new = [t for t in changes[i][seen[i] :] if t <= now]
+            delays.extend((now - t).total_seconds() / 3600 for t in new)
+            seen[i] += len(new)
+            history[i].append((now, bool(new)))
+            scrapes += 1
+        now += step
+
+    # Stale time: from each change to the scrape that saw it, per list-hour
+    stale_share = sum(delays) / (n_lists * n_days * 24)
+    return {
+        "scrapes": scrapes,
+        "delay": sum(delays) / len(delays) if delays else 0.0,
+        "stale": stale_share,
+    }
+
+
+def main(n_lists: int, n_days: int, runs: int) -> None:
+    changes = simulate_changes(n_lists, n_days)
+    fixed = run_schedule(changes, n_days, 1, adaptive=False)
+    adaptive = run_schedule(changes, n_days, runs, adaptive=True)
+
+    print(
+        f"{n_lists} lists over {n_days} days, {sum(map(len, changes))} changes; "
+        f"adaptive: {runs} runs/day, {math.ceil(n_lists / runs)} lists per run"
+    )
+    print(f"{'schedule':<9} {'scrapes':>8} {'mean delay':>11} {'stale':>7}")
+    for name, r in (("daily", fixed), ("adaptive", adaptive)):
+        print(f"{name:<9} {r['scrapes']:>8} {r['delay']:>9.1f}h {r['stale']:>7.1%}")
+    print(f"delay reduction {fixed['delay'] / adaptive['delay']:.1f}x for the same budget")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lists", type=int, default=60)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--runs", type=int, default=4)
+    args = parser.parse_args()
+    main(args.lists, args.days, args.runs)
@@ -0,0 +1,131 @@
+"""
+Benchmark: per-row alert checks vs the preloaded AlertEngine.
+
+Seeds an in-memory SQLite database with users and favorites, then
+evaluates a list where every athlete moved by a few places, with:
+
+- per-row: the previous ``_check_alerts`` (users listed for every row,
+  one favorite query per user and changed row);
+- engine: ``AlertEngine.load`` once, then in-memory evaluation.
+
+Reports SQL statements and wall time. The per-row path is run on the
+first ``--legacy-rows`` rows and extrapolated, since it grows as
+rows x users queries.
+
+Usage:
+    python benchmarks/bench_alert_engine.py [--rows 1000] [--users 500] [--favorites 5000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.services import AlertEngine  # noqa: E402
+from src.infrastructure.database.models import (  # noqa: E402
+    Athlete,
+    Base,
+    Epreuve,
+    Favorite,
+    User,
+)
+from src.infrastructure.database.repositories import (  # noqa: E402
+    SQLAlchemyFavoriteRepository,
+    SQLAlchemyUserRepository,
+)
+from tests.fixtures.legacy_alerts import legacy_check_alerts  # noqa: E402
+
+EPREUVE_CODE = 670
+
+
+def seed(session, n_rows: int, n_users: int, n_favorites: int) -> list[tuple]:
+    """Create users, athletes and favorites; return (id, name, old, new) changes."""
+    rng = random.Random(42)
+    now = datetime.now()
+    session.add(Epreuve(nom="Javelot", code=EPREUVE_CODE, actif=True))
+    session.add_all(
+        User(email=f"user{i}@test.com", password_hash="x", actif=i % 10 != 0)
+        for i in range(n_users)
+    )
+    session.add_all(
+        Athlete(athlete_id=f"athlete_{i}", name=f"Athlete {i}", first_seen_date=now)
+        for i in range(n_rows)
+    )
+    session.flush()
+    user_ids = [user.id for user in session.query(User)]
+    pairs = set()
+    while len(pairs) < n_favorites:
+        pairs.add((rng.choice(user_ids), f"athlete_{rng.randrange(n_rows)}"))
+    session.add_all(
+        Favorite(user_id=u, athlete_id=a, epreuve_code=EPREUVE_CODE, added_date=now)
+        for u, a in pairs
+    )
+    session.commit()
+
+    changes = []
+    for i in range(n_rows):
+        new_rank = i + 1
+        old_rank = max(1, new_rank + rng.randint(-3, 3)) if rng.random() > 0.05 else None
+        changes.append((f"athlete_{i}", f"Athlete {i}", old_rank, new_rank))
+    return changes
+
+
+def main(n_rows: int, n_users: int, n_favorites: int, legacy_rows: int) -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    changes = seed(session, n_rows, n_users, n_favorites)
+    user_repo = SQLAlchemyUserRepository(session)
+    favorite_repo = SQLAlchemyFavoriteRepository(session)
+
+    statements = [0]
+
+    def count_statement(*args) -> None:
+        statements[0] += 1
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    legacy_sample = changes[:legacy_rows]
+    start = time.perf_counter()
+    for change in legacy_sample:
+        legacy_check_alerts(user_repo, favorite_repo, *change, EPREUVE_CODE, "M")
+    legacy_time, legacy_queries = time.perf_counter() - start, statements[0]
+    scale = len(changes) / len(legacy_sample)
+
+    statements[0] = 0
+    start = time.perf_counter()
+    alert_engine = AlertEngine.load(user_repo, favorite_repo, EPREUVE_CODE)
+    alerts = sum(
+        len(alert["user_ids"])
+        for change in changes
+        for alert in alert_engine.evaluate(*change, EPREUVE_CODE, "M")
+    )
+    engine_time, engine_queries = time.perf_counter() - start, statements[0]
+
+    print(f"{n_rows} rows, {n_users} users, {n_favorites} favorites -> {alerts} alerts")
+    print(f"{'path':<10} {'queries':>10} {'wall':>10}")
+    print(
+        f"{'per-row':<10} {legacy_queries * scale:>10.0f} {legacy_time * scale:>9.2f}s"
+        f"  (measured on {len(legacy_sample)} rows, extrapolated)"
+    )
+    print(f"{'engine':<10} {engine_queries:>10} {engine_time:>9.3f}s")
+    print(f"speedup {legacy_time * scale / engine_time:.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--favorites", type=int, default=5000)
+    parser.add_argument("--legacy-rows", type=int, default=100)
+    args = parser.parse_args()
+    main(args.rows, args.users, args.favorites, args.legacy_rows)
@@ -0,0 +1,144 @@
+"""
+Benchmark: per-user alert rows vs alert events with per-user deliveries.
+
+Stores the alerts of one nightly run (``--events`` threshold crossings
+sent to ``--users`` users) in two SQLite files:
+
+- per-user: the previous ``alerts`` table, one full row (title and
+  message included) per user and crossing;
+- events: ``SQLAlchemyAlertRepository.create_bulk``, one ``alert_events``
+  row per crossing and one ``alert_deliveries`` row per user, keyed by
+  (user_id, event_id) with only the read state besides.
+
+Reports rows written, database size and insert time.
+
+Usage:
+    python benchmarks/bench_alert_storage.py [--events 200] [--users 500]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.models import Base  # noqa: E402
+from src.infrastructure.database.repositories import SQLAlchemyAlertRepository  # noqa: E402
+
+LEGACY_ALERTS_TABLE = """
+CREATE TABLE alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    alert_type VARCHAR(50) NOT NULL,
+    athlete_id VARCHAR(100) NOT NULL,
+    epreuve_code INTEGER NOT NULL,
+    sexe VARCHAR(1) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    old_rank INTEGER,
+    new_rank INTEGER NOT NULL,
+    is_read BOOLEAN NOT NULL DEFAULT 0
+)
+"""
+LEGACY_INDEXES = (
+    "CREATE INDEX ix_alerts_user_id ON alerts (user_id)",
+    "CREATE INDEX ix_alerts_created_at ON alerts (created_at)",
+    "CREATE INDEX ix_alerts_athlete_id ON alerts (athlete_id)",
+    "CREATE INDEX ix_alerts_epreuve_code ON alerts (epreuve_code)",
+    "CREATE INDEX ix_alerts_is_read ON alerts (is_read)",
+    "CREATE INDEX idx_alert_user_read ON alerts (user_id, is_read)",
+)
+
+
+def build_alerts(n_events: int, n_users: int) -> list[dict]:
+    """Alert data as produced by the alert engine."""
+    user_ids = list(range(1, n_users + 1))
+    return [
+        {
+            "alert_type": "important",
+            "athlete_id": f"athlete_{i}",
+            "epreuve_code": 670,
+            "sexe": "M",
+            "title": f"⭐ Top 10 : Athlete {i}",
+            "message": f"Athlete {i} entre dans le Top 10 (rang {i % 10 + 1})",
+            "old_rank": 12,
+            "new_rank": i % 10 + 1,
+            "user_ids": user_ids,
+        }
+        for i in range(n_events)
+    ]
+
+
+def store_per_user(path: Path, alerts: list[dict]) -> int:
+    """Previous layout: one full alert row per user."""
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_ALERTS_TABLE))
+        for index in LEGACY_INDEXES:
+            conn.execute(text(index))
+    rows = [
+        {"user_id": user_id, **{k: v for k, v in alert.items() if k != "user_ids"}}
+        for alert in alerts
+        for user_id in alert["user_ids"]
+    ]
+    if rows:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO alerts (user_id, alert_type, athlete_id, epreuve_code, sexe, "
+                    "title, message, old_rank, new_rank) VALUES (:user_id, :alert_type, "
+                    ":athlete_id, :epreuve_code, :sexe, :title, :message, :old_rank, :new_rank)"
+                ),
+                rows,
+            )
+    engine.dispose()
+    return len(rows)
+
+
+def store_events(path: Path, alerts: list[dict]) -> int:
+    """Current layout: alert events and per-user deliveries."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    deliveries = SQLAlchemyAlertRepository(session).create_bulk(alerts)
+    session.close()
+    engine.dispose()
+    return len(alerts) + deliveries
+
+
+def main(n_events: int, n_users: int) -> None:
+    alerts = build_alerts(n_events, n_users)
+
+    print(f"{n_events} events x {n_users} users")
+    print(f"{'layout':<10} {'rows':>10} {'alert tables':>14} {'insert':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        sizes = {}
+        for name, store in (("per-user", store_per_user), ("events", store_events)):
+            path = Path(tmp) / f"{name}.db"
+            empty = Path(tmp) / f"{name}-empty.db"
+            store(empty, [])
+            start = time.perf_counter()
+            rows = store(path, alerts)
+            elapsed = time.perf_counter() - start
+            sizes[name] = path.stat().st_size - empty.stat().st_size
+            print(
+                f"{name:<10} {rows:>10} {sizes[name] / (1024 * 1024):>12.2f}MB " f"{elapsed:>9.2f}s"
+            )
+
+    print(f"alert storage reduced {sizes['per-user'] / sizes['events']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--users", type=int, default=500)
+    args = parser.parse_args()
+    main(args.events, args.users)
@@ -0,0 +1,134 @@
+"""
+Benchmark: event loop stalls of sync vs async database writes.
+
+Stores N ranking rows in a file-backed SQLite database from a coroutine,
+once with the sync repository (the database I/O runs on the event loop)
+and once with the async repository (the I/O runs on the aiosqlite
+driver), and reports the wall time and the longest event loop stall
+seen by a watchdog task. With the async repository the SQLite work runs
+in the driver thread and other scrapes keep downloading meanwhile; the
+remaining stall is the statement and parameter building, which still
+runs on the loop inside ``run_sync``.
+
+Usage:
+    python benchmarks/bench_async_db.py [--rows 20000] [--snapshots 3]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.entities import RankingRow  # noqa: E402
+from src.infrastructure.database.async_repositories import (  # noqa: E402
+    AsyncSQLAlchemyRankingRepository,
+)
+from src.infrastructure.database.models import Base, Epreuve  # noqa: E402
+from src.infrastructure.database.repositories import SQLAlchemyRankingRepository  # noqa: E402
+
+EPREUVE_CODE = 670
+
+
+def build_rows(n_rows: int) -> list[RankingRow]:
+    """Build one snapshot of ranking rows."""
+    return [
+        RankingRow(
+            rank=i + 1,
+            athlete_id=f"athlete_{i}",
+            name=f"Athlete {i}",
+            performance=f"{70 - i / 1000:.2f}",
+            performance_numeric=70 - i / 1000,
+            club="Club",
+            ligue="IDF",
+            departement="75",
+            date=datetime(2026, 5, 1),
+            lieu="Paris",
+        )
+        for i in range(n_rows)
+    ]
+
+
+async def watch(write) -> tuple[float, float]:
+    """Return (wall seconds, longest loop stall seconds) of one awaited write."""
+    longest_stall = 0.0
+    running = True
+
+    async def watchdog() -> None:
+        nonlocal longest_stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            longest_stall = max(longest_stall, now - last - 0.005)
+            last = now
+
+    watchdog_task = asyncio.create_task(watchdog())
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await write()
+    elapsed = time.perf_counter() - start
+    running = False
+    await watchdog_task
+    return elapsed, longest_stall
+
+
+async def main(n_rows: int, n_snapshots: int) -> None:
+    rows = build_rows(n_rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add(Epreuve(nom="Javelot", code=EPREUVE_CODE, actif=True))
+        session.commit()
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async_session = async_sessionmaker(async_engine, expire_on_commit=False)()
+        sync_repo = SQLAlchemyRankingRepository(session)
+        async_repo = AsyncSQLAlchemyRankingRepository(async_session)
+
+        results = {"sync": [], "async": []}
+        base_date = datetime(2026, 1, 1)
+        for i in range(n_snapshots):
+            sync_date = base_date + timedelta(days=2 * i)
+            async_date = sync_date + timedelta(days=1)
+
+            async def sync_write(date=sync_date) -> None:
+                sync_repo.create_from_rows(rows, date, EPREUVE_CODE, "M")
+
+            async def async_write(date=async_date) -> None:
+                await async_repo.create_from_rows(rows, date, EPREUVE_CODE, "M")
+
+            results["sync"].append(await watch(sync_write))
+            results["async"].append(await watch(async_write))
+
+        await async_session.close()
+        await async_engine.dispose()
+        session.close()
+        engine.dispose()
+
+    print(f"{n_rows} rows x {n_snapshots} snapshots")
+    print(f"{'repository':<12} {'wall':>10} {'max stall':>12}")
+    for name, samples in results.items():
+        wall = min(elapsed for elapsed, _ in samples)
+        stall = min(stall for _, stall in samples)
+        print(f"{name:<12} {wall * 1000:>8.1f}ms {stall * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--snapshots", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.snapshots))
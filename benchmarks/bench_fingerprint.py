@@ -0,0 +1,74 @@
+"""
+Benchmark: cost of the unchanged-list fingerprint against a full parse.
+
+An unchanged list is detected by fingerprinting its results table and
+comparing it with the last successful scrape; only changed lists are
+parsed. For every page of ``tests/fixtures/athle_pages``, reports the
+best time of ``compute_fingerprint`` and of the table parser backends,
+and how many times cheaper the unchanged path is than the cheapest parse.
+
+Usage:
+    python benchmarks/bench_fingerprint.py [--repeat 5] [--backends lxml lxml-stream]
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.scraper import (  # noqa: E402
+    PARSER_BACKENDS,
+    AthleScraper,
+    compute_fingerprint,
+    get_table_parser,
+)
+from src.utils import logger  # noqa: E402
+from tests.fixtures.pages import list_corpus_pages, load_corpus_page  # noqa: E402
+
+
+def best_time(run: Callable[[], object], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(backends: list[str], repeat: int) -> None:
+    logger.setLevel("ERROR")
+    scrapers = {name: AthleScraper(parser=get_table_parser(name)) for name in backends}
+
+    header = "".join(f" {name:>12}" for name in backends)
+    print(f"{'page':<28} {'fingerprint':>12}{header} {'speedup':>8}")
+    for page in list_corpus_pages():
+        html = load_corpus_page(page)
+        fingerprint = best_time(lambda html=html: compute_fingerprint(html), repeat)
+        parses = [
+            best_time(lambda s=scraper, h=html: s.parse_page(h), repeat)
+            for scraper in scrapers.values()
+        ]
+        columns = "".join(f" {seconds * 1000:>10.1f}ms" for seconds in parses)
+        print(
+            f"{page:<28} {fingerprint * 1000:>10.1f}ms{columns} "
+            f"{min(parses) / fingerprint:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (best kept)")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=[name for name in PARSER_BACKENDS if name != "bs4"],
+        choices=list(PARSER_BACKENDS),
+    )
+    args = parser.parse_args()
+    main(args.backends, args.repeat)
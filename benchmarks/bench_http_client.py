@@ -0,0 +1,113 @@
+"""
+Benchmark: fresh AsyncClient per request vs the scraper's pooled client.
+
+Starts a local stand-in for www.athle.fr (HTTP/1.1 with keep-alive) and
+measures the per-request latency of both strategies.
+
+Usage:
+    python benchmarks/bench_http_client.py [--requests 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.scraper import AthleScraper  # noqa: E402
+
+PAGE = b"<html><body><table id='ctnBilans'></table></body></html>"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal handler serving a static bilans page with keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def start_server() -> tuple[ThreadingHTTPServer, str]:
+    """Start the stand-in server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}/bases/liste.aspx"
+
+
+async def bench_fresh_client(url: str, n: int) -> list[float]:
+    """Previous behaviour: one AsyncClient per request."""
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def bench_pooled_client(url: str, n: int) -> list[float]:
+    """Current behaviour: the scraper's long-lived pooled client."""
+    latencies = []
+    async with AthleScraper() as scraper:
+        for _ in range(n):
+            start = time.perf_counter()
+            response = await scraper.client.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    """Print latency statistics in milliseconds."""
+    ms = sorted(x * 1000 for x in latencies)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{label:<14} mean={statistics.mean(ms):7.3f}ms  "
+        f"median={statistics.median(ms):7.3f}ms  p95={p95:7.3f}ms"
+    )
+
+
+async def main(n: int) -> None:
+    server, url = start_server()
+    try:
+        # Warm-up both code paths
+        await bench_fresh_client(url, 5)
+        await bench_pooled_client(url, 5)
+
+        fresh = await bench_fresh_client(url, n)
+        pooled = await bench_pooled_client(url, n)
+    finally:
+        server.shutdown()
+
+    print(f"{n} requests against {url}")
+    report("fresh client", fresh)
+    report("pooled client", pooled)
+    print(f"speedup (median): {statistics.median(fresh) / statistics.median(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per strategy")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,109 @@
+"""
+Benchmark: parsing inline vs in a thread / process pool during batch scrapes.
+
+Scrapes N large lists with ``scrape_many`` against a mock transport that
+answers after a fixed network latency, and reports the wall time of the
+batch and the longest event loop stall for each parse executor. Inline
+parsing blocks every other download while a page is parsed; pools let
+downloads and parsing overlap (and a process pool uses several cores).
+
+Usage:
+    python benchmarks/bench_parse_offload.py [--lists 8] [--rows 5000] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings  # noqa: E402
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget  # noqa: E402
+from src.infrastructure.scraper.rate_limiter import reset_host_limiters  # noqa: E402
+from src.utils import logger  # noqa: E402
+from tests.fixtures.pages import build_bilans_page  # noqa: E402
+
+
+async def run_batch(
+    executor: Optional[Executor], page: str, lists: int, latency: float
+) -> tuple[float, float, int]:
+    """Return (wall seconds, longest loop stall seconds, rankings) for one executor."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, text=page)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scraper = AthleScraper(client=client, parse_executor=executor)
+    targets = [ScrapeTarget(600 + i, "M") for i in range(lists)]
+
+    longest_stall = 0.0
+    running = True
+
+    async def watchdog() -> None:
+        nonlocal longest_stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            longest_stall = max(longest_stall, now - last - 0.005)
+            last = now
+
+    watchdog_task = asyncio.create_task(watchdog())
+    start = time.perf_counter()
+    rankings = 0
+    async for outcome in scraper.scrape_many(targets, concurrency=lists):
+        rankings += len(outcome.rankings)
+    elapsed = time.perf_counter() - start
+    running = False
+    await watchdog_task
+    await client.aclose()
+    return elapsed, longest_stall, rankings
+
+
+def main(lists: int, rows: int, latency: float, workers: int) -> None:
+    logger.setLevel("ERROR")
+    settings.scraping_archive_enabled = False
+    settings.scraping_rate_limit = 10_000.0
+    settings.scraping_rate_burst = 1_000
+    settings.scraping_rate_jitter = 0.0
+    settings.scraping_parse_executor = "inline"
+    reset_host_limiters()
+
+    page = build_bilans_page(rows)
+    executors: dict[str, Optional[Executor]] = {
+        "inline": None,
+        "thread": ThreadPoolExecutor(max_workers=workers),
+        "process": ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ),
+    }
+    # Warm the process pool up so worker start-up is not measured
+    asyncio.run(run_batch(executors["process"], page, workers, 0.0))
+
+    print(f"{lists} lists x {rows} rows, {latency * 1000:.0f} ms latency, {workers} workers")
+    print(f"{'executor':<10} {'wall':>8} {'max stall':>10} {'rankings':>9}")
+    for name, executor in executors.items():
+        elapsed, stall, rankings = asyncio.run(run_batch(executor, page, lists, latency))
+        print(f"{name:<10} {elapsed:>7.2f}s {stall * 1000:>8.0f}ms {rankings:>9}")
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lists", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    main(args.lists, args.rows, args.latency, args.workers)
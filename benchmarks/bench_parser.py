@@ -0,0 +1,71 @@
+"""
+Benchmark: table parser backends on the saved page corpus.
+
+Parses every page of ``tests/fixtures/athle_pages`` with each backend of
+``PARSER_BACKENDS`` and reports throughput (rows/sec) and peak traced
+memory, after checking the output matches the bs4 reference. Peak memory
+comes from tracemalloc and only covers Python allocations, not the
+libxml2 tree itself.
+
+Usage:
+    python benchmarks/bench_parser.py [--repeat 3] [--backends bs4 lxml lxml-stream]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.scraper import PARSER_BACKENDS, AthleScraper, get_table_parser  # noqa: E402
+from src.utils import logger  # noqa: E402
+from tests.fixtures.pages import list_corpus_pages, load_corpus_page  # noqa: E402
+
+
+def measure(scraper: AthleScraper, html: str, repeat: int) -> tuple[float, float, list]:
+    """Return (best seconds, peak MiB, rankings) for one backend."""
+    best = float("inf")
+    rankings: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rankings = scraper.parse_page(html)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    scraper.parse_page(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak / (1024 * 1024), rankings
+
+
+def main(backends: list[str], repeat: int) -> None:
+    logger.setLevel("ERROR")
+    reference = AthleScraper(parser=get_table_parser("bs4"))
+
+    print(f"{'page':<28} {'backend':<12} {'rows':>6} {'rows/sec':>10} {'peak mem':>10}")
+    for page in list_corpus_pages():
+        html = load_corpus_page(page)
+        expected = reference.parse_page(html)
+        for backend in backends:
+            scraper = AthleScraper(parser=get_table_parser(backend))
+            seconds, peak_mib, rankings = measure(scraper, html, repeat)
+            status = "" if rankings == expected else "  MISMATCH"
+            print(
+                f"{page:<28} {backend:<12} {len(rankings):>6} "
+                f"{len(rankings) / seconds:>10.0f} {peak_mib:>8.1f}MiB{status}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per backend (best kept)")
+    parser.add_argument(
+        "--backends", nargs="+", default=list(PARSER_BACKENDS), choices=list(PARSER_BACKENDS)
+    )
+    args = parser.parse_args()
+    main(args.backends, args.repeat)
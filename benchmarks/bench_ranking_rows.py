@@ -0,0 +1,98 @@
+"""
+Benchmark: per-row dicts vs RankingRow records from parser to persistence.
+
+Takes the rows of a synthetic list and builds what the scrape pipeline
+holds before the INSERT:
+
+- dicts: the previous path (11-key dict per decoded row, a second
+  10-key dict per ranking in the use case, then a ``Ranking`` ORM object);
+- rows: ``RankingRow`` tuples with interned club/ligue/departement, the
+  INSERT parameters being generated on the fly.
+
+Reports retained memory, peak memory and number of live allocations
+(tracemalloc, Python objects only).
+
+Usage:
+    python benchmarks/bench_ranking_rows.py [--rows 10000]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.database.models import Ranking  # noqa: E402
+from src.infrastructure.scraper import get_table_parser  # noqa: E402
+from src.infrastructure.scraper.row_decoder import decode_rows  # noqa: E402
+from tests.fixtures.legacy_parser import legacy_decode_rows  # noqa: E402
+from tests.fixtures.pages import build_bilans_page  # noqa: E402
+
+SNAPSHOT_DATE = datetime(2026, 10, 1, 2, 0)
+
+
+def dict_pipeline(rows: list[list[str]]) -> list:
+    """Previous path: decoded dicts, ranking dicts, ORM objects."""
+    scraped = legacy_decode_rows(rows)
+    rankings_data = [
+        {
+            "snapshot_date": SNAPSHOT_DATE,
+            "epreuve_code": 670,
+            "sexe": "M",
+            "rank": data["rank"],
+            "athlete_id": data["athlete_id"],
+            "performance": data["performance"],
+            "performance_numeric": data["performance_numeric"],
+            "club": data.get("club"),
+            "ligue": data.get("ligue"),
+            "departement": data.get("departement"),
+        }
+        for data in scraped
+    ]
+    return [scraped, rankings_data, [Ranking(**data) for data in rankings_data]]
+
+
+def row_pipeline(rows: list[list[str]]) -> list:
+    """Current path: RankingRow records only."""
+    rankings, _ = decode_rows(rows)
+    return rankings
+
+
+def measure(pipeline, rows: list[list[str]]) -> tuple[float, float, int]:
+    """Return (retained MiB, peak MiB, live blocks) of the pipeline output."""
+    tracemalloc.start()
+    result = pipeline(rows)
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    del result
+    return current / (1024 * 1024), peak / (1024 * 1024), blocks
+
+
+def main(n_rows: int) -> None:
+    rows = get_table_parser("lxml").extract_rows(build_bilans_page(n_rows, detail_rows=False))
+    # Warm the memoized decoders so both paths are measured on a hot cache
+    decode_rows(rows)
+
+    print(f"{n_rows} rows")
+    print(f"{'pipeline':<10} {'retained':>10} {'peak':>10} {'live blocks':>12}")
+    results = {}
+    for name, pipeline in (("dicts", dict_pipeline), ("rows", row_pipeline)):
+        results[name] = measure(pipeline, rows)
+        retained, peak, blocks = results[name]
+        print(f"{name:<10} {retained:>8.2f}MB {peak:>8.2f}MB {blocks:>12}")
+
+    ratio = results["dicts"][1] / results["rows"][1]
+    print(f"peak memory reduced {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.rows)
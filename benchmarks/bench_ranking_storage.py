@@ -0,0 +1,149 @@
+"""
+Benchmark: full vs delta-encoded ranking snapshot storage.
+
+Simulates a season of daily snapshots of one list: every day a few
+athletes improve their performance and climb some places, and a few new
+athletes enter the list at a random rank. Each storage mode stores the
+season in a file-backed SQLite database, and the benchmark reports the
+rows written, the database size and the time to read the latest
+snapshot, a snapshot as of mid-season and an athlete's history.
+
+Usage:
+    python benchmarks/bench_ranking_storage.py [--rows 2000] [--days 120] [--moves 20]
+        [--entrants 2]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings  # noqa: E402
+from src.core.entities import RankingRow  # noqa: E402
+from src.infrastructure.database.models import Base, Epreuve, Ranking  # noqa: E402
+from src.infrastructure.database.repositories import SQLAlchemyRankingRepository  # noqa: E402
+
+EPREUVE_CODE = 670
+
+
+def simulate_season(
+    n_rows: int, n_days: int, n_moves: int, n_entrants: int
+) -> list[list[RankingRow]]:
+    """Build one list per day, ranked by performance."""
+    rng = random.Random(42)
+    performances = {f"athlete_{i}": 70.0 - i * 0.01 for i in range(n_rows)}
+    next_id = n_rows
+    season = []
+    for _ in range(n_days):
+        ranked = sorted(performances, key=performances.__getitem__, reverse=True)
+        for athlete_id in rng.sample(ranked, n_moves):
+            # Beat the performance of an athlete ranked up to 50 places higher
+            target = ranked[max(0, ranked.index(athlete_id) - rng.randint(1, 50))]
+            performances[athlete_id] = performances[target] + 0.001
+        for _ in range(n_entrants):
+            performances[f"athlete_{next_id}"] = rng.uniform(60.0, 70.0)
+            next_id += 1
+        ranked = sorted(performances, key=performances.__getitem__, reverse=True)
+        season.append(
+            [
+                RankingRow(
+                    rank,
+                    athlete_id,
+                    athlete_id,
+                    f"{performances[athlete_id]:.2f}",
+                    round(performances[athlete_id], 2),
+                    "Club",
+                    "I-F",
+                    "093",
+                )
+                for rank, athlete_id in enumerate(ranked, start=1)
+            ]
+        )
+    return season
+
+
+def timed(function, *args) -> float:
+    """Return the best wall time of a few calls (seconds)."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_mode(mode: str, season: list[list[RankingRow]], tmp: Path) -> dict:
+    """Store the season with one storage mode and measure the reads."""
+    settings.ranking_storage_mode = mode
+    db_path = tmp / f"{mode}.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Epreuve(nom="Javelot", code=EPREUVE_CODE, actif=True))
+    session.commit()
+    repo = SQLAlchemyRankingRepository(session)
+
+    start_date = datetime(2026, 3, 1, 2, 0)
+    start = time.perf_counter()
+    for day, rows in enumerate(season):
+        repo.create_from_rows(rows, start_date + timedelta(days=day), EPREUVE_CODE, "M")
+    write_time = time.perf_counter() - start
+    stored_rows = session.query(func.count(Ranking.id)).scalar()
+
+    mid_season = start_date + timedelta(days=len(season) // 2, hours=1)
+    latest = timed(repo.get_latest_by_epreuve, EPREUVE_CODE, "M")
+    as_of = timed(repo.get_snapshot_as_of, EPREUVE_CODE, "M", mid_season)
+    history = timed(repo.get_athlete_history, "athlete_0", EPREUVE_CODE, "M", len(season))
+    session.close()
+    engine.dispose()
+    return {
+        "rows": stored_rows,
+        "size": db_path.stat().st_size,
+        "write": write_time,
+        "latest": latest,
+        "as_of": as_of,
+        "history": history,
+    }
+
+
+def main(n_rows: int, n_days: int, n_moves: int, n_entrants: int) -> None:
+    season = simulate_season(n_rows, n_days, n_moves, n_entrants)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {mode: run_mode(mode, season, Path(tmp)) for mode in ("full", "delta")}
+
+    print(
+        f"{n_days} daily snapshots of ~{n_rows} rows "
+        f"({n_moves} climbers, {n_entrants} entrants per day), "
+        f"keyframe every {settings.ranking_keyframe_interval}"
+    )
+    print(
+        f"{'mode':<6} {'rows':>9} {'size':>9} {'write':>8} "
+        f"{'latest':>9} {'as-of':>9} {'history':>9}"
+    )
+    for mode, r in results.items():
+        print(
+            f"{mode:<6} {r['rows']:>9} {r['size'] / 1e6:>7.1f}MB {r['write']:>7.1f}s "
+            f"{r['latest'] * 1000:>7.1f}ms {r['as_of'] * 1000:>7.1f}ms "
+            f"{r['history'] * 1000:>7.1f}ms"
+        )
+    print(f"storage reduction {results['full']['size'] / results['delta']['size']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--entrants", type=int, default=2)
+    args = parser.parse_args()
+    main(args.rows, args.days, args.moves, args.entrants)
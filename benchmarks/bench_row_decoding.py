@@ -0,0 +1,71 @@
+"""
+Microbenchmark: per-row decoding vs batch column-wise decoding.
+
+Extracts the rows of each corpus page once, then times the previous
+per-row decoder (regexes recompiled per call, strptime per row) against
+``decode_rows`` (precompiled patterns, memoized date/performance decoding).
+
+Usage:
+    python benchmarks/bench_row_decoding.py [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.infrastructure.scraper import get_table_parser  # noqa: E402
+from src.infrastructure.scraper.row_decoder import (  # noqa: E402
+    decode_date,
+    decode_performance,
+    decode_rows,
+    is_valid_performance,
+)
+from tests.fixtures.legacy_parser import legacy_decode_rows  # noqa: E402
+from tests.fixtures.pages import list_corpus_pages, load_corpus_page  # noqa: E402
+
+
+def best_of(func, rows: list[list[str]], repeat: int, cold: bool = False) -> float:
+    """Best wall time of ``func(rows)`` over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        if cold:
+            for cached in (decode_date, decode_performance, is_valid_performance):
+                cached.cache_clear()
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(repeat: int) -> None:
+    parser = get_table_parser("lxml")
+
+    print(
+        f"{'page':<28} {'rows':>6} {'per-row':>10} {'batch cold':>11} {'batch warm':>11} {'speedup':>8}"
+    )
+    for page in list_corpus_pages():
+        rows = parser.extract_rows(load_corpus_page(page))
+        batch_rows, _ = decode_rows(rows)
+        assert [r._asdict() for r in batch_rows] == legacy_decode_rows(
+            rows
+        ), f"output mismatch on {page}"
+
+        per_row = best_of(legacy_decode_rows, rows, repeat)
+        cold = best_of(decode_rows, rows, repeat, cold=True)
+        warm = best_of(decode_rows, rows, repeat)
+        print(
+            f"{page:<28} {len(batch_rows):>6} {per_row * 1000:>8.2f}ms "
+            f"{cold * 1000:>9.2f}ms {warm * 1000:>9.2f}ms {per_row / cold:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (best kept)")
+    args = parser.parse_args()
+    main(args.repeat)
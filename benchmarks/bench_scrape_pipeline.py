@@ -0,0 +1,126 @@
+"""
+Benchmark: sequential scrape run vs fetch/parse/persist pipeline.
+
+Scrapes N events from a fake athle.fr that answers each list after a
+fixed network latency, once the way scheduled runs used to (fetch, parse
+and persist one event after the other) and once through ScrapePipeline,
+where the next events are downloaded and parsed while the writer task
+stores the previous one. Both runs use a file-backed SQLite database and
+the same parse executor, and the benchmark reports the wall time and the
+per-stage metrics of the pipeline.
+
+Usage:
+    python benchmarks/bench_scrape_pipeline.py [--events 12] [--rows 1500] [--latency 0.3]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings  # noqa: E402
+from src.core.use_cases import ScrapePipeline, ScrapeRankingsUseCase  # noqa: E402
+from src.infrastructure.database.models import Base, Epreuve  # noqa: E402
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget  # noqa: E402
+from tests.fixtures.pages import build_bilans_page  # noqa: E402
+
+
+def fake_site(n_events: int, n_rows: int, latency: float):
+    """Return a fetch_pages replacement serving one page per event."""
+    pages = {code: build_bilans_page(n_rows, seed=code) for code in range(n_events)}
+
+    async def fetch_pages(epreuve_code: int, sexe: str, annee: int, categorie: str) -> list[str]:
+        await asyncio.sleep(latency)
+        return [pages[epreuve_code]]
+
+    return fetch_pages
+
+
+def create_database(path: Path, n_events: int) -> str:
+    """Create a database with N active events and return its async URL."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(Epreuve(nom=f"Event {code}", code=code, actif=True) for code in range(n_events))
+    session.commit()
+    session.close()
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+async def run_sequential(url: str, targets: list[ScrapeTarget], fetch_pages) -> float:
+    """Scrape every target one after the other."""
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    scraper = AthleScraper()
+    start = time.perf_counter()
+    with patch.object(scraper, "fetch_pages", new=fetch_pages):
+        for target in targets:
+            async with session_factory() as session:
+                use_case = ScrapeRankingsUseCase(session, scraper)
+                await use_case.execute(target.epreuve_code, target.sexe, force=True)
+    elapsed = time.perf_counter() - start
+    await scraper.aclose()
+    await engine.dispose()
+    return elapsed
+
+
+async def run_pipeline(
+    url: str, targets: list[ScrapeTarget], fetch_pages
+) -> tuple[float, ScrapePipeline]:
+    """Scrape every target through the pipeline."""
+    engine = create_async_engine(url)
+    scraper = AthleScraper()
+    pipeline = ScrapePipeline(async_sessionmaker(engine, expire_on_commit=False), scraper=scraper)
+    start = time.perf_counter()
+    with patch.object(scraper, "fetch_pages", new=fetch_pages):
+        await pipeline.run(targets, force=True)
+    elapsed = time.perf_counter() - start
+    await scraper.aclose()
+    await engine.dispose()
+    return elapsed, pipeline
+
+
+def main(n_events: int, n_rows: int, latency: float) -> None:
+    settings.scraping_archive_enabled = False
+    fetch_pages = fake_site(n_events, n_rows, latency)
+    targets = [ScrapeTarget(code, "M") for code in range(n_events)]
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential_url = create_database(Path(tmp) / "sequential.db", n_events)
+        pipeline_url = create_database(Path(tmp) / "pipeline.db", n_events)
+        sequential = asyncio.run(run_sequential(sequential_url, targets, fetch_pages))
+        pipelined, pipeline = asyncio.run(run_pipeline(pipeline_url, targets, fetch_pages))
+
+    print(
+        f"{n_events} events of {n_rows} rows, {latency * 1000:.0f}ms per list, "
+        f"{settings.scraping_parse_executor} parse executor"
+    )
+    print(f"sequential {sequential:>7.2f}s")
+    print(f"pipeline   {pipelined:>7.2f}s  ({sequential / pipelined:.1f}x)")
+    metrics = pipeline.metrics.to_dict()
+    print(f"{'stage':<8} {'workers':>7} {'items':>6} {'items/s':>8} {'busy':>6} {'max queue':>10}")
+    for stage, m in metrics["stages"].items():
+        print(
+            f"{stage:<8} {m['workers']:>7} {m['items']:>6} {m['items_per_second']:>8.1f} "
+            f"{m['utilization']:>6.0%} {m['max_queue_depth']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=12)
+    parser.add_argument("--rows", type=int, default=1500)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+    main(args.events, args.rows, args.latency)
@@ -0,0 +1,91 @@
+"""
+Benchmark: per-row alert checks vs vectorized snapshot diff.
+
+Diffs two synthetic snapshots of the same list, the current one being the
+previous one with a few athletes moved (a typical daily change), and builds
+the alerts of an audience of users:
+
+- per-row: the previous path (previous ranks in a dict, then the alert
+  engine evaluated for every row);
+- vectorized: ``diff_snapshots`` (NumPy masks over aligned rank arrays,
+  also yielding entrants and dropouts) and ``evaluate_changes``, which only
+  looks at the rows crossing a threshold or changing rank.
+
+Usage:
+    python benchmarks/bench_snapshot_diff.py [--rows 10000] [--moves 20] [--repeat 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.entities import RankingRow  # noqa: E402
+from src.core.services import AlertEngine, diff_snapshots  # noqa: E402
+
+ENGINE = AlertEngine(list(range(20)), {("athlete_5", 670): {1, 2}})
+
+
+def build_snapshots(n_rows: int, moves: int) -> tuple[list[tuple[str, int]], list[RankingRow]]:
+    """Build a previous snapshot and a current one with a few athletes moved."""
+    rng = random.Random(42)
+    previous = [(f"athlete_{i}", i + 1) for i in range(n_rows)]
+    ids = [athlete_id for athlete_id, _ in previous]
+    for i in range(moves):
+        athlete_id = ids.pop(rng.randrange(len(ids)))
+        # Half of the moves are newcomers replacing a dropout
+        ids.insert(rng.randrange(len(ids)), athlete_id if i % 2 else f"newcomer_{i}")
+    # A new leader pushes everyone down across the top 3/10/20 thresholds
+    ids.insert(0, ids.pop())
+    current = [
+        RankingRow(rank, athlete_id, athlete_id, "50m00", 50.0)
+        for rank, athlete_id in enumerate(ids, start=1)
+    ]
+    return previous, current
+
+
+def per_row(previous: list[tuple[str, int]], current: list[RankingRow]) -> int:
+    """Previous path: dict lookup and alert evaluation for every row."""
+    prev_ranks_map = dict(previous)
+    alerts = []
+    for row in current:
+        alerts.extend(
+            ENGINE.evaluate(
+                row.athlete_id, row.name, prev_ranks_map.get(row.athlete_id), row.rank, 670, "M"
+            )
+        )
+    return len(alerts)
+
+
+def vectorized(previous: list[tuple[str, int]], current: list[RankingRow]) -> int:
+    """Current path: one change set for the whole snapshot."""
+    return len(ENGINE.evaluate_changes(diff_snapshots(previous, current), 670, "M"))
+
+
+def main(n_rows: int, moves: int, repeat: int) -> None:
+    previous, current = build_snapshots(n_rows, moves)
+
+    print(f"{n_rows} rows, {moves} moves, {repeat} runs")
+    results = {}
+    for name, diff in (("per-row", per_row), ("vectorized", vectorized)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            alerts = diff(previous, current)
+        results[name] = (time.perf_counter() - start) / repeat
+        print(f"{name:<12} {results[name] * 1000:>8.2f}ms  {alerts} alerts")
+
+    print(f"speedup {results['per-row'] / results['vectorized']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--moves", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.rows, args.moves, args.repeat)
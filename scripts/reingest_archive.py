@@ -0,0 +1,95 @@
+"""
+Re-ingest archived athle.fr pages without network access.
+
+Replays the raw HTML archive through the parser and the scraping workflow,
+storing one snapshot per archived fetch, dated at its fetch time.
+
+Usage:
+    python scripts/reingest_archive.py [--epreuve 670] [--sexe M] [--since 2026-01-01]
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import settings  # noqa: E402
+from src.core.use_cases import ReingestArchiveUseCase  # noqa: E402
+from src.infrastructure.database.connection import (  # noqa: E402
+    dispose_async_engine,
+    get_async_db_session,
+    init_db,
+)
+from src.infrastructure.scraper import HtmlArchive  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--archive-dir", type=Path, default=settings.archive_dir)
+    parser.add_argument("--epreuve", type=int, help="Only this competition code")
+    parser.add_argument("--sexe", choices=["M", "F"], help="Only this gender")
+    parser.add_argument("--annee", type=int, help="Only this year")
+    parser.add_argument("--categorie", help="Only this category")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only fetches after this date")
+    parser.add_argument(
+        "--until", type=datetime.fromisoformat, help="Only fetches before this date"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Store a snapshot even if the table is unchanged"
+    )
+    parser.add_argument("--alerts", action="store_true", help="Generate alerts while replaying")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the matching fetches")
+    return parser.parse_args()
+
+
+async def reingest(
+    archive: HtmlArchive, fetches: list, force: bool, generate_alerts: bool
+) -> list[dict]:
+    """Replay the fetches in one async session."""
+    try:
+        async with get_async_db_session() as session:
+            use_case = ReingestArchiveUseCase(session, archive)
+            return await use_case.execute(fetches, force=force, generate_alerts=generate_alerts)
+    finally:
+        await dispose_async_engine()
+
+
+def main() -> None:
+    args = parse_args()
+    archive = HtmlArchive(args.archive_dir)
+    fetches = archive.fetches(
+        epreuve_code=args.epreuve,
+        sexe=args.sexe,
+        annee=args.annee,
+        categorie=args.categorie,
+        since=args.since,
+        until=args.until,
+    )
+    print(f"{len(fetches)} archived fetches in {args.archive_dir}")
+
+    if args.dry_run:
+        for fetch in fetches:
+            print(
+                f"  {fetch.fetched_at.isoformat()}  epreuve={fetch.epreuve_code} "
+                f"sexe={fetch.sexe} {fetch.annee}/{fetch.categorie} pages={len(fetch.entries)}"
+            )
+        return
+
+    init_db()
+    results = asyncio.run(reingest(archive, fetches, args.force, args.alerts))
+
+    for result in results:
+        status = (
+            "unchanged" if result.get("unchanged") else ("ok" if result["success"] else "error")
+        )
+        detail = result.get("rankings_count", result.get("error"))
+        print(f"  {result['fetched_at']}  {status:<9} {detail}")
+
+
+if __name__ == "__main__":
+    main()
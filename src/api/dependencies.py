@@ -1,16 +1,18 @@
 """FastAPI dependencies for database and authentication."""
 
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator, Generator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from src.config import settings
-from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.database.connection import SessionLocal, new_async_session
 from src.infrastructure.database.repositories import SQLAlchemyUserRepository
+from src.infrastructure.scheduler import ScrapingScheduler
 
 # Security
 security = HTTPBearer()
@@ -31,6 +33,31 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session dependency (for async endpoints).
+
+    Yields:
+        SQLAlchemy async database session
+    """
+    async with new_async_session() as db:
+        yield db
+
+
+def get_scheduler(request: Request) -> ScrapingScheduler:
+    """
+    Scraping scheduler dependency (the one running on the app's event loop).
+
+    Returns:
+        Scraping scheduler of the application
+    """
+    scheduler: Optional[ScrapingScheduler] = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        # App served without its lifespan (e.g. a test client not used as a context)
+        scheduler = request.app.state.scheduler = ScrapingScheduler(mode="asyncio")
+    return scheduler
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -1,10 +1,27 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routers import auth, rankings, alerts, epreuves, scraping, users
 from src.config import settings
+from src.infrastructure.scheduler import ScrapingScheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the scraping scheduler on the app's event loop and release it on shutdown."""
+    # Manual scrapes share its HTTP client even when the scheduled job runs elsewhere
+    scheduler = ScrapingScheduler(mode="asyncio")
+    app.state.scheduler = scheduler
+    if settings.scheduler_mode == "asyncio":
+        scheduler.start()
+    yield
+    await scheduler.aclose()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -14,6 +31,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS middleware for Next.js frontend
@@ -3,43 +3,43 @@
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db, get_current_user
+from src.api.dependencies import get_async_db, get_current_user
 from src.api.schemas import AlertResponse
-from src.infrastructure.database.repositories import SQLAlchemyAlertRepository
+from src.infrastructure.database.async_repositories import AsyncSQLAlchemyAlertRepository
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
 
 @router.get("/", response_model=list[AlertResponse])
-def get_user_alerts(
+async def get_user_alerts(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    current_user: Annotated[dict, Depends(get_current_user)],
     is_read: Annotated[Optional[bool], Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-    db: Annotated[Session, Depends(get_db)] = None,
-    current_user: Annotated[dict, Depends(get_current_user)] = None,
 ) -> list[AlertResponse]:
     """
     Get alerts for current user.
 
     Args:
-        is_read: Filter by read status (None = all)
-        limit: Maximum number of alerts to return
         db: Database session
         current_user: Authenticated user
+        is_read: Filter by read status (None = all)
+        limit: Maximum number of alerts to return
 
     Returns:
         List of alerts
     """
-    alert_repo = SQLAlchemyAlertRepository(db)
-    alerts = alert_repo.get_user_alerts(current_user["id"], is_read, limit)
+    alert_repo = AsyncSQLAlchemyAlertRepository(db)
+    alerts = await alert_repo.get_user_alerts(current_user["id"], is_read, limit)
 
     return [AlertResponse.model_validate(a) for a in alerts]
 
 
 @router.get("/unread-count", response_model=int)
-def get_unread_count(
-    db: Annotated[Session, Depends(get_db)],
+async def get_unread_count(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_user)],
 ) -> int:
     """
@@ -52,14 +52,14 @@ def get_unread_count(
     Returns:
         Number of unread alerts
     """
-    alert_repo = SQLAlchemyAlertRepository(db)
-    return alert_repo.count_unread(current_user["id"])
+    alert_repo = AsyncSQLAlchemyAlertRepository(db)
+    return await alert_repo.count_unread(current_user["id"])
 
 
 @router.patch("/{alert_id}/read")
-def mark_alert_as_read(
+async def mark_alert_as_read(
     alert_id: int,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_user)],
 ) -> dict:
     """
@@ -76,20 +76,17 @@ def mark_alert_as_read(
     Raises:
         HTTPException: If alert not found or doesn't belong to user
     """
-    alert_repo = SQLAlchemyAlertRepository(db)
-    alert = alert_repo.get_by_id(alert_id)
+    alert_repo = AsyncSQLAlchemyAlertRepository(db)
 
-    if not alert or alert.user_id != current_user["id"]:
+    if not await alert_repo.mark_as_read(current_user["id"], alert_id):
         raise HTTPException(status_code=404, detail="Alert not found")
 
-    alert_repo.mark_as_read(alert_id)
-
     return {"message": "Alert marked as read"}
 
 
 @router.patch("/mark-all-read")
-def mark_all_alerts_as_read(
-    db: Annotated[Session, Depends(get_db)],
+async def mark_all_alerts_as_read(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_user)],
 ) -> dict:
     """
@@ -102,7 +99,7 @@ def mark_all_alerts_as_read(
     Returns:
         Count of marked alerts
     """
-    alert_repo = SQLAlchemyAlertRepository(db)
-    count = alert_repo.mark_all_as_read(current_user["id"])
+    alert_repo = AsyncSQLAlchemyAlertRepository(db)
+    count = await alert_repo.mark_all_as_read(current_user["id"])
 
     return {"message": f"{count} alerts marked as read", "count": count}
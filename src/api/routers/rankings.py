@@ -1,6 +1,7 @@
 """Rankings endpoints."""
 
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -16,6 +17,7 @@ router = APIRouter(prefix="/rankings", tags=["Rankings"])
 def get_rankings(
     epreuve_code: Annotated[int, Query(ge=1)],
     sexe: Annotated[str, Query(pattern="^[MF]$")] = "M",
+    as_of: Optional[datetime] = None,
     db: Annotated[Session, Depends(get_db)] = None,
     current_user: Annotated[dict, Depends(get_current_user)] = None,
 ) -> list[RankingResponse]:
@@ -25,6 +27,7 @@ def get_rankings(
     Args:
         epreuve_code: Event code
         sexe: Gender (M or F)
+        as_of: Get the rankings as they were at this date instead of the latest
         db: Database session
         current_user: Authenticated user
 
@@ -32,7 +35,10 @@ def get_rankings(
         List of rankings
     """
     ranking_repo = SQLAlchemyRankingRepository(db)
-    latest_date, rankings = ranking_repo.get_latest_by_epreuve(epreuve_code, sexe)
+    if as_of is not None:
+        latest_date, rankings = ranking_repo.get_snapshot_as_of(epreuve_code, sexe, as_of)
+    else:
+        latest_date, rankings = ranking_repo.get_latest_by_epreuve(epreuve_code, sexe)
 
     if not rankings:
         return []
@@ -1,85 +1,186 @@
 """Scraping endpoints (admin only)."""
 
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_db, get_current_admin_user
+from src.api.dependencies import get_async_db, get_current_admin_user, get_scheduler
 from src.api.schemas import (
+    ScrapeJobResponse,
     ScrapeRequest,
-    ScrapeResultResponse,
     ScrapeLogResponse,
 )
-from src.infrastructure.database.repositories import SQLAlchemyScrapeLogRepository
-from src.infrastructure.scheduler.scraping_scheduler import ScrapingScheduler
+from src.config import settings
+from src.core.use_cases import PipelineMetrics, get_latest_pipeline_metrics
+from src.infrastructure.database.async_repositories import (
+    AsyncSQLAlchemyLeaseRepository,
+    AsyncSQLAlchemyRunReportRepository,
+    AsyncSQLAlchemyScrapeLogRepository,
+)
+from src.infrastructure.scraper import ScrapeTarget
+from src.infrastructure.scheduler.scraping_scheduler import (
+    LAST_RUN_REPORT,
+    PIPELINE_METRICS_REPORT,
+    SCHEDULER_LEASE,
+    ScrapingScheduler,
+)
 
 router = APIRouter(prefix="/scraping", tags=["Scraping"])
 
 
-@router.post("/manual", response_model=ScrapeResultResponse)
-def run_manual_scrape(
+@router.post("/manual", response_model=ScrapeJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def run_manual_scrape(
     data: ScrapeRequest,
-    db: Annotated[Session, Depends(get_db)],
+    scheduler: Annotated[ScrapingScheduler, Depends(get_scheduler)],
     current_user: Annotated[dict, Depends(get_current_admin_user)],
-) -> ScrapeResultResponse:
+) -> ScrapeJobResponse:
     """
-    Run manual scraping for an event (admin only).
+    Queue manual scraping for an event (admin only).
+
+    The scrape runs in the background: poll ``GET /scraping/jobs/{id}`` for
+    its progress and result. A list already queued or being scraped is not
+    scraped twice; its existing job is returned.
 
     Args:
         data: Scrape request (epreuve_code + sexe)
-        db: Database session
+        scheduler: Scraping scheduler of the application
+        current_user: Authenticated admin user
+
+    Returns:
+        Queued (or coalesced) scrape job
+    """
+    job, _ = await scheduler.jobs.submit(ScrapeTarget(data.epreuve_code, data.sexe))
+
+    return ScrapeJobResponse(**job.to_dict())
+
+
+@router.get("/jobs", response_model=list[ScrapeJobResponse])
+async def list_scrape_jobs(
+    scheduler: Annotated[ScrapingScheduler, Depends(get_scheduler)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+) -> list[ScrapeJobResponse]:
+    """
+    Get the queued, running and recently finished manual scrape jobs (admin only).
+
+    Args:
+        scheduler: Scraping scheduler of the application
         current_user: Authenticated admin user
 
     Returns:
-        Scraping result
+        Scrape jobs, most recent first
     """
-    scheduler = ScrapingScheduler()
-    result = scheduler.run_manual_scrape(data.epreuve_code, data.sexe)
+    return [ScrapeJobResponse(**job.to_dict()) for job in await scheduler.jobs.list_jobs()]
 
-    return ScrapeResultResponse(**result)
+
+@router.get("/jobs/{job_id}", response_model=ScrapeJobResponse)
+async def get_scrape_job(
+    job_id: str,
+    scheduler: Annotated[ScrapingScheduler, Depends(get_scheduler)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+) -> ScrapeJobResponse:
+    """
+    Get the status, stage progress and result of a manual scrape job (admin only).
+
+    Args:
+        job_id: Job id returned when the scrape was queued
+        scheduler: Scraping scheduler of the application
+        current_user: Authenticated admin user
+
+    Returns:
+        Scrape job
+
+    Raises:
+        HTTPException: If the job is unknown (or too old to be kept)
+    """
+    job = await scheduler.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+
+    return ScrapeJobResponse(**job.to_dict())
 
 
 @router.get("/logs", response_model=list[ScrapeLogResponse])
-def get_scrape_logs(
+async def get_scrape_logs(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-    db: Annotated[Session, Depends(get_db)] = None,
-    current_user: Annotated[dict, Depends(get_current_admin_user)] = None,
 ) -> list[ScrapeLogResponse]:
     """
     Get recent scrape logs (admin only).
 
     Args:
-        limit: Maximum number of logs to return
         db: Database session
         current_user: Authenticated admin user
+        limit: Maximum number of logs to return
 
     Returns:
         List of scrape logs
     """
-    log_repo = SQLAlchemyScrapeLogRepository(db)
-    logs = log_repo.get_recent_logs(limit)
+    log_repo = AsyncSQLAlchemyScrapeLogRepository(db)
+    logs = await log_repo.get_recent_logs(limit=limit)
 
     return [ScrapeLogResponse.model_validate(log) for log in logs]
 
 
 @router.get("/scheduler/status")
-def get_scheduler_status(
+async def get_scheduler_status(
+    scheduler: Annotated[ScrapingScheduler, Depends(get_scheduler)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[dict, Depends(get_current_admin_user)],
 ) -> dict:
     """
     Get scheduler status (admin only).
 
     Args:
+        scheduler: Scraping scheduler of the application
+        db: Database session
         current_user: Authenticated admin user
 
     Returns:
-        Scheduler status information
+        Scheduler status information, with the process running the scheduled
+        scrapes and the stored summary of the last run (whichever process ran it)
     """
-    scheduler = ScrapingScheduler()
     next_run = scheduler.get_next_run_time()
+    last_run = await AsyncSQLAlchemyRunReportRepository(db).get(LAST_RUN_REPORT)
+    lease = await AsyncSQLAlchemyLeaseRepository(db).get(SCHEDULER_LEASE)
+    if lease is not None and lease.expires_at <= datetime.now():
+        # Expired: no process runs the scheduled scrapes until one takes it over
+        lease = None
 
     return {
-        "enabled": True,  # From settings
+        "enabled": settings.scheduler_enabled,
+        "mode": settings.scheduler_mode,
         "next_run_time": next_run,
+        "leader": lease.holder if lease else None,
+        "lease_expires_at": lease.expires_at.isoformat() if lease else None,
+        "is_leader": scheduler.is_leader,
+        "last_run": last_run,
     }
+
+
+@router.get("/pipeline/metrics")
+async def get_pipeline_metrics(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    current_user: Annotated[dict, Depends(get_current_admin_user)],
+) -> dict:
+    """
+    Get the stage metrics of the running or last scrape pipeline run (admin only).
+
+    A run in progress in this process is reported live. Otherwise the
+    metrics stored by the last scheduled run are returned, whichever
+    process ran it (e.g. run_scheduler.py in background mode).
+
+    Args:
+        db: Database session
+        current_user: Authenticated admin user
+
+    Returns:
+        Per-stage items, throughput, utilization and queue depths
+    """
+    metrics = get_latest_pipeline_metrics()
+    if metrics is not None and metrics.running:
+        return metrics.to_dict()
+    stored = await AsyncSQLAlchemyRunReportRepository(db).get(PIPELINE_METRICS_REPORT)
+    return stored or PipelineMetrics().to_dict()
@@ -151,12 +151,29 @@ class ScrapeResultResponse(BaseModel):
     """Scraping result response schema."""
 
     success: bool
+    unchanged: bool = False
     rankings_count: int = 0
     alerts_count: int = 0
-    duration_seconds: float
+    duration_seconds: float = 0.0
     error: Optional[str] = None
 
 
+class ScrapeJobResponse(BaseModel):
+    """Manual scrape job response schema."""
+
+    id: str
+    epreuve_code: int
+    sexe: str
+    status: str
+    stage: Optional[str] = None
+    stages: dict[str, str]
+    submitted_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    coalesced: int = 0
+    result: Optional[ScrapeResultResponse] = None
+
+
 class ScrapeLogResponse(BaseModel):
     """Scrape log response schema."""
 
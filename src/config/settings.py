@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,17 @@ class Settings(BaseSettings):
         default="sqlite:///./athle_tracker.db",
         description="Database connection URL",
     )
+    ranking_storage_mode: str = Field(
+        default="delta",
+        description=(
+            "How ranking snapshots are stored: delta (rows changed since the previous "
+            "snapshot, with periodic keyframes) or full (every row of every snapshot)"
+        ),
+    )
+    ranking_keyframe_interval: int = Field(
+        default=7,
+        description="Store a full keyframe every N snapshots of a list in delta mode",
+    )
 
     # Application
     app_name: str = Field(default="Athle Tracker", description="Application name")
@@ -29,13 +40,17 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, description="Debug mode")
 
     # Scraping Configuration
-    scraping_min_delay: float = Field(
-        default=2.0,
-        description="Minimum delay between requests (seconds)",
+    scraping_rate_limit: float = Field(
+        default=0.5,
+        description="Maximum sustained requests per second to athle.fr (shared by all scrapes)",
+    )
+    scraping_rate_burst: int = Field(
+        default=2,
+        description="Number of requests allowed back to back before rate limiting",
     )
-    scraping_max_delay: float = Field(
-        default=3.0,
-        description="Maximum delay between requests (seconds)",
+    scraping_rate_jitter: float = Field(
+        default=0.5,
+        description="Maximum random delay added to each request (seconds)",
     )
     scraping_max_retries: int = Field(
         default=3,
@@ -45,12 +60,104 @@ class Settings(BaseSettings):
         default=30,
         description="Request timeout (seconds)",
     )
+    scraping_retry_budget: int = Field(
+        default=20,
+        description="Maximum number of retries for a whole scrape run",
+    )
+    scraping_max_retry_after: float = Field(
+        default=300.0,
+        description="Longest Retry-After delay honored before giving up (seconds)",
+    )
+    scraping_circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive failures that make requests to athle.fr fail fast",
+    )
+    scraping_circuit_reset_timeout: float = Field(
+        default=300.0,
+        description="Time before probing athle.fr again after the circuit opened (seconds)",
+    )
+    scraping_max_connections: int = Field(
+        default=10,
+        description="Maximum number of concurrent connections in the HTTP pool",
+    )
+    scraping_max_keepalive_connections: int = Field(
+        default=5,
+        description="Maximum number of idle keep-alive connections kept in the pool",
+    )
+    scraping_keepalive_expiry: float = Field(
+        default=60.0,
+        description="Idle time before a keep-alive connection is closed (seconds)",
+    )
+    scraping_http2: bool = Field(
+        default=False,
+        description="Enable HTTP/2 (requires the 'h2' package)",
+    )
+    scraping_max_pages: int = Field(
+        default=20,
+        description="Maximum number of pages fetched for one rankings list",
+    )
+    scraping_page_concurrency: int = Field(
+        default=3,
+        description="Maximum number of pages of one list fetched concurrently",
+    )
+    scraping_target_concurrency: int = Field(
+        default=4,
+        description="Maximum number of rankings lists scraped concurrently by scrape_many",
+    )
+    scraping_pipeline_queue_size: int = Field(
+        default=4,
+        description="Maximum number of lists waiting between two stages of the scrape pipeline",
+    )
+    scraping_parser_backend: str = Field(
+        default="lxml-stream",
+        description="HTML table parser backend: lxml-stream, lxml or bs4",
+        # SCRAPING_PARSER_MODE is the name this setting had before the lxml backend
+        validation_alias=AliasChoices("scraping_parser_backend", "scraping_parser_mode"),
+    )
+    scraping_parse_executor: str = Field(
+        default="process",
+        description="Where pages are parsed: process (pool), thread (pool) or inline",
+    )
+    scraping_parse_workers: int = Field(
+        default=0,
+        description="Number of parse pool workers (0: number of CPUs, at most 4)",
+    )
+    scraping_job_workers: int = Field(
+        default=2,
+        description="Maximum number of manual scrape jobs run concurrently",
+    )
+    scraping_job_history: int = Field(
+        default=100,
+        description="Number of finished manual scrape jobs kept for polling",
+    )
+    scraping_job_timeout_seconds: int = Field(
+        default=3600,
+        description=(
+            "Seconds without an update after which a queued or running manual scrape "
+            "job is failed (its process stopped)"
+        ),
+    )
+    scraping_archive_enabled: bool = Field(
+        default=True,
+        description="Archive the raw HTML of every fetched page",
+    )
+    scraping_archive_dir: str = Field(
+        default="data/html_archive",
+        description="Raw HTML archive directory (relative to the project root)",
+    )
 
     # Scheduler Configuration
     scheduler_enabled: bool = Field(
         default=True,
         description="Enable automatic scraping scheduler",
     )
+    scheduler_mode: str = Field(
+        default="background",
+        description=(
+            "background (jobs run in a thread, each on a new event loop: run_scheduler.py) "
+            "or asyncio (jobs run on the API's event loop, started with the app)"
+        ),
+    )
     scheduler_start_hour: int = Field(
         default=1,
         description="Scheduler start hour (24h format)",
@@ -67,6 +174,41 @@ class Settings(BaseSettings):
         default=15,
         description="Scheduler end minute",
     )
+    scheduler_runs_per_day: int = Field(
+        default=4,
+        description="Scheduled runs per day, evenly spaced from the random time in the window",
+    )
+    scheduler_adaptive: bool = Field(
+        default=True,
+        description=(
+            "Scrape the lists most likely to have changed within the daily budget, "
+            "instead of every list at every run"
+        ),
+    )
+    scheduler_daily_list_budget: int = Field(
+        default=0,
+        description="Lists scraped per day by adaptive runs (0: one per active list)",
+    )
+    scheduler_max_interval_days: float = Field(
+        default=7.0,
+        description="Longest time an active list goes without an adaptive scrape (days)",
+    )
+    scheduler_min_change_probability: float = Field(
+        default=0.05,
+        description="Lowest probability that a list changed worth scraping it",
+    )
+    scheduler_change_half_life_days: float = Field(
+        default=14.0,
+        description="Age at which a past scrape weighs half in a list's change rate (days)",
+    )
+    scheduler_lease_ttl_seconds: float = Field(
+        default=90.0,
+        description="Time after which another process takes over the scheduler lease (seconds)",
+    )
+    scheduler_lease_renew_seconds: float = Field(
+        default=30.0,
+        description="Interval between two renewals of the scheduler lease (seconds)",
+    )
     timezone: str = Field(
         default="Europe/Paris",
         description="Timezone for scheduler",
@@ -137,6 +279,14 @@ class Settings(BaseSettings):
         logs_path.mkdir(exist_ok=True)
         return logs_path
 
+    @property
+    def archive_dir(self) -> Path:
+        """Get raw HTML archive directory."""
+        archive_path = Path(self.scraping_archive_dir)
+        if not archive_path.is_absolute():
+            archive_path = self.project_root / archive_path
+        return archive_path
+
 
 # Global settings instance
 settings = Settings()
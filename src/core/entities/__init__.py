@@ -1 +1,5 @@
 """Core domain entities."""
+
+from .ranking_row import RankingRow
+
+__all__ = ["RankingRow"]
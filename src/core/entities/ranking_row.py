@@ -0,0 +1,27 @@
+"""Scraped ranking row record."""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class RankingRow(NamedTuple):
+    """
+    One decoded row of an athle.fr rankings table.
+
+    A plain tuple (no per-instance ``__dict__``) that flows unchanged from
+    the parser to persistence and pickles compactly out of parse workers.
+    Club, ligue and departement strings are interned by the decoder, so the
+    few distinct values are shared by every row.
+    """
+
+    rank: int
+    athlete_id: str
+    name: str
+    performance: str
+    performance_numeric: float
+    club: Optional[str] = None
+    ligue: Optional[str] = None
+    departement: Optional[str] = None
+    infos: Optional[str] = None
+    date: Optional[datetime] = None
+    lieu: Optional[str] = None
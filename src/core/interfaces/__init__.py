@@ -1,11 +1,24 @@
 """Core interfaces package."""
 
 from .repositories import (
+    AsyncAlertRepository,
+    AsyncAthleteRepository,
+    AsyncEpreuveRepository,
+    AsyncFavoriteRepository,
+    AsyncLeaseRepository,
+    AsyncRankingRepository,
+    AsyncRunReportRepository,
+    AsyncScrapeJobRepository,
+    AsyncScrapeLogRepository,
+    AsyncUserRepository,
     AlertRepository,
     AthleteRepository,
     EpreuveRepository,
     FavoriteRepository,
+    LeaseRepository,
     RankingRepository,
+    RunReportRepository,
+    ScrapeJobRepository,
     ScrapeLogRepository,
     UserRepository,
 )
@@ -18,4 +31,17 @@ __all__ = [
     "FavoriteRepository",
     "AlertRepository",
     "ScrapeLogRepository",
+    "LeaseRepository",
+    "ScrapeJobRepository",
+    "RunReportRepository",
+    "AsyncUserRepository",
+    "AsyncEpreuveRepository",
+    "AsyncAthleteRepository",
+    "AsyncRankingRepository",
+    "AsyncFavoriteRepository",
+    "AsyncAlertRepository",
+    "AsyncScrapeLogRepository",
+    "AsyncLeaseRepository",
+    "AsyncScrapeJobRepository",
+    "AsyncRunReportRepository",
 ]
@@ -4,12 +4,16 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Optional
 
+from src.core.entities import RankingRow
 from src.infrastructure.database.models import (
-    Alert,
+    AlertDelivery,
+    AlertEvent,
     Athlete,
     Epreuve,
     Favorite,
     Ranking,
+    SchedulerLease,
+    ScrapeJobRecord,
     ScrapeLog,
     User,
 )
@@ -48,6 +52,11 @@ class UserRepository(ABC):
         """List all users."""
         pass
 
+    @abstractmethod
+    def list_active(self) -> list[User]:
+        """List active users."""
+        pass
+
 
 class EpreuveRepository(ABC):
     """Interface for Epreuve repository."""
@@ -101,6 +110,11 @@ class AthleteRepository(ABC):
         """Get or create athlete."""
         pass
 
+    @abstractmethod
+    def upsert_bulk(self, athletes_data: list[dict[str, Any]]) -> int:
+        """Create the athletes that do not exist yet."""
+        pass
+
 
 class RankingRepository(ABC):
     """Interface for Ranking repository."""
@@ -112,6 +126,13 @@ class RankingRepository(ABC):
         """Get latest rankings for an epreuve and gender."""
         pass
 
+    @abstractmethod
+    def get_snapshot_as_of(
+        self, epreuve_code: int, sexe: str, as_of: datetime
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        """Get the rankings of the latest snapshot taken at or before a date."""
+        pass
+
     @abstractmethod
     def get_previous_rank(
         self, athlete_id: str, epreuve_code: int, sexe: str, before_date: datetime
@@ -124,6 +145,13 @@ class RankingRepository(ABC):
         """Create multiple rankings."""
         pass
 
+    @abstractmethod
+    def create_from_rows(
+        self, rows: list[RankingRow], snapshot_date: datetime, epreuve_code: int, sexe: str
+    ) -> int:
+        """Store scraped rows as one ranking snapshot."""
+        pass
+
     @abstractmethod
     def get_athlete_history(
         self, athlete_id: str, epreuve_code: int, sexe: str, limit: int = 30
@@ -155,30 +183,47 @@ class FavoriteRepository(ABC):
         """Check if athlete is favorite."""
         pass
 
+    @abstractmethod
+    def get_favorites_index(
+        self, epreuve_code: Optional[int] = None
+    ) -> dict[tuple[str, int], set[int]]:
+        """Get the ids of the users who favorited each (athlete_id, epreuve_code)."""
+        pass
+
 
 class AlertRepository(ABC):
-    """Interface for Alert repository."""
+    """
+    Interface for Alert repository.
+
+    Alerts are stored as one event plus one delivery (read state) per
+    recipient; the data dictionaries list the recipients in ``user_ids``.
+    """
 
     @abstractmethod
-    def create(self, alert_data: dict[str, Any]) -> Alert:
-        """Create alert."""
+    def create(self, alert_data: dict[str, Any]) -> AlertEvent:
+        """Create alert event and its deliveries."""
         pass
 
     @abstractmethod
-    def create_bulk(self, alerts_data: list[dict[str, Any]]) -> list[Alert]:
-        """Create multiple alerts."""
+    def create_bulk(self, alerts_data: list[dict[str, Any]]) -> int:
+        """Create multiple alert events and their deliveries, return the number of deliveries."""
+        pass
+
+    @abstractmethod
+    def get_user_alert(self, user_id: int, alert_id: int) -> Optional[AlertDelivery]:
+        """Get user's alert by (event) ID."""
         pass
 
     @abstractmethod
     def get_user_alerts(
         self, user_id: int, is_read: Optional[bool] = None, limit: int = 50
-    ) -> list[Alert]:
+    ) -> list[AlertDelivery]:
         """Get user's alerts."""
         pass
 
     @abstractmethod
-    def mark_as_read(self, alert_id: int) -> bool:
-        """Mark alert as read."""
+    def mark_as_read(self, user_id: int, alert_id: int) -> bool:
+        """Mark user's alert as read."""
         pass
 
     @abstractmethod
@@ -209,3 +254,401 @@ class ScrapeLogRepository(ABC):
     def get_last_success(self, epreuve_code: int, sexe: str) -> Optional[ScrapeLog]:
         """Get last successful scrape."""
         pass
+
+    @abstractmethod
+    def get_change_history(self, since: datetime) -> list[ScrapeLog]:
+        """Get the success and unchanged scrapes since a date, oldest first."""
+        pass
+
+    @abstractmethod
+    def get_last_failures(self, since: datetime) -> dict[tuple[int, str], datetime]:
+        """Get the date of the last failed scrape of each list since a date."""
+        pass
+
+
+class LeaseRepository(ABC):
+    """Interface for SchedulerLease repository."""
+
+    @abstractmethod
+    def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """Take or renew a lease unless another holder's lease is still valid."""
+        pass
+
+    @abstractmethod
+    def release(self, name: str, holder: str) -> bool:
+        """Give up a lease held by the holder."""
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[SchedulerLease]:
+        """Get the current state of a lease."""
+        pass
+
+
+class ScrapeJobRepository(ABC):
+    """Interface for ScrapeJobRecord repository."""
+
+    @abstractmethod
+    def submit(self, job: ScrapeJobRecord) -> tuple[ScrapeJobRecord, bool]:
+        """Store a new job, or join the job already in flight for its list."""
+        pass
+
+    @abstractmethod
+    def save(self, job: ScrapeJobRecord) -> None:
+        """Store the progress of a job (status, stages, result and dates)."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[ScrapeJobRecord]:
+        """Get job by ID."""
+        pass
+
+    @abstractmethod
+    def get_recent(self, limit: int) -> list[ScrapeJobRecord]:
+        """Get the most recently submitted jobs, most recent first."""
+        pass
+
+    @abstractmethod
+    def get_abandoned(self, updated_before: datetime) -> list[ScrapeJobRecord]:
+        """Get the jobs in flight not updated since a date."""
+        pass
+
+    @abstractmethod
+    def delete_finished(self, keep: int) -> int:
+        """Delete the finished jobs but the most recent ones."""
+        pass
+
+
+class RunReportRepository(ABC):
+    """Interface for ScrapeRunReport repository."""
+
+    @abstractmethod
+    def save(self, name: str, data: dict[str, Any]) -> None:
+        """Store a report, replacing the previous one of the same name."""
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[dict[str, Any]]:
+        """Get the latest report of a name, if any."""
+        pass
+
+
+# Async mirrors of the interfaces above, for repositories on an AsyncSession
+
+
+class AsyncUserRepository(ABC):
+    """Async interface for User repository."""
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        pass
+
+    @abstractmethod
+    async def create(self, user_data: dict[str, Any]) -> User:
+        """Create new user."""
+        pass
+
+    @abstractmethod
+    async def update(self, user_id: int, user_data: dict[str, Any]) -> Optional[User]:
+        """Update user."""
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> bool:
+        """Delete user."""
+        pass
+
+    @abstractmethod
+    async def list_all(self) -> list[User]:
+        """List all users."""
+        pass
+
+    @abstractmethod
+    async def list_active(self) -> list[User]:
+        """List active users."""
+        pass
+
+
+class AsyncEpreuveRepository(ABC):
+    """Async interface for Epreuve repository."""
+
+    @abstractmethod
+    async def get_by_code(self, code: int) -> Optional[Epreuve]:
+        """Get epreuve by code."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, epreuve_id: int) -> Optional[Epreuve]:
+        """Get epreuve by ID."""
+        pass
+
+    @abstractmethod
+    async def list_active(self) -> list[Epreuve]:
+        """List all active epreuves."""
+        pass
+
+    @abstractmethod
+    async def create(self, epreuve_data: dict[str, Any]) -> Epreuve:
+        """Create new epreuve."""
+        pass
+
+    @abstractmethod
+    async def update(self, epreuve_id: int, epreuve_data: dict[str, Any]) -> Optional[Epreuve]:
+        """Update epreuve."""
+        pass
+
+    @abstractmethod
+    async def delete(self, epreuve_id: int) -> bool:
+        """Delete epreuve."""
+        pass
+
+
+class AsyncAthleteRepository(ABC):
+    """Async interface for Athlete repository."""
+
+    @abstractmethod
+    async def get_by_athlete_id(self, athlete_id: str) -> Optional[Athlete]:
+        """Get athlete by athlete_id."""
+        pass
+
+    @abstractmethod
+    async def create(self, athlete_data: dict[str, Any]) -> Athlete:
+        """Create new athlete."""
+        pass
+
+    @abstractmethod
+    async def get_or_create(self, athlete_data: dict[str, Any]) -> Athlete:
+        """Get or create athlete."""
+        pass
+
+    @abstractmethod
+    async def upsert_bulk(self, athletes_data: list[dict[str, Any]]) -> int:
+        """Create the athletes that do not exist yet."""
+        pass
+
+
+class AsyncRankingRepository(ABC):
+    """Async interface for Ranking repository."""
+
+    @abstractmethod
+    async def get_latest_by_epreuve(
+        self, epreuve_code: int, sexe: str
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        """Get latest rankings for an epreuve and gender."""
+        pass
+
+    @abstractmethod
+    async def get_snapshot_as_of(
+        self, epreuve_code: int, sexe: str, as_of: datetime
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        """Get the rankings of the latest snapshot taken at or before a date."""
+        pass
+
+    @abstractmethod
+    async def get_previous_rank(
+        self, athlete_id: str, epreuve_code: int, sexe: str, before_date: datetime
+    ) -> Optional[int]:
+        """Get athlete's previous rank."""
+        pass
+
+    @abstractmethod
+    async def create_bulk(self, rankings_data: list[dict[str, Any]]) -> list[Ranking]:
+        """Create multiple rankings."""
+        pass
+
+    @abstractmethod
+    async def create_from_rows(
+        self, rows: list[RankingRow], snapshot_date: datetime, epreuve_code: int, sexe: str
+    ) -> int:
+        """Store scraped rows as one ranking snapshot."""
+        pass
+
+    @abstractmethod
+    async def get_athlete_history(
+        self, athlete_id: str, epreuve_code: int, sexe: str, limit: int = 30
+    ) -> list[Ranking]:
+        """Get athlete's ranking history."""
+        pass
+
+
+class AsyncFavoriteRepository(ABC):
+    """Async interface for Favorite repository."""
+
+    @abstractmethod
+    async def get_user_favorites(
+        self, user_id: int, epreuve_code: Optional[int] = None
+    ) -> list[Favorite]:
+        """Get user's favorites."""
+        pass
+
+    @abstractmethod
+    async def add_favorite(self, favorite_data: dict[str, Any]) -> Favorite:
+        """Add favorite."""
+        pass
+
+    @abstractmethod
+    async def remove_favorite(self, user_id: int, athlete_id: str, epreuve_code: int) -> bool:
+        """Remove favorite."""
+        pass
+
+    @abstractmethod
+    async def is_favorite(self, user_id: int, athlete_id: str, epreuve_code: int) -> bool:
+        """Check if athlete is favorite."""
+        pass
+
+    @abstractmethod
+    async def get_favorites_index(
+        self, epreuve_code: Optional[int] = None
+    ) -> dict[tuple[str, int], set[int]]:
+        """Get the ids of the users who favorited each (athlete_id, epreuve_code)."""
+        pass
+
+
+class AsyncAlertRepository(ABC):
+    """
+    Async interface for Alert repository.
+
+    Alerts are stored as one event plus one delivery (read state) per
+    recipient; the data dictionaries list the recipients in ``user_ids``.
+    """
+
+    @abstractmethod
+    async def create(self, alert_data: dict[str, Any]) -> AlertEvent:
+        """Create alert event and its deliveries."""
+        pass
+
+    @abstractmethod
+    async def create_bulk(self, alerts_data: list[dict[str, Any]]) -> int:
+        """Create multiple alert events and their deliveries, return the number of deliveries."""
+        pass
+
+    @abstractmethod
+    async def get_user_alert(self, user_id: int, alert_id: int) -> Optional[AlertDelivery]:
+        """Get user's alert by (event) ID."""
+        pass
+
+    @abstractmethod
+    async def get_user_alerts(
+        self, user_id: int, is_read: Optional[bool] = None, limit: int = 50
+    ) -> list[AlertDelivery]:
+        """Get user's alerts."""
+        pass
+
+    @abstractmethod
+    async def mark_as_read(self, user_id: int, alert_id: int) -> bool:
+        """Mark user's alert as read."""
+        pass
+
+    @abstractmethod
+    async def mark_all_as_read(self, user_id: int) -> int:
+        """Mark all user's alerts as read."""
+        pass
+
+    @abstractmethod
+    async def count_unread(self, user_id: int) -> int:
+        """Count unread alerts."""
+        pass
+
+
+class AsyncScrapeLogRepository(ABC):
+    """Async interface for ScrapeLog repository."""
+
+    @abstractmethod
+    async def create(self, log_data: dict[str, Any]) -> ScrapeLog:
+        """Create scrape log."""
+        pass
+
+    @abstractmethod
+    async def get_recent_logs(
+        self, epreuve_code: Optional[int] = None, limit: int = 50
+    ) -> list[ScrapeLog]:
+        """Get recent scrape logs."""
+        pass
+
+    @abstractmethod
+    async def get_last_success(self, epreuve_code: int, sexe: str) -> Optional[ScrapeLog]:
+        """Get last successful scrape."""
+        pass
+
+    @abstractmethod
+    async def get_change_history(self, since: datetime) -> list[ScrapeLog]:
+        """Get the success and unchanged scrapes since a date, oldest first."""
+        pass
+
+    @abstractmethod
+    async def get_last_failures(self, since: datetime) -> dict[tuple[int, str], datetime]:
+        """Get the date of the last failed scrape of each list since a date."""
+        pass
+
+
+class AsyncLeaseRepository(ABC):
+    """Async interface for SchedulerLease repository."""
+
+    @abstractmethod
+    async def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """Take or renew a lease unless another holder's lease is still valid."""
+        pass
+
+    @abstractmethod
+    async def release(self, name: str, holder: str) -> bool:
+        """Give up a lease held by the holder."""
+        pass
+
+    @abstractmethod
+    async def get(self, name: str) -> Optional[SchedulerLease]:
+        """Get the current state of a lease."""
+        pass
+
+
+class AsyncScrapeJobRepository(ABC):
+    """Async interface for ScrapeJobRecord repository."""
+
+    @abstractmethod
+    async def submit(self, job: ScrapeJobRecord) -> tuple[ScrapeJobRecord, bool]:
+        """Store a new job, or join the job already in flight for its list."""
+        pass
+
+    @abstractmethod
+    async def save(self, job: ScrapeJobRecord) -> None:
+        """Store the progress of a job (status, stages, result and dates)."""
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[ScrapeJobRecord]:
+        """Get job by ID."""
+        pass
+
+    @abstractmethod
+    async def get_recent(self, limit: int) -> list[ScrapeJobRecord]:
+        """Get the most recently submitted jobs, most recent first."""
+        pass
+
+    @abstractmethod
+    async def get_abandoned(self, updated_before: datetime) -> list[ScrapeJobRecord]:
+        """Get the jobs in flight not updated since a date."""
+        pass
+
+    @abstractmethod
+    async def delete_finished(self, keep: int) -> int:
+        """Delete the finished jobs but the most recent ones."""
+        pass
+
+
+class AsyncRunReportRepository(ABC):
+    """Async interface for ScrapeRunReport repository."""
+
+    @abstractmethod
+    async def save(self, name: str, data: dict[str, Any]) -> None:
+        """Store a report, replacing the previous one of the same name."""
+        pass
+
+    @abstractmethod
+    async def get(self, name: str) -> Optional[dict[str, Any]]:
+        """Get the latest report of a name, if any."""
+        pass
@@ -0,0 +1,21 @@
+"""Core domain services."""
+
+from .alert_engine import AlertEngine
+from .scrape_planner import (
+    ListFreshness,
+    estimate_change_rate,
+    freshness_from_history,
+    plan_scrapes,
+)
+from .snapshot_diff import ChangeSet, ThresholdEvent, diff_snapshots
+
+__all__ = [
+    "AlertEngine",
+    "ChangeSet",
+    "ThresholdEvent",
+    "diff_snapshots",
+    "ListFreshness",
+    "estimate_change_rate",
+    "freshness_from_history",
+    "plan_scrapes",
+]
@@ -0,0 +1,254 @@
+"""In-memory evaluation of ranking changes into alerts."""
+
+from collections.abc import Collection
+from typing import Any, Optional
+
+import numpy as np
+
+from src.core.interfaces.repositories import FavoriteRepository, UserRepository
+
+from .snapshot_diff import ABSENT, ChangeSet, ThresholdEvent, threshold_event
+
+# (alert_type, title, message) of each threshold crossing
+THRESHOLD_ALERTS: dict[ThresholdEvent, tuple[str, str, str]] = {
+    ThresholdEvent.ENTER_TOP3: (
+        "critique",
+        "🥇 Podium : {name}",
+        "{name} entre dans le Top 3 (rang {new})",
+    ),
+    ThresholdEvent.EXIT_TOP3: (
+        "critique",
+        "⚠️ Podium : {name}",
+        "{name} sort du Top 3 (rang {old} → {new})",
+    ),
+    ThresholdEvent.ENTER_TOP10: (
+        "important",
+        "⭐ Top 10 : {name}",
+        "{name} entre dans le Top 10 (rang {new})",
+    ),
+    ThresholdEvent.EXIT_TOP10: (
+        "important",
+        "📉 Top 10 : {name}",
+        "{name} sort du Top 10 (rang {old} → {new})",
+    ),
+    ThresholdEvent.ENTER_TOP20: (
+        "info",
+        "📊 Top 20 : {name}",
+        "{name} entre dans le Top 20 (rang {new})",
+    ),
+    ThresholdEvent.EXIT_TOP20: (
+        "info",
+        "📉 Top 20 : {name}",
+        "{name} sort du Top 20 (rang {old} → {new})",
+    ),
+}
+
+
+class AlertEngine:
+    """
+    Evaluate ranking changes into alerts without touching the database.
+
+    The active users and a favorites index keyed by (athlete_id,
+    epreuve_code) are loaded once per run with :meth:`load`; every row is
+    then evaluated in memory, instead of listing users for every row and
+    checking each user's favorites one query at a time. Each alert is
+    produced once with the list of its recipients, to be stored as one
+    event and one delivery per user.
+
+    Alert types:
+    - Top 3 (podium): critique
+    - Top 10: important
+    - Top 20: info
+    - Favorites: info
+    """
+
+    def __init__(
+        self,
+        active_user_ids: list[int],
+        favorites_index: dict[tuple[str, int], set[int]],
+    ) -> None:
+        """
+        Initialize engine.
+
+        Args:
+            active_user_ids: Ids of the users receiving alerts, in delivery order
+            favorites_index: User ids who favorited each (athlete_id, epreuve_code)
+        """
+        self.active_user_ids = active_user_ids
+        position = {user_id: i for i, user_id in enumerate(active_user_ids)}
+        # Only active users get favorite alerts, in the same order as the others
+        self.favorites_index: dict[tuple[str, int], tuple[int, ...]] = {
+            key: tuple(sorted((u for u in user_ids if u in position), key=position.__getitem__))
+            for key, user_ids in favorites_index.items()
+        }
+
+    @classmethod
+    def load(
+        cls,
+        user_repo: UserRepository,
+        favorite_repo: FavoriteRepository,
+        epreuve_code: Optional[int] = None,
+    ) -> "AlertEngine":
+        """
+        Load the users and favorites needed for one run (two queries).
+
+        Args:
+            user_repo: User repository
+            favorite_repo: Favorite repository
+            epreuve_code: Only index favorites of this competition
+
+        Returns:
+            Alert engine
+        """
+        active_user_ids = [user.id for user in user_repo.list_active()]
+        return cls(active_user_ids, favorite_repo.get_favorites_index(epreuve_code))
+
+    @classmethod
+    async def load_async(
+        cls, user_repo: Any, favorite_repo: Any, epreuve_code: Optional[int] = None
+    ) -> "AlertEngine":
+        """
+        Load the users and favorites needed for one run from async repositories.
+
+        Args:
+            user_repo: Async user repository
+            favorite_repo: Async favorite repository
+            epreuve_code: Only index favorites of this competition
+
+        Returns:
+            Alert engine
+        """
+        active_user_ids = [user.id for user in await user_repo.list_active()]
+        return cls(active_user_ids, await favorite_repo.get_favorites_index(epreuve_code))
+
+    @staticmethod
+    def _threshold_alert(
+        athlete_name: str, old_rank: Optional[int], new_rank: int, event: ThresholdEvent
+    ) -> Optional[tuple[str, str, str]]:
+        """Get (alert_type, title, message) of a top 3/10/20 crossing, if any."""
+        template = THRESHOLD_ALERTS.get(event)
+        if template is None:
+            return None
+        alert_type, title, message = template
+        return (
+            alert_type,
+            title.format(name=athlete_name),
+            message.format(name=athlete_name, old=old_rank, new=new_rank),
+        )
+
+    def evaluate(
+        self,
+        athlete_id: str,
+        athlete_name: str,
+        old_rank: Optional[int],
+        new_rank: int,
+        epreuve_code: int,
+        sexe: str,
+        event: Optional[ThresholdEvent] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Build the alerts of one ranking change.
+
+        Args:
+            athlete_id: Athlete ID
+            athlete_name: Athlete name
+            old_rank: Previous rank (None if new)
+            new_rank: Current rank
+            epreuve_code: Competition code
+            sexe: Gender
+            event: Threshold crossing, if already computed by a snapshot diff
+
+        Returns:
+            List of alert data dictionaries, one per event with its
+            recipients in ``user_ids``
+        """
+        alerts = []
+
+        def fan_out(user_ids: Collection[int], alert_type: str, title: str, message: str) -> None:
+            if not user_ids:
+                return
+            alerts.append(
+                {
+                    "alert_type": alert_type,
+                    "athlete_id": athlete_id,
+                    "epreuve_code": epreuve_code,
+                    "sexe": sexe,
+                    "title": title,
+                    "message": message,
+                    "old_rank": old_rank,
+                    "new_rank": new_rank,
+                    "user_ids": list(user_ids),
+                }
+            )
+
+        if event is None:
+            event = threshold_event(old_rank, new_rank)
+        threshold_alert = self._threshold_alert(athlete_name, old_rank, new_rank, event)
+        if threshold_alert:
+            fan_out(self.active_user_ids, *threshold_alert)
+
+        # Check Favorites - INFO (for any rank change)
+        if old_rank and old_rank != new_rank:
+            favorite_user_ids = self.favorites_index.get((athlete_id, epreuve_code))
+            if favorite_user_ids:
+                direction = "📈" if new_rank < old_rank else "📉"
+                fan_out(
+                    favorite_user_ids,
+                    "info",
+                    f"{direction} Favori : {athlete_name}",
+                    f"{athlete_name} passe du rang {old_rank} au rang {new_rank}",
+                )
+
+        return alerts
+
+    def evaluate_changes(
+        self, changes: ChangeSet, epreuve_code: int, sexe: str
+    ) -> list[dict[str, Any]]:
+        """
+        Build the alerts of a whole snapshot diff.
+
+        Only the rows crossing a threshold, or favorited athletes changing
+        rank, can produce alerts; the others are skipped without being
+        looked at.
+
+        Args:
+            changes: Diff of the previous and current snapshots
+            epreuve_code: Competition code
+            sexe: Gender
+
+        Returns:
+            List of alert data dictionaries (see :meth:`evaluate`), in row order
+        """
+        # Only favorited athletes can get an alert without crossing a threshold
+        favorited = {
+            athlete_id
+            for (athlete_id, code), user_ids in self.favorites_index.items()
+            if code == epreuve_code and user_ids
+        }
+        is_favorite = np.fromiter(
+            map(favorited.__contains__, changes.athlete_ids), dtype=bool, count=len(changes)
+        )
+        candidates = np.flatnonzero(
+            (changes.events != ThresholdEvent.NONE) | (changes.rank_changed & is_favorite)
+        )
+
+        alerts = []
+        for i, old_rank, new_rank, event in zip(
+            candidates.tolist(),
+            changes.old_ranks[candidates].tolist(),
+            changes.new_ranks[candidates].tolist(),
+            changes.events[candidates].tolist(),
+            strict=True,
+        ):
+            alerts.extend(
+                self.evaluate(
+                    changes.athlete_ids[i],
+                    changes.names[i],
+                    None if old_rank == ABSENT else old_rank,
+                    new_rank,
+                    epreuve_code,
+                    sexe,
+                    ThresholdEvent(event),
+                )
+            )
+        return alerts
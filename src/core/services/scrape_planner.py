@@ -0,0 +1,147 @@
+"""Adaptive scrape planning from the observed change rate of each rankings list."""
+
+import math
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import pairwise
+from typing import Generic, Optional, TypeVar
+
+# Gamma prior on the change rate: one change a week, worth one week of observations
+PRIOR_CHANGES = 1.0
+PRIOR_DAYS = 7.0
+
+SECONDS_PER_DAY = 86400.0
+
+# Identifies a rankings list (e.g. a ScrapeTarget)
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+@dataclass
+class ListFreshness(Generic[KeyT]):
+    """Change rate and last scrape of one rankings list."""
+
+    key: KeyT
+    change_rate: float  # Expected changes per day
+    last_scraped: Optional[datetime] = None
+
+    def age_days(self, now: datetime) -> float:
+        """Get the days since the last scrape (infinite if never scraped)."""
+        if self.last_scraped is None:
+            return math.inf
+        return max(0.0, (now - self.last_scraped).total_seconds() / SECONDS_PER_DAY)
+
+    def change_probability(self, now: datetime) -> float:
+        """Get the probability that the list changed since its last scrape."""
+        return 1.0 - math.exp(-self.change_rate * self.age_days(now))
+
+
+def estimate_change_rate(
+    observations: Sequence[tuple[datetime, bool]],
+    now: datetime,
+    half_life_days: float,
+) -> float:
+    """
+    Estimate the change rate of a list from its scrape history.
+
+    Each scrape after the first is an observation of the interval since
+    the previous one: whether the list changed in it, and its length.
+    Recent observations weigh more (exponential decay), so the rate
+    follows the season. The estimate is the posterior mean of a Gamma
+    prior of one change a week.
+
+    Args:
+        observations: (scrape date, whether the list had changed) of the
+            successful scrapes, in chronological order
+        now: Reference time of the decay
+        half_life_days: Age at which an observation weighs half
+
+    Returns:
+        Expected number of changes per day
+    """
+    changes = PRIOR_CHANGES
+    days = PRIOR_DAYS
+    for (previous, _), (scraped, changed) in pairwise(observations):
+        age = max(0.0, (now - scraped).total_seconds() / SECONDS_PER_DAY)
+        weight = 0.5 ** (age / half_life_days)
+        interval = (scraped - previous).total_seconds() / SECONDS_PER_DAY
+        changes += weight * changed
+        days += weight * interval
+    return changes / days
+
+
+def freshness_from_history(
+    history: Mapping[KeyT, Sequence[tuple[datetime, bool]]],
+    keys: Sequence[KeyT],
+    now: datetime,
+    half_life_days: float,
+    last_failures: Optional[Mapping[KeyT, datetime]] = None,
+) -> list[ListFreshness[KeyT]]:
+    """
+    Build the freshness of lists from their scrape histories.
+
+    A failed scrape is not an observation of the list, but it counts as
+    its last scrape: a list that keeps failing is retried like a list
+    scraped then, instead of staying overdue and taking the budget of
+    every run.
+
+    Args:
+        history: Chronological (scrape date, changed) observations per list
+        keys: Lists to plan (lists without history were never scraped)
+        now: Reference time
+        half_life_days: Half-life of the observations' weight
+        last_failures: Date of the last failed scrape per list, if any
+
+    Returns:
+        Freshness of each list, in the order of ``keys``
+    """
+    last_failures = last_failures or {}
+    freshness = []
+    for key in keys:
+        observations = history.get(key, ())
+        last_scraped = observations[-1][0] if observations else None
+        failed = last_failures.get(key)
+        if failed is not None and (last_scraped is None or failed > last_scraped):
+            last_scraped = failed
+        freshness.append(
+            ListFreshness(
+                key, estimate_change_rate(observations, now, half_life_days), last_scraped
+            )
+        )
+    return freshness
+
+
+def plan_scrapes(
+    lists: Sequence[ListFreshness[KeyT]],
+    now: datetime,
+    budget: int,
+    max_interval_days: float,
+    min_probability: float,
+) -> list[ListFreshness[KeyT]]:
+    """
+    Choose the lists worth scraping now within a budget.
+
+    Lists not scraped for ``max_interval_days`` (or never) come first,
+    oldest first. The rest of the budget goes to the lists most likely to
+    have changed since their last scrape; lists below ``min_probability``
+    are not scraped.
+
+    Args:
+        lists: Freshness of the candidate lists
+        now: Current time
+        budget: Maximum number of lists to scrape
+        max_interval_days: Longest time a list may go without a scrape
+        min_probability: Lowest change probability worth a scrape
+
+    Returns:
+        Lists to scrape, most urgent first
+    """
+    overdue = [f for f in lists if f.age_days(now) >= max_interval_days]
+    overdue.sort(key=lambda f: f.age_days(now), reverse=True)
+    due = [
+        f
+        for f in lists
+        if f.age_days(now) < max_interval_days and f.change_probability(now) >= min_probability
+    ]
+    due.sort(key=lambda f: f.change_probability(now), reverse=True)
+    return (overdue + due)[: max(0, budget)]
@@ -0,0 +1,229 @@
+"""Vectorized diff of two ranking snapshots."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import repeat
+from operator import attrgetter
+from typing import Optional
+
+import numpy as np
+
+from src.core.entities import RankingRow
+
+# Rank code of an athlete absent from a snapshot
+ABSENT = -1
+
+_ATHLETE_ID = attrgetter("athlete_id")
+_NAME = attrgetter("name")
+_RANK = attrgetter("rank")
+
+
+class ThresholdEvent(IntEnum):
+    """Top 3/10/20 crossing of one athlete between two snapshots."""
+
+    NONE = 0
+    ENTER_TOP3 = 1
+    EXIT_TOP3 = 2
+    ENTER_TOP10 = 3
+    EXIT_TOP10 = 4
+    ENTER_TOP20 = 5
+    EXIT_TOP20 = 6
+
+
+def threshold_event(old_rank: Optional[int], new_rank: int) -> ThresholdEvent:
+    """
+    Get the threshold crossing of a single ranking change.
+
+    Only the highest crossed threshold is reported: an athlete going from
+    2nd to 15th exits the podium, not the top 10.
+
+    Args:
+        old_rank: Previous rank (None if new)
+        new_rank: Current rank
+
+    Returns:
+        Threshold event
+    """
+    if new_rank <= 3:
+        if old_rank is None or old_rank > 3:
+            return ThresholdEvent.ENTER_TOP3
+    elif old_rank and old_rank <= 3:
+        return ThresholdEvent.EXIT_TOP3
+    elif new_rank <= 10:
+        if old_rank is None or old_rank > 10:
+            return ThresholdEvent.ENTER_TOP10
+    elif old_rank and old_rank <= 10:
+        return ThresholdEvent.EXIT_TOP10
+    elif new_rank <= 20:
+        if old_rank is None or old_rank > 20:
+            return ThresholdEvent.ENTER_TOP20
+    elif old_rank and old_rank <= 20:
+        return ThresholdEvent.EXIT_TOP20
+    return ThresholdEvent.NONE
+
+
+def threshold_events(old_ranks: np.ndarray, new_ranks: np.ndarray) -> np.ndarray:
+    """
+    Vectorized :func:`threshold_event` over aligned rank arrays.
+
+    Args:
+        old_ranks: Previous ranks (``ABSENT`` if new)
+        new_ranks: Current ranks
+
+    Returns:
+        Array of :class:`ThresholdEvent` codes (int8)
+    """
+    has_old = old_ranks != ABSENT
+    # "old_rank and ...": a previous rank of 0 counts as no rank for exits
+    old_truthy = has_old & (old_ranks != 0)
+
+    # Branches of the if/elif chain, each excluding the previous ones
+    remaining = np.ones(new_ranks.shape, dtype=bool)
+    branches = []
+    for condition in (
+        new_ranks <= 3,
+        old_truthy & (old_ranks <= 3),
+        new_ranks <= 10,
+        old_truthy & (old_ranks <= 10),
+        new_ranks <= 20,
+        old_truthy & (old_ranks <= 20),
+    ):
+        branch = remaining & condition
+        branches.append(branch)
+        remaining &= ~condition
+
+    top3, exit3, top10, exit10, top20, exit20 = branches
+    return np.select(
+        [
+            top3 & (~has_old | (old_ranks > 3)),
+            exit3,
+            top10 & (~has_old | (old_ranks > 10)),
+            exit10,
+            top20 & (~has_old | (old_ranks > 20)),
+            exit20,
+        ],
+        [
+            ThresholdEvent.ENTER_TOP3,
+            ThresholdEvent.EXIT_TOP3,
+            ThresholdEvent.ENTER_TOP10,
+            ThresholdEvent.EXIT_TOP10,
+            ThresholdEvent.ENTER_TOP20,
+            ThresholdEvent.EXIT_TOP20,
+        ],
+        default=ThresholdEvent.NONE,
+    ).astype(np.int8)
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """
+    Differences between a previous and a current snapshot.
+
+    Arrays are aligned on the rows of the current snapshot; dropouts (in
+    the previous snapshot only) are listed separately.
+    """
+
+    athlete_ids: list[str]
+    names: list[str]
+    old_ranks: np.ndarray
+    new_ranks: np.ndarray
+    events: np.ndarray
+    dropout_ids: list[str]
+    dropout_ranks: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.athlete_ids)
+
+    @property
+    def rank_changed(self) -> np.ndarray:
+        """Mask of rows whose (non-zero) previous rank differs from the current one."""
+        changed: np.ndarray = (
+            (self.old_ranks != ABSENT) & (self.old_ranks != 0) & (self.old_ranks != self.new_ranks)
+        )
+        return changed
+
+    @property
+    def new_entrants(self) -> np.ndarray:
+        """Indexes of the rows absent from the previous snapshot."""
+        return np.flatnonzero(self.old_ranks == ABSENT)
+
+    @property
+    def crossings(self) -> np.ndarray:
+        """Indexes of the rows crossing a top 3/10/20 threshold."""
+        return np.flatnonzero(self.events != ThresholdEvent.NONE)
+
+    def old_rank(self, index: int) -> Optional[int]:
+        """Get the previous rank of a row (None if new)."""
+        rank = int(self.old_ranks[index])
+        return None if rank == ABSENT else rank
+
+    def movers(
+        self, limit: int = 10
+    ) -> tuple[list[tuple[str, int, int]], list[tuple[str, int, int]]]:
+        """
+        Get the biggest climbers and fallers.
+
+        Args:
+            limit: Maximum number of athletes in each list
+
+        Returns:
+            Tuple of (climbers, fallers) as (athlete_id, old_rank, new_rank),
+            biggest moves first
+        """
+        moved = np.flatnonzero(self.rank_changed)
+        # Positive delta: places gained
+        deltas = self.old_ranks[moved] - self.new_ranks[moved]
+        order = np.argsort(-deltas, kind="stable")
+
+        def describe(indexes: np.ndarray) -> list[tuple[str, int, int]]:
+            return [
+                (self.athlete_ids[i], int(self.old_ranks[i]), int(self.new_ranks[i]))
+                for i in indexes
+            ]
+
+        climbers = moved[order[deltas[order] > 0]][:limit]
+        fallers = moved[order[::-1][deltas[order[::-1]] < 0]][:limit]
+        return describe(climbers), describe(fallers)
+
+
+def diff_snapshots(previous: Iterable[tuple[str, int]], current: Sequence[RankingRow]) -> ChangeSet:
+    """
+    Align two snapshots on the current rows and diff them.
+
+    Alignment is a single hash lookup per row done in C (``map`` over the
+    previous ranks); every comparison then runs on integer rank arrays.
+
+    Args:
+        previous: (athlete_id, rank) of the previous snapshot (if an athlete
+            appears twice, the last rank wins)
+        current: Rows of the current snapshot
+
+    Returns:
+        Change set
+    """
+    previous_ranks = dict(previous)
+    athlete_ids = list(map(_ATHLETE_ID, current))
+    count = len(athlete_ids)
+
+    old_ranks = np.fromiter(
+        map(previous_ranks.get, athlete_ids, repeat(ABSENT, count)), dtype=np.int32, count=count
+    )
+    new_ranks = np.fromiter(map(_RANK, current), dtype=np.int32, count=count)
+
+    # Dropouts, best previous rank first
+    dropout_ids = list(previous_ranks.keys() - set(athlete_ids))
+    dropout_ranks = np.fromiter(
+        map(previous_ranks.__getitem__, dropout_ids), dtype=np.int32, count=len(dropout_ids)
+    )
+    order = np.argsort(dropout_ranks, kind="stable")
+
+    return ChangeSet(
+        athlete_ids=athlete_ids,
+        names=list(map(_NAME, current)),
+        old_ranks=old_ranks,
+        new_ranks=new_ranks,
+        events=threshold_events(old_ranks, new_ranks),
+        dropout_ids=[dropout_ids[i] for i in order],
+        dropout_ranks=dropout_ranks[order],
+    )
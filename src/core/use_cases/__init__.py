@@ -1,5 +1,21 @@
 """Use cases package."""
 
+from .reingest_archive import ReingestArchiveUseCase
+from .scrape_pipeline import (
+    PipelineMetrics,
+    ScrapePipeline,
+    ScrapeRunSummary,
+    StageMetrics,
+    get_latest_pipeline_metrics,
+)
 from .scrape_rankings import ScrapeRankingsUseCase
 
-__all__ = ["ScrapeRankingsUseCase"]
+__all__ = [
+    "ReingestArchiveUseCase",
+    "ScrapeRankingsUseCase",
+    "ScrapePipeline",
+    "PipelineMetrics",
+    "ScrapeRunSummary",
+    "StageMetrics",
+    "get_latest_pipeline_metrics",
+]
@@ -0,0 +1,68 @@
+"""Use case for re-ingesting archived pages."""
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.use_cases.scrape_rankings import ScrapeRankingsUseCase
+from src.infrastructure.scraper import ArchivedFetch, ArchiveReplayScraper, HtmlArchive
+from src.utils import logger
+
+
+class ReingestArchiveUseCase:
+    """
+    Use case replaying archived fetches through the scraping workflow.
+
+    Each archived fetch is parsed and stored as a snapshot dated at its
+    fetch time, oldest first, exactly as if it had just been scraped.
+    No network access is needed, so a parser change can be backfilled over
+    the whole history at local speed.
+    """
+
+    def __init__(self, session: AsyncSession, archive: HtmlArchive) -> None:
+        """
+        Initialize use case.
+
+        Args:
+            session: Async database session
+            archive: Archive to replay
+        """
+        self.session = session
+        self.archive = archive
+
+    async def execute(
+        self,
+        fetches: list[ArchivedFetch],
+        force: bool = False,
+        generate_alerts: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Replay archived fetches.
+
+        Args:
+            fetches: Archived fetches to replay (see :meth:`HtmlArchive.fetches`)
+            force: Store a snapshot even if the table is unchanged
+            generate_alerts: Create alerts for the replayed ranking changes
+
+        Returns:
+            Result of the scraping workflow for each fetch, in replay order
+        """
+        results = []
+        for fetch in sorted(fetches, key=lambda f: f.fetched_at):
+            scraper = ArchiveReplayScraper(self.archive, fetch)
+            use_case = ScrapeRankingsUseCase(self.session, scraper=scraper)
+            result = await use_case.execute(
+                fetch.epreuve_code,
+                fetch.sexe,
+                fetch.annee,
+                fetch.categorie,
+                snapshot_date=fetch.fetched_at,
+                force=force,
+                generate_alerts=generate_alerts,
+            )
+            result["fetched_at"] = fetch.fetched_at.isoformat()
+            results.append(result)
+
+        replayed = sum(1 for r in results if r["success"])
+        logger.info(f"Re-ingested {replayed}/{len(results)} archived fetches")
+        return results
@@ -0,0 +1,495 @@
+"""Streaming pipeline scraping several rankings lists with overlapping stages."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.entities import RankingRow
+from src.core.use_cases.scrape_rankings import ScrapeRankingsUseCase, is_unchanged
+from src.infrastructure.database.models import Epreuve, ScrapeLog
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget, ScrapingError
+from src.infrastructure.scraper.parse_pool import get_parse_worker_count
+from src.utils import logger
+
+# Stages of the pipeline, in order
+PIPELINE_STAGES = ("fetch", "parse", "persist")
+
+
+@dataclass
+class StageMetrics:
+    """Counters of one pipeline stage."""
+
+    workers: int = 0
+    items: int = 0  # Lists handled by the stage
+    errors: int = 0
+    busy_seconds: float = 0.0  # Summed over the stage's workers
+    queue_depth: int = 0  # Lists waiting for the stage
+    max_queue_depth: int = 0
+
+    def to_dict(self, elapsed_seconds: float) -> dict[str, Any]:
+        """Get the counters, with throughput and utilization over the run's wall time."""
+        capacity = elapsed_seconds * self.workers
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items / elapsed_seconds, 3) if elapsed_seconds else 0.0,
+            "utilization": round(self.busy_seconds / capacity, 3) if capacity else 0.0,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+@dataclass
+class PipelineMetrics:
+    """Per-stage throughput and queue depth of a pipeline run (updated live)."""
+
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    targets: int = 0
+    stages: dict[str, StageMetrics] = field(
+        default_factory=lambda: {stage: StageMetrics() for stage in PIPELINE_STAGES}
+    )
+    _start: float = 0.0
+    _elapsed: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self.started_at is not None and self.finished_at is None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self._elapsed is not None:
+            return self._elapsed
+        return time.monotonic() - self._start if self.started_at else 0.0
+
+    def start(self, targets: int) -> None:
+        self.started_at = datetime.now()
+        self.targets = targets
+        self._start = time.monotonic()
+
+    def finish(self) -> None:
+        self._elapsed = time.monotonic() - self._start
+        self.finished_at = datetime.now()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the metrics as a JSON-serializable dictionary."""
+        elapsed = self.elapsed_seconds
+        return {
+            "running": self.running,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "targets": self.targets,
+            "elapsed_seconds": round(elapsed, 3),
+            "stages": {name: stage.to_dict(elapsed) for name, stage in self.stages.items()},
+        }
+
+
+@dataclass
+class ScrapeRunSummary:
+    """Outcome of a scrape run over several rankings lists."""
+
+    started_at: datetime
+    wall_seconds: float
+    targets: int = 0
+    stored: int = 0
+    unchanged: int = 0
+    # Failed lists whose failure could not be written to the scrape logs
+    unrecorded: int = 0
+    # Time from the start of a list's download to the end of its storage
+    latencies: dict[ScrapeTarget, float] = field(default_factory=dict)
+    failures: dict[ScrapeTarget, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[tuple[ScrapeTarget, dict[str, Any]]],
+        started_at: datetime,
+        wall_seconds: float,
+    ) -> "ScrapeRunSummary":
+        """
+        Summarize the results of a pipeline run.
+
+        Args:
+            results: (target, result) pairs returned by ScrapePipeline.run
+            started_at: Start of the run
+            wall_seconds: Wall time of the whole run
+
+        Returns:
+            Run summary
+        """
+        summary = cls(started_at=started_at, wall_seconds=wall_seconds)
+        for target, result in results:
+            summary.targets += 1
+            if "duration_seconds" in result:
+                summary.latencies[target] = result["duration_seconds"]
+            if not result["success"]:
+                summary.failures[target] = result.get("error") or "Unknown error"
+                if result.get("recorded") is False:
+                    summary.unrecorded += 1
+            elif result.get("unchanged"):
+                summary.unchanged += 1
+            else:
+                summary.stored += 1
+        return summary
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Get a per-list latency percentile (nearest rank), 0 without latencies."""
+        latencies = sorted(self.latencies.values())
+        if not latencies:
+            return 0.0
+        index = max(0, math.ceil(percentile / 100 * len(latencies)) - 1)
+        return latencies[index]
+
+    def slowest(self, count: int = 5) -> list[tuple[ScrapeTarget, float]]:
+        """Get the lists that took the longest, slowest first."""
+        return sorted(self.latencies.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the summary as a JSON-serializable dictionary."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "wall_seconds": round(self.wall_seconds, 2),
+            "targets": self.targets,
+            "stored": self.stored,
+            "unchanged": self.unchanged,
+            "failed": len(self.failures),
+            "unrecorded": self.unrecorded,
+            "latency_seconds": {
+                "p50": self.latency_percentile(50),
+                "p95": self.latency_percentile(95),
+                "max": self.latency_percentile(100),
+            },
+            "slowest": [
+                {"epreuve_code": target.epreuve_code, "sexe": target.sexe, "seconds": seconds}
+                for target, seconds in self.slowest()
+            ],
+            "failures": [
+                {"epreuve_code": target.epreuve_code, "sexe": target.sexe, "error": error}
+                for target, error in self.failures.items()
+            ],
+        }
+
+
+@dataclass
+class _PipelineItem:
+    """One rankings list flowing through the pipeline."""
+
+    target: ScrapeTarget
+    epreuve: Optional[Epreuve]
+    last_success: Optional[ScrapeLog]
+    start_time: float = field(default_factory=time.time)
+    snapshot_date: Optional[datetime] = None
+    pages: list[str] = field(default_factory=list)
+    content_hash: Optional[str] = None
+    rows: Optional[list[RankingRow]] = None
+    unchanged: bool = False
+    error: Optional[str] = None
+
+
+# Metrics of the latest pipeline run of the process
+_latest_metrics: Optional[PipelineMetrics] = None
+
+
+def get_latest_pipeline_metrics() -> Optional[PipelineMetrics]:
+    """Get the metrics of the running or last finished pipeline run, if any."""
+    return _latest_metrics
+
+
+class _MeteredQueue(asyncio.Queue):
+    """Bounded queue reporting its depth to the metrics of the stage reading it."""
+
+    def __init__(self, maxsize: int, metrics: StageMetrics) -> None:
+        super().__init__(maxsize)
+        self.metrics = metrics
+
+    def _put(self, item: Any) -> None:
+        super()._put(item)
+        self.metrics.queue_depth = self.qsize()
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.qsize())
+
+    def _get(self) -> Any:
+        item = super()._get()
+        self.metrics.queue_depth = self.qsize()
+        return item
+
+
+class ScrapePipeline:
+    """
+    Scrape several rankings lists as a fetch -> parse -> persist pipeline.
+
+    Each stage runs its own workers, connected by bounded queues: lists are
+    downloaded (``scraping_target_concurrency`` at a time, through the
+    shared rate limiter), parsed in the parse pool, then stored one at a
+    time by a single writer task owning the database session, which keeps
+    SQLite writes serialized. The next lists are downloaded and parsed
+    while the previous one is being stored; a full queue makes the stage
+    feeding it wait, so at most a few lists of pages are held in memory.
+
+    Lists whose pages have the fingerprint of their last successful scrape
+    skip the parse stage. Each list is committed on its own, so a failing
+    list is recorded in the scrape logs without affecting the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        scraper: Optional[AthleScraper] = None,
+        fetch_workers: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            session_factory: Creates the writer's async session (e.g. ``new_async_session``)
+            scraper: Optional shared scraper (a private one is created and closed if omitted)
+            fetch_workers: Lists downloaded concurrently (default ``scraping_target_concurrency``)
+            parse_workers: Lists parsed concurrently (default: parse pool size)
+            queue_size: Lists waiting between two stages (default
+                ``scraping_pipeline_queue_size``)
+        """
+        self.session_factory = session_factory
+        self.scraper = scraper
+        self.fetch_workers = fetch_workers or settings.scraping_target_concurrency
+        self.parse_workers = parse_workers or get_parse_worker_count()
+        self.queue_size = queue_size or settings.scraping_pipeline_queue_size
+        self.metrics = PipelineMetrics()
+
+    async def run(
+        self,
+        targets: Iterable[ScrapeTarget],
+        force: bool = False,
+        generate_alerts: bool = True,
+    ) -> list[tuple[ScrapeTarget, dict[str, Any]]]:
+        """
+        Scrape and store every target.
+
+        Args:
+            targets: Rankings lists to scrape
+            force: Store the rankings even if a table is unchanged
+            generate_alerts: Create alerts for the ranking changes
+
+        Returns:
+            (target, result of the scraping workflow) of each target, in the
+            order they were stored
+        """
+        global _latest_metrics
+
+        targets = list(targets)
+        self.metrics = PipelineMetrics()
+        _latest_metrics = self.metrics
+        self.metrics.start(len(targets))
+        stages = self.metrics.stages
+        stages["fetch"].workers = self.fetch_workers
+        stages["parse"].workers = self.parse_workers
+        stages["persist"].workers = 1
+
+        scraper = self.scraper or AthleScraper()
+        results: list[tuple[ScrapeTarget, dict[str, Any]]] = []
+        try:
+            async with self.session_factory() as session:
+                use_case = ScrapeRankingsUseCase(session, scraper=scraper)
+                fetch_queue = _MeteredQueue(0, stages["fetch"])
+                parse_queue = _MeteredQueue(self.queue_size, stages["parse"])
+                persist_queue = _MeteredQueue(self.queue_size, stages["persist"])
+
+                # Reads done before the workers start: the session is the writer's
+                for target in targets:
+                    item = await self._load_item(use_case, target)
+                    if item.error:
+                        results.append((target, {"success": False, "error": item.error}))
+                    else:
+                        fetch_queue.put_nowait(item)
+
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(
+                        self._fetch_stage(scraper, force, fetch_queue, parse_queue, persist_queue)
+                    )
+                    group.create_task(self._parse_stage(scraper, parse_queue, persist_queue))
+                    group.create_task(
+                        self._persist_worker(use_case, generate_alerts, persist_queue, results)
+                    )
+        finally:
+            if self.scraper is None:
+                await scraper.aclose()
+            self.metrics.finish()
+
+        logger.info(
+            f"Pipeline stored {len(results)} list(s) in {self.metrics.elapsed_seconds:.1f}s"
+        )
+        return results
+
+    async def _load_item(
+        self, use_case: ScrapeRankingsUseCase, target: ScrapeTarget
+    ) -> _PipelineItem:
+        """Load the competition and last successful scrape of a target."""
+        epreuve = await use_case.epreuve_repo.get_by_code(target.epreuve_code)
+        if not epreuve:
+            logger.error(f"Epreuve with code {target.epreuve_code} not found")
+            return _PipelineItem(
+                target, None, None, error=f"Epreuve {target.epreuve_code} not found"
+            )
+        last_success = await use_case.scrape_log_repo.get_last_success(
+            target.epreuve_code, target.sexe
+        )
+        # Detached: rolling back a failed list must not expire them
+        use_case.session.expunge_all()
+        return _PipelineItem(target, epreuve, last_success)
+
+    async def _fetch_stage(
+        self,
+        scraper: AthleScraper,
+        force: bool,
+        fetch_queue: asyncio.Queue,
+        parse_queue: asyncio.Queue,
+        persist_queue: asyncio.Queue,
+    ) -> None:
+        """Run the fetch workers, then end the parse stage's stream."""
+        async with asyncio.TaskGroup() as group:
+            for _ in range(self.fetch_workers):
+                group.create_task(
+                    self._fetch_worker(scraper, force, fetch_queue, parse_queue, persist_queue)
+                )
+        for _ in range(self.parse_workers):
+            await parse_queue.put(None)
+
+    async def _parse_stage(
+        self, scraper: AthleScraper, parse_queue: asyncio.Queue, persist_queue: asyncio.Queue
+    ) -> None:
+        """Run the parse workers, then end the persist stage's stream."""
+        async with asyncio.TaskGroup() as group:
+            for _ in range(self.parse_workers):
+                group.create_task(self._parse_worker(scraper, parse_queue, persist_queue))
+        await persist_queue.put(None)
+
+    async def _fetch_worker(
+        self,
+        scraper: AthleScraper,
+        force: bool,
+        fetch_queue: asyncio.Queue,
+        parse_queue: asyncio.Queue,
+        persist_queue: asyncio.Queue,
+    ) -> None:
+        """Download the pages of the queued targets and fingerprint them."""
+        metrics = self.metrics.stages["fetch"]
+        while True:
+            try:
+                item = fetch_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.monotonic()
+            target = item.target
+            item.start_time = time.time()
+            item.snapshot_date = datetime.now()
+            try:
+                logger.info(f"Starting scrape for {item.epreuve.nom} ({target.sexe})")
+                item.pages = await scraper.fetch_pages(
+                    target.epreuve_code, target.sexe, target.annee, target.categorie
+                )
+                item.content_hash = await scraper.fingerprint_pages_async(item.pages)
+                item.unchanged = not force and is_unchanged(item.last_success, item.content_hash)
+            except ScrapingError as e:
+                item.error = str(e)
+            except Exception as e:
+                item.error = f"Unexpected error: {str(e)}"
+            self._count(metrics, started, item.error)
+
+            # Failed and unchanged lists have nothing to parse
+            if item.error or item.unchanged:
+                item.pages = []
+                await persist_queue.put(item)
+            else:
+                await parse_queue.put(item)
+
+    async def _parse_worker(
+        self, scraper: AthleScraper, parse_queue: asyncio.Queue, persist_queue: asyncio.Queue
+    ) -> None:
+        """Parse the downloaded pages (in the parse pool) until the end of the stream."""
+        metrics = self.metrics.stages["parse"]
+        while (item := await parse_queue.get()) is not None:
+            started = time.monotonic()
+            try:
+                item.rows = await scraper.parse_pages_async(item.pages)
+            except Exception as e:
+                item.error = f"Unexpected error: {str(e)}"
+            item.pages = []
+            self._count(metrics, started, item.error)
+            await persist_queue.put(item)
+
+    async def _persist_worker(
+        self,
+        use_case: ScrapeRankingsUseCase,
+        generate_alerts: bool,
+        persist_queue: asyncio.Queue,
+        results: list[tuple[ScrapeTarget, dict[str, Any]]],
+    ) -> None:
+        """Store the lists one at a time (the only task writing to the database)."""
+        metrics = self.metrics.stages["persist"]
+        while (item := await persist_queue.get()) is not None:
+            started = time.monotonic()
+            target = item.target
+            try:
+                try:
+                    if item.error:
+                        result = await use_case.record_failure(
+                            target.epreuve_code, target.sexe, item.error, item.start_time
+                        )
+                    elif item.unchanged:
+                        result = await use_case.record_unchanged(
+                            item.epreuve,
+                            target.sexe,
+                            item.last_success,
+                            item.start_time,
+                            item.snapshot_date,
+                        )
+                    else:
+                        result = await use_case.store(
+                            item.epreuve,
+                            target.sexe,
+                            item.rows,
+                            item.snapshot_date,
+                            item.content_hash,
+                            item.start_time,
+                            generate_alerts,
+                        )
+                except Exception as e:
+                    error_msg = f"Unexpected error: {str(e)}"
+                    result = await use_case.record_failure(
+                        target.epreuve_code, target.sexe, error_msg, item.start_time
+                    )
+            except Exception as e:
+                # Not even the failure could be logged (e.g. the database is
+                # unavailable): report the list and go on with the next ones
+                logger.error(f"Could not record the scrape of {target}: {e}")
+                result = {
+                    "success": False,
+                    "recorded": False,
+                    "error": f"Could not record the scrape: {str(e)}",
+                    "duration_seconds": round(time.time() - item.start_time, 2),
+                }
+                try:
+                    await use_case.session.rollback()
+                except Exception as rollback_error:
+                    logger.error(f"Rollback after {target} failed: {rollback_error}")
+            # Keep the identity map from growing with every stored list
+            use_case.session.expunge_all()
+            self._count(metrics, started, None if result["success"] else result["error"])
+            results.append((target, result))
+
+    @staticmethod
+    def _count(metrics: StageMetrics, started: float, error: Optional[str]) -> None:
+        """Count one list handled by a stage."""
+        metrics.items += 1
+        metrics.busy_seconds += time.monotonic() - started
+        if error:
+            metrics.errors += 1
@@ -1,49 +1,78 @@
 """Use case for scraping rankings and generating alerts."""
 
 import time
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
-
-from sqlalchemy.orm import Session
-
-from src.infrastructure.database.repositories import (
-    SQLAlchemyAlertRepository,
-    SQLAlchemyAthleteRepository,
-    SQLAlchemyEpreuveRepository,
-    SQLAlchemyFavoriteRepository,
-    SQLAlchemyRankingRepository,
-    SQLAlchemyScrapeLogRepository,
-    SQLAlchemyUserRepository,
+from typing import Any, Optional, TypeGuard
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.entities import RankingRow
+from src.core.services import AlertEngine, diff_snapshots
+from src.infrastructure.database.async_repositories import (
+    AsyncSQLAlchemyAlertRepository,
+    AsyncSQLAlchemyAthleteRepository,
+    AsyncSQLAlchemyEpreuveRepository,
+    AsyncSQLAlchemyFavoriteRepository,
+    AsyncSQLAlchemyRankingRepository,
+    AsyncSQLAlchemyScrapeLogRepository,
+    AsyncSQLAlchemyUserRepository,
 )
+from src.infrastructure.database.models import Epreuve, ScrapeLog
 from src.infrastructure.scraper import AthleScraper, ScrapingError
 from src.utils import logger
 
 
+def is_unchanged(
+    last_success: Optional[ScrapeLog], content_hash: Optional[str]
+) -> TypeGuard[ScrapeLog]:
+    """Whether scraped pages have the fingerprint of the last successful scrape."""
+    return bool(content_hash and last_success and last_success.content_hash == content_hash)
+
+
 class ScrapeRankingsUseCase:
     """
     Use case for scraping rankings, storing them, and generating alerts.
 
     This orchestrates the entire workflow:
     1. Scrape rankings from athle.fr
-    2. Store athletes and rankings in database
-    3. Compare with previous rankings
-    4. Generate alerts for significant changes
-    5. Log the scraping operation
+    2. Skip the run if the page fingerprint matches the last successful scrape
+    3. Store athletes and rankings in database
+    4. Compare with previous rankings
+    5. Generate alerts for significant changes
+    6. Log the scraping operation
+
+    The persist phase is one unit of work: repositories only flush, and the
+    session is committed once, together with the scrape log. Alerts are
+    written in a savepoint, so failing to store them does not lose the
+    rankings.
     """
 
-    def __init__(self, session: Session) -> None:
-        """Initialize use case with database session."""
+    def __init__(self, session: AsyncSession, scraper: Optional[AthleScraper] = None) -> None:
+        """
+        Initialize use case with database session.
+
+        Args:
+            session: Async database session (see ``new_async_session``); database
+                I/O does not block the event loop, so several runs can overlap
+            scraper: Optional shared scraper (reuses its pooled HTTP client
+                across several executions). A private one is created if omitted.
+        """
         self.session = session
-        self.scraper = AthleScraper()
+        self.scraper = scraper or AthleScraper()
+
+        # Initialize repositories (the run commits once, see _log_scrape)
+        self.epreuve_repo = AsyncSQLAlchemyEpreuveRepository(session, autocommit=False)
+        self.athlete_repo = AsyncSQLAlchemyAthleteRepository(session, autocommit=False)
+        self.ranking_repo = AsyncSQLAlchemyRankingRepository(session, autocommit=False)
+        self.alert_repo = AsyncSQLAlchemyAlertRepository(session, autocommit=False)
+        self.favorite_repo = AsyncSQLAlchemyFavoriteRepository(session, autocommit=False)
+        self.scrape_log_repo = AsyncSQLAlchemyScrapeLogRepository(session, autocommit=False)
+        self.user_repo = AsyncSQLAlchemyUserRepository(session, autocommit=False)
 
-        # Initialize repositories
-        self.epreuve_repo = SQLAlchemyEpreuveRepository(session)
-        self.athlete_repo = SQLAlchemyAthleteRepository(session)
-        self.ranking_repo = SQLAlchemyRankingRepository(session)
-        self.alert_repo = SQLAlchemyAlertRepository(session)
-        self.favorite_repo = SQLAlchemyFavoriteRepository(session)
-        self.scrape_log_repo = SQLAlchemyScrapeLogRepository(session)
-        self.user_repo = SQLAlchemyUserRepository(session)
+        # Users and favorites, loaded once per run
+        self._alert_engine: Optional[AlertEngine] = None
 
     async def execute(
         self,
@@ -51,6 +80,10 @@ class ScrapeRankingsUseCase:
         sexe: str,
         annee: int = 2026,
         categorie: str = "CA",
+        snapshot_date: Optional[datetime] = None,
+        force: bool = False,
+        generate_alerts: bool = True,
+        on_stage: Optional[Callable[[str], None]] = None,
     ) -> dict[str, Any]:
         """
         Execute the scraping workflow.
@@ -60,15 +93,22 @@ class ScrapeRankingsUseCase:
             sexe: Gender (M or F)
             annee: Year (default 2026)
             categorie: Category (default CA for Cadets)
+            snapshot_date: Date of the stored snapshot (default now; set to the
+                fetch time when re-ingesting archived pages)
+            force: Process the rankings even if the table is unchanged
+            generate_alerts: Create alerts for the ranking changes
+            on_stage: Optional callback told the stage the run enters (fetch,
+                parse, persist); parse is skipped when the table is unchanged
 
         Returns:
             Dictionary with scraping results and statistics
         """
+        report_stage = on_stage or (lambda stage: None)
         start_time = time.time()
-        snapshot_date = datetime.now()
+        snapshot_date = snapshot_date or datetime.now()
 
         # Verify epreuve exists
-        epreuve = self.epreuve_repo.get_by_code(epreuve_code)
+        epreuve = await self.epreuve_repo.get_by_code(epreuve_code)
         if not epreuve:
             logger.error(f"Epreuve with code {epreuve_code} not found")
             return {
@@ -79,119 +119,196 @@ class ScrapeRankingsUseCase:
         try:
             # Step 1: Scrape rankings
             logger.info(f"Starting scrape for {epreuve.nom} ({sexe})")
-            scraped_data = await self.scraper.scrape_rankings(
-                epreuve_code, sexe, annee, categorie
+            report_stage("fetch")
+            pages = await self.scraper.fetch_pages(epreuve_code, sexe, annee, categorie)
+
+            # Short-circuit when the table is identical to the last successful scrape
+            content_hash = await self.scraper.fingerprint_pages_async(pages)
+            last_success = await self.scrape_log_repo.get_last_success(epreuve_code, sexe)
+            if not force and is_unchanged(last_success, content_hash):
+                report_stage("persist")
+                return await self.record_unchanged(
+                    epreuve, sexe, last_success, start_time, snapshot_date
+                )
+
+            report_stage("parse")
+            scraped_data = await self.scraper.parse_pages_async(pages)
+            report_stage("persist")
+            return await self.store(
+                epreuve,
+                sexe,
+                scraped_data,
+                snapshot_date,
+                content_hash,
+                start_time,
+                generate_alerts,
             )
 
-            if not scraped_data:
-                logger.warning("No rankings data scraped")
-                self._log_scrape(
-                    epreuve_code, sexe, "partial", 0, time.time() - start_time, "No data found"
-                )
-                return {
-                    "success": False,
-                    "error": "No rankings data found",
-                }
+        except ScrapingError as e:
+            return await self.record_failure(epreuve_code, sexe, str(e), start_time)
 
-            # Step 2: Get previous rankings for comparison
-            prev_date, prev_rankings = self.ranking_repo.get_latest_by_epreuve(
-                epreuve_code, sexe
+        except Exception as e:
+            return await self.record_failure(
+                epreuve_code, sexe, f"Unexpected error: {str(e)}", start_time
             )
-            prev_ranks_map = {r.athlete_id: r.rank for r in prev_rankings} if prev_rankings else {}
-
-            # Step 3: Process athletes and create rankings
-            rankings_to_create = []
-            alerts_to_create = []
-
-            for data in scraped_data:
-                # Get or create athlete
-                athlete = self.athlete_repo.get_or_create(
-                    {
-                        "athlete_id": data["athlete_id"],
-                        "name": data["name"],
-                        "first_seen_date": snapshot_date,
-                    }
-                )
 
-                # Create ranking entry
-                ranking_data = {
-                    "snapshot_date": snapshot_date,
-                    "epreuve_code": epreuve_code,
-                    "sexe": sexe,
-                    "rank": data["rank"],
-                    "athlete_id": data["athlete_id"],
-                    "performance": data["performance"],
-                    "performance_numeric": data["performance_numeric"],
-                    "club": data.get("club"),
-                    "ligue": data.get("ligue"),
-                    "departement": data.get("departement"),
-                }
-                rankings_to_create.append(ranking_data)
-
-                # Generate alerts if rank changed
-                old_rank = prev_ranks_map.get(data["athlete_id"])
-                new_rank = data["rank"]
-
-                alert_data_list = self._check_alerts(
-                    athlete.athlete_id,
-                    athlete.name,
-                    old_rank,
-                    new_rank,
-                    epreuve_code,
-                    sexe,
-                )
-                alerts_to_create.extend(alert_data_list)
+    async def store(
+        self,
+        epreuve: Epreuve,
+        sexe: str,
+        scraped_data: list[RankingRow],
+        snapshot_date: datetime,
+        content_hash: Optional[str],
+        start_time: float,
+        generate_alerts: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Store parsed rankings and their alerts, and commit the run (steps 2 to 6).
 
-            # Step 4: Bulk insert rankings
-            self.ranking_repo.create_bulk(rankings_to_create)
-            logger.info(f"Created {len(rankings_to_create)} ranking entries")
+        Args:
+            epreuve: Scraped competition
+            sexe: Gender (M or F)
+            scraped_data: Parsed ranking rows
+            snapshot_date: Date of the stored snapshot
+            content_hash: Fingerprint of the scraped pages
+            start_time: ``time.time()`` when the run started
+            generate_alerts: Create alerts for the ranking changes
 
-            # Step 5: Create alerts
-            if alerts_to_create:
-                self.alert_repo.create_bulk(alerts_to_create)
-                logger.info(f"Created {len(alerts_to_create)} alerts")
+        Returns:
+            Dictionary with scraping results and statistics
 
-            # Step 6: Log success
-            duration = time.time() - start_time
-            self._log_scrape(
-                epreuve_code, sexe, "success", len(scraped_data), duration, None
+        Raises:
+            Exception: Any database error (the caller records the failure)
+        """
+        epreuve_code = epreuve.code
+        if not scraped_data:
+            logger.warning("No rankings data scraped")
+            await self._log_scrape(
+                epreuve_code, sexe, "partial", 0, time.time() - start_time, "No data found"
             )
-
             return {
-                "success": True,
-                "epreuve": epreuve.nom,
-                "sexe": sexe,
-                "rankings_count": len(scraped_data),
-                "alerts_count": len(alerts_to_create),
-                "duration_seconds": round(duration, 2),
-                "snapshot_date": snapshot_date.isoformat(),
+                "success": False,
+                "error": "No rankings data found",
             }
 
-        except ScrapingError as e:
-            duration = time.time() - start_time
-            error_msg = str(e)
-            logger.error(f"Scraping failed: {error_msg}")
-            self._log_scrape(epreuve_code, sexe, "error", 0, duration, error_msg)
+        # Step 2: Get previous rankings for comparison
+        prev_date, prev_rankings = await self.ranking_repo.get_latest_by_epreuve(
+            epreuve_code, sexe
+        )
+        changes = diff_snapshots(
+            ((r.athlete_id, r.rank) for r in prev_rankings or ()), scraped_data
+        )
+        logger.info(
+            f"{len(changes.new_entrants)} new entrants, {len(changes.dropout_ids)} dropouts, "
+            f"{len(changes.crossings)} threshold crossings"
+        )
 
-            return {
-                "success": False,
-                "error": error_msg,
-                "duration_seconds": round(duration, 2),
-            }
+        # Step 3: Create new athletes in bulk and generate alerts from the diff
+        new_athletes = await self.athlete_repo.upsert_bulk(
+            [
+                {
+                    "athlete_id": row.athlete_id,
+                    "name": row.name,
+                    "first_seen_date": snapshot_date,
+                }
+                for row in scraped_data
+            ]
+        )
+        logger.info(f"Created {new_athletes} new athletes")
 
-        except Exception as e:
-            duration = time.time() - start_time
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(error_msg)
-            self._log_scrape(epreuve_code, sexe, "error", 0, duration, error_msg)
+        alerts_to_create = []
+        if generate_alerts:
+            self._alert_engine = await AlertEngine.load_async(
+                self.user_repo, self.favorite_repo, epreuve_code
+            )
+            alerts_to_create = self._alert_engine.evaluate_changes(changes, epreuve_code, sexe)
 
-            return {
-                "success": False,
-                "error": error_msg,
-                "duration_seconds": round(duration, 2),
-            }
+        # Step 4: Bulk insert rankings
+        created = await self.ranking_repo.create_from_rows(
+            scraped_data, snapshot_date, epreuve_code, sexe
+        )
+        logger.info(f"Created {created} ranking entries")
+
+        # Step 5: Create alerts (one event, one delivery per recipient)
+        alerts_count = await self._create_alerts(alerts_to_create)
+
+        # Step 6: Log success
+        duration = time.time() - start_time
+        await self._log_scrape(
+            epreuve_code, sexe, "success", len(scraped_data), duration, None, content_hash
+        )
+
+        return {
+            "success": True,
+            "unchanged": False,
+            "epreuve": epreuve.nom,
+            "sexe": sexe,
+            "rankings_count": len(scraped_data),
+            "alerts_count": alerts_count,
+            "duration_seconds": round(duration, 2),
+            "snapshot_date": snapshot_date.isoformat(),
+        }
+
+    async def record_unchanged(
+        self,
+        epreuve: Epreuve,
+        sexe: str,
+        last_success: ScrapeLog,
+        start_time: float,
+        snapshot_date: datetime,
+    ) -> dict[str, Any]:
+        """
+        Log a run whose table is identical to the last successful scrape.
+
+        The run is logged with the fingerprint of ``last_success``, which
+        is the one of the scraped pages.
 
-    def _check_alerts(
+        Returns:
+            Dictionary with scraping results (``unchanged`` set)
+        """
+        duration = time.time() - start_time
+        logger.info(f"Rankings unchanged for {epreuve.nom} ({sexe}), skipping")
+        await self._log_scrape(
+            epreuve.code,
+            sexe,
+            "unchanged",
+            last_success.results_count,
+            duration,
+            None,
+            last_success.content_hash,
+        )
+        return {
+            "success": True,
+            "unchanged": True,
+            "epreuve": epreuve.nom,
+            "sexe": sexe,
+            "rankings_count": last_success.results_count,
+            "alerts_count": 0,
+            "duration_seconds": round(duration, 2),
+            "snapshot_date": snapshot_date.isoformat(),
+        }
+
+    async def record_failure(
+        self, epreuve_code: int, sexe: str, error_msg: str, start_time: float
+    ) -> dict[str, Any]:
+        """
+        Discard the partial snapshot of a failed run, then log the failure.
+
+        Returns:
+            Dictionary with the error
+        """
+        await self.session.rollback()
+        duration = time.time() - start_time
+        logger.error(f"Scraping failed: {error_msg}")
+        await self._log_scrape(epreuve_code, sexe, "error", 0, duration, error_msg)
+
+        return {
+            "success": False,
+            "error": error_msg,
+            "duration_seconds": round(duration, 2),
+        }
+
+    async def _check_alerts(
         self,
         athlete_id: str,
         athlete_name: str,
@@ -218,142 +335,33 @@ class ScrapeRankingsUseCase:
             sexe: Gender
 
         Returns:
-            List of alert data dictionaries
+            List of alert data dictionaries, with their recipients in ``user_ids``
         """
-        alerts = []
-
-        # Get all active users for alerts
-        all_users = self.user_repo.list_all()
-        active_users = [u for u in all_users if u.actif]
-
-        # Check Top 3 (Podium) - CRITIQUE
-        if new_rank <= 3:
-            if old_rank is None or old_rank > 3:
-                # Entered podium
-                for user in active_users:
-                    alerts.append(
-                        {
-                            "user_id": user.id,
-                            "alert_type": "critique",
-                            "athlete_id": athlete_id,
-                            "epreuve_code": epreuve_code,
-                            "sexe": sexe,
-                            "title": f"🥇 Podium : {athlete_name}",
-                            "message": f"{athlete_name} entre dans le Top 3 (rang {new_rank})",
-                            "old_rank": old_rank,
-                            "new_rank": new_rank,
-                        }
-                    )
-        elif old_rank and old_rank <= 3:
-            # Exited podium
-            for user in active_users:
-                alerts.append(
-                    {
-                        "user_id": user.id,
-                        "alert_type": "critique",
-                        "athlete_id": athlete_id,
-                        "epreuve_code": epreuve_code,
-                        "sexe": sexe,
-                        "title": f"⚠️ Podium : {athlete_name}",
-                        "message": f"{athlete_name} sort du Top 3 (rang {old_rank} → {new_rank})",
-                        "old_rank": old_rank,
-                        "new_rank": new_rank,
-                    }
-                )
-
-        # Check Top 10 - IMPORTANT
-        elif new_rank <= 10:
-            if old_rank is None or old_rank > 10:
-                # Entered Top 10
-                for user in active_users:
-                    alerts.append(
-                        {
-                            "user_id": user.id,
-                            "alert_type": "important",
-                            "athlete_id": athlete_id,
-                            "epreuve_code": epreuve_code,
-                            "sexe": sexe,
-                            "title": f"⭐ Top 10 : {athlete_name}",
-                            "message": f"{athlete_name} entre dans le Top 10 (rang {new_rank})",
-                            "old_rank": old_rank,
-                            "new_rank": new_rank,
-                        }
-                    )
-        elif old_rank and old_rank <= 10:
-            # Exited Top 10
-            for user in active_users:
-                alerts.append(
-                    {
-                        "user_id": user.id,
-                        "alert_type": "important",
-                        "athlete_id": athlete_id,
-                        "epreuve_code": epreuve_code,
-                        "sexe": sexe,
-                        "title": f"📉 Top 10 : {athlete_name}",
-                        "message": f"{athlete_name} sort du Top 10 (rang {old_rank} → {new_rank})",
-                        "old_rank": old_rank,
-                        "new_rank": new_rank,
-                    }
-                )
+        if self._alert_engine is None:
+            self._alert_engine = await AlertEngine.load_async(self.user_repo, self.favorite_repo)
+        return self._alert_engine.evaluate(
+            athlete_id, athlete_name, old_rank, new_rank, epreuve_code, sexe
+        )
 
-        # Check Top 20 - INFO
-        elif new_rank <= 20:
-            if old_rank is None or old_rank > 20:
-                # Entered Top 20
-                for user in active_users:
-                    alerts.append(
-                        {
-                            "user_id": user.id,
-                            "alert_type": "info",
-                            "athlete_id": athlete_id,
-                            "epreuve_code": epreuve_code,
-                            "sexe": sexe,
-                            "title": f"📊 Top 20 : {athlete_name}",
-                            "message": f"{athlete_name} entre dans le Top 20 (rang {new_rank})",
-                            "old_rank": old_rank,
-                            "new_rank": new_rank,
-                        }
-                    )
-        elif old_rank and old_rank <= 20:
-            # Exited Top 20
-            for user in active_users:
-                alerts.append(
-                    {
-                        "user_id": user.id,
-                        "alert_type": "info",
-                        "athlete_id": athlete_id,
-                        "epreuve_code": epreuve_code,
-                        "sexe": sexe,
-                        "title": f"📉 Top 20 : {athlete_name}",
-                        "message": f"{athlete_name} sort du Top 20 (rang {old_rank} → {new_rank})",
-                        "old_rank": old_rank,
-                        "new_rank": new_rank,
-                    }
-                )
+    async def _create_alerts(self, alerts_data: list[dict[str, Any]]) -> int:
+        """
+        Store alerts in a savepoint of the run's transaction.
 
-        # Check Favorites - INFO (for any rank change)
-        if old_rank and old_rank != new_rank:
-            # Get users who favorited this athlete
-            for user in active_users:
-                if self.favorite_repo.is_favorite(user.id, athlete_id, epreuve_code):
-                    direction = "📈" if new_rank < old_rank else "📉"
-                    alerts.append(
-                        {
-                            "user_id": user.id,
-                            "alert_type": "info",
-                            "athlete_id": athlete_id,
-                            "epreuve_code": epreuve_code,
-                            "sexe": sexe,
-                            "title": f"{direction} Favori : {athlete_name}",
-                            "message": f"{athlete_name} passe du rang {old_rank} au rang {new_rank}",
-                            "old_rank": old_rank,
-                            "new_rank": new_rank,
-                        }
-                    )
-
-        return alerts
-
-    def _log_scrape(
+        Returns:
+            Number of deliveries created (0 if storing the alerts failed)
+        """
+        if not alerts_data:
+            return 0
+        try:
+            async with self.session.begin_nested():
+                alerts_count = await self.alert_repo.create_bulk(alerts_data)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to store alerts, keeping the rankings: {e}")
+            return 0
+        logger.info(f"Created {len(alerts_data)} alert events ({alerts_count} deliveries)")
+        return alerts_count
+
+    async def _log_scrape(
         self,
         epreuve_code: int,
         sexe: str,
@@ -361,9 +369,10 @@ class ScrapeRankingsUseCase:
         results_count: int,
         duration_seconds: float,
         error_message: str | None,
+        content_hash: str | None = None,
     ) -> None:
-        """Log scraping operation."""
-        self.scrape_log_repo.create(
+        """Log scraping operation and commit the run."""
+        await self.scrape_log_repo.create(
             {
                 "epreuve_code": epreuve_code,
                 "sexe": sexe,
@@ -371,5 +380,7 @@ class ScrapeRankingsUseCase:
                 "results_count": results_count,
                 "duration_seconds": duration_seconds,
                 "error_message": error_message,
+                "content_hash": content_hash,
             }
         )
+        await self.session.commit()
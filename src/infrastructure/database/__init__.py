@@ -1,7 +1,21 @@
 """Database infrastructure package."""
 
 from .connection import SessionLocal, engine, get_db, get_db_session, init_db
-from .models import Alert, Athlete, Base, Epreuve, Favorite, Ranking, ScrapeLog, User
+from .models import (
+    AlertDelivery,
+    AlertEvent,
+    Athlete,
+    Base,
+    Epreuve,
+    Favorite,
+    Ranking,
+    RankingSnapshot,
+    SchedulerLease,
+    ScrapeJobRecord,
+    ScrapeLog,
+    ScrapeRunReport,
+    User,
+)
 
 __all__ = [
     "Base",
@@ -9,9 +23,14 @@ __all__ = [
     "Epreuve",
     "Athlete",
     "Ranking",
+    "RankingSnapshot",
     "Favorite",
-    "Alert",
+    "AlertEvent",
+    "AlertDelivery",
     "ScrapeLog",
+    "SchedulerLease",
+    "ScrapeJobRecord",
+    "ScrapeRunReport",
     "engine",
     "SessionLocal",
     "get_db",
@@ -0,0 +1,344 @@
+"""Async implementations of repositories on SQLAlchemy's asyncio extension."""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Generic, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.entities import RankingRow
+from src.core.interfaces.repositories import (
+    AsyncAlertRepository,
+    AsyncAthleteRepository,
+    AsyncEpreuveRepository,
+    AsyncFavoriteRepository,
+    AsyncLeaseRepository,
+    AsyncRankingRepository,
+    AsyncRunReportRepository,
+    AsyncScrapeJobRepository,
+    AsyncScrapeLogRepository,
+    AsyncUserRepository,
+)
+from src.infrastructure.database.models import (
+    AlertDelivery,
+    AlertEvent,
+    Athlete,
+    Epreuve,
+    Favorite,
+    Ranking,
+    SchedulerLease,
+    ScrapeJobRecord,
+    ScrapeLog,
+    User,
+)
+from src.infrastructure.database.repositories import (
+    SQLAlchemyAlertRepository,
+    SQLAlchemyAthleteRepository,
+    SQLAlchemyEpreuveRepository,
+    SQLAlchemyFavoriteRepository,
+    SQLAlchemyLeaseRepository,
+    SQLAlchemyRankingRepository,
+    SQLAlchemyRepository,
+    SQLAlchemyRunReportRepository,
+    SQLAlchemyScrapeJobRepository,
+    SQLAlchemyScrapeLogRepository,
+    SQLAlchemyUserRepository,
+)
+
+SyncRepositoryT = TypeVar("SyncRepositoryT", bound=SQLAlchemyRepository)
+T = TypeVar("T")
+
+
+class AsyncSQLAlchemyRepository(Generic[SyncRepositoryT]):
+    """
+    Base of the async repositories.
+
+    Each method awaits the matching method of the sync repository through
+    :meth:`AsyncSession.run_sync`: the queries are shared with the sync
+    implementations, and the database I/O runs on the async driver.
+    Building the statements and hydrating the ORM objects still happen on
+    the event loop (inside ``run_sync``), so a large read or write does
+    not block it for the round trips, but still holds it for that CPU
+    work. Returned objects are fully loaded, as lazy loading is not
+    available outside ``run_sync``.
+    """
+
+    # Sync repository holding the query logic
+    sync_repository: type[SyncRepositoryT]
+
+    def __init__(self, session: AsyncSession, autocommit: bool = True) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            session: Async database session (use ``expire_on_commit=False``)
+            autocommit: Commit after each write (flush only if False)
+        """
+        self.session = session
+        self.autocommit = autocommit
+
+    async def _run(self, call: Callable[[SyncRepositoryT], T]) -> T:
+        """Await a call on the sync repository bound to the session's sync facade."""
+
+        def run(sync_session: Session) -> T:
+            return call(self.sync_repository(sync_session, autocommit=self.autocommit))
+
+        return await self.session.run_sync(run)
+
+
+class AsyncSQLAlchemyUserRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyUserRepository], AsyncUserRepository
+):
+    """Async implementation of UserRepository."""
+
+    sync_repository = SQLAlchemyUserRepository
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._run(lambda repo: repo.get_by_email(email))
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return await self._run(lambda repo: repo.get_by_id(user_id))
+
+    async def create(self, user_data: dict[str, Any]) -> User:
+        return await self._run(lambda repo: repo.create(user_data))
+
+    async def update(self, user_id: int, user_data: dict[str, Any]) -> Optional[User]:
+        return await self._run(lambda repo: repo.update(user_id, user_data))
+
+    async def delete(self, user_id: int) -> bool:
+        return await self._run(lambda repo: repo.delete(user_id))
+
+    async def list_all(self) -> list[User]:
+        return await self._run(lambda repo: repo.list_all())
+
+    async def list_active(self) -> list[User]:
+        return await self._run(lambda repo: repo.list_active())
+
+
+class AsyncSQLAlchemyEpreuveRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyEpreuveRepository], AsyncEpreuveRepository
+):
+    """Async implementation of EpreuveRepository."""
+
+    sync_repository = SQLAlchemyEpreuveRepository
+
+    async def get_by_code(self, code: int) -> Optional[Epreuve]:
+        return await self._run(lambda repo: repo.get_by_code(code))
+
+    async def get_by_id(self, epreuve_id: int) -> Optional[Epreuve]:
+        return await self._run(lambda repo: repo.get_by_id(epreuve_id))
+
+    async def list_active(self) -> list[Epreuve]:
+        return await self._run(lambda repo: repo.list_active())
+
+    async def create(self, epreuve_data: dict[str, Any]) -> Epreuve:
+        return await self._run(lambda repo: repo.create(epreuve_data))
+
+    async def update(self, epreuve_id: int, epreuve_data: dict[str, Any]) -> Optional[Epreuve]:
+        return await self._run(lambda repo: repo.update(epreuve_id, epreuve_data))
+
+    async def delete(self, epreuve_id: int) -> bool:
+        return await self._run(lambda repo: repo.delete(epreuve_id))
+
+
+class AsyncSQLAlchemyAthleteRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyAthleteRepository], AsyncAthleteRepository
+):
+    """Async implementation of AthleteRepository."""
+
+    sync_repository = SQLAlchemyAthleteRepository
+
+    async def get_by_athlete_id(self, athlete_id: str) -> Optional[Athlete]:
+        return await self._run(lambda repo: repo.get_by_athlete_id(athlete_id))
+
+    async def create(self, athlete_data: dict[str, Any]) -> Athlete:
+        return await self._run(lambda repo: repo.create(athlete_data))
+
+    async def get_or_create(self, athlete_data: dict[str, Any]) -> Athlete:
+        return await self._run(lambda repo: repo.get_or_create(athlete_data))
+
+    async def upsert_bulk(self, athletes_data: list[dict[str, Any]]) -> int:
+        return await self._run(lambda repo: repo.upsert_bulk(athletes_data))
+
+
+class AsyncSQLAlchemyRankingRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyRankingRepository], AsyncRankingRepository
+):
+    """Async implementation of RankingRepository."""
+
+    sync_repository = SQLAlchemyRankingRepository
+
+    async def get_latest_by_epreuve(
+        self, epreuve_code: int, sexe: str
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        return await self._run(lambda repo: repo.get_latest_by_epreuve(epreuve_code, sexe))
+
+    async def get_snapshot_as_of(
+        self, epreuve_code: int, sexe: str, as_of: datetime
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        return await self._run(lambda repo: repo.get_snapshot_as_of(epreuve_code, sexe, as_of))
+
+    async def get_previous_rank(
+        self, athlete_id: str, epreuve_code: int, sexe: str, before_date: datetime
+    ) -> Optional[int]:
+        return await self._run(
+            lambda repo: repo.get_previous_rank(athlete_id, epreuve_code, sexe, before_date)
+        )
+
+    async def create_bulk(self, rankings_data: list[dict[str, Any]]) -> list[Ranking]:
+        return await self._run(lambda repo: repo.create_bulk(rankings_data))
+
+    async def create_from_rows(
+        self, rows: list[RankingRow], snapshot_date: datetime, epreuve_code: int, sexe: str
+    ) -> int:
+        return await self._run(
+            lambda repo: repo.create_from_rows(rows, snapshot_date, epreuve_code, sexe)
+        )
+
+    async def get_athlete_history(
+        self, athlete_id: str, epreuve_code: int, sexe: str, limit: int = 30
+    ) -> list[Ranking]:
+        return await self._run(
+            lambda repo: repo.get_athlete_history(athlete_id, epreuve_code, sexe, limit)
+        )
+
+
+class AsyncSQLAlchemyFavoriteRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyFavoriteRepository], AsyncFavoriteRepository
+):
+    """Async implementation of FavoriteRepository."""
+
+    sync_repository = SQLAlchemyFavoriteRepository
+
+    async def get_user_favorites(
+        self, user_id: int, epreuve_code: Optional[int] = None
+    ) -> list[Favorite]:
+        return await self._run(lambda repo: repo.get_user_favorites(user_id, epreuve_code))
+
+    async def add_favorite(self, favorite_data: dict[str, Any]) -> Favorite:
+        return await self._run(lambda repo: repo.add_favorite(favorite_data))
+
+    async def remove_favorite(self, user_id: int, athlete_id: str, epreuve_code: int) -> bool:
+        return await self._run(lambda repo: repo.remove_favorite(user_id, athlete_id, epreuve_code))
+
+    async def is_favorite(self, user_id: int, athlete_id: str, epreuve_code: int) -> bool:
+        return await self._run(lambda repo: repo.is_favorite(user_id, athlete_id, epreuve_code))
+
+    async def get_favorites_index(
+        self, epreuve_code: Optional[int] = None
+    ) -> dict[tuple[str, int], set[int]]:
+        return await self._run(lambda repo: repo.get_favorites_index(epreuve_code))
+
+
+class AsyncSQLAlchemyAlertRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyAlertRepository], AsyncAlertRepository
+):
+    """Async implementation of AlertRepository."""
+
+    sync_repository = SQLAlchemyAlertRepository
+
+    async def create(self, alert_data: dict[str, Any]) -> AlertEvent:
+        return await self._run(lambda repo: repo.create(alert_data))
+
+    async def create_bulk(self, alerts_data: list[dict[str, Any]]) -> int:
+        return await self._run(lambda repo: repo.create_bulk(alerts_data))
+
+    async def get_user_alert(self, user_id: int, alert_id: int) -> Optional[AlertDelivery]:
+        return await self._run(lambda repo: repo.get_user_alert(user_id, alert_id))
+
+    async def get_user_alerts(
+        self, user_id: int, is_read: Optional[bool] = None, limit: int = 50
+    ) -> list[AlertDelivery]:
+        return await self._run(lambda repo: repo.get_user_alerts(user_id, is_read, limit))
+
+    async def mark_as_read(self, user_id: int, alert_id: int) -> bool:
+        return await self._run(lambda repo: repo.mark_as_read(user_id, alert_id))
+
+    async def mark_all_as_read(self, user_id: int) -> int:
+        return await self._run(lambda repo: repo.mark_all_as_read(user_id))
+
+    async def count_unread(self, user_id: int) -> int:
+        return await self._run(lambda repo: repo.count_unread(user_id))
+
+
+class AsyncSQLAlchemyScrapeLogRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyScrapeLogRepository], AsyncScrapeLogRepository
+):
+    """Async implementation of ScrapeLogRepository."""
+
+    sync_repository = SQLAlchemyScrapeLogRepository
+
+    async def create(self, log_data: dict[str, Any]) -> ScrapeLog:
+        return await self._run(lambda repo: repo.create(log_data))
+
+    async def get_recent_logs(
+        self, epreuve_code: Optional[int] = None, limit: int = 50
+    ) -> list[ScrapeLog]:
+        return await self._run(lambda repo: repo.get_recent_logs(epreuve_code, limit))
+
+    async def get_last_success(self, epreuve_code: int, sexe: str) -> Optional[ScrapeLog]:
+        return await self._run(lambda repo: repo.get_last_success(epreuve_code, sexe))
+
+    async def get_change_history(self, since: datetime) -> list[ScrapeLog]:
+        return await self._run(lambda repo: repo.get_change_history(since))
+
+    async def get_last_failures(self, since: datetime) -> dict[tuple[int, str], datetime]:
+        return await self._run(lambda repo: repo.get_last_failures(since))
+
+
+class AsyncSQLAlchemyLeaseRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyLeaseRepository], AsyncLeaseRepository
+):
+    """Async implementation of LeaseRepository."""
+
+    sync_repository = SQLAlchemyLeaseRepository
+
+    async def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        return await self._run(lambda repo: repo.acquire(name, holder, ttl_seconds))
+
+    async def release(self, name: str, holder: str) -> bool:
+        return await self._run(lambda repo: repo.release(name, holder))
+
+    async def get(self, name: str) -> Optional[SchedulerLease]:
+        return await self._run(lambda repo: repo.get(name))
+
+
+class AsyncSQLAlchemyRunReportRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyRunReportRepository], AsyncRunReportRepository
+):
+    """Async implementation of RunReportRepository."""
+
+    sync_repository = SQLAlchemyRunReportRepository
+
+    async def save(self, name: str, data: dict[str, Any]) -> None:
+        await self._run(lambda repo: repo.save(name, data))
+
+    async def get(self, name: str) -> Optional[dict[str, Any]]:
+        return await self._run(lambda repo: repo.get(name))
+
+
+class AsyncSQLAlchemyScrapeJobRepository(
+    AsyncSQLAlchemyRepository[SQLAlchemyScrapeJobRepository], AsyncScrapeJobRepository
+):
+    """Async implementation of ScrapeJobRepository."""
+
+    sync_repository = SQLAlchemyScrapeJobRepository
+
+    async def submit(self, job: ScrapeJobRecord) -> tuple[ScrapeJobRecord, bool]:
+        return await self._run(lambda repo: repo.submit(job))
+
+    async def save(self, job: ScrapeJobRecord) -> None:
+        await self._run(lambda repo: repo.save(job))
+
+    async def get(self, job_id: str) -> Optional[ScrapeJobRecord]:
+        return await self._run(lambda repo: repo.get(job_id))
+
+    async def get_recent(self, limit: int) -> list[ScrapeJobRecord]:
+        return await self._run(lambda repo: repo.get_recent(limit))
+
+    async def get_abandoned(self, updated_before: datetime) -> list[ScrapeJobRecord]:
+        return await self._run(lambda repo: repo.get_abandoned(updated_before))
+
+    async def delete_finished(self, keep: int) -> int:
+        return await self._run(lambda repo: repo.delete_finished(keep))
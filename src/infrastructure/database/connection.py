@@ -1,9 +1,13 @@
 """Database connection and session management."""
 
-from contextlib import contextmanager
-from typing import Generator
+import asyncio
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import settings
@@ -26,6 +30,77 @@ SessionLocal = sessionmaker(
 )
 
 
+# Async drivers of the supported database URLs
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+# One async engine per event loop: pooled async connections are bound to
+# the loop that opened them
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Get the async driver URL of a database URL.
+
+    Args:
+        database_url: Sync database URL (e.g. sqlite:///./athle_tracker.db)
+
+    Returns:
+        Same database with its async driver (e.g. sqlite+aiosqlite:///./athle_tracker.db)
+
+    Raises:
+        ValueError: If the database has no known async driver
+    """
+    url = make_url(database_url)
+    if url.drivername in ASYNC_DRIVERS.values():
+        return database_url
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.drivername}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine of the running event loop (created on first use).
+
+    Returns:
+        Async engine
+    """
+    loop = asyncio.get_running_loop()
+    async_engine = _async_engines.get(loop)
+    if async_engine is None:
+        async_engine = create_async_engine(
+            get_async_database_url(settings.database_url),
+            echo=settings.debug,
+            pool_pre_ping=True,
+        )
+        _async_engines[loop] = async_engine
+    return async_engine
+
+
+def new_async_session() -> AsyncSession:
+    """
+    Create an async session on the running loop's engine.
+
+    Objects are not expired on commit: they cannot be lazily reloaded
+    outside of the session's I/O calls.
+    """
+    return AsyncSession(get_async_engine(), expire_on_commit=False)
+
+
+async def dispose_async_engine() -> None:
+    """Close the connections of the running loop's async engine (before the loop ends)."""
+    async_engine = _async_engines.pop(asyncio.get_running_loop(), None)
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables.
@@ -35,12 +110,131 @@ def init_db() -> None:
     try:
         logger.info("Initializing database...")
         Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
+        _migrate_legacy_alerts()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 
+def _add_missing_columns() -> None:
+    """
+    Add nullable columns declared on models but missing from existing tables.
+
+    ``create_all`` only creates missing tables, so databases created by an
+    older version would lack newly added optional columns.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+                )
+                logger.info(f"Added missing column {table.name}.{column.name}")
+
+
+# Columns identifying one alert event in the legacy per-user alerts table
+_LEGACY_ALERT_EVENT_COLUMNS = (
+    "created_at",
+    "alert_type",
+    "athlete_id",
+    "epreuve_code",
+    "sexe",
+    "title",
+    "message",
+    "old_rank",
+    "new_rank",
+)
+
+
+def _migrate_legacy_alerts() -> None:
+    """
+    Move alerts from the legacy ``alerts`` table (one full row per user).
+
+    Identical rows are merged into one alert event with one delivery per
+    user, which stays unread if any of the user's copies was unread. Rows
+    are grouped with a window function and every join goes through an
+    integer key, so the migration stays linear in the size of the table.
+    The legacy table is dropped in the same transaction, once the number
+    of events and deliveries written matches the groups found; otherwise
+    the migration is rolled back and the table kept.
+
+    Raises:
+        RuntimeError: If the migrated rows do not match the legacy groups
+    """
+    if "alerts" not in inspect(engine).get_table_names():
+        return
+
+    columns = ", ".join(_LEGACY_ALERT_EVENT_COLUMNS)
+    legacy_columns = ", ".join(f"a.{c}" for c in _LEGACY_ALERT_EVENT_COLUMNS)
+    with engine.begin() as connection:
+        # Each legacy row with the id of the first row of its event
+        connection.execute(
+            text(
+                "CREATE TEMP TABLE legacy_alert_groups AS "
+                "SELECT id, user_id, is_read, "
+                f"MIN(id) OVER (PARTITION BY {columns}) AS first_id FROM alerts"
+            )
+        )
+        # New event id of each group, numbered after the existing events
+        connection.execute(
+            text(
+                "CREATE TEMP TABLE legacy_alert_events "
+                "(first_id INTEGER PRIMARY KEY, event_id INTEGER NOT NULL)"
+            )
+        )
+        expected_events = connection.execute(
+            text(
+                "INSERT INTO legacy_alert_events (first_id, event_id) "
+                "SELECT first_id, (SELECT COALESCE(MAX(id), 0) FROM alert_events) "
+                "+ ROW_NUMBER() OVER (ORDER BY first_id) "
+                "FROM (SELECT DISTINCT first_id FROM legacy_alert_groups)"
+            )
+        ).rowcount
+        expected_deliveries = connection.execute(
+            text(
+                "SELECT COUNT(*) FROM "
+                "(SELECT DISTINCT first_id, user_id FROM legacy_alert_groups)"
+            )
+        ).scalar_one()
+
+        events = connection.execute(
+            text(
+                f"INSERT INTO alert_events (id, {columns}) "
+                f"SELECT m.event_id, {legacy_columns} FROM legacy_alert_events m "
+                "JOIN alerts a ON a.id = m.first_id ORDER BY m.event_id"
+            )
+        ).rowcount
+        deliveries = connection.execute(
+            text(
+                "INSERT INTO alert_deliveries (event_id, user_id, is_read) "
+                "SELECT m.event_id, g.user_id, MIN(g.is_read) FROM legacy_alert_groups g "
+                "JOIN legacy_alert_events m ON m.first_id = g.first_id "
+                "GROUP BY m.event_id, g.user_id ORDER BY MIN(g.id)"
+            )
+        ).rowcount
+
+        if (events, deliveries) != (expected_events, expected_deliveries):
+            raise RuntimeError(
+                f"Legacy alerts migration wrote {events} events and {deliveries} deliveries, "
+                f"expected {expected_events} and {expected_deliveries}; alerts table kept"
+            )
+        connection.execute(text("DROP TABLE legacy_alert_groups"))
+        connection.execute(text("DROP TABLE legacy_alert_events"))
+        connection.execute(text("DROP TABLE alerts"))
+    logger.info(f"Migrated {deliveries} legacy alerts into {events} alert events")
+
+
 def drop_db() -> None:
     """
     Drop all database tables.
@@ -80,6 +274,25 @@ def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for database sessions.
+
+    Yields:
+        Async database session (committed on exit, rolled back on error)
+    """
+    session = new_async_session()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -47,8 +48,8 @@ class User(Base):
     favorites: Mapped[list["Favorite"]] = relationship(
         "Favorite", back_populates="user", cascade="all, delete-orphan"
     )
-    alerts: Mapped[list["Alert"]] = relationship(
-        "Alert", back_populates="user", cascade="all, delete-orphan"
+    alert_deliveries: Mapped[list["AlertDelivery"]] = relationship(
+        "AlertDelivery", back_populates="user", cascade="all, delete-orphan"
     )
 
     def __repr__(self) -> str:
@@ -75,11 +76,14 @@ class Epreuve(Base):
     rankings: Mapped[list["Ranking"]] = relationship(
         "Ranking", back_populates="epreuve", cascade="all, delete-orphan"
     )
+    ranking_snapshots: Mapped[list["RankingSnapshot"]] = relationship(
+        "RankingSnapshot", back_populates="epreuve", cascade="all, delete-orphan"
+    )
     favorites: Mapped[list["Favorite"]] = relationship(
         "Favorite", back_populates="epreuve", cascade="all, delete-orphan"
     )
-    alerts: Mapped[list["Alert"]] = relationship(
-        "Alert", back_populates="epreuve", cascade="all, delete-orphan"
+    alert_events: Mapped[list["AlertEvent"]] = relationship(
+        "AlertEvent", back_populates="epreuve", cascade="all, delete-orphan"
     )
     scrape_logs: Mapped[list["ScrapeLog"]] = relationship(
         "ScrapeLog", back_populates="epreuve", cascade="all, delete-orphan"
@@ -114,8 +118,8 @@ class Athlete(Base):
     favorites: Mapped[list["Favorite"]] = relationship(
         "Favorite", back_populates="athlete", cascade="all, delete-orphan"
     )
-    alerts: Mapped[list["Alert"]] = relationship(
-        "Alert", back_populates="athlete", cascade="all, delete-orphan"
+    alert_events: Mapped[list["AlertEvent"]] = relationship(
+        "AlertEvent", back_populates="athlete", cascade="all, delete-orphan"
     )
 
     def __repr__(self) -> str:
@@ -123,7 +127,13 @@ class Athlete(Base):
 
 
 class Ranking(Base):
-    """Ranking snapshot for a specific date, event, and gender."""
+    """
+    Ranking row of a snapshot for a specific date, event, and gender.
+
+    In a delta snapshot (see :class:`RankingSnapshot`), a row with
+    ``removed`` set is a tombstone: the athlete left the list since the
+    base snapshot (its rank and performance are meaningless).
+    """
 
     __tablename__ = "rankings"
 
@@ -145,6 +155,7 @@ class Ranking(Base):
     club: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     ligue: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     departement: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    removed: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=func.now(), server_default=func.now()
     )
@@ -163,6 +174,59 @@ class Ranking(Base):
         return f"<Ranking(id={self.id}, rank={self.rank}, athlete_id='{self.athlete_id}', performance='{self.performance}')>"
 
 
+class RankingSnapshot(Base):
+    """
+    Header of one stored ranking snapshot.
+
+    A keyframe (no ``base_date``) stores every row of the list. A delta only
+    stores the rows new or changed since its base snapshot, plus tombstones
+    for the athletes who left the list; the other rows are carried over,
+    moved by ``rank_shifts``. A snapshot is read back by applying the deltas
+    chained on its keyframe. Snapshots whose rows have no header
+    (stored by an older version) are keyframes.
+    """
+
+    __tablename__ = "ranking_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    epreuve_code: Mapped[int] = mapped_column(
+        Integer, ForeignKey("epreuves.code", ondelete="CASCADE"), nullable=False
+    )
+    sexe: Mapped[str] = mapped_column(String(1), nullable=False)  # M or F
+    snapshot_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    base_date: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )  # Snapshot the delta applies to (None for a keyframe)
+    depth: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )  # Number of deltas since the keyframe
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)  # Rows of the list
+    stored_rows: Mapped[int] = mapped_column(Integer, nullable=False)  # Rows written
+    rank_shifts: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )  # JSON [first base rank, last base rank, offset] runs of the carried-over rows
+
+    # Relationships
+    epreuve: Mapped["Epreuve"] = relationship("Epreuve", back_populates="ranking_snapshots")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "epreuve_code", "sexe", "snapshot_date", name="uq_ranking_snapshot_list_date"
+        ),
+    )
+
+    @property
+    def is_keyframe(self) -> bool:
+        """Whether the snapshot stores every row of the list."""
+        return self.base_date is None
+
+    def __repr__(self) -> str:
+        return (
+            f"<RankingSnapshot(epreuve_code={self.epreuve_code}, sexe='{self.sexe}', "
+            f"snapshot_date={self.snapshot_date}, base_date={self.base_date})>"
+        )
+
+
 class Favorite(Base):
     """User's favorite athletes for a specific event."""
 
@@ -199,15 +263,16 @@ class Favorite(Base):
         return f"<Favorite(id={self.id}, user_id={self.user_id}, athlete_id='{self.athlete_id}')>"
 
 
-class Alert(Base):
-    """Alert model for ranking changes and favorites."""
+class AlertEvent(Base):
+    """
+    Ranking change worth an alert, stored once whatever the number of recipients.
 
-    __tablename__ = "alerts"
+    Each recipient gets an :class:`AlertDelivery` holding its read state.
+    """
+
+    __tablename__ = "alert_events"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
-    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=func.now(), server_default=func.now(), index=True
     )
@@ -228,18 +293,67 @@ class Alert(Base):
     message: Mapped[str] = mapped_column(Text, nullable=False)
     old_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     new_rank: Mapped[int] = mapped_column(Integer, nullable=False)
-    is_read: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="alerts")
-    athlete: Mapped["Athlete"] = relationship("Athlete", back_populates="alerts")
-    epreuve: Mapped["Epreuve"] = relationship("Epreuve", back_populates="alerts")
+    athlete: Mapped["Athlete"] = relationship("Athlete", back_populates="alert_events")
+    epreuve: Mapped["Epreuve"] = relationship("Epreuve", back_populates="alert_events")
+    deliveries: Mapped[list["AlertDelivery"]] = relationship(
+        "AlertDelivery", back_populates="event", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        return f"<AlertEvent(id={self.id}, alert_type='{self.alert_type}', title='{self.title}')>"
+
+
+class AlertDelivery(Base):
+    """
+    Alert as seen by one user: a reference to the event and the read state.
+
+    The primary key (user_id, event_id) is the only index: it serves listing,
+    counting and marking a user's alerts. The event fields are exposed as
+    read-only attributes (the alert id being the event id), so a delivery can
+    be serialized like a full alert.
+    """
+
+    __tablename__ = "alert_deliveries"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    event_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("alert_events.id", ondelete="CASCADE"), primary_key=True
+    )
+    is_read: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    # Relationships
+    event: Mapped["AlertEvent"] = relationship("AlertEvent", back_populates="deliveries")
+    user: Mapped["User"] = relationship("User", back_populates="alert_deliveries")
+
+    # Clustered on the primary key, no extra rowid index on SQLite
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    @property
+    def id(self) -> int:
+        return self.event_id
 
-    # Index for filtering unread alerts
-    __table_args__ = (Index("idx_alert_user_read", "user_id", "is_read"),)
+    @property
+    def alert_type(self) -> str:
+        return self.event.alert_type
+
+    @property
+    def title(self) -> str:
+        return self.event.title
+
+    @property
+    def message(self) -> str:
+        return self.event.message
+
+    @property
+    def created_at(self) -> datetime:
+        return self.event.created_at
 
     def __repr__(self) -> str:
-        return f"<Alert(id={self.id}, alert_type='{self.alert_type}', title='{self.title}', is_read={self.is_read})>"
+        return f"<AlertDelivery(user_id={self.user_id}, event_id={self.event_id}, is_read={self.is_read})>"
 
 
 class ScrapeLog(Base):
@@ -257,10 +371,13 @@ class ScrapeLog(Base):
     sexe: Mapped[str] = mapped_column(String(1), nullable=False)  # M or F
     status: Mapped[str] = mapped_column(
         String(50), nullable=False
-    )  # success, error, partial
+    )  # success, error, partial, unchanged
     results_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     duration_seconds: Mapped[float] = mapped_column(Float, nullable=False)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )  # SHA-256 of the normalized rankings table
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=func.now(), server_default=func.now()
     )
@@ -273,3 +390,57 @@ class ScrapeLog(Base):
 
     def __repr__(self) -> str:
         return f"<ScrapeLog(id={self.id}, epreuve_code={self.epreuve_code}, status='{self.status}', results_count={self.results_count})>"
+
+
+class SchedulerLease(Base):
+    """Lease electing the one process that runs scheduled jobs."""
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(255), nullable=False)  # host:pid:id
+    acquired_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    renewed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Another process may take the lease over once it is expired
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease(name='{self.name}', holder='{self.holder}', expires_at={self.expires_at})>"
+
+
+class ScrapeRunReport(Base):
+    """Latest report of a scheduled scrape run, readable by every process."""
+
+    __tablename__ = "scrape_run_reports"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)  # e.g. pipeline_metrics
+    data: Mapped[str] = mapped_column(Text, nullable=False)  # JSON report
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ScrapeRunReport(name='{self.name}', updated_at={self.updated_at})>"
+
+
+class ScrapeJobRecord(Base):
+    """Stored state of a manual scrape job, shared by every API process."""
+
+    __tablename__ = "scrape_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    epreuve_code: Mapped[int] = mapped_column(Integer, nullable=False)
+    sexe: Mapped[str] = mapped_column(String(1), nullable=False)  # M or F
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # queued, running, ...
+    # "epreuve_code:sexe" while the job is queued or running, NULL once it is
+    # finished: at most one job in flight per list, across processes
+    active_key: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, unique=True)
+    stages: Mapped[str] = mapped_column(Text, nullable=False)  # JSON {stage: status}
+    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON scrape result
+    coalesced: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    submitted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Jobs in flight not updated for long were abandoned by their process
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ScrapeJobRecord(id='{self.id}', epreuve_code={self.epreuve_code}, sexe='{self.sexe}', status='{self.status}')>"
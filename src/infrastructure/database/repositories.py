@@ -1,36 +1,202 @@
 """Concrete implementations of repositories using SQLAlchemy."""
 
-from datetime import datetime
-from typing import Any, Optional
+import json
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Optional, Sequence
 
-from sqlalchemy import and_, desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, desc, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import Insert
 
+from src.config import settings
+from src.core.entities import RankingRow
 from src.core.interfaces.repositories import (
     AlertRepository,
     AthleteRepository,
     EpreuveRepository,
     FavoriteRepository,
+    LeaseRepository,
     RankingRepository,
+    RunReportRepository,
+    ScrapeJobRepository,
     ScrapeLogRepository,
     UserRepository,
 )
 from src.infrastructure.database.models import (
-    Alert,
+    AlertDelivery,
+    AlertEvent,
     Athlete,
     Epreuve,
     Favorite,
     Ranking,
+    RankingSnapshot,
+    SchedulerLease,
+    ScrapeJobRecord,
     ScrapeLog,
+    ScrapeRunReport,
     User,
 )
 
+# Bound parameters per IN (...) query, below SQLite's historical limit of 999
+IN_CLAUSE_CHUNK_SIZE = 500
 
-class SQLAlchemyUserRepository(UserRepository):
-    """SQLAlchemy implementation of UserRepository."""
 
-    def __init__(self, session: Session) -> None:
+def _insert_ignoring_conflicts(session: Session, model: Any, index_elements: list[str]) -> Insert:
+    """Build an INSERT that skips rows conflicting on a unique key."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    return insert(model)
+
+
+# Storage modes of ranking snapshots (see settings.ranking_storage_mode)
+RANKING_STORAGE_MODES = ("delta", "full")
+
+# Columns compared with the previous snapshot to find changed rows (ranks are
+# compared separately, see _encode_rank_shifts)
+RANKING_VALUE_COLUMNS = ("performance", "performance_numeric", "club", "ligue", "departement")
+
+# (athlete_id, rank, values) of a row to store, values None for a tombstone
+StoredRow = tuple[str, int, Optional[tuple]]
+
+# Column values of a tombstone row
+TOMBSTONE_VALUES = {"rank": 0, "performance": "", "performance_numeric": 0.0, "removed": True}
+
+
+def _ranking_values(row: RankingRow) -> tuple:
+    """Get the values of a scraped row, in RANKING_VALUE_COLUMNS order."""
+    return (row.performance, row.performance_numeric, row.club, row.ligue, row.departement)
+
+
+def _snapshot_chain(
+    headers: dict[datetime, RankingSnapshot], snapshot_date: datetime
+) -> list[datetime]:
+    """Get the dates of a snapshot and of its bases, down to its keyframe."""
+    chain = [snapshot_date]
+    header = headers.get(snapshot_date)
+    while header is not None and header.base_date is not None:
+        chain.append(header.base_date)
+        header = headers.get(header.base_date)
+    return chain
+
+
+def _encode_rank_shifts(moves: list[tuple[int, int, str]]) -> tuple[list[list[int]], set[str]]:
+    """
+    Encode the rank changes of the rows carried over by a delta.
+
+    Args:
+        moves: (base rank, new rank, athlete_id) of the carried-over rows
+
+    Returns:
+        [first base rank, last base rank, offset] runs of consecutive rows
+        moving by the same offset, and the ids of the athletes whose move
+        cannot be encoded (tied with a row moving differently) and must be
+        stored as rows
+    """
+    runs: list[list[int]] = []
+    unencoded: set[str] = set()
+    last = None  # (base rank, offset) of the last encoded row
+    for base_rank, new_rank, athlete_id in sorted(moves):
+        offset = new_rank - base_rank
+        if last is not None and last[0] == base_rank and last[1] != offset:
+            unencoded.add(athlete_id)
+            continue
+        if offset:
+            if runs and last == (runs[-1][1], offset):
+                runs[-1][1] = base_rank
+            else:
+                runs.append([base_rank, base_rank, offset])
+        last = (base_rank, offset)
+    return runs, unencoded
+
+
+def _rank_shifter(rank_shifts: str) -> Callable[[int], int]:
+    """Get the function moving a base rank by the runs of a delta (see _encode_rank_shifts)."""
+    runs: list[list[int]] = json.loads(rank_shifts)
+    firsts = [run[0] for run in runs]
+
+    def shift(rank: int) -> int:
+        i = bisect_right(firsts, rank) - 1
+        if i >= 0 and rank <= runs[i][1]:
+            return rank + runs[i][2]
+        return rank
+
+    return shift
+
+
+def _replay_snapshot(
+    chain: list[datetime],
+    headers: dict[datetime, RankingSnapshot],
+    rows: Iterable[tuple[datetime, str, Optional[bool], int, Any]],
+) -> dict[str, list]:
+    """
+    Apply the deltas of a snapshot chain on its keyframe.
+
+    Args:
+        chain: Snapshot dates, latest first, down to the keyframe (see _snapshot_chain)
+        headers: Snapshot headers by date
+        rows: (snapshot date, athlete_id, removed, rank, payload) of the rows
+            stored by the snapshots of the chain
+
+    Returns:
+        [rank, payload] of each athlete listed in the snapshot
+    """
+    rows_by_date: dict[datetime, list] = defaultdict(list)
+    for snapshot_date, *row in rows:
+        rows_by_date[snapshot_date].append(row)
+
+    entries: dict[str, list] = {}
+    for snapshot_date in reversed(chain):
+        header = headers.get(snapshot_date)
+        if header is not None and header.rank_shifts:
+            shift = _rank_shifter(header.rank_shifts)
+            for entry in entries.values():
+                entry[0] = shift(entry[0])
+        for athlete_id, removed, rank, payload in rows_by_date[snapshot_date]:
+            if removed:
+                entries.pop(athlete_id, None)
+            else:
+                entries[athlete_id] = [rank, payload]
+    return entries
+
+
+class SQLAlchemyRepository:
+    """
+    Base of the SQLAlchemy repositories.
+
+    By default every write is committed right away. With ``autocommit=False``
+    writes are only flushed: the caller groups several repository calls in
+    one unit of work and commits (or rolls back) the session itself.
+    """
+
+    def __init__(self, session: Session, autocommit: bool = True) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            session: Database session
+            autocommit: Commit after each write (flush only if False)
+        """
         self.session = session
+        self.autocommit = autocommit
+
+    def _commit(self) -> None:
+        """End a write: commit, or flush when the caller owns the transaction."""
+        if self.autocommit:
+            self.session.commit()
+        else:
+            self.session.flush()
+
+
+class SQLAlchemyUserRepository(SQLAlchemyRepository, UserRepository):
+    """SQLAlchemy implementation of UserRepository."""
 
     def get_by_email(self, email: str) -> Optional[User]:
         return self.session.query(User).filter(User.email == email).first()
@@ -41,7 +207,7 @@ class SQLAlchemyUserRepository(UserRepository):
     def create(self, user_data: dict[str, Any]) -> User:
         user = User(**user_data)
         self.session.add(user)
-        self.session.commit()
+        self._commit()
         self.session.refresh(user)
         return user
 
@@ -51,7 +217,7 @@ class SQLAlchemyUserRepository(UserRepository):
             for key, value in user_data.items():
                 setattr(user, key, value)
             user.updated_at = datetime.now()
-            self.session.commit()
+            self._commit()
             self.session.refresh(user)
         return user
 
@@ -59,19 +225,24 @@ class SQLAlchemyUserRepository(UserRepository):
         user = self.get_by_id(user_id)
         if user:
             self.session.delete(user)
-            self.session.commit()
+            self._commit()
             return True
         return False
 
     def list_all(self) -> list[User]:
         return self.session.query(User).order_by(User.created_at.desc()).all()
 
+    def list_active(self) -> list[User]:
+        return (
+            self.session.query(User)
+            .filter(User.actif.is_(True))
+            .order_by(User.created_at.desc())
+            .all()
+        )
 
-class SQLAlchemyEpreuveRepository(EpreuveRepository):
-    """SQLAlchemy implementation of EpreuveRepository."""
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
+class SQLAlchemyEpreuveRepository(SQLAlchemyRepository, EpreuveRepository):
+    """SQLAlchemy implementation of EpreuveRepository."""
 
     def get_by_code(self, code: int) -> Optional[Epreuve]:
         return self.session.query(Epreuve).filter(Epreuve.code == code).first()
@@ -85,7 +256,7 @@ class SQLAlchemyEpreuveRepository(EpreuveRepository):
     def create(self, epreuve_data: dict[str, Any]) -> Epreuve:
         epreuve = Epreuve(**epreuve_data)
         self.session.add(epreuve)
-        self.session.commit()
+        self._commit()
         self.session.refresh(epreuve)
         return epreuve
 
@@ -95,7 +266,7 @@ class SQLAlchemyEpreuveRepository(EpreuveRepository):
             for key, value in epreuve_data.items():
                 setattr(epreuve, key, value)
             epreuve.updated_at = datetime.now()
-            self.session.commit()
+            self._commit()
             self.session.refresh(epreuve)
         return epreuve
 
@@ -103,24 +274,21 @@ class SQLAlchemyEpreuveRepository(EpreuveRepository):
         epreuve = self.get_by_id(epreuve_id)
         if epreuve:
             self.session.delete(epreuve)
-            self.session.commit()
+            self._commit()
             return True
         return False
 
 
-class SQLAlchemyAthleteRepository(AthleteRepository):
+class SQLAlchemyAthleteRepository(SQLAlchemyRepository, AthleteRepository):
     """SQLAlchemy implementation of AthleteRepository."""
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
-
     def get_by_athlete_id(self, athlete_id: str) -> Optional[Athlete]:
         return self.session.query(Athlete).filter(Athlete.athlete_id == athlete_id).first()
 
     def create(self, athlete_data: dict[str, Any]) -> Athlete:
         athlete = Athlete(**athlete_data)
         self.session.add(athlete)
-        self.session.commit()
+        self._commit()
         self.session.refresh(athlete)
         return athlete
 
@@ -130,99 +298,375 @@ class SQLAlchemyAthleteRepository(AthleteRepository):
             athlete = self.create(athlete_data)
         return athlete
 
+    def upsert_bulk(self, athletes_data: list[dict[str, Any]]) -> int:
+        """
+        Create the athletes that do not exist yet, in one transaction.
 
-class SQLAlchemyRankingRepository(RankingRepository):
-    """SQLAlchemy implementation of RankingRepository."""
+        Existing ids are loaded with chunked IN queries, then the missing
+        athletes are inserted with a single INSERT ... ON CONFLICT DO NOTHING
+        (a concurrent writer inserting the same athlete is not an error).
+        Existing athletes are left untouched.
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
+        Returns:
+            Number of athletes inserted
+        """
+        # Keep the first occurrence of each athlete
+        by_id: dict[str, dict[str, Any]] = {}
+        for data in athletes_data:
+            by_id.setdefault(data["athlete_id"], data)
+        if not by_id:
+            return 0
+
+        athlete_ids = list(by_id)
+        existing: set[str] = set()
+        for start in range(0, len(athlete_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = athlete_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+            query = select(Athlete.athlete_id).where(Athlete.athlete_id.in_(chunk))
+            existing.update(self.session.scalars(query))
+
+        missing = [data for athlete_id, data in by_id.items() if athlete_id not in existing]
+        if missing:
+            self.session.execute(
+                _insert_ignoring_conflicts(self.session, Athlete, ["athlete_id"]), missing
+            )
+        self._commit()
+        return len(missing)
+
+
+class SQLAlchemyRankingRepository(SQLAlchemyRepository, RankingRepository):
+    """
+    SQLAlchemy implementation of RankingRepository.
+
+    With ``settings.ranking_storage_mode = "delta"``, a snapshot only stores
+    the rows new or changed since the previous snapshot of the list, plus a
+    tombstone for each athlete who left it; the rank changes of the other
+    rows (everyone below an entrant moves down one place) are stored as a
+    few runs in the snapshot header. A full keyframe is stored every
+    ``settings.ranking_keyframe_interval`` snapshots, or whenever the delta
+    would not be smaller. Reads rebuild a snapshot from its keyframe and the
+    chain of deltas leading to it (see :class:`RankingSnapshot`).
+    """
 
     def get_latest_by_epreuve(
         self, epreuve_code: int, sexe: str
     ) -> tuple[Optional[datetime], list[Ranking]]:
         """Get latest rankings and their snapshot date."""
-        # Get latest snapshot date
-        latest_date = (
-            self.session.query(func.max(Ranking.snapshot_date))
-            .filter(
-                and_(
-                    Ranking.epreuve_code == epreuve_code,
-                    Ranking.sexe == sexe,
-                )
-            )
-            .scalar()
-        )
+        return self._get_snapshot(epreuve_code, sexe)
 
-        if not latest_date:
-            return None, []
-
-        # Get rankings for latest date
-        rankings = (
-            self.session.query(Ranking)
-            .filter(
-                and_(
-                    Ranking.epreuve_code == epreuve_code,
-                    Ranking.sexe == sexe,
-                    Ranking.snapshot_date == latest_date,
-                )
-            )
-            .order_by(Ranking.rank)
-            .all()
-        )
-
-        return latest_date, rankings
+    def get_snapshot_as_of(
+        self, epreuve_code: int, sexe: str, as_of: datetime
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        """Get the rankings of the latest snapshot taken at or before a date, and its date."""
+        return self._get_snapshot(epreuve_code, sexe, as_of)
 
     def get_previous_rank(
         self, athlete_id: str, epreuve_code: int, sexe: str, before_date: datetime
     ) -> Optional[int]:
-        """Get athlete's most recent rank before a given date."""
-        ranking = (
-            self.session.query(Ranking)
-            .filter(
-                and_(
-                    Ranking.athlete_id == athlete_id,
-                    Ranking.epreuve_code == epreuve_code,
-                    Ranking.sexe == sexe,
-                    Ranking.snapshot_date < before_date,
-                )
-            )
-            .order_by(desc(Ranking.snapshot_date))
-            .first()
-        )
-
-        return ranking.rank if ranking else None
+        """Get athlete's rank in the most recent snapshot before a given date listing them."""
+        for _, state in self._athlete_snapshots(athlete_id, epreuve_code, sexe, before_date):
+            if state is not None:
+                return state[0]
+        return None
 
     def create_bulk(self, rankings_data: list[dict[str, Any]]) -> list[Ranking]:
-        """Create multiple rankings efficiently."""
+        """Create multiple rankings efficiently (stored as full snapshots)."""
         rankings = [Ranking(**data) for data in rankings_data]
         self.session.bulk_save_objects(rankings)
-        self.session.commit()
+        self._commit()
         return rankings
 
+    def create_from_rows(
+        self, rows: list[RankingRow], snapshot_date: datetime, epreuve_code: int, sexe: str
+    ) -> int:
+        """
+        Store scraped rows as one ranking snapshot (single executemany INSERT).
+
+        In delta mode, only the rows differing from the previous snapshot of
+        the list are written, plus tombstones for the athletes who left it.
+
+        Returns:
+            Number of rows of the snapshot (whatever the number of rows written)
+
+        Raises:
+            ValueError: If the configured storage mode is unknown
+            sqlalchemy.exc.IntegrityError: If the list already has a snapshot at this date
+        """
+        mode = settings.ranking_storage_mode
+        if mode not in RANKING_STORAGE_MODES:
+            raise ValueError(
+                f"Unknown ranking storage mode '{mode}'. "
+                f"Available: {', '.join(RANKING_STORAGE_MODES)}"
+            )
+        if not rows:
+            return 0
+
+        snapshot = {"snapshot_date": snapshot_date, "epreuve_code": epreuve_code, "sexe": sexe}
+        current = [(row.athlete_id, row.rank, _ranking_values(row)) for row in rows]
+        base_date = self._latest_snapshot_date(epreuve_code, sexe, before=snapshot_date)
+        stored: Optional[Sequence[StoredRow]] = None
+        rank_shifts: list[list[int]] = []
+        depth = 0
+        if mode == "delta" and base_date is not None:
+            headers = self._snapshot_headers(epreuve_code, sexe, base_date)
+            base_header = headers.get(base_date)
+            depth = (base_header.depth if base_header else 0) + 1
+            if depth < settings.ranking_keyframe_interval:
+                stored, rank_shifts = self._diff_rows(
+                    current, self._rebuild_values(epreuve_code, sexe, headers, base_date)
+                )
+                if len(stored) + len(rank_shifts) >= len(rows):
+                    stored = None  # A keyframe would not be larger
+        if stored is None:
+            base_date, depth, stored, rank_shifts = None, 0, current, []
+
+        if stored:
+            self.session.execute(
+                insert(Ranking),
+                [
+                    {
+                        **snapshot,
+                        "athlete_id": athlete_id,
+                        "rank": rank,
+                        **(
+                            dict(zip(RANKING_VALUE_COLUMNS, values, strict=True))
+                            if values is not None
+                            else TOMBSTONE_VALUES
+                        ),
+                    }
+                    for athlete_id, rank, values in stored
+                ],
+            )
+        self.session.execute(
+            insert(RankingSnapshot).values(
+                **snapshot,
+                base_date=base_date,
+                depth=depth,
+                row_count=len(rows),
+                stored_rows=len(stored),
+                rank_shifts=json.dumps(rank_shifts) if rank_shifts else None,
+            )
+        )
+        self._commit()
+        return len(rows)
+
     def get_athlete_history(
         self, athlete_id: str, epreuve_code: int, sexe: str, limit: int = 30
     ) -> list[Ranking]:
-        """Get athlete's ranking history over time."""
-        return (
-            self.session.query(Ranking)
-            .filter(
-                and_(
-                    Ranking.athlete_id == athlete_id,
-                    Ranking.epreuve_code == epreuve_code,
-                    Ranking.sexe == sexe,
+        """
+        Get athlete's ranking history over time (latest first).
+
+        Returns:
+            One ranking per snapshot listing the athlete. When a delta did not
+            store the athlete's row, a copy of the carried-over row with the
+            snapshot's date and rank is returned (not attached to the session).
+        """
+        history = []
+        for snapshot_date, state in self._athlete_snapshots(athlete_id, epreuve_code, sexe):
+            if state is None:
+                continue
+            rank, ranking = state
+            if (ranking.snapshot_date, ranking.rank) != (snapshot_date, rank):
+                ranking = Ranking(
+                    **{
+                        column.key: getattr(ranking, column.key)
+                        for column in Ranking.__table__.columns
+                        if column.key not in ("snapshot_date", "rank")
+                    },
+                    snapshot_date=snapshot_date,
+                    rank=rank,
                 )
+            history.append(ranking)
+            if len(history) == limit:
+                break
+        return history
+
+    def _latest_snapshot_date(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        as_of: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+    ) -> Optional[datetime]:
+        """Get the date of the latest snapshot of a list (at or before as_of, before before)."""
+        latest = None
+        # Snapshots stored by an older version only have rows, not a header
+        columns = (
+            (RankingSnapshot.snapshot_date, RankingSnapshot.epreuve_code, RankingSnapshot.sexe),
+            (Ranking.snapshot_date, Ranking.epreuve_code, Ranking.sexe),
+        )
+        for date_column, epreuve_column, sexe_column in columns:
+            query = select(func.max(date_column)).where(
+                epreuve_column == epreuve_code, sexe_column == sexe
             )
-            .order_by(desc(Ranking.snapshot_date))
-            .limit(limit)
-            .all()
+            if as_of is not None:
+                query = query.where(date_column <= as_of)
+            if before is not None:
+                query = query.where(date_column < before)
+            snapshot_date = self.session.execute(query).scalar()
+            if snapshot_date is not None and (latest is None or snapshot_date > latest):
+                latest = snapshot_date
+        return latest
+
+    def _snapshot_headers(
+        self, epreuve_code: int, sexe: str, until: Optional[datetime] = None
+    ) -> dict[datetime, RankingSnapshot]:
+        """Get the snapshot headers of a list (up to a date), keyed by snapshot date."""
+        query = select(RankingSnapshot).where(
+            RankingSnapshot.epreuve_code == epreuve_code, RankingSnapshot.sexe == sexe
         )
+        if until is not None:
+            query = query.where(RankingSnapshot.snapshot_date <= until)
+        return {header.snapshot_date: header for header in self.session.scalars(query)}
 
+    def _get_snapshot(
+        self, epreuve_code: int, sexe: str, as_of: Optional[datetime] = None
+    ) -> tuple[Optional[datetime], list[Ranking]]:
+        """
+        Rebuild the latest snapshot of a list (at or before a date).
 
-class SQLAlchemyFavoriteRepository(FavoriteRepository):
-    """SQLAlchemy implementation of FavoriteRepository."""
+        Rows carried over from an earlier snapshot are returned with the rank
+        and date of the rebuilt snapshot, set as their loaded state (the
+        session does not see them as modified).
+        """
+        snapshot_date = self._latest_snapshot_date(epreuve_code, sexe, as_of=as_of)
+        if snapshot_date is None:
+            return None, []
+
+        headers = self._snapshot_headers(epreuve_code, sexe, snapshot_date)
+        chain = _snapshot_chain(headers, snapshot_date)
+        # Reload the stored values of rows already rebuilt into another snapshot
+        query = (
+            select(Ranking)
+            .where(
+                Ranking.epreuve_code == epreuve_code,
+                Ranking.sexe == sexe,
+                Ranking.snapshot_date.in_(chain),
+            )
+            .execution_options(populate_existing=True)
+        )
+        if len(chain) == 1:
+            return snapshot_date, list(self.session.scalars(query.order_by(Ranking.rank)))
+
+        entries = _replay_snapshot(
+            chain,
+            headers,
+            (
+                (r.snapshot_date, r.athlete_id, r.removed, r.rank, r)
+                for r in self.session.scalars(query.order_by(Ranking.id))
+            ),
+        )
+        rankings = []
+        for rank, ranking in sorted(entries.values(), key=itemgetter(0)):
+            set_committed_value(ranking, "rank", rank)
+            set_committed_value(ranking, "snapshot_date", snapshot_date)
+            rankings.append(ranking)
+        return snapshot_date, rankings
+
+    def _rebuild_values(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        headers: dict[datetime, RankingSnapshot],
+        snapshot_date: datetime,
+    ) -> dict[str, list]:
+        """Rebuild the [rank, values] (see RANKING_VALUE_COLUMNS) of a snapshot, by athlete."""
+        chain = _snapshot_chain(headers, snapshot_date)
+        rows = self.session.execute(
+            select(
+                Ranking.snapshot_date,
+                Ranking.athlete_id,
+                Ranking.removed,
+                Ranking.rank,
+                *(getattr(Ranking, column) for column in RANKING_VALUE_COLUMNS),
+            )
+            .where(
+                Ranking.epreuve_code == epreuve_code,
+                Ranking.sexe == sexe,
+                Ranking.snapshot_date.in_(chain),
+            )
+            .order_by(Ranking.id)
+        )
+        return _replay_snapshot(chain, headers, ((*row[:4], tuple(row[4:])) for row in rows))
+
+    @staticmethod
+    def _diff_rows(
+        current: list[tuple[str, int, tuple]], previous: dict[str, list]
+    ) -> tuple[list[StoredRow], list[list[int]]]:
+        """
+        Compute the delta of a snapshot against its base.
+
+        Args:
+            current: (athlete_id, rank, values) of the rows of the snapshot
+            previous: [rank, values] of the base snapshot by athlete (consumed)
+
+        Returns:
+            Rows to store (values None for a tombstone), and the rank shift
+            runs of the rows carried over from the base
+        """
+        stored: list[StoredRow] = []
+        moves: list[tuple[int, int, str]] = []
+        for athlete_id, rank, values in current:
+            base = previous.pop(athlete_id, None)
+            if base is not None and base[1] == values:
+                moves.append((base[0], rank, athlete_id))
+            else:
+                stored.append((athlete_id, rank, values))
+        rank_shifts, unencoded = _encode_rank_shifts(moves)
+        if unencoded:
+            stored.extend(row for row in current if row[0] in unencoded)
+        # Whoever is left was in the base snapshot but is not listed anymore
+        stored.extend((athlete_id, 0, None) for athlete_id in previous)
+        return stored, rank_shifts
+
+    def _athlete_snapshots(
+        self,
+        athlete_id: str,
+        epreuve_code: int,
+        sexe: str,
+        before: Optional[datetime] = None,
+    ) -> list[tuple[datetime, Optional[tuple[int, Ranking]]]]:
+        """
+        Follow an athlete through the snapshots of a list.
+
+        Returns:
+            (snapshot date, (rank, stored row) of the athlete in that snapshot,
+            or None if it does not list them), latest first
+        """
+        query = select(Ranking).where(
+            Ranking.athlete_id == athlete_id,
+            Ranking.epreuve_code == epreuve_code,
+            Ranking.sexe == sexe,
+        )
+        if before is not None:
+            query = query.where(Ranking.snapshot_date < before)
+        stored = {
+            ranking.snapshot_date: ranking
+            for ranking in self.session.scalars(query.execution_options(populate_existing=True))
+        }
+        headers = {
+            snapshot_date: header
+            for snapshot_date, header in self._snapshot_headers(epreuve_code, sexe).items()
+            if before is None or snapshot_date < before
+        }
+
+        # Header-less snapshots without the athlete's row cannot list them
+        states: dict[datetime, Optional[tuple[int, Ranking]]] = {}
+        for snapshot_date in sorted(set(stored) | set(headers)):
+            header = headers.get(snapshot_date)
+            state = None
+            if header is not None and header.base_date is not None:
+                state = states.get(header.base_date)
+                if state is not None and header.rank_shifts:
+                    state = (_rank_shifter(header.rank_shifts)(state[0]), state[1])
+            ranking = stored.get(snapshot_date)
+            if ranking is not None:
+                state = None if ranking.removed else (ranking.rank, ranking)
+            states[snapshot_date] = state
+        return sorted(states.items(), key=itemgetter(0), reverse=True)
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
+
+class SQLAlchemyFavoriteRepository(SQLAlchemyRepository, FavoriteRepository):
+    """SQLAlchemy implementation of FavoriteRepository."""
 
     def get_user_favorites(
         self, user_id: int, epreuve_code: Optional[int] = None
@@ -235,7 +679,7 @@ class SQLAlchemyFavoriteRepository(FavoriteRepository):
     def add_favorite(self, favorite_data: dict[str, Any]) -> Favorite:
         favorite = Favorite(**favorite_data)
         self.session.add(favorite)
-        self.session.commit()
+        self._commit()
         self.session.refresh(favorite)
         return favorite
 
@@ -253,7 +697,7 @@ class SQLAlchemyFavoriteRepository(FavoriteRepository):
         )
         if favorite:
             self.session.delete(favorite)
-            self.session.commit()
+            self._commit()
             return True
         return False
 
@@ -271,69 +715,111 @@ class SQLAlchemyFavoriteRepository(FavoriteRepository):
         )
         return favorite is not None
 
+    def get_favorites_index(
+        self, epreuve_code: Optional[int] = None
+    ) -> dict[tuple[str, int], set[int]]:
+        """Get the ids of the users who favorited each (athlete_id, epreuve_code)."""
+        query = select(Favorite.athlete_id, Favorite.epreuve_code, Favorite.user_id)
+        if epreuve_code is not None:
+            query = query.where(Favorite.epreuve_code == epreuve_code)
 
-class SQLAlchemyAlertRepository(AlertRepository):
+        index: dict[tuple[str, int], set[int]] = {}
+        for athlete_id, favorite_epreuve_code, user_id in self.session.execute(query):
+            index.setdefault((athlete_id, favorite_epreuve_code), set()).add(user_id)
+        return index
+
+
+class SQLAlchemyAlertRepository(SQLAlchemyRepository, AlertRepository):
     """SQLAlchemy implementation of AlertRepository."""
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
+    def create(self, alert_data: dict[str, Any]) -> AlertEvent:
+        event_data = dict(alert_data)
+        user_ids = event_data.pop("user_ids")
+        event = AlertEvent(**event_data)
+        event.deliveries = [AlertDelivery(user_id=user_id) for user_id in user_ids]
+        self.session.add(event)
+        self._commit()
+        self.session.refresh(event)
+        return event
 
-    def create(self, alert_data: dict[str, Any]) -> Alert:
-        alert = Alert(**alert_data)
-        self.session.add(alert)
-        self.session.commit()
-        self.session.refresh(alert)
-        return alert
+    def create_bulk(self, alerts_data: list[dict[str, Any]]) -> int:
+        """
+        Store alert events once, then one narrow delivery row per recipient.
 
-    def create_bulk(self, alerts_data: list[dict[str, Any]]) -> list[Alert]:
-        alerts = [Alert(**data) for data in alerts_data]
-        self.session.bulk_save_objects(alerts)
-        self.session.commit()
-        return alerts
+        Both tables are filled with a single executemany INSERT each; the
+        event ids come back in parameter order to build the deliveries.
+
+        Returns:
+            Number of deliveries created
+        """
+        if not alerts_data:
+            return 0
+        event_ids = self.session.scalars(
+            insert(AlertEvent).returning(AlertEvent.id, sort_by_parameter_order=True),
+            [
+                {key: value for key, value in data.items() if key != "user_ids"}
+                for data in alerts_data
+            ],
+        ).all()
+        deliveries = [
+            {"event_id": event_id, "user_id": user_id, "is_read": False}
+            for event_id, data in zip(event_ids, alerts_data, strict=True)
+            for user_id in data["user_ids"]
+        ]
+        if deliveries:
+            self.session.execute(insert(AlertDelivery), deliveries)
+        self._commit()
+        return len(deliveries)
+
+    def get_user_alert(self, user_id: int, alert_id: int) -> Optional[AlertDelivery]:
+        return self.session.get(AlertDelivery, (user_id, alert_id))
 
     def get_user_alerts(
         self, user_id: int, is_read: Optional[bool] = None, limit: int = 50
-    ) -> list[Alert]:
-        query = self.session.query(Alert).filter(Alert.user_id == user_id)
+    ) -> list[AlertDelivery]:
+        query = (
+            select(AlertDelivery)
+            .options(joinedload(AlertDelivery.event))
+            .where(AlertDelivery.user_id == user_id)
+        )
         if is_read is not None:
-            query = query.filter(Alert.is_read == is_read)
-        return query.order_by(desc(Alert.created_at)).limit(limit).all()
+            query = query.where(AlertDelivery.is_read == is_read)
+        # Event ids grow with creation time: newest first along the primary key
+        query = query.order_by(desc(AlertDelivery.event_id)).limit(limit)
+        return list(self.session.scalars(query))
 
-    def mark_as_read(self, alert_id: int) -> bool:
-        alert = self.session.query(Alert).filter(Alert.id == alert_id).first()
-        if alert:
-            alert.is_read = True
-            self.session.commit()
-            return True
-        return False
+    def mark_as_read(self, user_id: int, alert_id: int) -> bool:
+        result = self.session.execute(
+            update(AlertDelivery)
+            .where(and_(AlertDelivery.user_id == user_id, AlertDelivery.event_id == alert_id))
+            .values(is_read=True)
+        )
+        self._commit()
+        return result.rowcount > 0
 
     def mark_all_as_read(self, user_id: int) -> int:
-        count = (
-            self.session.query(Alert)
-            .filter(and_(Alert.user_id == user_id, Alert.is_read == False))
-            .update({Alert.is_read: True})
+        result = self.session.execute(
+            update(AlertDelivery)
+            .where(and_(AlertDelivery.user_id == user_id, AlertDelivery.is_read == False))
+            .values(is_read=True)
         )
-        self.session.commit()
-        return count
+        self._commit()
+        return result.rowcount
 
     def count_unread(self, user_id: int) -> int:
-        return (
-            self.session.query(Alert)
-            .filter(and_(Alert.user_id == user_id, Alert.is_read == False))
-            .count()
+        query = select(func.count()).where(
+            and_(AlertDelivery.user_id == user_id, AlertDelivery.is_read == False)
         )
+        return self.session.scalar(query) or 0
 
 
-class SQLAlchemyScrapeLogRepository(ScrapeLogRepository):
+class SQLAlchemyScrapeLogRepository(SQLAlchemyRepository, ScrapeLogRepository):
     """SQLAlchemy implementation of ScrapeLogRepository."""
 
-    def __init__(self, session: Session) -> None:
-        self.session = session
-
     def create(self, log_data: dict[str, Any]) -> ScrapeLog:
         log = ScrapeLog(**log_data)
         self.session.add(log)
-        self.session.commit()
+        self._commit()
         self.session.refresh(log)
         return log
 
@@ -358,3 +844,201 @@ class SQLAlchemyScrapeLogRepository(ScrapeLogRepository):
             .order_by(desc(ScrapeLog.scrape_date))
             .first()
         )
+
+    def get_change_history(self, since: datetime) -> list[ScrapeLog]:
+        return (
+            self.session.query(ScrapeLog)
+            .filter(
+                and_(
+                    ScrapeLog.scrape_date >= since,
+                    ScrapeLog.status.in_(("success", "unchanged")),
+                )
+            )
+            .order_by(ScrapeLog.scrape_date, ScrapeLog.id)
+            .all()
+        )
+
+    def get_last_failures(self, since: datetime) -> dict[tuple[int, str], datetime]:
+        rows = self.session.execute(
+            select(ScrapeLog.epreuve_code, ScrapeLog.sexe, func.max(ScrapeLog.scrape_date))
+            .where(ScrapeLog.scrape_date >= since, ScrapeLog.status == "error")
+            .group_by(ScrapeLog.epreuve_code, ScrapeLog.sexe)
+        )
+        return {(epreuve_code, sexe): last for epreuve_code, sexe, last in rows}
+
+
+class SQLAlchemyLeaseRepository(SQLAlchemyRepository, LeaseRepository):
+    """
+    SQLAlchemy implementation of LeaseRepository.
+
+    Leases are taken with conditional statements (no read-then-write), so
+    two processes racing for the same lease cannot both get it.
+    """
+
+    def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        # Renew our own lease, or take over an expired one
+        renewed = self.session.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == name,
+                or_(SchedulerLease.holder == holder, SchedulerLease.expires_at < now),
+            )
+            .values(
+                holder=holder,
+                acquired_at=case(
+                    (SchedulerLease.holder == holder, SchedulerLease.acquired_at), else_=now
+                ),
+                renewed_at=now,
+                expires_at=expires_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        acquired = renewed.rowcount == 1
+        if not acquired:
+            # First holder of the lease: the row does not exist yet
+            created = self.session.execute(
+                _insert_ignoring_conflicts(self.session, SchedulerLease, ["name"]).values(
+                    name=name,
+                    holder=holder,
+                    acquired_at=now,
+                    renewed_at=now,
+                    expires_at=expires_at,
+                )
+            )
+            acquired = created.rowcount == 1
+        self._commit()
+        return acquired
+
+    def release(self, name: str, holder: str) -> bool:
+        released = self.session.execute(
+            delete(SchedulerLease)
+            .where(SchedulerLease.name == name, SchedulerLease.holder == holder)
+            .execution_options(synchronize_session=False)
+        )
+        self._commit()
+        return released.rowcount == 1
+
+    def get(self, name: str) -> Optional[SchedulerLease]:
+        return self.session.scalar(
+            select(SchedulerLease)
+            .where(SchedulerLease.name == name)
+            .execution_options(populate_existing=True)
+        )
+
+
+class SQLAlchemyRunReportRepository(SQLAlchemyRepository, RunReportRepository):
+    """SQLAlchemy implementation of RunReportRepository."""
+
+    def save(self, name: str, data: dict[str, Any]) -> None:
+        self.session.merge(
+            ScrapeRunReport(name=name, data=json.dumps(data), updated_at=datetime.now())
+        )
+        self._commit()
+
+    def get(self, name: str) -> Optional[dict[str, Any]]:
+        report = self.session.scalar(
+            select(ScrapeRunReport)
+            .where(ScrapeRunReport.name == name)
+            .execution_options(populate_existing=True)
+        )
+        return json.loads(report.data) if report else None
+
+
+class SQLAlchemyScrapeJobRepository(SQLAlchemyRepository, ScrapeJobRepository):
+    """
+    SQLAlchemy implementation of ScrapeJobRepository.
+
+    A job in flight holds the unique ``active_key`` of its list, so two
+    processes submitting the same list cannot both create a job.
+    """
+
+    def submit(self, job: ScrapeJobRecord) -> tuple[ScrapeJobRecord, bool]:
+        values = {column.key: getattr(job, column.key) for column in ScrapeJobRecord.__table__.c}
+        while True:
+            created = self.session.execute(
+                _insert_ignoring_conflicts(self.session, ScrapeJobRecord, ["active_key"]).values(
+                    **values
+                )
+            )
+            if created.rowcount == 1:
+                self._commit()
+                return job, True
+            joined = self.session.execute(
+                update(ScrapeJobRecord)
+                .where(ScrapeJobRecord.active_key == job.active_key)
+                .values(coalesced=ScrapeJobRecord.coalesced + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if joined.rowcount == 1:
+                active = self.session.scalars(
+                    select(ScrapeJobRecord)
+                    .where(ScrapeJobRecord.active_key == job.active_key)
+                    .execution_options(populate_existing=True)
+                ).one()
+                self._commit()
+                return active, False
+            # The job in flight finished in between: try creating one again
+
+    def save(self, job: ScrapeJobRecord) -> None:
+        values: dict[str, Any] = {
+            "status": job.status,
+            "stages": job.stages,
+            "result": job.result,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+            "updated_at": job.updated_at,
+        }
+        if job.active_key is None:
+            # The job is finished: its list can get a new job
+            values["active_key"] = None
+        self.session.execute(
+            update(ScrapeJobRecord)
+            .where(ScrapeJobRecord.id == job.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self._commit()
+
+    def get(self, job_id: str) -> Optional[ScrapeJobRecord]:
+        return self.session.scalar(
+            select(ScrapeJobRecord)
+            .where(ScrapeJobRecord.id == job_id)
+            .execution_options(populate_existing=True)
+        )
+
+    def get_recent(self, limit: int) -> list[ScrapeJobRecord]:
+        return list(
+            self.session.scalars(
+                select(ScrapeJobRecord)
+                .order_by(desc(ScrapeJobRecord.submitted_at), desc(ScrapeJobRecord.id))
+                .limit(limit)
+                .execution_options(populate_existing=True)
+            )
+        )
+
+    def get_abandoned(self, updated_before: datetime) -> list[ScrapeJobRecord]:
+        return list(
+            self.session.scalars(
+                select(ScrapeJobRecord).where(
+                    ScrapeJobRecord.active_key.is_not(None),
+                    ScrapeJobRecord.updated_at < updated_before,
+                )
+            )
+        )
+
+    def delete_finished(self, keep: int) -> int:
+        kept = (
+            select(ScrapeJobRecord.id)
+            .where(ScrapeJobRecord.active_key.is_(None))
+            .order_by(desc(ScrapeJobRecord.submitted_at), desc(ScrapeJobRecord.id))
+            .limit(keep)
+        )
+        deleted = self.session.execute(
+            delete(ScrapeJobRecord)
+            .where(ScrapeJobRecord.active_key.is_(None), ScrapeJobRecord.id.not_in(kept))
+            .execution_options(synchronize_session=False)
+        )
+        self._commit()
+        return int(deleted.rowcount)
@@ -1,5 +1,6 @@
 """Scheduler infrastructure package."""
 
+from .scrape_jobs import ScrapeJob, ScrapeJobQueue
 from .scraping_scheduler import ScrapingScheduler
 
-__all__ = ["ScrapingScheduler"]
+__all__ = ["ScrapingScheduler", "ScrapeJob", "ScrapeJobQueue"]
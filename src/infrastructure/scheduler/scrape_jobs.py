@@ -0,0 +1,278 @@
+"""Background queue of manual scrape jobs."""
+
+import asyncio
+import json
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.use_cases.scrape_pipeline import PIPELINE_STAGES
+from src.infrastructure.database.async_repositories import AsyncSQLAlchemyScrapeJobRepository
+from src.infrastructure.database.models import ScrapeJobRecord
+from src.infrastructure.scraper import ScrapeTarget
+from src.utils import logger
+
+# Job statuses
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Stage statuses
+STAGE_PENDING = "pending"
+STAGE_RUNNING = "running"
+STAGE_DONE = "done"
+STAGE_SKIPPED = "skipped"
+STAGE_FAILED = "failed"
+
+# Runs a scrape, reporting each stage it enters (see ScrapingScheduler.scrape_now)
+ScrapeRunner = Callable[[int, str, Callable[[str], None]], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class ScrapeJob:
+    """One manual scrape, from submission to its result."""
+
+    target: ScrapeTarget
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_QUEUED
+    stages: dict[str, str] = field(
+        default_factory=lambda: {stage: STAGE_PENDING for stage in PIPELINE_STAGES}
+    )
+    submitted_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[dict[str, Any]] = None
+    # Submissions coalesced into this job while it was queued or running
+    coalesced: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    @property
+    def stage(self) -> Optional[str]:
+        """Get the stage the job is running, if any."""
+        return next((s for s, status in self.stages.items() if status == STAGE_RUNNING), None)
+
+    def enter_stage(self, stage: str) -> None:
+        """Mark a stage as running and the stages before it as done or skipped."""
+        for name in PIPELINE_STAGES:
+            if name == stage:
+                self.stages[name] = STAGE_RUNNING
+                return
+            if self.stages[name] == STAGE_RUNNING:
+                self.stages[name] = STAGE_DONE
+            elif self.stages[name] == STAGE_PENDING:
+                self.stages[name] = STAGE_SKIPPED
+
+    def finish(self, result: dict[str, Any]) -> None:
+        """Store the result; the running stage is done (or failed), the others skipped."""
+        for name, status in self.stages.items():
+            if status == STAGE_RUNNING:
+                self.stages[name] = STAGE_DONE if result["success"] else STAGE_FAILED
+            elif status == STAGE_PENDING:
+                self.stages[name] = STAGE_SKIPPED
+        self.result = result
+        self.status = JOB_SUCCEEDED if result["success"] else JOB_FAILED
+        self.finished_at = datetime.now()
+
+    @classmethod
+    def from_record(cls, record: ScrapeJobRecord) -> "ScrapeJob":
+        """Build a job from its stored state."""
+        return cls(
+            ScrapeTarget(record.epreuve_code, record.sexe),
+            id=record.id,
+            status=record.status,
+            stages=json.loads(record.stages),
+            submitted_at=record.submitted_at,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            result=json.loads(record.result) if record.result else None,
+            coalesced=record.coalesced,
+        )
+
+    def to_record(self) -> ScrapeJobRecord:
+        """Get the state of the job to store."""
+        target = self.target
+        return ScrapeJobRecord(
+            id=self.id,
+            epreuve_code=target.epreuve_code,
+            sexe=target.sexe,
+            status=self.status,
+            active_key=None if self.finished else f"{target.epreuve_code}:{target.sexe}",
+            stages=json.dumps(self.stages),
+            result=json.dumps(self.result) if self.result is not None else None,
+            coalesced=self.coalesced,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            updated_at=datetime.now(),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the job as a JSON-serializable dictionary."""
+        return {
+            "id": self.id,
+            "epreuve_code": self.target.epreuve_code,
+            "sexe": self.target.sexe,
+            "status": self.status,
+            "stage": self.stage,
+            "stages": dict(self.stages),
+            "submitted_at": self.submitted_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "coalesced": self.coalesced,
+            "result": self.result,
+        }
+
+
+class ScrapeJobQueue:
+    """
+    Queue running manual scrapes in background tasks of the event loop.
+
+    Jobs are stored in the ``scrape_jobs`` table, so every API process can
+    report their progress, whichever process runs them. A target submitted
+    while a job for it is queued or running, in any process, joins that
+    job instead of starting another scrape. The process that created a job
+    runs it. Finished jobs are kept (up to ``scraping_job_history``) so
+    their result can be polled; jobs in flight whose process stopped are
+    failed after ``scraping_job_timeout_seconds`` without an update.
+    """
+
+    def __init__(
+        self,
+        run: ScrapeRunner,
+        session_factory: Callable[[], AsyncSession],
+        workers: Optional[int] = None,
+        history: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            run: Coroutine function scraping one list
+            session_factory: Callable creating the sessions storing the jobs
+            workers: Number of jobs run concurrently (defaults to settings)
+            history: Number of finished jobs kept (defaults to settings)
+            timeout_seconds: Age of the last update of an abandoned job
+                (defaults to settings)
+        """
+        self.run = run
+        self.session_factory = session_factory
+        self.workers = workers or settings.scraping_job_workers
+        self.history = history or settings.scraping_job_history
+        self.timeout_seconds = timeout_seconds or settings.scraping_job_timeout_seconds
+        # Jobs of this process in flight
+        self._active: dict[str, ScrapeJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def submit(self, target: ScrapeTarget) -> tuple[ScrapeJob, bool]:
+        """
+        Queue a scrape, or join the job already queued or running for the target.
+
+        Must be called from the event loop running the jobs.
+
+        Args:
+            target: Rankings list to scrape
+
+        Returns:
+            (job, whether the job was created by this call)
+        """
+        async with self.session_factory() as session:
+            repo = AsyncSQLAlchemyScrapeJobRepository(session)
+            await self._fail_abandoned(repo)
+            record, created = await repo.submit(ScrapeJob(target).to_record())
+            if created:
+                await repo.delete_finished(self.history)
+
+        job = ScrapeJob.from_record(record)
+        if not created:
+            logger.info(f"Scrape of {target} coalesced into job {job.id}")
+            return job, False
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._tasks = [
+                asyncio.create_task(self._worker(self._queue)) for _ in range(self.workers)
+            ]
+        self._active[job.id] = job
+        self._queue.put_nowait(job)
+        logger.info(f"Scrape job {job.id} queued for {target}")
+        return job, True
+
+    async def get(self, job_id: str) -> Optional[ScrapeJob]:
+        """Get a job by id, if it is still known."""
+        async with self.session_factory() as session:
+            record = await AsyncSQLAlchemyScrapeJobRepository(session).get(job_id)
+        return ScrapeJob.from_record(record) if record else None
+
+    async def list_jobs(self) -> list[ScrapeJob]:
+        """Get the known jobs, most recent first."""
+        async with self.session_factory() as session:
+            records = await AsyncSQLAlchemyScrapeJobRepository(session).get_recent(self.history)
+        return [ScrapeJob.from_record(record) for record in records]
+
+    async def aclose(self) -> None:
+        """Cancel the workers; queued and running jobs of this process fail."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        for job in self._active.values():
+            job.finish({"success": False, "error": "Scrape cancelled at shutdown"})
+            await self._save(job)
+        self._active.clear()
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            job = await queue.get()
+            job.status = JOB_RUNNING
+            job.started_at = datetime.now()
+            await self._save(job)
+            # Stage changes are stored in the background, not to slow the scrape down
+            saves: list[asyncio.Task] = []
+
+            def on_stage(
+                stage: str, job: ScrapeJob = job, saves: list[asyncio.Task] = saves
+            ) -> None:
+                job.enter_stage(stage)
+                saves.append(asyncio.create_task(self._save(job)))
+
+            target = job.target
+            try:
+                result = await self.run(target.epreuve_code, target.sexe, on_stage)
+            except Exception as e:
+                logger.error(f"Scrape job {job.id} failed: {e}")
+                result = {"success": False, "error": str(e)}
+            job.finish(result)
+            await asyncio.gather(*saves)
+            await self._save(job)
+            del self._active[job.id]
+            logger.info(f"Scrape job {job.id} {job.status}")
+
+    async def _save(self, job: ScrapeJob) -> None:
+        """Store the progress of a job (a failure only loses that update)."""
+        try:
+            async with self.session_factory() as session:
+                await AsyncSQLAlchemyScrapeJobRepository(session).save(job.to_record())
+        except Exception as e:
+            logger.error(f"Could not store the progress of scrape job {job.id}: {e}")
+
+    async def _fail_abandoned(self, repo: AsyncSQLAlchemyScrapeJobRepository) -> None:
+        """Fail the jobs in flight not updated for too long: their process stopped."""
+        updated_before = datetime.now() - timedelta(seconds=self.timeout_seconds)
+        for record in await repo.get_abandoned(updated_before):
+            job = ScrapeJob.from_record(record)
+            job.finish({"success": False, "error": "Scrape abandoned by its process"})
+            await repo.save(job.to_record())
+            logger.warning(f"Scrape job {job.id} abandoned by its process, marked failed")
@@ -1,19 +1,137 @@
 """Scheduler for automatic daily scraping."""
 
 import asyncio
+import math
+import os
 import random
-from datetime import datetime, time
+import socket
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, time, timedelta
+from typing import Any, Optional
 
 import pytz
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.config import settings
-from src.core.use_cases import ScrapeRankingsUseCase
-from src.infrastructure.database.connection import SessionLocal
-from src.infrastructure.database.repositories import SQLAlchemyEpreuveRepository
+from src.core.services import ListFreshness, freshness_from_history, plan_scrapes
+from src.core.use_cases import ScrapePipeline, ScrapeRankingsUseCase, ScrapeRunSummary
+from src.infrastructure.database.async_repositories import (
+    AsyncSQLAlchemyEpreuveRepository,
+    AsyncSQLAlchemyRunReportRepository,
+    AsyncSQLAlchemyScrapeLogRepository,
+)
+from src.infrastructure.database.connection import (
+    SessionLocal,
+    dispose_async_engine,
+    new_async_session,
+)
+from src.infrastructure.database.models import Epreuve, ScrapeLog
+from src.infrastructure.database.repositories import SQLAlchemyLeaseRepository
+from src.infrastructure.scheduler.scrape_jobs import ScrapeJobQueue
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget
+from src.infrastructure.scraper.parse_pool import shutdown_parse_executor
 from src.utils import logger
 
+# background: jobs run in a scheduler thread, each on its own event loop
+# asyncio: jobs run on the event loop that started the scheduler (the API's)
+SCHEDULER_MODES = ("background", "asyncio")
+
+# Lease held by the one process running the scheduled jobs
+SCHEDULER_LEASE = "scraping_scheduler"
+
+# Stored reports of the last scheduled run, read by the API processes
+LAST_RUN_REPORT = "last_run"
+PIPELINE_METRICS_REPORT = "pipeline_metrics"
+
+# Rankings lists scraped for every active event
+SCRAPED_SEXES = ("M", "F")
+
+# Summary of the latest scheduled run of the process
+_last_run_summary: Optional[ScrapeRunSummary] = None
+
+
+def build_targets(epreuves: list[Epreuve]) -> list[ScrapeTarget]:
+    """
+    Expand events into the rankings lists of a scheduled run.
+
+    Args:
+        epreuves: Events to scrape
+
+    Returns:
+        One target per (event, sexe), events first
+    """
+    return [ScrapeTarget(epreuve.code, sexe) for epreuve in epreuves for sexe in SCRAPED_SEXES]
+
+
+def history_since(now: datetime) -> datetime:
+    """Get the start of the scrape history used to plan an adaptive run."""
+    # Older scrapes weigh less than 1/16th, and lists idle for longer are overdue
+    days = max(4 * settings.scheduler_change_half_life_days, settings.scheduler_max_interval_days)
+    return now - timedelta(days=days)
+
+
+def plan_adaptive_run(
+    targets: Sequence[ScrapeTarget],
+    history: Sequence[ScrapeLog],
+    now: datetime,
+    last_failures: Optional[Mapping[tuple[int, str], datetime]] = None,
+) -> list[ListFreshness[ScrapeTarget]]:
+    """
+    Choose the lists of an adaptive run from their scrape history.
+
+    Each run gets an equal share of the daily list budget, spent on the
+    lists most likely to have changed since their last scrape (see
+    :func:`plan_scrapes`). A failed scrape counts as the list's last
+    scrape, so lists that keep failing back off instead of staying overdue.
+
+    Args:
+        targets: Every list of the active events
+        history: Success and unchanged scrapes since :func:`history_since`, oldest first
+        now: Time of the run
+        last_failures: Date of the last failed scrape per (event code, sexe)
+
+    Returns:
+        Freshness of the lists to scrape (keyed by target), most urgent first
+    """
+    observations: defaultdict[ScrapeTarget, list[tuple[datetime, bool]]] = defaultdict(list)
+    for log in history:
+        changed = log.status == "success"
+        observations[ScrapeTarget(log.epreuve_code, log.sexe)].append((log.scrape_date, changed))
+    failures = {
+        ScrapeTarget(epreuve_code, sexe): failed
+        for (epreuve_code, sexe), failed in (last_failures or {}).items()
+    }
+
+    freshness = freshness_from_history(
+        observations, targets, now, settings.scheduler_change_half_life_days, failures
+    )
+    daily_budget = settings.scheduler_daily_list_budget or len(targets)
+    return plan_scrapes(
+        freshness,
+        now,
+        math.ceil(daily_budget / max(1, settings.scheduler_runs_per_day)),
+        settings.scheduler_max_interval_days,
+        settings.scheduler_min_change_probability,
+    )
+
+
+def new_instance_id() -> str:
+    """Identify a scheduler among the processes sharing the database."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def get_last_run_summary() -> Optional[ScrapeRunSummary]:
+    """Get the summary of the last finished scheduled run, if any."""
+    return _last_run_summary
+
 
 class ScrapingScheduler:
     """
@@ -24,12 +142,50 @@ class ScrapingScheduler:
     - Automatic scraping for all active events
     - Both male and female categories
     - Timezone aware (Europe/Paris)
+
+    Every started scheduler renews a lease in the database; only the one
+    holding it runs the scheduled scrapes, so several API workers (or the
+    API next to run_scheduler.py) scrape once. When the leader dies, its
+    lease expires and another scheduler takes over.
+
+    In asyncio mode the scheduler must be started from a running event loop.
+    Its jobs and manual scrapes then share that loop's database engine and
+    one pooled HTTP client, released by :meth:`aclose`; each run and manual
+    scrape still gets its own retry budget.
     """
 
-    def __init__(self) -> None:
-        """Initialize scheduler with configuration."""
-        self.scheduler = BackgroundScheduler(timezone=settings.timezone)
+    def __init__(self, mode: Optional[str] = None) -> None:
+        """
+        Initialize scheduler with configuration.
+
+        Args:
+            mode: background or asyncio (defaults to the configured mode)
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        self.mode = mode or settings.scheduler_mode
+        if self.mode not in SCHEDULER_MODES:
+            raise ValueError(
+                f"Unknown scheduler mode {self.mode!r}, expected one of {SCHEDULER_MODES}"
+            )
+        if self.mode == "asyncio":
+            self.scheduler = AsyncIOScheduler(timezone=settings.timezone)
+        else:
+            self.scheduler = BackgroundScheduler(timezone=settings.timezone)
         self.timezone = pytz.timezone(settings.timezone)
+        self._scraper: Optional[AthleScraper] = None
+        self.instance_id = new_instance_id()
+        self.is_leader = False
+        # Manual scrapes run in the background of the event loop
+        self.jobs = ScrapeJobQueue(self.scrape_now, new_async_session)
+
+    @property
+    def scraper(self) -> AthleScraper:
+        """Get the scraper shared by the jobs and manual scrapes of the event loop."""
+        if self._scraper is None:
+            self._scraper = AthleScraper()
+        return self._scraper
 
     def _get_random_time_in_window(self) -> time:
         """
@@ -53,59 +209,71 @@ class ScrapingScheduler:
 
         This is the main scheduled job that runs daily.
         """
+        global _last_run_summary
+
         logger.info("=" * 60)
         logger.info("Starting scheduled scraping job")
         logger.info(f"Timestamp: {datetime.now(self.timezone)}")
         logger.info("=" * 60)
 
-        session = SessionLocal()
+        started_at = datetime.now()
+        session = new_async_session()
+        # One scraper (and retry budget) shared by every list of the run; runs on
+        # the application's loop also share its pooled HTTP client
+        scraper = self.scraper.with_budget() if self.mode == "asyncio" else AthleScraper()
         try:
             # Get all active events
-            epreuve_repo = SQLAlchemyEpreuveRepository(session)
-            active_events = epreuve_repo.list_active()
+            epreuve_repo = AsyncSQLAlchemyEpreuveRepository(session)
+            active_events = await epreuve_repo.list_active()
 
             if not active_events:
                 logger.warning("No active events found for scraping")
                 return
 
-            logger.info(f"Found {len(active_events)} active event(s) to scrape")
-
-            # Scrape each event (male only)
-            for epreuve in active_events:
-                try:
-                    logger.info(f"Scraping {epreuve.nom} (Hommes)...")
-
-                    # Create fresh session for each use case
-                    scrape_session = SessionLocal()
-                    use_case = ScrapeRankingsUseCase(scrape_session)
-
-                    result = await use_case.execute(
-                        epreuve_code=epreuve.code,
-                        sexe="M",
-                    )
+            targets = build_targets(active_events)
+            logger.info(
+                f"Found {len(active_events)} active event(s) to scrape: "
+                f"{len(targets)} rankings list(s)"
+            )
+            if settings.scheduler_adaptive:
+                targets = await self._plan_targets(session, targets)
+            await session.close()
+            if not targets:
+                logger.info("No list is due for a scrape")
+                return
 
-                    if result["success"]:
-                        logger.info(
-                            f"✓ {epreuve.nom}: "
-                            f"{result['rankings_count']} rankings, "
-                            f"{result['alerts_count']} alerts, "
-                            f"{result['duration_seconds']}s"
-                        )
-                    else:
-                        logger.error(
-                            f"✗ {epreuve.nom}: {result.get('error')}"
-                        )
-
-                    scrape_session.close()
-
-                    # Small delay between events
-                    await asyncio.sleep(random.uniform(3, 5))
-
-                except Exception as e:
-                    logger.error(
-                        f"Error scraping {epreuve.nom}: {e}"
+            # Up to scraping_target_concurrency lists are downloaded at once, and
+            # parsed while the previous ones are being stored
+            names = {epreuve.code: epreuve.nom for epreuve in active_events}
+            pipeline = ScrapePipeline(new_async_session, scraper=scraper)
+            results = await pipeline.run(targets)
+
+            for target, result in results:
+                name = f"{names[target.epreuve_code]} ({target.sexe})"
+                if result["success"]:
+                    logger.info(
+                        f"✓ {name}: "
+                        f"{result['rankings_count']} rankings, "
+                        f"{result['alerts_count']} alerts, "
+                        f"{result['duration_seconds']}s"
                     )
-                    continue
+                else:
+                    logger.error(f"✗ {name}: {result.get('error')}")
+
+            for stage, metrics in pipeline.metrics.to_dict()["stages"].items():
+                logger.info(
+                    f"Pipeline {stage}: {metrics['items']} lists, "
+                    f"{metrics['items_per_second']}/s, "
+                    f"utilization {metrics['utilization']:.0%}, "
+                    f"max queue depth {metrics['max_queue_depth']}"
+                )
+            await self._save_report(PIPELINE_METRICS_REPORT, pipeline.metrics.to_dict())
+
+            wall_seconds = (datetime.now() - started_at).total_seconds()
+            summary = ScrapeRunSummary.from_results(results, started_at, wall_seconds)
+            _last_run_summary = summary
+            await self._save_report(LAST_RUN_REPORT, summary.to_dict())
+            self._log_summary(summary, names)
 
             logger.info("=" * 60)
             logger.info("Scheduled scraping job completed")
@@ -114,29 +282,154 @@ class ScrapingScheduler:
         except Exception as e:
             logger.error(f"Critical error in scheduled job: {e}")
         finally:
-            session.close()
+            await session.close()
+            if self.mode == "background":
+                # The job's event loop ends with asyncio.run
+                await scraper.aclose()
+                await dispose_async_engine()
+
+    @staticmethod
+    async def _plan_targets(
+        session: AsyncSession, targets: list[ScrapeTarget]
+    ) -> list[ScrapeTarget]:
+        """Keep the lists worth scraping in this run, most urgent first."""
+        now = datetime.now()
+        log_repo = AsyncSQLAlchemyScrapeLogRepository(session)
+        history = await log_repo.get_change_history(history_since(now))
+        last_failures = await log_repo.get_last_failures(history_since(now))
+        plan = plan_adaptive_run(targets, history, now, last_failures)
+
+        logger.info(f"Adaptive run: {len(plan)} of {len(targets)} list(s) due")
+        for freshness in plan:
+            age = freshness.age_days(now)
+            logger.debug(
+                f"Due: {freshness.key} "
+                f"({freshness.change_rate:.2f} changes/day, "
+                f"last scraped {age:.1f} days ago, "
+                f"P(changed) {freshness.change_probability(now):.0%})"
+            )
+        return [freshness.key for freshness in plan]
+
+    @staticmethod
+    async def _save_report(name: str, data: dict[str, Any]) -> None:
+        """Store a report of the run for the API processes (a failure only loses it)."""
+        try:
+            async with new_async_session() as session:
+                await AsyncSQLAlchemyRunReportRepository(session).save(name, data)
+        except Exception as e:
+            logger.error(f"Could not store the {name} report of the run: {e}")
+
+    @staticmethod
+    def _log_summary(summary: ScrapeRunSummary, names: dict[int, str]) -> None:
+        """Log the wall time, latencies and failures of a run."""
+        logger.info(
+            f"Run summary: {summary.targets} lists in {summary.wall_seconds:.1f}s "
+            f"({summary.stored} stored, {summary.unchanged} unchanged, "
+            f"{len(summary.failures)} failed)"
+        )
+        logger.info(
+            f"List latency: p50 {summary.latency_percentile(50):.1f}s, "
+            f"p95 {summary.latency_percentile(95):.1f}s, "
+            f"max {summary.latency_percentile(100):.1f}s"
+        )
+        for target, seconds in summary.slowest(3):
+            logger.info(f"Slow list: {names[target.epreuve_code]} ({target.sexe}) {seconds}s")
+        for target, error in summary.failures.items():
+            name = names.get(target.epreuve_code, target.epreuve_code)
+            logger.warning(f"Failed list: {name} ({target.sexe}): {error}")
 
     def _scheduled_job(self) -> None:
-        """Wrapper to run async scraping in event loop."""
+        """Wrapper to run async scraping in event loop (background mode)."""
+        if not self._heartbeat():
+            logger.info("Scheduled scraping skipped: another process holds the scheduler lease")
+            return
         try:
             asyncio.run(self._scrape_all_active_events())
         except Exception as e:
             logger.error(f"Failed to run scheduled job: {e}")
 
+    async def _run_scheduled_job(self) -> None:
+        """Run the scheduled scraping if this scheduler holds the lease (asyncio mode)."""
+        if not await self._aheartbeat():
+            logger.info("Scheduled scraping skipped: another process holds the scheduler lease")
+            return
+        await self._scrape_all_active_events()
+
+    def _hold_lease(self, session: Session) -> bool:
+        """
+        Take or renew the scheduler lease.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Whether this scheduler leads (holds the lease)
+        """
+        lease_repo = SQLAlchemyLeaseRepository(session)
+        try:
+            leader = lease_repo.acquire(
+                SCHEDULER_LEASE, self.instance_id, settings.scheduler_lease_ttl_seconds
+            )
+        except SQLAlchemyError as e:
+            # The lease expires on its own if this process cannot reach the database
+            logger.error(f"Failed to renew the scheduler lease: {e}")
+            session.rollback()
+            leader = False
+
+        if leader and not self.is_leader:
+            logger.info(f"Scheduler {self.instance_id} now runs the scheduled scrapes")
+        elif self.is_leader and not leader:
+            logger.warning(f"Scheduler {self.instance_id} lost the scheduler lease")
+        self.is_leader = leader
+        return leader
+
+    def _release_lease(self, session: Session) -> None:
+        """Give up the lease so that another scheduler takes over right away."""
+        if self.is_leader:
+            SQLAlchemyLeaseRepository(session).release(SCHEDULER_LEASE, self.instance_id)
+            self.is_leader = False
+            logger.info(f"Scheduler {self.instance_id} released the scheduler lease")
+
+    def _heartbeat(self) -> bool:
+        """Renew the lease from a scheduler thread (background mode)."""
+        session = SessionLocal()
+        try:
+            return self._hold_lease(session)
+        finally:
+            session.close()
+
+    async def _aheartbeat(self) -> bool:
+        """Renew the lease on the event loop (asyncio mode)."""
+        async with new_async_session() as session:
+            return await session.run_sync(self._hold_lease)
+
     def start(self) -> None:
         """
         Start the scheduler.
 
         Schedules daily scraping at a random time within configured window.
+
+        Raises:
+            RuntimeError: In asyncio mode, if no event loop is running
         """
         if not settings.scheduler_enabled:
             logger.info("Scheduler is disabled in settings")
             return
 
+        # Coroutine functions in asyncio mode, plain functions in background mode
+        job: Callable[[], object]
+        heartbeat: Callable[[], object]
+        if self.mode == "asyncio":
+            # Jobs are coroutines awaited on this loop: no thread, no loop per job
+            self.scheduler.configure(event_loop=asyncio.get_running_loop())
+            job, heartbeat = self._run_scheduled_job, self._aheartbeat
+        else:
+            job, heartbeat = self._scheduled_job, self._heartbeat
+
         # Calculate next run time (random within window)
         next_run_time = self._get_random_time_in_window()
 
-        logger.info(f"Scheduler starting with timezone: {settings.timezone}")
+        logger.info(f"Scheduler starting ({self.mode} mode) with timezone: {settings.timezone}")
         logger.info(
             f"Scraping window: "
             f"{settings.scheduler_start_hour:02d}:{settings.scheduler_start_minute:02d} - "
@@ -144,12 +437,14 @@ class ScrapingScheduler:
         )
         logger.info(f"Next scheduled run: {next_run_time}")
 
-        # Add daily job at random time
+        # Add daily job at random time, repeated every 24 / runs_per_day hours
         # Note: We use cron trigger with hour/minute for daily execution
+        runs = max(1, settings.scheduler_runs_per_day)
+        hours = sorted({(next_run_time.hour + round(k * 24 / runs)) % 24 for k in range(runs)})
         self.scheduler.add_job(
-            func=self._scheduled_job,
+            func=job,
             trigger=CronTrigger(
-                hour=next_run_time.hour,
+                hour=",".join(str(hour) for hour in hours),
                 minute=next_run_time.minute,
                 timezone=self.timezone,
             ),
@@ -158,18 +453,86 @@ class ScrapingScheduler:
             replace_existing=True,
         )
 
+        # Take the lease now, then keep it (or wait for it) between runs
+        self.scheduler.add_job(
+            func=heartbeat,
+            trigger=IntervalTrigger(seconds=settings.scheduler_lease_renew_seconds),
+            id="lease_heartbeat",
+            name="Scheduler Lease Heartbeat",
+            next_run_time=datetime.now(self.timezone),
+            replace_existing=True,
+        )
+
         self.scheduler.start()
-        logger.info("✓ Scheduler started successfully")
+        logger.info(f"✓ Scheduler {self.instance_id} started successfully")
 
     def stop(self) -> None:
-        """Stop the scheduler."""
+        """Stop the scheduler (and give up the lease in background mode)."""
+        self._stop_scheduler()
+        shutdown_parse_executor()
+
+    def _stop_scheduler(self) -> None:
+        """Stop the scheduled jobs (and give up the lease in background mode)."""
         if self.scheduler.running:
             self.scheduler.shutdown()
             logger.info("Scheduler stopped")
+            if self.mode == "background" and self.is_leader:
+                session = SessionLocal()
+                try:
+                    self._release_lease(session)
+                finally:
+                    session.close()
+
+    async def aclose(self) -> None:
+        """Stop the scheduler and manual jobs, then release the lease, HTTP client and engine."""
+        self._stop_scheduler()
+        await self.jobs.aclose()
+        # Waits for the parse tasks in flight: off the loop, which keeps serving meanwhile
+        await asyncio.to_thread(shutdown_parse_executor)
+        if self.is_leader:
+            async with new_async_session() as session:
+                await session.run_sync(self._release_lease)
+        if self._scraper is not None:
+            await self._scraper.aclose()
+            self._scraper = None
+        await dispose_async_engine()
+
+    async def scrape_now(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        on_stage: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """
+        Run manual scraping on the running event loop (for admin interface).
+
+        The scrape reuses the loop's database engine and the scheduler's
+        pooled HTTP client, with a retry budget of its own.
+
+        Args:
+            epreuve_code: Competition code
+            sexe: Gender (M or F)
+            on_stage: Optional callback told the stage the scrape enters
+
+        Returns:
+            Scraping result dictionary
+        """
+        logger.info(f"Running manual scrape: epreuve={epreuve_code}, sexe={sexe}")
+
+        try:
+            async with new_async_session() as session:
+                use_case = ScrapeRankingsUseCase(session, scraper=self.scraper.with_budget())
+                return await use_case.execute(epreuve_code, sexe, on_stage=on_stage)
+        except Exception as e:
+            logger.error(f"Manual scrape failed: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+            }
 
     def run_manual_scrape(self, epreuve_code: int, sexe: str) -> dict:
         """
-        Run manual scraping (for admin interface).
+        Run manual scraping on a new event loop (outside of any running loop).
 
         Args:
             epreuve_code: Competition code
@@ -180,19 +543,27 @@ class ScrapingScheduler:
         """
         logger.info(f"Running manual scrape: epreuve={epreuve_code}, sexe={sexe}")
 
-        session = SessionLocal()
         try:
-            use_case = ScrapeRankingsUseCase(session)
-            result = asyncio.run(use_case.execute(epreuve_code, sexe))
-            return result
+            return asyncio.run(self._run_and_close(epreuve_code, sexe))
         except Exception as e:
             logger.error(f"Manual scrape failed: {e}")
             return {
                 "success": False,
                 "error": str(e),
             }
+
+    @staticmethod
+    async def _run_and_close(epreuve_code: int, sexe: str) -> dict:
+        """Execute a scrape in its own session, then release the HTTP client and engine."""
+        try:
+            async with new_async_session() as session:
+                use_case = ScrapeRankingsUseCase(session)
+                try:
+                    return await use_case.execute(epreuve_code, sexe)
+                finally:
+                    await use_case.scraper.aclose()
         finally:
-            session.close()
+            await dispose_async_engine()
 
     def get_next_run_time(self) -> str | None:
         """
@@ -1,5 +1,25 @@
 """Scraper infrastructure package."""
 
-from .athle_scraper import AthleScraper, ScrapingError
+from .archive import ArchivedFetch, ArchiveEntry, HtmlArchive
+from .athle_scraper import AthleScraper, ScrapeOutcome, ScrapeTarget
+from .errors import CircuitOpenError, RetryBudgetExhaustedError, ScrapingError
+from .fingerprint import compute_fingerprint
+from .parsers import PARSER_BACKENDS, TableParser, get_table_parser
+from .replay import ArchiveReplayScraper
 
-__all__ = ["AthleScraper", "ScrapingError"]
+__all__ = [
+    "AthleScraper",
+    "ScrapeOutcome",
+    "ScrapeTarget",
+    "ScrapingError",
+    "CircuitOpenError",
+    "RetryBudgetExhaustedError",
+    "ArchiveEntry",
+    "ArchivedFetch",
+    "ArchiveReplayScraper",
+    "HtmlArchive",
+    "compute_fingerprint",
+    "PARSER_BACKENDS",
+    "TableParser",
+    "get_table_parser",
+]
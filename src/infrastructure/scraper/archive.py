@@ -0,0 +1,220 @@
+"""Compressed on-disk archive of the raw HTML pages fetched from athle.fr."""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils import logger
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Index entry of one archived page."""
+
+    epreuve_code: int
+    sexe: str
+    annee: int
+    categorie: str
+    fetched_at: datetime
+    page: int
+    content_hash: str
+    url: str
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["fetched_at"] = self.fetched_at.isoformat()
+        return json.dumps(data, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> "ArchiveEntry":
+        data = json.loads(line)
+        data["fetched_at"] = datetime.fromisoformat(data["fetched_at"])
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class ArchivedFetch:
+    """All pages of one rankings list fetched at the same time."""
+
+    epreuve_code: int
+    sexe: str
+    annee: int
+    categorie: str
+    fetched_at: datetime
+    entries: tuple[ArchiveEntry, ...]
+
+
+class HtmlArchive:
+    """
+    Content-addressed archive of fetched pages.
+
+    Page bodies are gzip-compressed and stored once per distinct content
+    (``blobs/<hash[:2]>/<hash>.html.gz``), so a list that does not change
+    from one night to the next costs a single index line. The index
+    (``index.jsonl``) keys every fetch by (epreuve, sexe, annee, categorie,
+    fetch time, page).
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize archive.
+
+        Args:
+            root: Archive directory (created on first write)
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / self.INDEX_FILE
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.root / "blobs" / content_hash[:2] / f"{content_hash}.html.gz"
+
+    def store(
+        self,
+        html: str,
+        epreuve_code: int,
+        sexe: str,
+        annee: int,
+        categorie: str,
+        page: int,
+        fetched_at: datetime,
+        url: str,
+    ) -> ArchiveEntry:
+        """
+        Archive a fetched page.
+
+        Args:
+            html: Raw page HTML
+            epreuve_code: Competition code
+            sexe: Gender (M or F)
+            annee: Year
+            categorie: Category
+            page: 0-based page index of the list
+            fetched_at: Fetch time (shared by all pages of one list)
+            url: Fetched URL
+
+        Returns:
+            Index entry of the archived page
+        """
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(content_hash)
+
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # A temporary file of its own per call: threads archiving the same page race
+            # to os.replace, and every one of them succeeds
+            with tempfile.NamedTemporaryFile(
+                dir=blob_path.parent, prefix=f"{blob_path.name}.", suffix=".tmp", delete=False
+            ) as tmp:
+                with gzip.GzipFile(fileobj=tmp, mode="wb", compresslevel=6) as f:
+                    f.write(data)
+            os.replace(tmp.name, blob_path)
+
+        entry = ArchiveEntry(
+            epreuve_code=epreuve_code,
+            sexe=sexe,
+            annee=annee,
+            categorie=categorie,
+            fetched_at=fetched_at,
+            page=page,
+            content_hash=content_hash,
+            url=url,
+        )
+        with self._lock, open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(entry.to_json() + "\n")
+
+        return entry
+
+    def load(self, entry: ArchiveEntry) -> str:
+        """
+        Load the HTML of an archived page.
+
+        Args:
+            entry: Index entry
+
+        Returns:
+            Raw page HTML
+        """
+        with gzip.open(self._blob_path(entry.content_hash), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def iter_entries(self) -> Iterator[ArchiveEntry]:
+        """Iterate over the index entries in write order."""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield ArchiveEntry.from_json(line)
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning(f"Skipping invalid archive index line {line_number}: {e}")
+
+    def fetches(
+        self,
+        epreuve_code: Optional[int] = None,
+        sexe: Optional[str] = None,
+        annee: Optional[int] = None,
+        categorie: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[ArchivedFetch]:
+        """
+        List archived fetches matching the filters, oldest first.
+
+        Args:
+            epreuve_code: Only this competition code
+            sexe: Only this gender
+            annee: Only this year
+            categorie: Only this category
+            since: Only fetches at or after this time
+            until: Only fetches at or before this time
+
+        Returns:
+            Archived fetches with their pages in page order
+        """
+        filters: dict[str, Any] = {
+            "epreuve_code": epreuve_code,
+            "sexe": sexe,
+            "annee": annee,
+            "categorie": categorie,
+        }
+        groups: dict[tuple, dict[int, ArchiveEntry]] = {}
+        for entry in self.iter_entries():
+            if any(
+                value is not None and getattr(entry, key) != value for key, value in filters.items()
+            ):
+                continue
+            if since and entry.fetched_at < since:
+                continue
+            if until and entry.fetched_at > until:
+                continue
+            key = (entry.epreuve_code, entry.sexe, entry.annee, entry.categorie, entry.fetched_at)
+            groups.setdefault(key, {})[entry.page] = entry
+
+        return [
+            ArchivedFetch(
+                epreuve_code=key[0],
+                sexe=key[1],
+                annee=key[2],
+                categorie=key[3],
+                fetched_at=key[4],
+                entries=tuple(pages[page] for page in sorted(pages)),
+            )
+            for key, pages in sorted(groups.items(), key=lambda item: item[0][4])
+        ]
@@ -1,40 +1,191 @@
 """Scraper for athle.fr rankings with anti-detection."""
 
 import asyncio
-import random
-import re
+import importlib.util
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
 
 from src.config import settings
+from src.core.entities import RankingRow
+from src.infrastructure.scraper.archive import HtmlArchive
+from src.infrastructure.scraper.errors import RetryBudgetExhaustedError, ScrapingError
+from src.infrastructure.scraper.fingerprint import compute_fingerprint
+from src.infrastructure.scraper.pagination import count_pages
+from src.infrastructure.scraper.parse_pool import (
+    extract_and_decode,
+    get_parse_executor,
+    parse_pages_to_records,
+)
+from src.infrastructure.scraper.parsers import HtmlInput, TableParser, get_table_parser
+from src.infrastructure.scraper.rate_limiter import TokenBucket, get_host_limiter
+from src.infrastructure.scraper.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    get_host_breaker,
+    parse_retry_after,
+)
+from src.infrastructure.scraper.row_decoder import decode_performance, decode_rows
 from src.infrastructure.scraper.user_agents import get_default_headers
 from src.utils import logger
 
 
-class ScrapingError(Exception):
-    """Custom exception for scraping errors."""
+# Status codes for which the server may send a Retry-After header
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
 
-    pass
+
+@dataclass(frozen=True)
+class ScrapeTarget:
+    """One rankings list to scrape."""
+
+    epreuve_code: int
+    sexe: str
+    annee: int = 2026
+    categorie: str = "CA"
+
+
+@dataclass
+class ScrapeOutcome:
+    """Result of scraping one target in a batch."""
+
+    target: ScrapeTarget
+    pages: list[str] = field(default_factory=list)
+    rankings: list[RankingRow] = field(default_factory=list)
+    error: Optional[Exception] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
 
 
 class AthleScraper:
-    """Scraper for athle.fr rankings with retry logic and anti-detection."""
+    """
+    Scraper for athle.fr rankings with retry logic and anti-detection.
+
+    The scraper owns a long-lived ``httpx.AsyncClient`` so that every scrape
+    performed with the same instance reuses pooled keep-alive connections
+    (no repeated TCP/TLS/DNS setup). Call :meth:`aclose` (or use the scraper
+    as an async context manager) once the run is finished.
+    """
 
-    def __init__(self) -> None:
-        """Initialize scraper with configuration."""
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        parser: Optional[TableParser] = None,
+        archive: Optional[HtmlArchive] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        parse_executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize scraper with configuration.
+
+        Args:
+            client: Optional pre-configured HTTP client. When given, the caller
+                keeps ownership and :meth:`aclose` will not close it.
+            parser: Optional table parser backend (defaults to the one
+                configured in settings)
+            archive: Optional raw HTML archive (defaults to the one configured
+                in settings, if archiving is enabled)
+            rate_limiter: Optional rate limiter (defaults to the one shared by
+                every scraper for the athle.fr host)
+            circuit_breaker: Optional circuit breaker (defaults to the one
+                shared by every scraper for the athle.fr host)
+            retry_budget: Optional retry budget (defaults to a new one, shared
+                by every scrape performed with this instance)
+            parse_executor: Optional pool used by :meth:`parse_pages_async`
+                (defaults to the shared pool configured in settings)
+        """
         self.base_url = settings.athle_base_url
         self.timeout = settings.scraping_timeout
         self.max_retries = settings.scraping_max_retries
-        self.min_delay = settings.scraping_min_delay
-        self.max_delay = settings.scraping_max_delay
+        self.max_pages = settings.scraping_max_pages
+        self.page_concurrency = settings.scraping_page_concurrency
+        self.target_concurrency = settings.scraping_target_concurrency
+        self.parser = parser or get_table_parser(settings.scraping_parser_backend)
+        if archive is None and settings.scraping_archive_enabled:
+            archive = HtmlArchive(settings.archive_dir)
+        self.archive = archive
+        host = urlsplit(self.base_url).netloc
+        self.rate_limiter = rate_limiter or get_host_limiter(host)
+        self.circuit_breaker = circuit_breaker or get_host_breaker(host)
+        self.retry_budget = retry_budget or RetryBudget(settings.scraping_retry_budget)
+        self.max_retry_after = settings.scraping_max_retry_after
+        self._parse_executor = parse_executor
+        self._client = client
+        self._owns_client = client is None
+
+    async def __aenter__(self) -> "AthleScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client from settings."""
+        http2 = settings.scraping_http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=settings.scraping_max_connections,
+            max_keepalive_connections=settings.scraping_max_keepalive_connections,
+            keepalive_expiry=settings.scraping_keepalive_expiry,
+        )
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            http2=http2,
+            follow_redirects=True,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+            self._owns_client = True
+        return self._client
+
+    def with_budget(self, retry_budget: Optional[RetryBudget] = None) -> "AthleScraper":
+        """
+        Get a scraper for a new run, with its own retry budget.
 
-    async def _random_delay(self) -> None:
-        """Add random delay to avoid detection."""
-        delay = random.uniform(self.min_delay, self.max_delay)
-        await asyncio.sleep(delay)
+        The returned scraper shares this one's HTTP client, parser, archive,
+        rate limiter and circuit breaker, but does not own the client:
+        closing it leaves this scraper usable.
+
+        Args:
+            retry_budget: Optional retry budget (defaults to a new one)
+
+        Returns:
+            Scraper for one run
+        """
+        return AthleScraper(
+            client=self.client,
+            parser=self.parser,
+            archive=self.archive,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            retry_budget=retry_budget,
+            parse_executor=self._parse_executor,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this scraper created it."""
+        if self._client is not None and self._owns_client and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("Scraper HTTP client closed")
+        self._client = None
 
     def _build_url(
         self,
@@ -42,6 +193,7 @@ class AthleScraper:
         sexe: str,
         annee: int = 2026,
         categorie: str = "CA",
+        page: int = 0,
     ) -> str:
         """
         Build athle.fr URL for rankings.
@@ -51,6 +203,7 @@ class AthleScraper:
             sexe: Gender (M or F)
             annee: Year (default 2026)
             categorie: Category (default CA for Cadets)
+            page: 0-based page index of the list
 
         Returns:
             Complete URL for scraping
@@ -70,10 +223,33 @@ class AthleScraper:
             "frmvent": "VR",
             "frmamaxi": "",
         }
+        if page > 0:
+            params["frmposition"] = str(page)
 
         query_string = "&".join([f"{k}={v}" for k, v in params.items()])
         return f"{self.base_url}?{query_string}"
 
+    async def _archive_page(
+        self,
+        html: str,
+        epreuve_code: int,
+        sexe: str,
+        annee: int,
+        categorie: str,
+        page: int,
+        fetched_at: datetime,
+        url: str,
+    ) -> None:
+        """Write a fetched page to the archive without failing the scrape."""
+        if self.archive is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.archive.store, html, epreuve_code, sexe, annee, categorie, page, fetched_at, url
+            )
+        except OSError as e:
+            logger.warning(f"Failed to archive page {page} of epreuve={epreuve_code}: {e}")
+
     def _parse_performance(self, performance_str: str) -> tuple[str, float]:
         """
         Parse performance string to extract clean value and numeric representation.
@@ -89,28 +265,11 @@ class AthleScraper:
             "49m29" -> ("49m29", 49.29)
             "47m20 (RP)" -> ("47m20", 47.20)
         """
-        # Remove (RP) and other markers
-        clean = re.sub(r"\s*\([^)]*\)", "", performance_str).strip()
-
-        # Extract numeric value (e.g., "58m14" -> 58.14)
-        match = re.match(r"(\d+)m(\d+)", clean)
-        if match:
-            meters = int(match.group(1))
-            centimeters = int(match.group(2))
-            numeric_value = meters + (centimeters / 100.0)
-            return clean, numeric_value
-
-        # Fallback: try to extract any number
-        numbers = re.findall(r"\d+\.?\d*", clean)
-        if numbers:
-            numeric_value = float(numbers[0])
-            return clean, numeric_value
-
-        # If no pattern matches, return 0.0
-        logger.warning(f"Could not parse performance: {performance_str}")
-        return clean, 0.0
-
-    def _parse_ranking_row(self, row: Any, last_valid_rank: int) -> Optional[tuple[dict[str, Any], int]]:
+        return decode_performance(performance_str)
+
+    def _parse_ranking_row(
+        self, row: Any, last_valid_rank: int = 0
+    ) -> Optional[tuple[RankingRow, int]]:
         """
         Parse a single ranking row from HTML table.
 
@@ -119,167 +278,109 @@ class AthleScraper:
             last_valid_rank: Last valid rank seen (for ex-aequo handling)
 
         Returns:
-            Tuple of (ranking data dict, updated last_valid_rank) or None if parsing fails
+            Tuple of (ranking row, updated last_valid_rank) or None if parsing fails
         """
         try:
-            cells = row.find_all("td")
-            # Need at least rank, perf, name + some metadata (relaxed from 8 to 3+)
-            if len(cells) < 3:
-                return None
-
-            # Extract data from cells
-            rank_text = cells[0].get_text(strip=True)
-            performance_text = cells[1].get_text(strip=True)
-            name = cells[2].get_text(strip=True)
-            club = cells[3].get_text(strip=True) if len(cells) > 3 else None
-            ligue = cells[4].get_text(strip=True) if len(cells) > 4 else None
-            departement = cells[5].get_text(strip=True) if len(cells) > 5 else None
-            infos = cells[6].get_text(strip=True) if len(cells) > 6 else None
-            date_text = cells[7].get_text(strip=True) if len(cells) > 7 else ""
-            lieu = cells[8].get_text(strip=True) if len(cells) > 8 else None
-
-            # Skip rows without valid data (detail rows, empty rows)
-            if not name or not performance_text:
-                return None
-
-            # Parse rank (handle tied ranks like "3", "3=", or "-" for ex-aequo)
-            if rank_text == "-":
-                # Ex-aequo: use last valid rank (passed as parameter)
-                rank = last_valid_rank
-                new_last_valid_rank = last_valid_rank  # Don't update
-            else:
-                rank_digits = re.sub(r"[^0-9]", "", rank_text)
-                if not rank_digits:
-                    return None
-                rank = int(rank_digits)
-                new_last_valid_rank = rank  # Update for next row
-
-            # Parse performance - MUST contain 'm' or digits to be valid
-            # This filters out detail rows where perf_text is actually a club name
-            if not re.search(r'\d+m\d+|\d+\.\d+', performance_text, re.IGNORECASE):
-                return None
-
-            performance, performance_numeric = self._parse_performance(performance_text)
-
-            # Parse date (DD/MM/YY format)
-            if date_text:
-                try:
-                    date_obj = datetime.strptime(date_text, "%d/%m/%y")
-                except ValueError:
-                    date_obj = datetime.now()
-            else:
-                date_obj = datetime.now()
-
-            # Generate athlete_id from name (normalized)
-            athlete_id = re.sub(r"[^a-zA-Z0-9]", "_", name.lower())
-
-            ranking_data = {
-                "rank": rank,
-                "athlete_id": athlete_id,
-                "name": name,
-                "performance": performance,
-                "performance_numeric": performance_numeric,
-                "club": club,
-                "ligue": ligue,
-                "departement": departement,
-                "infos": infos,
-                "date": date_obj,
-                "lieu": lieu,
-            }
-
-            return (ranking_data, new_last_valid_rank)
-
+            cells = [cell.get_text(strip=True) for cell in row.find_all("td")]
         except Exception as e:
             logger.warning(f"Failed to parse ranking row: {e}")
             return None
 
-    async def scrape_rankings(
+        return self._parse_ranking_cells(cells, last_valid_rank)
+
+    def _parse_ranking_cells(
+        self, cells: list[str], last_valid_rank: int
+    ) -> Optional[tuple[RankingRow, int]]:
+        """
+        Parse the cell texts of a single ranking row.
+
+        Args:
+            cells: Stripped text of each cell of the row
+            last_valid_rank: Last valid rank seen (for ex-aequo handling)
+
+        Returns:
+            Tuple of (ranking row, updated last_valid_rank) or None if parsing fails
+        """
+        rankings, new_last_valid_rank = decode_rows([cells], last_valid_rank)
+        if not rankings:
+            return None
+        return rankings[0], new_last_valid_rank
+
+    async def fetch_page(
         self,
         epreuve_code: int,
         sexe: str,
         annee: int = 2026,
         categorie: str = "CA",
-    ) -> list[dict[str, Any]]:
+        page: int = 0,
+        fetched_at: Optional[datetime] = None,
+    ) -> str:
         """
-        Scrape rankings from athle.fr with retry logic.
+        Download one page of rankings from athle.fr with retry logic.
 
         Args:
             epreuve_code: Competition code (e.g., 670 for Javelin)
             sexe: Gender (M or F)
             annee: Year (default 2026)
             categorie: Category (default CA for Cadets)
+            page: 0-based page index of the list
+            fetched_at: Fetch time recorded in the archive (defaults to now)
 
         Returns:
-            List of ranking dictionaries
+            Raw HTML of the rankings page
 
         Raises:
-            ScrapingError: If scraping fails after all retries
+            CircuitOpenError: If the host is short-circuited after repeated failures
+            RetryBudgetExhaustedError: If the retry budget of the run is used up
+            ScrapingError: If fetching fails after all retries
         """
-        url = self._build_url(epreuve_code, sexe, annee, categorie)
-        logger.info(f"Scraping rankings: epreuve={epreuve_code}, sexe={sexe}")
+        url = self._build_url(epreuve_code, sexe, annee, categorie, page)
+        logger.info(f"Scraping rankings: epreuve={epreuve_code}, sexe={sexe}, page={page}")
 
         for attempt in range(1, self.max_retries + 1):
+            # Fail fast while the host is known to be down
+            self.circuit_breaker.before_request()
+            retry_after: Optional[float] = None
+
             try:
-                # Random delay before request (except first attempt)
-                if attempt > 1:
-                    await self._random_delay()
+                # Wait for the shared per-host politeness budget
+                await self.rate_limiter.acquire()
 
                 # Make request with random user agent
                 headers = get_default_headers()
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    logger.debug(f"Attempt {attempt}/{self.max_retries}: GET {url}")
-                    response = await client.get(url, headers=headers, follow_redirects=True)
-                    response.raise_for_status()
-
-                # Parse HTML
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Find results table (new structure with id="ctnBilans")
-                table = soup.find("table", id="ctnBilans")
-                if not table:
-                    logger.warning("No results table found with id=ctnBilans")
-                    # Debug: check what tables exist
-                    all_tables = soup.find_all("table")
-                    logger.warning(f"Found {len(all_tables)} tables total")
-                    for i, tbl in enumerate(all_tables[:5]):  # Log first 5 tables
-                        logger.warning(f"  Table {i+1}: classes={tbl.get('class')}, id={tbl.get('id')}")
-
-                    # Try fallback: look for reveal-table class
-                    table = soup.find("table", class_="reveal-table")
-                    if table:
-                        logger.info("Found table with class=reveal-table, using fallback")
-                    else:
-                        logger.error("No suitable table found")
-                        return []
-
-                # Parse rows - skip first 3 rows (headers/info), row 3 is column names
-                all_rows = table.find_all("tr")
-                data_rows = all_rows[4:] if len(all_rows) > 4 else []  # Data starts at row 4
-                rankings = []
-
-                # Track last valid rank for ex-aequo handling
-                last_valid_rank = 0
-
-                for row in data_rows:
-                    parsed_result = self._parse_ranking_row(row, last_valid_rank)
-                    if parsed_result:
-                        ranking_data, last_valid_rank = parsed_result
-                        rankings.append(ranking_data)
-
-                logger.info(f"Successfully scraped {len(rankings)} rankings")
-                return rankings
+                logger.debug(f"Attempt {attempt}/{self.max_retries}: GET {url}")
+                response = await self.client.get(url, headers=headers)
+                response.raise_for_status()
+                self.circuit_breaker.record_success()
+                html = response.text
+                await self._archive_page(
+                    html, epreuve_code, sexe, annee, categorie, page,
+                    fetched_at or datetime.now(), url,
+                )
+                return html
 
             except httpx.HTTPStatusError as e:
-                logger.warning(
-                    f"HTTP error on attempt {attempt}/{self.max_retries}: {e.response.status_code}"
-                )
+                status_code = e.response.status_code
+                logger.warning(f"HTTP error on attempt {attempt}/{self.max_retries}: {status_code}")
+                if status_code in RETRY_AFTER_STATUS_CODES or status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                    retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                else:
+                    # The host answered: not a reason to open the circuit
+                    self.circuit_breaker.record_success()
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    self.circuit_breaker.open_for(retry_after)
+                    raise ScrapingError(
+                        f"HTTP error {status_code}, server asked to retry after {retry_after:.0f}s"
+                    ) from e
                 if attempt == self.max_retries:
                     raise ScrapingError(
-                        f"HTTP error after {self.max_retries} attempts: {e.response.status_code}"
+                        f"HTTP error after {self.max_retries} attempts: {status_code}"
                     ) from e
 
             except httpx.TimeoutException as e:
                 logger.warning(f"Timeout on attempt {attempt}/{self.max_retries}")
+                self.circuit_breaker.record_failure()
                 if attempt == self.max_retries:
                     raise ScrapingError(
                         f"Timeout after {self.max_retries} attempts"
@@ -287,16 +388,251 @@ class AthleScraper:
 
             except Exception as e:
                 logger.error(f"Unexpected error on attempt {attempt}/{self.max_retries}: {e}")
+                self.circuit_breaker.record_failure()
                 if attempt == self.max_retries:
                     raise ScrapingError(
                         f"Scraping failed after {self.max_retries} attempts: {str(e)}"
                     ) from e
 
-            # Exponential backoff before retry
-            if attempt < self.max_retries:
-                backoff_delay = 2**attempt
-                logger.info(f"Retrying in {backoff_delay} seconds...")
-                await asyncio.sleep(backoff_delay)
+            # Exponential backoff (or server-requested delay) before retry
+            if not self.retry_budget.try_spend():
+                raise RetryBudgetExhaustedError(
+                    f"Retry budget of {self.retry_budget.max_retries} retries exhausted"
+                )
+            backoff_delay = max(2**attempt, retry_after or 0)
+            logger.info(f"Retrying in {backoff_delay} seconds...")
+            await asyncio.sleep(backoff_delay)
 
         # Should never reach here, but just in case
         raise ScrapingError("Scraping failed: Max retries exceeded")
+
+    async def fetch_pages(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        annee: int = 2026,
+        categorie: str = "CA",
+    ) -> list[str]:
+        """
+        Download every page of a rankings list.
+
+        The first page tells how many pages the list has; the remaining ones
+        are fetched concurrently (bounded by ``scraping_page_concurrency``).
+        When a page fails, the downloads of the other pages are cancelled.
+
+        Args:
+            epreuve_code: Competition code (e.g., 670 for Javelin)
+            sexe: Gender (M or F)
+            annee: Year (default 2026)
+            categorie: Category (default CA for Cadets)
+
+        Returns:
+            Raw HTML of each page, in page order
+
+        Raises:
+            ScrapingError: If fetching any page fails after all retries
+        """
+        fetched_at = datetime.now()
+        first_page = await self.fetch_page(
+            epreuve_code, sexe, annee, categorie, fetched_at=fetched_at
+        )
+
+        page_count = count_pages(first_page)
+        if page_count > self.max_pages:
+            logger.warning(
+                f"List has {page_count} pages, only the first {self.max_pages} will be scraped"
+            )
+            page_count = self.max_pages
+        if page_count == 1:
+            return [first_page]
+
+        logger.info(f"List has {page_count} pages, fetching the remaining ones")
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+
+        async def fetch(page: int) -> str:
+            async with semaphore:
+                return await self.fetch_page(
+                    epreuve_code, sexe, annee, categorie, page, fetched_at
+                )
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(1, page_count)]
+        try:
+            other_pages = await asyncio.gather(*tasks)
+        except BaseException:
+            # The list is lost: stop the other downloads before they spend
+            # rate limiter tokens and retries on pages that would be dropped
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [first_page, *other_pages]
+
+    def parse_pages(self, pages: Sequence[HtmlInput]) -> list[RankingRow]:
+        """
+        Parse rankings out of the downloaded pages of a list.
+
+        Rows of all pages are decoded as one table, so that an ex-aequo rank
+        at the top of a page continues the last rank of the previous page.
+
+        Args:
+            pages: Raw HTML of each page, in page order
+
+        Returns:
+            List of ranking rows (empty if no results table is found)
+        """
+        rankings, missing_pages = extract_and_decode(self.parser, pages)
+        return self._log_parsed(rankings, missing_pages)
+
+    @staticmethod
+    def _log_parsed(
+        rankings: list[RankingRow], missing_pages: list[int]
+    ) -> list[RankingRow]:
+        for index in missing_pages:
+            logger.error(f"No suitable table found on page {index}")
+        logger.info(f"Successfully scraped {len(rankings)} rankings")
+        return rankings
+
+    @property
+    def parse_executor(self) -> Optional[Executor]:
+        """Get the pool used to parse pages off the event loop (None: inline)."""
+        return self._parse_executor or get_parse_executor()
+
+    async def parse_pages_async(self, pages: Sequence[HtmlInput]) -> list[RankingRow]:
+        """
+        Parse rankings out of the downloaded pages of a list, off the event loop.
+
+        Pages are handed to the parse pool as raw bytes and come back as
+        compact :class:`RankingRow` tuples, so other downloads keep
+        progressing while a large list is parsed, possibly on another core.
+
+        Args:
+            pages: Raw HTML of each page, in page order
+
+        Returns:
+            List of ranking rows (empty if no results table is found)
+        """
+        executor = self.parse_executor
+        if executor is None:
+            return self.parse_pages(pages)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            # Only bytes cross the process boundary: cheapest to pickle
+            pages = [page.encode("utf-8") if isinstance(page, str) else page for page in pages]
+
+        loop = asyncio.get_running_loop()
+        rankings, missing_pages = await loop.run_in_executor(
+            executor, parse_pages_to_records, self.parser.name, pages
+        )
+        return self._log_parsed(rankings, missing_pages)
+
+    async def fingerprint_pages_async(self, pages: list[str]) -> Optional[str]:
+        """
+        Fingerprint the results table of the pages of a list, off the event loop.
+
+        Runs :func:`compute_fingerprint` in the parse pool, so that checking
+        a large list for changes does not hold the loop either.
+
+        Args:
+            pages: Raw HTML of each page, in page order
+
+        Returns:
+            Fingerprint of the list, or None if the first page has no table
+        """
+        executor = self.parse_executor
+        if executor is None:
+            return compute_fingerprint(*pages)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, compute_fingerprint, *pages)
+
+    def parse_page(self, html: HtmlInput) -> list[RankingRow]:
+        """
+        Parse rankings out of a single downloaded athle.fr page.
+
+        Args:
+            html: Raw HTML of the rankings page
+
+        Returns:
+            List of ranking rows (empty if no results table is found)
+        """
+        return self.parse_pages([html])
+
+    async def scrape_rankings(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        annee: int = 2026,
+        categorie: str = "CA",
+    ) -> list[RankingRow]:
+        """
+        Scrape rankings from athle.fr with retry logic.
+
+        Args:
+            epreuve_code: Competition code (e.g., 670 for Javelin)
+            sexe: Gender (M or F)
+            annee: Year (default 2026)
+            categorie: Category (default CA for Cadets)
+
+        Returns:
+            List of ranking rows
+
+        Raises:
+            ScrapingError: If scraping fails after all retries
+        """
+        pages = await self.fetch_pages(epreuve_code, sexe, annee, categorie)
+        return await self.parse_pages_async(pages)
+
+    async def _scrape_target(self, target: ScrapeTarget) -> ScrapeOutcome:
+        """Scrape one target of a batch, capturing its error."""
+        start_time = time.monotonic()
+        outcome = ScrapeOutcome(target=target)
+        try:
+            outcome.pages = await self.fetch_pages(
+                target.epreuve_code, target.sexe, target.annee, target.categorie
+            )
+            outcome.rankings = await self.parse_pages_async(outcome.pages)
+        except ScrapingError as e:
+            outcome.error = e
+        except Exception as e:
+            logger.error(f"Unexpected error scraping {target}: {e}")
+            outcome.error = e
+        outcome.duration_seconds = time.monotonic() - start_time
+        return outcome
+
+    async def scrape_many(
+        self,
+        targets: Iterable[ScrapeTarget],
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[ScrapeOutcome]:
+        """
+        Scrape several rankings lists concurrently.
+
+        Targets overlap up to ``concurrency`` at a time; every request still
+        goes through the shared per-host rate limiter and circuit breaker.
+        Outcomes are yielded as soon as each target completes, so callers
+        can store a list while the others are still downloading.
+
+        Args:
+            targets: Rankings lists to scrape
+            concurrency: Maximum number of targets scraped at once (defaults
+                to ``scraping_target_concurrency``)
+
+        Yields:
+            One outcome per target, in completion order. A failed target
+            carries its error instead of stopping the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.target_concurrency)
+
+        async def run(target: ScrapeTarget) -> ScrapeOutcome:
+            async with semaphore:
+                return await self._scrape_target(target)
+
+        tasks = [asyncio.ensure_future(run(target)) for target in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: do not leave orphan downloads behind
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
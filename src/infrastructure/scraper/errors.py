@@ -0,0 +1,19 @@
+"""Scraping exceptions."""
+
+
+class ScrapingError(Exception):
+    """Custom exception for scraping errors."""
+
+    pass
+
+
+class CircuitOpenError(ScrapingError):
+    """Raised when requests to a host are short-circuited after repeated failures."""
+
+    pass
+
+
+class RetryBudgetExhaustedError(ScrapingError):
+    """Raised when a scrape run has used up its retry budget."""
+
+    pass
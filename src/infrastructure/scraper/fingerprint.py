@@ -0,0 +1,85 @@
+"""Content fingerprinting of athle.fr ranking pages."""
+
+import hashlib
+import re
+from typing import Optional
+
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b([^>]*)>", re.IGNORECASE)
+_ATTRIBUTE_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+def _attributes(tag_attributes: str) -> dict[str, str]:
+    """Get the attributes of a start tag (lowercase names)."""
+    return {
+        match.group(1).lower(): next(v for v in match.groups()[1:] if v is not None)
+        for match in _ATTRIBUTE_RE.finditer(tag_attributes)
+    }
+
+
+def _raw_table(html: str) -> Optional[str]:
+    """
+    Cut the raw HTML of the results table out of a page, without parsing it.
+
+    Only ``<table>`` tags are scanned: the ``ctnBilans`` table (or the first
+    ``reveal-table``) runs to its matching end tag, nested tables included,
+    or to the end of the page when the end tag is missing.
+    """
+    tags = list(_TABLE_TAG_RE.finditer(html))
+    start = None
+    for index, tag in enumerate(tags):
+        if tag.group(1):
+            continue
+        attributes = _attributes(tag.group(2))
+        if attributes.get("id") == "ctnBilans":
+            start = index
+            break
+        if start is None and "reveal-table" in attributes.get("class", "").split():
+            start = index
+    if start is None:
+        return None
+
+    depth = 0
+    for tag in tags[start:]:
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return html[tags[start].start() : tag.end()]
+    return html[tags[start].start() :]
+
+
+def _normalized_table(html: str) -> Optional[str]:
+    """Get the whitespace-normalized HTML of the results table of a page."""
+    table_html = _raw_table(html) if html else None
+    if table_html is None:
+        return None
+    # Collapse whitespace runs, then drop the ones between tags
+    return " ".join(table_html.split()).replace("> <", "><")
+
+
+def compute_fingerprint(*pages: str) -> Optional[str]:
+    """
+    Compute a stable fingerprint of the rankings table of a list.
+
+    Only the results table is hashed (``id="ctnBilans"``, or the
+    ``reveal-table`` fallback) after whitespace normalization, so that
+    changes in the page chrome (menus, ads, tokens) do not count as a
+    ranking change. The table is cut out of the raw HTML by scanning its
+    ``<table>`` tags, without building a document tree: an unchanged list
+    costs a small fraction of a parse. The tables of all pages of a
+    paginated list are hashed together, in page order.
+
+    Args:
+        pages: Raw HTML of each page of the list
+
+    Returns:
+        SHA-256 hex digest of the normalized tables, or None if the first
+        page has no table
+    """
+    tables = [_normalized_table(html) for html in pages]
+    if not tables or tables[0] is None:
+        return None
+
+    digest = hashlib.sha256()
+    for table in tables:
+        digest.update((table or "").encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -0,0 +1,23 @@
+"""Pagination discovery for athle.fr bilans lists."""
+
+import re
+
+from src.infrastructure.scraper.parsers import HtmlInput
+
+# Pagination links point to the other pages through the 0-based frmposition parameter
+_POSITION_RE = re.compile(rb"frmposition=(\d+)")
+
+
+def count_pages(html: HtmlInput) -> int:
+    """
+    Discover how many pages a bilans list has from its first page.
+
+    Args:
+        html: Raw HTML of the first page
+
+    Returns:
+        Number of pages (1 when the list is not paginated)
+    """
+    data = html.encode("utf-8") if isinstance(html, str) else html
+    positions = [int(position) for position in _POSITION_RE.findall(data)]
+    return max(positions, default=0) + 1
@@ -0,0 +1,116 @@
+"""Off-loop parsing of downloaded pages in a thread or process pool."""
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from src.config import settings
+from src.core.entities import RankingRow
+from src.infrastructure.scraper.parsers import HtmlInput, TableParser, get_table_parser
+from src.infrastructure.scraper.row_decoder import decode_rows
+
+PARSE_EXECUTOR_KINDS = ("process", "thread", "inline")
+
+
+def extract_and_decode(
+    parser: TableParser, pages: Sequence[HtmlInput]
+) -> tuple[list[RankingRow], list[int]]:
+    """
+    Extract and decode the rankings of the pages of a list.
+
+    Rows of all pages are decoded as one table, so that an ex-aequo rank
+    at the top of a page continues the last rank of the previous page.
+
+    Args:
+        parser: Table parser backend
+        pages: Raw HTML of each page, in page order
+
+    Returns:
+        Tuple of (ranking rows, indexes of pages without results table)
+    """
+    rows: list[list[str]] = []
+    missing_pages = []
+    for index, html in enumerate(pages):
+        page_rows = parser.extract_rows(html)
+        if page_rows is None:
+            missing_pages.append(index)
+            continue
+        rows.extend(page_rows)
+
+    rankings, _ = decode_rows(rows)
+    return rankings, missing_pages
+
+
+def parse_pages_to_records(backend: str, pages: list[bytes]) -> tuple[list[RankingRow], list[int]]:
+    """
+    Parse pages into ranking rows (pool worker entry point).
+
+    Takes raw bytes and returns :class:`RankingRow` tuples, which pickle
+    compactly across processes (interned strings are sent once per batch).
+
+    Args:
+        backend: Table parser backend name
+        pages: Raw HTML of each page, in page order
+
+    Returns:
+        Tuple of (ranking rows, indexes of pages without results table)
+    """
+    return extract_and_decode(get_table_parser(backend), pages)
+
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_worker_count() -> int:
+    """Get the number of parse workers (``scraping_parse_workers``, or CPUs up to 4)."""
+    return settings.scraping_parse_workers or min(os.cpu_count() or 1, 4)
+
+
+def get_parse_executor() -> Optional[Executor]:
+    """
+    Get the pool shared by every scraper to parse pages.
+
+    Returns:
+        Executor configured from settings on first use, or None when parsing
+        runs inline on the event loop
+
+    Raises:
+        ValueError: If the configured executor kind is unknown
+    """
+    global _executor
+
+    kind = settings.scraping_parse_executor
+    if kind not in PARSE_EXECUTOR_KINDS:
+        raise ValueError(
+            f"Unknown parse executor '{kind}'. Available: {', '.join(PARSE_EXECUTOR_KINDS)}"
+        )
+    if kind == "inline":
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            workers = get_parse_worker_count()
+            if kind == "process":
+                # spawn: forking a process that runs scheduler/HTTP threads is unsafe
+                _executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                _executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="athle-parse"
+                )
+        return _executor
+
+
+def shutdown_parse_executor() -> None:
+    """Shut the shared parse pool down (a new one is created on next use)."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
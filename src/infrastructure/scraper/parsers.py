@@ -0,0 +1,146 @@
+"""Pluggable HTML table parsers for athle.fr rankings pages."""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+from src.infrastructure.scraper.table_stream import (
+    HEADER_ROWS_COUNT,
+    cell_text,
+    stream_table_rows,
+)
+from src.utils import logger
+
+HtmlInput = Union[str, bytes]
+
+
+class TableParser(ABC):
+    """
+    Interface for extracting the results table of a rankings page.
+
+    Backends only locate the table (``id="ctnBilans"``, falling back to the
+    first ``reveal-table``) and return the stripped text of every cell of
+    the data rows; decoding the cells into rankings is shared.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def extract_rows(self, html: HtmlInput) -> Optional[list[list[str]]]:
+        """
+        Extract the cell texts of the data rows.
+
+        Args:
+            html: Raw HTML of the rankings page
+
+        Returns:
+            Cell texts of every data row (header rows skipped), or None if
+            no suitable table is found
+        """
+        pass
+
+
+class BeautifulSoupTableParser(TableParser):
+    """Parser building a full BeautifulSoup tree (reference implementation)."""
+
+    name = "bs4"
+
+    def extract_rows(self, html: HtmlInput) -> Optional[list[list[str]]]:
+        soup = BeautifulSoup(html, "lxml")
+
+        # Find results table (new structure with id="ctnBilans")
+        table = soup.find("table", id="ctnBilans")
+        if not table:
+            logger.warning("No results table found with id=ctnBilans")
+            # Debug: check what tables exist
+            all_tables = soup.find_all("table")
+            logger.warning(f"Found {len(all_tables)} tables total")
+            for i, tbl in enumerate(all_tables[:5]):  # Log first 5 tables
+                logger.warning(f"  Table {i+1}: classes={tbl.get('class')}, id={tbl.get('id')}")
+
+            # Try fallback: look for reveal-table class
+            table = soup.find("table", class_="reveal-table")
+            if table:
+                logger.info("Found table with class=reveal-table, using fallback")
+            else:
+                return None
+
+        # Skip first 3 rows (headers/info), row 3 is column names
+        all_rows = table.find_all("tr")
+        data_rows = all_rows[HEADER_ROWS_COUNT:] if len(all_rows) > HEADER_ROWS_COUNT else []
+
+        return [[cell.get_text(strip=True) for cell in row.find_all("td")] for row in data_rows]
+
+
+class LxmlXPathTableParser(TableParser):
+    """Parser building an lxml tree and locating the table with XPath."""
+
+    name = "lxml"
+
+    _MAIN_TABLE = etree.XPath('//table[@id="ctnBilans"]')
+    _FALLBACK_TABLE = etree.XPath(
+        '//table[contains(concat(" ", normalize-space(@class), " "), " reveal-table ")]'
+    )
+    _ROWS = etree.XPath(".//tr")
+    _CELLS = etree.XPath(".//td")
+
+    def extract_rows(self, html: HtmlInput) -> Optional[list[list[str]]]:
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+            parser = lxml_html.HTMLParser(encoding="utf-8")
+        else:
+            parser = None
+
+        try:
+            document = lxml_html.fromstring(html, parser=parser)
+        except etree.ParserError:
+            return None
+
+        tables = self._MAIN_TABLE(document) or self._FALLBACK_TABLE(document)
+        if not tables:
+            return None
+
+        all_rows = self._ROWS(tables[0])
+        data_rows = all_rows[HEADER_ROWS_COUNT:] if len(all_rows) > HEADER_ROWS_COUNT else []
+
+        return [[cell_text(cell) for cell in self._CELLS(row)] for row in data_rows]
+
+
+class LxmlStreamTableParser(TableParser):
+    """Parser streaming only the results table rows out of lxml."""
+
+    name = "lxml-stream"
+
+    def extract_rows(self, html: HtmlInput) -> Optional[list[list[str]]]:
+        return stream_table_rows(html)
+
+
+PARSER_BACKENDS: dict[str, type[TableParser]] = {
+    BeautifulSoupTableParser.name: BeautifulSoupTableParser,
+    LxmlXPathTableParser.name: LxmlXPathTableParser,
+    LxmlStreamTableParser.name: LxmlStreamTableParser,
+}
+
+
+def get_table_parser(name: str) -> TableParser:
+    """
+    Get a table parser backend by name.
+
+    Args:
+        name: Backend name (bs4, lxml or lxml-stream)
+
+    Returns:
+        Parser instance
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    try:
+        return PARSER_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown parser backend '{name}' (available: {', '.join(PARSER_BACKENDS)})"
+        ) from None
@@ -0,0 +1,123 @@
+"""Per-host token-bucket rate limiting shared by every scraper."""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from src.config import settings
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+
+    Callers reserve a token under a lock and sleep outside of it, so the
+    bucket can be shared by concurrent coroutines, by several event loops
+    and by threads: the requests are spread over time in reservation order
+    instead of each caller sleeping a fixed delay.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize bucket (full).
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests allowed back to back
+            jitter: Maximum random delay added to each request (seconds)
+            clock: Monotonic clock (injectable for tests)
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate limiter rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, possibly in advance.
+
+        Returns:
+            Delay to wait before using the token (seconds, jitter excluded)
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            # Negative balance: the token is borrowed from the future
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent.
+
+        Returns:
+            Time waited (seconds)
+        """
+        delay = self.reserve()
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> TokenBucket:
+    """
+    Get the rate limiter shared by every request to a host.
+
+    Args:
+        host: Host name
+
+    Returns:
+        Token bucket configured from settings on first use
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = TokenBucket(
+                rate=settings.scraping_rate_limit,
+                burst=settings.scraping_rate_burst,
+                jitter=settings.scraping_rate_jitter,
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def reset_host_limiters(host: Optional[str] = None) -> None:
+    """
+    Forget the rate limiter of a host (or of every host).
+
+    The next request rebuilds it from the current settings.
+
+    Args:
+        host: Host name (all hosts if omitted)
+    """
+    with _limiters_lock:
+        if host is None:
+            _limiters.clear()
+        else:
+            _limiters.pop(host, None)
@@ -0,0 +1,93 @@
+"""Scraper replaying archived pages instead of fetching athle.fr."""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from src.infrastructure.scraper.archive import ArchivedFetch, HtmlArchive
+from src.infrastructure.scraper.athle_scraper import AthleScraper
+from src.infrastructure.scraper.errors import ScrapingError
+from src.infrastructure.scraper.parsers import TableParser
+
+
+class ArchiveReplayScraper(AthleScraper):
+    """
+    Scraper serving the pages of one archived fetch.
+
+    It plugs into :class:`ScrapeRankingsUseCase` in place of the network
+    scraper, so archived pages go through the exact same parsing and
+    persistence path, with no network access and no delays.
+    """
+
+    def __init__(
+        self,
+        archive: HtmlArchive,
+        fetch: ArchivedFetch,
+        parser: Optional[TableParser] = None,
+    ) -> None:
+        """
+        Initialize replay scraper.
+
+        Args:
+            archive: Archive holding the pages
+            fetch: Archived fetch to replay
+            parser: Optional table parser backend
+        """
+        super().__init__(parser=parser)
+        # Replayed pages must not be archived a second time
+        self.archive = None
+        self.source = archive
+        self.fetch = fetch
+
+    def _check_target(self, epreuve_code: int, sexe: str, annee: int, categorie: str) -> None:
+        target = (epreuve_code, sexe, annee, categorie)
+        archived = (
+            self.fetch.epreuve_code,
+            self.fetch.sexe,
+            self.fetch.annee,
+            self.fetch.categorie,
+        )
+        if target != archived:
+            raise ScrapingError(f"Archived fetch is for {archived}, not {target}")
+
+    async def fetch_page(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        annee: int = 2026,
+        categorie: str = "CA",
+        page: int = 0,
+        fetched_at: Optional[datetime] = None,
+    ) -> str:
+        """
+        Load one archived page.
+
+        Raises:
+            ScrapingError: If the page is not part of the archived fetch
+        """
+        self._check_target(epreuve_code, sexe, annee, categorie)
+        for entry in self.fetch.entries:
+            if entry.page == page:
+                return await asyncio.to_thread(self.source.load, entry)
+        raise ScrapingError(f"Page {page} is not archived")
+
+    async def fetch_pages(
+        self,
+        epreuve_code: int,
+        sexe: str,
+        annee: int = 2026,
+        categorie: str = "CA",
+    ) -> list[str]:
+        """
+        Load every archived page of the fetch, in page order.
+
+        Raises:
+            ScrapingError: If the fetch is for another list or a page is unreadable
+        """
+        self._check_target(epreuve_code, sexe, annee, categorie)
+        try:
+            return [
+                await asyncio.to_thread(self.source.load, entry) for entry in self.fetch.entries
+            ]
+        except OSError as e:
+            raise ScrapingError(f"Failed to read archived page: {e}") from e
@@ -0,0 +1,221 @@
+"""Circuit breaking and retry budgeting for requests to athle.fr."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+from src.config import settings
+from src.infrastructure.scraper.errors import CircuitOpenError
+from src.utils import logger
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every request fails fast with :class:`CircuitOpenError`. Once
+    ``reset_timeout`` has elapsed a single probe request is let through:
+    its success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize breaker (closed).
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Time before probing an open circuit (seconds)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_until: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Get current state (closed, open or half_open)."""
+        with self._lock:
+            return self._state(self._clock())
+
+    def _state(self, now: float) -> str:
+        if self._opened_until is None:
+            return self.CLOSED
+        if now < self._opened_until:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def before_request(self) -> None:
+        """
+        Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and (
+                self._probe_started_at is None or now - self._probe_started_at > self.reset_timeout
+            ):
+                self._probe_started_at = now
+                return
+            retry_in = max((self._opened_until or now) - now, 0.0)
+        raise CircuitOpenError(f"Circuit open after repeated failures, retry in {retry_in:.0f}s")
+
+    def record_success(self) -> None:
+        """Record a successful request (closes the circuit)."""
+        with self._lock:
+            if self._opened_until is not None:
+                logger.info("Circuit closed, host is responding again")
+            self._failures = 0
+            self._opened_until = None
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed request (may open the circuit)."""
+        with self._lock:
+            now = self._clock()
+            self._failures += 1
+            probe_failed = self._state(now) == self.HALF_OPEN
+            if probe_failed or self._failures >= self.failure_threshold:
+                self._open(now, self.reset_timeout)
+
+    def open_for(self, seconds: float) -> None:
+        """
+        Open the circuit for at least the given time (e.g. a ``Retry-After``).
+
+        Args:
+            seconds: Time before the host may be probed again
+        """
+        with self._lock:
+            self._open(self._clock(), seconds)
+
+    def _open(self, now: float, seconds: float) -> None:
+        opened_until = now + seconds
+        if self._opened_until is None or opened_until > self._opened_until:
+            logger.warning(f"Circuit opened for {seconds:.0f}s after {self._failures} failure(s)")
+            self._opened_until = opened_until
+        self._probe_started_at = None
+
+
+class RetryBudget:
+    """
+    Maximum number of retries for a whole scrape run.
+
+    Shared by every page and event scraped with the same scraper, it bounds
+    the extra time a bad night can add to a run.
+    """
+
+    def __init__(self, max_retries: int) -> None:
+        """
+        Initialize budget.
+
+        Args:
+            max_retries: Number of retries allowed
+        """
+        self.max_retries = max_retries
+        self._spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Get number of retries left."""
+        with self._lock:
+            return max(self.max_retries - self._spent, 0)
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if a retry was available
+        """
+        with self._lock:
+            if self._spent >= self.max_retries:
+                return False
+            self._spent += 1
+            return True
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value: Header value (delay in seconds or HTTP date)
+        now: Current time for HTTP dates (default now, UTC)
+
+    Returns:
+        Delay in seconds (never negative), or None if absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_host_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker shared by every request to a host.
+
+    Args:
+        host: Host name
+
+    Returns:
+        Circuit breaker configured from settings on first use
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=settings.scraping_circuit_failure_threshold,
+                reset_timeout=settings.scraping_circuit_reset_timeout,
+            )
+            _breakers[host] = breaker
+        return breaker
+
+
+def reset_host_breakers(host: Optional[str] = None) -> None:
+    """
+    Forget the circuit breaker of a host (or of every host).
+
+    Args:
+        host: Host name (all hosts if omitted)
+    """
+    with _breakers_lock:
+        if host is None:
+            _breakers.clear()
+        else:
+            _breakers.pop(host, None)
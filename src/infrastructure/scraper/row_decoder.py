@@ -0,0 +1,177 @@
+"""Batch decoding of ranking table rows into ranking records."""
+
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from src.core.entities import RankingRow
+from src.utils import logger
+
+# Precompiled patterns (previously recompiled for every row)
+_MARKERS_RE = re.compile(r"\s*\([^)]*\)")
+_METRIC_PERF_RE = re.compile(r"(\d+)m(\d+)")
+_ANY_NUMBER_RE = re.compile(r"\d+\.?\d*")
+_VALID_PERF_RE = re.compile(r"\d+m\d+|\d+\.\d+", re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+DATE_FORMAT = "%d/%m/%y"
+
+
+@lru_cache(maxsize=4096)
+def decode_performance(performance_str: str) -> tuple[str, float]:
+    """
+    Parse performance string to extract clean value and numeric representation.
+
+    Results are memoized: the same performance strings repeat across a page
+    and across pages.
+
+    Args:
+        performance_str: Performance string (e.g., "58m14 (RP)", "49m29")
+
+    Returns:
+        Tuple of (clean_performance, numeric_value)
+
+    Examples:
+        "58m14 (RP)" -> ("58m14", 58.14)
+        "49m29" -> ("49m29", 49.29)
+        "47m20 (RP)" -> ("47m20", 47.20)
+    """
+    # Remove (RP) and other markers
+    clean = _MARKERS_RE.sub("", performance_str).strip()
+
+    # Extract numeric value (e.g., "58m14" -> 58.14)
+    match = _METRIC_PERF_RE.match(clean)
+    if match:
+        meters = int(match.group(1))
+        centimeters = int(match.group(2))
+        return clean, meters + (centimeters / 100.0)
+
+    # Fallback: try to extract any number
+    number = _ANY_NUMBER_RE.search(clean)
+    if number:
+        return clean, float(number.group(0))
+
+    # If no pattern matches, return 0.0
+    logger.warning(f"Could not parse performance: {performance_str}")
+    return clean, 0.0
+
+
+@lru_cache(maxsize=1024)
+def decode_date(date_text: str) -> Optional[datetime]:
+    """
+    Parse a DD/MM/YY date (memoized).
+
+    Args:
+        date_text: Date cell text
+
+    Returns:
+        Parsed date, or None if empty or invalid
+    """
+    if not date_text:
+        return None
+    try:
+        return datetime.strptime(date_text, DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def is_valid_performance(performance_text: str) -> bool:
+    """
+    Check that a performance cell holds a mark (e.g. "58m14" or "11.32").
+
+    This filters out detail rows where the performance cell is actually a
+    club name.
+    """
+    return _VALID_PERF_RE.search(performance_text) is not None
+
+
+def make_athlete_id(name: str) -> str:
+    """Generate athlete_id from name (normalized)."""
+    return _NON_ALNUM_RE.sub("_", name.lower())
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def decode_rows(rows: list[list[str]], last_valid_rank: int = 0) -> tuple[list[RankingRow], int]:
+    """
+    Decode all data rows of a table at once.
+
+    Rows are first filtered and ranked in one pass (ex-aequo "-" ranks depend
+    on the previous row), then every column is decoded in bulk with the
+    precompiled patterns and memoized decoders. Club, ligue and departement
+    values are interned: a list has thousands of rows but few distinct clubs.
+
+    Args:
+        rows: Stripped cell texts of each data row
+        last_valid_rank: Last valid rank before these rows (for ex-aequo handling)
+
+    Returns:
+        Tuple of (ranking rows, updated last_valid_rank)
+    """
+    kept: list[list[str]] = []
+    ranks: list[int] = []
+
+    # Pass 1: select data rows and resolve ranks
+    for cells in rows:
+        # Need at least rank, perf, name + some metadata
+        if len(cells) < 3:
+            continue
+
+        rank_text, performance_text, name = cells[0], cells[1], cells[2]
+
+        # Skip rows without valid data (detail rows, empty rows)
+        if not name or not performance_text:
+            continue
+
+        # Parse rank (handle tied ranks like "3", "3=", or "-" for ex-aequo)
+        if rank_text == "-":
+            rank = last_valid_rank
+        else:
+            rank_digits = _NON_DIGIT_RE.sub("", rank_text)
+            if not rank_digits:
+                continue
+            rank = int(rank_digits)
+
+        if not is_valid_performance(performance_text):
+            continue
+
+        last_valid_rank = rank
+        kept.append(cells)
+        ranks.append(rank)
+
+    # Pass 2: decode columns
+    names = [cells[2] for cells in kept]
+    athlete_ids = [make_athlete_id(name) for name in names]
+    performances = [decode_performance(cells[1]) for cells in kept]
+    now = datetime.now()
+    dates = [decode_date(cells[7]) if len(cells) > 7 else None for cells in kept]
+
+    def column(index: int) -> list[Optional[str]]:
+        return [cells[index] if len(cells) > index else None for cells in kept]
+
+    clubs, ligues, departements = ([_intern(value) for value in column(i)] for i in (3, 4, 5))
+    infos, lieux = column(6), column(8)
+
+    rankings = [
+        RankingRow(
+            ranks[i],
+            athlete_ids[i],
+            names[i],
+            performances[i][0],
+            performances[i][1],
+            clubs[i],
+            ligues[i],
+            departements[i],
+            infos[i],
+            dates[i] or now,
+            lieux[i],
+        )
+        for i in range(len(kept))
+    ]
+    return rankings, last_valid_rank
@@ -0,0 +1,117 @@
+"""Streaming extraction of the athle.fr results table with lxml."""
+
+from io import BytesIO
+from typing import Any, Optional, Union
+
+from lxml import etree
+
+# Tags whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Rows before the data: title, info lines and column names
+HEADER_ROWS_COUNT = 4
+
+
+def cell_text(cell: Any) -> str:
+    """
+    Get the text of a cell like BeautifulSoup's ``get_text(strip=True)``.
+
+    Args:
+        cell: lxml element
+
+    Returns:
+        Concatenation of every stripped text node of the cell
+    """
+    parts = [cell.text or ""]
+    for element in cell.iterdescendants():
+        # Comments and processing instructions have a non-string tag
+        if isinstance(element.tag, str) and element.tag not in _NON_TEXT_TAGS:
+            parts.append(element.text or "")
+        parts.append(element.tail or "")
+    return "".join(part.strip() for part in parts)
+
+
+def _has_class(element: Any, class_name: str) -> bool:
+    return class_name in (element.get("class") or "").split()
+
+
+def _is_inside(element: Any, table: Any) -> bool:
+    return any(ancestor is table for ancestor in element.iterancestors("table"))
+
+
+def stream_table_rows(html: Union[str, bytes]) -> Optional[list[list[str]]]:
+    """
+    Stream the data rows of the results table out of a page.
+
+    Only the ``ctnBilans`` table is materialized: rows are turned into lists
+    of cell texts as soon as they are closed and then dropped from the tree,
+    and parsing stops at the end of the table. When the page has no
+    ``ctnBilans`` table, the first ``reveal-table`` is used instead.
+
+    Args:
+        html: Raw page HTML (str is parsed as UTF-8, bytes use the page charset)
+
+    Returns:
+        Cell texts of every data row (header rows skipped), or None if no
+        suitable table was found
+    """
+    if isinstance(html, str):
+        source, encoding = BytesIO(html.encode("utf-8")), "utf-8"
+    else:
+        source, encoding = BytesIO(html), None
+
+    main_table = None
+    fallback_table = None
+    main_rows: list[list[str]] = []
+    fallback_rows: list[list[str]] = []
+
+    events = etree.iterparse(
+        source, events=("start", "end"), tag=("table", "tr"), html=True, encoding=encoding
+    )
+    try:
+        for event, element in events:
+            if element.tag == "table":
+                if event == "start":
+                    if main_table is None and element.get("id") == "ctnBilans":
+                        main_table = element
+                    elif fallback_table is None and _has_class(element, "reveal-table"):
+                        fallback_table = element
+                elif element is main_table:
+                    # Nothing after the results table is needed
+                    break
+                continue
+
+            if event != "end":
+                continue
+
+            if main_table is not None and _is_inside(element, main_table):
+                rows = main_rows
+            elif (
+                main_table is None
+                and fallback_table is not None
+                and _is_inside(element, fallback_table)
+            ):
+                rows = fallback_rows
+            else:
+                continue
+
+            rows.append([cell_text(cell) for cell in element.iter("td")])
+
+            # Free the row once read, unless it belongs to an enclosing row
+            if not any(True for _ in element.iterancestors("tr")):
+                element.clear()
+                parent = element.getparent()
+                while element.getprevious() is not None and parent is not None:
+                    del parent[0]
+    except etree.XMLSyntaxError:
+        # Raised by lxml on empty documents
+        return None
+
+    if main_table is not None:
+        rows = main_rows
+    elif fallback_table is not None:
+        rows = fallback_rows
+    else:
+        return None
+
+    return rows[HEADER_ROWS_COUNT:] if len(rows) > HEADER_ROWS_COUNT else []
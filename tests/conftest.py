@@ -1,24 +1,79 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+import pytest_asyncio
 from datetime import datetime
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from passlib.context import CryptContext
 
+from src.config import settings
+from src.core.entities import RankingRow
+from src.infrastructure.scraper.rate_limiter import reset_host_limiters
+from src.infrastructure.scraper.resilience import reset_host_breakers
+from src.infrastructure.database.connection import get_async_database_url
 from src.infrastructure.database.models import Base, User, Epreuve, Athlete, Ranking
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@pytest.fixture(autouse=True)
+def disable_html_archive(monkeypatch):
+    """Keep scrapers created by tests from writing to the real HTML archive."""
+    monkeypatch.setattr(settings, "scraping_archive_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def inline_parsing(monkeypatch):
+    """Parse pages on the event loop unless a test provides its own pool."""
+    monkeypatch.setattr(settings, "scraping_parse_executor", "inline")
+
+
+@pytest.fixture(autouse=True)
+def fast_rate_limit(monkeypatch):
+    """Lift the athle.fr politeness rate limit for scrapers hitting mock transports."""
+    monkeypatch.setattr(settings, "scraping_rate_limit", 10_000.0)
+    monkeypatch.setattr(settings, "scraping_rate_burst", 100)
+    monkeypatch.setattr(settings, "scraping_rate_jitter", 0.0)
+    reset_host_limiters()
+    yield
+    reset_host_limiters()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Keep failures simulated by one test from opening the circuit for the next."""
+    reset_host_breakers()
+    yield
+    reset_host_breakers()
+
+
 @pytest.fixture(scope="function")
-def test_engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
+def test_engine(tmp_path):
+    """Create SQLite engine for testing (file-backed, shared with the async engine)."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", echo=False)
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_async_engine(test_engine):
+    """Create async engine on the test database."""
+    engine = create_async_engine(get_async_database_url(str(test_engine.url)))
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_async_session(test_async_engine):
+    """Create async test database session."""
+    session = AsyncSession(test_async_engine, expire_on_commit=False)
+    yield session
+    await session.close()
 
 
 @pytest.fixture(scope="function")
@@ -118,43 +173,43 @@ def test_ranking(test_session: Session, test_epreuve: Epreuve, test_athlete: Ath
 def sample_scrape_data():
     """Sample scraped data for testing."""
     return [
-        {
-            "rank": 1,
-            "athlete_id": "navaud_roger_nathan",
-            "name": "NAVAUD-ROGER Nathan",
-            "performance": "58m14",
-            "performance_numeric": 58.14,
-            "club": "Ca Montreuil 93",
-            "ligue": "I-F",
-            "departement": "093",
-            "infos": "CAM/09",
-            "date": datetime(2025, 9, 28),
-            "lieu": "Aulnay sous bois",
-        },
-        {
-            "rank": 2,
-            "athlete_id": "sence_robin",
-            "name": "SENCE Robin",
-            "performance": "49m29",
-            "performance_numeric": 49.29,
-            "club": "Artois Athletisme*",
-            "ligue": "H-F",
-            "departement": "062",
-            "infos": "CAM/09",
-            "date": datetime(2025, 10, 5),
-            "lieu": "Bruay la buissiere",
-        },
-        {
-            "rank": 3,
-            "athlete_id": "klein_timeo",
-            "name": "KLEIN Timeo",
-            "performance": "49m10",
-            "performance_numeric": 49.10,
-            "club": "Fac Andrezieux",
-            "ligue": "ARA",
-            "departement": "042",
-            "infos": "CAM/09",
-            "date": datetime(2025, 9, 28),
-            "lieu": "Grenoble",
-        },
+        RankingRow(
+            rank=1,
+            athlete_id="navaud_roger_nathan",
+            name="NAVAUD-ROGER Nathan",
+            performance="58m14",
+            performance_numeric=58.14,
+            club="Ca Montreuil 93",
+            ligue="I-F",
+            departement="093",
+            infos="CAM/09",
+            date=datetime(2025, 9, 28),
+            lieu="Aulnay sous bois",
+        ),
+        RankingRow(
+            rank=2,
+            athlete_id="sence_robin",
+            name="SENCE Robin",
+            performance="49m29",
+            performance_numeric=49.29,
+            club="Artois Athletisme*",
+            ligue="H-F",
+            departement="062",
+            infos="CAM/09",
+            date=datetime(2025, 10, 5),
+            lieu="Bruay la buissiere",
+        ),
+        RankingRow(
+            rank=3,
+            athlete_id="klein_timeo",
+            name="KLEIN Timeo",
+            performance="49m10",
+            performance_numeric=49.10,
+            club="Fac Andrezieux",
+            ligue="ARA",
+            departement="042",
+            infos="CAM/09",
+            date=datetime(2025, 9, 28),
+            lieu="Grenoble",
+        ),
     ]
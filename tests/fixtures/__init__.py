@@ -0,0 +1 @@
+"""Reusable test fixtures (sample athle.fr pages)."""
@@ -0,0 +1,148 @@
+"""Previous per-row alert evaluation, kept as a reference for tests and benchmarks."""
+
+from typing import Any
+
+
+def legacy_check_alerts(
+    user_repo,
+    favorite_repo,
+    athlete_id: str,
+    athlete_name: str,
+    old_rank: int | None,
+    new_rank: int,
+    epreuve_code: int,
+    sexe: str,
+) -> list[dict[str, Any]]:
+    """Evaluate one ranking change, listing users and favorites for every call."""
+    alerts = []
+
+    # Get all active users for alerts
+    all_users = user_repo.list_all()
+    active_users = [u for u in all_users if u.actif]
+
+    # Check Top 3 (Podium) - CRITIQUE
+    if new_rank <= 3:
+        if old_rank is None or old_rank > 3:
+            # Entered podium
+            for user in active_users:
+                alerts.append(
+                    {
+                        "user_id": user.id,
+                        "alert_type": "critique",
+                        "athlete_id": athlete_id,
+                        "epreuve_code": epreuve_code,
+                        "sexe": sexe,
+                        "title": f"🥇 Podium : {athlete_name}",
+                        "message": f"{athlete_name} entre dans le Top 3 (rang {new_rank})",
+                        "old_rank": old_rank,
+                        "new_rank": new_rank,
+                    }
+                )
+    elif old_rank and old_rank <= 3:
+        # Exited podium
+        for user in active_users:
+            alerts.append(
+                {
+                    "user_id": user.id,
+                    "alert_type": "critique",
+                    "athlete_id": athlete_id,
+                    "epreuve_code": epreuve_code,
+                    "sexe": sexe,
+                    "title": f"⚠️ Podium : {athlete_name}",
+                    "message": f"{athlete_name} sort du Top 3 (rang {old_rank} → {new_rank})",
+                    "old_rank": old_rank,
+                    "new_rank": new_rank,
+                }
+            )
+
+    # Check Top 10 - IMPORTANT
+    elif new_rank <= 10:
+        if old_rank is None or old_rank > 10:
+            # Entered Top 10
+            for user in active_users:
+                alerts.append(
+                    {
+                        "user_id": user.id,
+                        "alert_type": "important",
+                        "athlete_id": athlete_id,
+                        "epreuve_code": epreuve_code,
+                        "sexe": sexe,
+                        "title": f"⭐ Top 10 : {athlete_name}",
+                        "message": f"{athlete_name} entre dans le Top 10 (rang {new_rank})",
+                        "old_rank": old_rank,
+                        "new_rank": new_rank,
+                    }
+                )
+    elif old_rank and old_rank <= 10:
+        # Exited Top 10
+        for user in active_users:
+            alerts.append(
+                {
+                    "user_id": user.id,
+                    "alert_type": "important",
+                    "athlete_id": athlete_id,
+                    "epreuve_code": epreuve_code,
+                    "sexe": sexe,
+                    "title": f"📉 Top 10 : {athlete_name}",
+                    "message": f"{athlete_name} sort du Top 10 (rang {old_rank} → {new_rank})",
+                    "old_rank": old_rank,
+                    "new_rank": new_rank,
+                }
+            )
+
+    # Check Top 20 - INFO
+    elif new_rank <= 20:
+        if old_rank is None or old_rank > 20:
+            # Entered Top 20
+            for user in active_users:
+                alerts.append(
+                    {
+                        "user_id": user.id,
+                        "alert_type": "info",
+                        "athlete_id": athlete_id,
+                        "epreuve_code": epreuve_code,
+                        "sexe": sexe,
+                        "title": f"📊 Top 20 : {athlete_name}",
+                        "message": f"{athlete_name} entre dans le Top 20 (rang {new_rank})",
+                        "old_rank": old_rank,
+                        "new_rank": new_rank,
+                    }
+                )
+    elif old_rank and old_rank <= 20:
+        # Exited Top 20
+        for user in active_users:
+            alerts.append(
+                {
+                    "user_id": user.id,
+                    "alert_type": "info",
+                    "athlete_id": athlete_id,
+                    "epreuve_code": epreuve_code,
+                    "sexe": sexe,
+                    "title": f"📉 Top 20 : {athlete_name}",
+                    "message": f"{athlete_name} sort du Top 20 (rang {old_rank} → {new_rank})",
+                    "old_rank": old_rank,
+                    "new_rank": new_rank,
+                }
+            )
+
+    # Check Favorites - INFO (for any rank change)
+    if old_rank and old_rank != new_rank:
+        # Get users who favorited this athlete
+        for user in active_users:
+            if favorite_repo.is_favorite(user.id, athlete_id, epreuve_code):
+                direction = "📈" if new_rank < old_rank else "📉"
+                alerts.append(
+                    {
+                        "user_id": user.id,
+                        "alert_type": "info",
+                        "athlete_id": athlete_id,
+                        "epreuve_code": epreuve_code,
+                        "sexe": sexe,
+                        "title": f"{direction} Favori : {athlete_name}",
+                        "message": f"{athlete_name} passe du rang {old_rank} au rang {new_rank}",
+                        "old_rank": old_rank,
+                        "new_rank": new_rank,
+                    }
+                )
+
+    return alerts
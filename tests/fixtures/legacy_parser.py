@@ -0,0 +1,103 @@
+"""Per-row reference implementation of the ranking row decoding.
+
+Kept verbatim from the scraper before batch decoding was introduced, to
+check that the batch decoder output is unchanged and to benchmark it.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Optional
+
+
+def legacy_parse_performance(performance_str: str) -> tuple[str, float]:
+    """Parse performance string (per-call regex compilation)."""
+    clean = re.sub(r"\s*\([^)]*\)", "", performance_str).strip()
+
+    match = re.match(r"(\d+)m(\d+)", clean)
+    if match:
+        meters = int(match.group(1))
+        centimeters = int(match.group(2))
+        return clean, meters + (centimeters / 100.0)
+
+    numbers = re.findall(r"\d+\.?\d*", clean)
+    if numbers:
+        return clean, float(numbers[0])
+
+    return clean, 0.0
+
+
+def legacy_parse_ranking_cells(
+    cells: list[str], last_valid_rank: int
+) -> Optional[tuple[dict[str, Any], int]]:
+    """Parse the cell texts of a single ranking row."""
+    try:
+        if len(cells) < 3:
+            return None
+
+        rank_text = cells[0]
+        performance_text = cells[1]
+        name = cells[2]
+        club = cells[3] if len(cells) > 3 else None
+        ligue = cells[4] if len(cells) > 4 else None
+        departement = cells[5] if len(cells) > 5 else None
+        infos = cells[6] if len(cells) > 6 else None
+        date_text = cells[7] if len(cells) > 7 else ""
+        lieu = cells[8] if len(cells) > 8 else None
+
+        if not name or not performance_text:
+            return None
+
+        if rank_text == "-":
+            rank = last_valid_rank
+            new_last_valid_rank = last_valid_rank
+        else:
+            rank_digits = re.sub(r"[^0-9]", "", rank_text)
+            if not rank_digits:
+                return None
+            rank = int(rank_digits)
+            new_last_valid_rank = rank
+
+        if not re.search(r"\d+m\d+|\d+\.\d+", performance_text, re.IGNORECASE):
+            return None
+
+        performance, performance_numeric = legacy_parse_performance(performance_text)
+
+        if date_text:
+            try:
+                date_obj = datetime.strptime(date_text, "%d/%m/%y")
+            except ValueError:
+                date_obj = datetime.now()
+        else:
+            date_obj = datetime.now()
+
+        athlete_id = re.sub(r"[^a-zA-Z0-9]", "_", name.lower())
+
+        ranking_data = {
+            "rank": rank,
+            "athlete_id": athlete_id,
+            "name": name,
+            "performance": performance,
+            "performance_numeric": performance_numeric,
+            "club": club,
+            "ligue": ligue,
+            "departement": departement,
+            "infos": infos,
+            "date": date_obj,
+            "lieu": lieu,
+        }
+        return ranking_data, new_last_valid_rank
+
+    except Exception:
+        return None
+
+
+def legacy_decode_rows(rows: list[list[str]]) -> list[dict[str, Any]]:
+    """Decode all rows of a table one at a time."""
+    rankings = []
+    last_valid_rank = 0
+    for cells in rows:
+        parsed = legacy_parse_ranking_cells(cells, last_valid_rank)
+        if parsed:
+            ranking_data, last_valid_rank = parsed
+            rankings.append(ranking_data)
+    return rankings
@@ -0,0 +1,128 @@
+"""Builders for synthetic athle.fr bilans pages."""
+
+import gzip
+import random
+from pathlib import Path
+from typing import Optional
+
+FIRST_NAMES = ["Nathan", "Robin", "Timeo", "Lucas", "Hugo", "Louis", "Jules", "Ethan", "Noé", "Léo"]
+LAST_NAMES = ["NAVAUD-ROGER", "SENCE", "KLEIN", "MARTIN", "BERNARD", "DUBOIS", "THOMAS", "ROBERT"]
+CLUBS = [
+    ("Ca Montreuil 93", "I-F", "093"),
+    ("Artois Athletisme*", "H-F", "062"),
+    ("Fac Andrezieux", "ARA", "042"),
+    ("Stade Français", "I-F", "075"),
+    ("Lille Metropole Athletisme", "H-F", "059"),
+]
+LIEUX = ["Aulnay sous bois", "Bruay la buissiere", "Grenoble", "Lyon", "Lille"]
+DATES = ["28/09/25", "05/10/25", "14/06/25", "21/06/25", "12/07/25"]
+
+HEADER_ROWS = """
+<tr><td colspan="9" class="titles">Bilans 2026 - Javelot (700g) - Cadets</td></tr>
+<tr><td colspan="9">Liste non officielle</td></tr>
+<tr><td colspan="9">&nbsp;</td></tr>
+<tr><th>Rang</th><th>Perf.</th><th>Athlète</th><th>Club</th><th>Lig.</th>
+<th>Dpt.</th><th>Infos</th><th>Date</th><th>Lieu</th></tr>
+"""
+
+
+def build_row_cells(index: int, rng: random.Random) -> list[str]:
+    """Build the cell texts of one data row."""
+    club, ligue, departement = rng.choice(CLUBS)
+    name = f"{rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)} {index}"
+    performance = f"{max(10, 70 - index // 20)}m{rng.randint(0, 99):02d}"
+    if rng.random() < 0.2:
+        performance += " (RP)"
+    return [
+        str(index + 1),
+        performance,
+        name,
+        club,
+        ligue,
+        departement,
+        "CAM/09",
+        rng.choice(DATES),
+        rng.choice(LIEUX),
+    ]
+
+
+def build_bilans_page(
+    n_rows: int,
+    seed: int = 42,
+    table_attrs: str = 'id="ctnBilans" class="reveal-table"',
+    ex_aequo_every: Optional[int] = 7,
+    detail_rows: bool = True,
+    first_index: int = 0,
+    page_count: int = 1,
+) -> str:
+    """
+    Build a synthetic athle.fr bilans page.
+
+    Args:
+        n_rows: Number of ranked athletes
+        seed: Random seed (pages are deterministic for a given seed)
+        table_attrs: Attributes of the results table
+        ex_aequo_every: Emit a "-" (ex-aequo) rank every N rows (None to disable)
+        detail_rows: Add the collapsible detail row athle.fr puts after each athlete
+        first_index: Index of the first athlete (for the following pages of a list)
+        page_count: Number of pages of the list (adds pagination links when > 1)
+
+    Returns:
+        Page HTML
+    """
+    rng = random.Random(seed)
+    body = []
+    for i in range(first_index, first_index + n_rows):
+        cells = build_row_cells(i, rng)
+        if ex_aequo_every and i and i % ex_aequo_every == 0:
+            cells[0] = "-"
+        tds = "".join(
+            f'<td class="datas0"><a href="#">{cell}</a></td>' if col == 2 else f"<td>{cell}</td>"
+            for col, cell in enumerate(cells)
+        )
+        body.append(f'<tr class="clickable">{tds}</tr>')
+        if detail_rows:
+            body.append(
+                f'<tr class="detail"><td></td><td>{cells[3]}</td>'
+                f'<td colspan="7">Né en 2009 &nbsp;<!-- licence --></td></tr>'
+            )
+
+    pagination = ""
+    if page_count > 1:
+        links = "".join(
+            f'<a href="liste.aspx?frmpostback=true&amp;frmbase=bilans&amp;frmposition={page}">'
+            f"{page + 1}</a>"
+            for page in range(page_count)
+        )
+        pagination = f'<div class="pagination">{links}</div>'
+
+    return f"""<!DOCTYPE html>
+<html lang="fr">
+<head><meta charset="utf-8"><title>FFA - Bilans</title></head>
+<body>
+<div class="menu"><table class="layout"><tr><td>Menu</td></tr></table></div>
+<div id="content">
+<table {table_attrs}>
+{HEADER_ROWS}
+{"".join(body)}
+</table>
+{pagination}
+</div>
+<footer>Généré le {rng.randint(1, 28)}/10/2026</footer>
+</body>
+</html>
+"""
+
+
+CORPUS_DIR = Path(__file__).parent / "athle_pages"
+
+
+def list_corpus_pages() -> list[str]:
+    """List the names of the saved pages of the parse corpus."""
+    return sorted(path.name.removesuffix(".html.gz") for path in CORPUS_DIR.glob("*.html.gz"))
+
+
+def load_corpus_page(name: str) -> str:
+    """Load a saved page of the parse corpus."""
+    with gzip.open(CORPUS_DIR / f"{name}.html.gz", "rt", encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,204 @@
+"""Integration tests for ScrapePipeline."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.use_cases import (
+    ScrapePipeline,
+    ScrapeRankingsUseCase,
+    ScrapeRunSummary,
+    get_latest_pipeline_metrics,
+)
+from src.infrastructure.database.models import Epreuve, Ranking, ScrapeLog
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget, ScrapingError
+from tests.fixtures.pages import build_bilans_page
+
+
+@pytest.fixture
+def test_epreuves(test_session: Session, test_epreuve: Epreuve) -> list[Epreuve]:
+    """Three active events."""
+    others = [
+        Epreuve(nom="Poids", code=610, actif=True),
+        Epreuve(nom="Disque", code=640, actif=True),
+    ]
+    test_session.add_all(others)
+    test_session.commit()
+    return [test_epreuve, *others]
+
+
+def make_pipeline(test_async_engine, scraper: AthleScraper, **kwargs) -> ScrapePipeline:
+    """Build a pipeline writing to the test database."""
+    return ScrapePipeline(
+        lambda: AsyncSession(test_async_engine, expire_on_commit=False), scraper=scraper, **kwargs
+    )
+
+
+def serve_pages(pages_by_code: dict[int, str], failing: tuple[int, ...] = ()):
+    """Fake fetch_pages returning one page per event code."""
+
+    async def fetch_pages(epreuve_code: int, sexe: str, annee: int, categorie: str) -> list[str]:
+        await asyncio.sleep(0.01)
+        if epreuve_code in failing:
+            raise ScrapingError(f"HTTP 503 for {epreuve_code}")
+        return [pages_by_code[epreuve_code]]
+
+    return fetch_pages
+
+
+@pytest.mark.integration
+class TestScrapePipeline:
+    """Integration tests for ScrapePipeline."""
+
+    @pytest.mark.asyncio
+    async def test_run_stores_every_target(
+        self, test_async_engine, test_session: Session, test_epreuves: list[Epreuve]
+    ) -> None:
+        """Test that every list goes through fetch, parse and persist."""
+        scraper = AthleScraper()
+        pages = {e.code: build_bilans_page(10 + i, seed=i) for i, e in enumerate(test_epreuves)}
+        pipeline = make_pipeline(test_async_engine, scraper, fetch_workers=2, queue_size=1)
+
+        with patch.object(scraper, "fetch_pages", new=serve_pages(pages)):
+            results = await pipeline.run(ScrapeTarget(e.code, "M") for e in test_epreuves)
+        await scraper.aclose()
+
+        assert sorted(target.epreuve_code for target, _ in results) == [610, 640, 670]
+        assert all(result["success"] for _, result in results)
+        for i, epreuve in enumerate(test_epreuves):
+            stored = test_session.query(Ranking).filter_by(epreuve_code=epreuve.code).count()
+            assert stored == 10 + i
+        metrics = pipeline.metrics.to_dict()
+        assert metrics["running"] is False
+        assert [metrics["stages"][s]["items"] for s in ("fetch", "parse", "persist")] == [3, 3, 3]
+        assert metrics["stages"]["parse"]["max_queue_depth"] <= 1
+        assert get_latest_pipeline_metrics() is pipeline.metrics
+
+    @pytest.mark.asyncio
+    async def test_unchanged_list_skips_parse(
+        self, test_async_engine, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that a list identical to the last scrape is logged without being parsed."""
+        scraper = AthleScraper()
+        pages = {test_epreuve.code: build_bilans_page(10)}
+
+        with patch.object(scraper, "fetch_pages", new=serve_pages(pages)):
+            await make_pipeline(test_async_engine, scraper).run([ScrapeTarget(670, "M")])
+            pipeline = make_pipeline(test_async_engine, scraper)
+            [(_, result)] = await pipeline.run([ScrapeTarget(670, "M")])
+        await scraper.aclose()
+
+        assert result["unchanged"] is True
+        assert pipeline.metrics.stages["parse"].items == 0
+        statuses = [log.status for log in test_session.query(ScrapeLog).order_by(ScrapeLog.id)]
+        assert statuses == ["success", "unchanged"]
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_the_run(
+        self, test_async_engine, test_session: Session, test_epreuves: list[Epreuve]
+    ) -> None:
+        """Test that a failed download and an unknown event are reported per target."""
+        scraper = AthleScraper()
+        pages = {e.code: build_bilans_page(10) for e in test_epreuves}
+        targets = [ScrapeTarget(e.code, "M") for e in test_epreuves] + [ScrapeTarget(999, "M")]
+
+        with patch.object(scraper, "fetch_pages", new=serve_pages(pages, failing=(610,))):
+            pipeline = make_pipeline(test_async_engine, scraper)
+            results = dict(await pipeline.run(targets))
+        await scraper.aclose()
+
+        assert results[ScrapeTarget(999, "M")] == {
+            "success": False,
+            "error": "Epreuve 999 not found",
+        }
+        assert results[ScrapeTarget(610, "M")]["error"] == "HTTP 503 for 610"
+        assert results[ScrapeTarget(670, "M")]["success"] is True
+        assert results[ScrapeTarget(640, "M")]["success"] is True
+        assert pipeline.metrics.stages["fetch"].errors == 1
+        error_log = test_session.query(ScrapeLog).filter_by(epreuve_code=610).one()
+        assert error_log.status == "error"
+        assert test_session.query(Ranking).filter_by(epreuve_code=610).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_list_does_not_stop_the_run(
+        self, test_async_engine, test_session: Session, test_epreuves: list[Epreuve]
+    ) -> None:
+        """Test that a list whose storage and error log both fail is skipped."""
+        scraper = AthleScraper()
+        pages = {e.code: build_bilans_page(10) for e in test_epreuves}
+        targets = [ScrapeTarget(e.code, "M") for e in test_epreuves]
+        store = ScrapeRankingsUseCase.store
+        record_failure = ScrapeRankingsUseCase.record_failure
+
+        async def failing_store(use_case, epreuve, *args, **kwargs):
+            if epreuve.code == 610:
+                raise RuntimeError("database is locked")
+            return await store(use_case, epreuve, *args, **kwargs)
+
+        async def failing_record(use_case, epreuve_code, *args, **kwargs):
+            if epreuve_code == 610:
+                raise RuntimeError("database is locked")
+            return await record_failure(use_case, epreuve_code, *args, **kwargs)
+
+        with (
+            patch.object(scraper, "fetch_pages", new=serve_pages(pages)),
+            patch.object(ScrapeRankingsUseCase, "store", new=failing_store),
+            patch.object(ScrapeRankingsUseCase, "record_failure", new=failing_record),
+        ):
+            pipeline = make_pipeline(test_async_engine, scraper, queue_size=1)
+            results = dict(await pipeline.run(targets))
+        await scraper.aclose()
+
+        failed = results[ScrapeTarget(610, "M")]
+        assert failed["recorded"] is False
+        assert failed["error"] == "Could not record the scrape: database is locked"
+        assert results[ScrapeTarget(670, "M")]["success"] is True
+        assert results[ScrapeTarget(640, "M")]["success"] is True
+        assert test_session.query(Ranking).filter_by(epreuve_code=640).count() == 10
+        assert test_session.query(ScrapeLog).filter_by(epreuve_code=610).count() == 0
+        assert pipeline.metrics.stages["persist"].errors == 1
+        assert ScrapeRunSummary.from_results(results.items(), datetime.now(), 1.0).unrecorded == 1
+
+
+@pytest.mark.unit
+class TestScrapeRunSummary:
+    """Unit tests for ScrapeRunSummary."""
+
+    def test_from_results(self) -> None:
+        """Test that results are counted and latencies kept per list."""
+        results = [
+            (ScrapeTarget(670, "M"), {"success": True, "duration_seconds": 1.0}),
+            (ScrapeTarget(670, "F"), {"success": True, "unchanged": True, "duration_seconds": 3.0}),
+            (
+                ScrapeTarget(610, "M"),
+                {"success": False, "error": "HTTP 503", "duration_seconds": 2.0},
+            ),
+            (ScrapeTarget(999, "M"), {"success": False, "error": "Epreuve 999 not found"}),
+            (
+                ScrapeTarget(640, "M"),
+                {"success": False, "recorded": False, "error": "Could not record the scrape"},
+            ),
+        ]
+
+        summary = ScrapeRunSummary.from_results(results, datetime(2026, 5, 1, 2, 0), 4.5)
+
+        assert (summary.targets, summary.stored, summary.unchanged) == (5, 1, 1)
+        assert summary.failures == {
+            ScrapeTarget(610, "M"): "HTTP 503",
+            ScrapeTarget(999, "M"): "Epreuve 999 not found",
+            ScrapeTarget(640, "M"): "Could not record the scrape",
+        }
+        assert summary.slowest(2) == [(ScrapeTarget(670, "F"), 3.0), (ScrapeTarget(610, "M"), 2.0)]
+        data = summary.to_dict()
+        assert (data["failed"], data["unrecorded"]) == (3, 1)
+        assert data["latency_seconds"] == {"p50": 2.0, "p95": 3.0, "max": 3.0}
+
+    def test_empty_run(self) -> None:
+        """Test the latencies of a run without lists."""
+        summary = ScrapeRunSummary.from_results([], datetime(2026, 5, 1, 2, 0), 0.1)
+
+        assert summary.to_dict()["latency_seconds"] == {"p50": 0.0, "p95": 0.0, "max": 0.0}
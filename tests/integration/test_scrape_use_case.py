@@ -1,11 +1,34 @@
 """Integration tests for ScrapeRankingsUseCase."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from datetime import datetime
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from src.core.use_cases import ScrapeRankingsUseCase
-from src.infrastructure.database.models import Epreuve, User
+from src.core.use_cases import ReingestArchiveUseCase, ScrapeRankingsUseCase
+from src.infrastructure.database.models import (
+    AlertDelivery,
+    AlertEvent,
+    Athlete,
+    Epreuve,
+    Ranking,
+    ScrapeLog,
+    User,
+)
+from src.infrastructure.scraper import HtmlArchive
+from tests.fixtures.pages import build_bilans_page
+
+
+@contextmanager
+def mock_scraper(use_case: ScrapeRankingsUseCase, rankings: list, html: str = ""):
+    """Mock the scraper of a use case to return the given rankings."""
+    with patch.object(
+        use_case.scraper, "fetch_pages", new=AsyncMock(return_value=[html])
+    ), patch.object(use_case.scraper, "parse_pages", new=MagicMock(return_value=rankings)):
+        yield
 
 
 @pytest.mark.integration
@@ -15,18 +38,17 @@ class TestScrapeRankingsUseCase:
     @pytest.mark.asyncio
     async def test_execute_success_with_mocked_scraper(
         self,
+        test_async_session,
         test_session: Session,
         test_epreuve: Epreuve,
         test_admin_user: User,
         sample_scrape_data,
     ) -> None:
         """Test successful scraping with mocked scraper."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
         # Mock the scraper to return sample data
-        with patch.object(
-            use_case.scraper, "scrape_rankings", new=AsyncMock(return_value=sample_scrape_data)
-        ):
+        with mock_scraper(use_case, sample_scrape_data):
             result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
 
         assert result["success"] is True
@@ -35,22 +57,22 @@ class TestScrapeRankingsUseCase:
 
     @pytest.mark.asyncio
     async def test_execute_no_data(
-        self, test_session: Session, test_epreuve: Epreuve
+        self, test_async_session, test_session: Session, test_epreuve: Epreuve
     ) -> None:
         """Test scraping when no data is returned."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
         # Mock scraper to return empty list
-        with patch.object(use_case.scraper, "scrape_rankings", new=AsyncMock(return_value=[])):
+        with mock_scraper(use_case, []):
             result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
 
         assert result["success"] is False
         assert "No rankings data found" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_execute_epreuve_not_found(self, test_session: Session) -> None:
+    async def test_execute_epreuve_not_found(self, test_async_session, test_session: Session) -> None:
         """Test scraping with nonexistent epreuve."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
         result = await use_case.execute(epreuve_code=9999, sexe="M")
 
@@ -60,31 +82,127 @@ class TestScrapeRankingsUseCase:
     @pytest.mark.asyncio
     async def test_alerts_generation_top_3(
         self,
+        test_async_session,
         test_session: Session,
         test_epreuve: Epreuve,
         test_admin_user: User,
         sample_scrape_data,
     ) -> None:
         """Test alert generation for Top 3 entries."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
         # Mock scraper
-        with patch.object(
-            use_case.scraper, "scrape_rankings", new=AsyncMock(return_value=sample_scrape_data)
-        ):
+        with mock_scraper(use_case, sample_scrape_data):
             result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
 
         # Should generate alerts for Top 3 (all new athletes)
         assert result["alerts_count"] > 0
 
+    @pytest.mark.asyncio
+    async def test_alerts_stored_once_per_event(
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+        sample_scrape_data,
+    ) -> None:
+        """Test that each alert is stored once with one delivery per user."""
+        test_session.add_all(
+            User(email=f"user{i}@test.com", password_hash="x", role="user") for i in range(2)
+        )
+        test_session.commit()
+        use_case = ScrapeRankingsUseCase(test_async_session)
+
+        with mock_scraper(use_case, sample_scrape_data):
+            result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        events = test_session.query(AlertEvent).count()
+        assert events > 0
+        assert test_session.query(AlertDelivery).count() == 3 * events
+        assert result["alerts_count"] == 3 * events
+
+    @pytest.mark.asyncio
+    async def test_run_commits_once(
+        self,
+        test_async_engine,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+        sample_scrape_data,
+    ) -> None:
+        """Test that athletes, rankings, alerts and log are committed together."""
+        use_case = ScrapeRankingsUseCase(test_async_session)
+        commits = []
+        event.listen(test_async_engine.sync_engine, "commit", commits.append)
+
+        with mock_scraper(use_case, sample_scrape_data):
+            result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        assert result["success"] is True
+        assert len(commits) == 1
+
+    @pytest.mark.asyncio
+    async def test_alert_failure_keeps_rankings(
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+        sample_scrape_data,
+    ) -> None:
+        """Test that failing to store alerts only rolls back the alerts savepoint."""
+        use_case = ScrapeRankingsUseCase(test_async_session)
+        create_bulk = use_case.alert_repo.create_bulk
+
+        async def failing_create_bulk(alerts_data):
+            await create_bulk(alerts_data)
+            raise SQLAlchemyError("disk full")
+
+        with mock_scraper(use_case, sample_scrape_data), patch.object(
+            use_case.alert_repo, "create_bulk", side_effect=failing_create_bulk
+        ):
+            result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        assert result["success"] is True
+        assert result["alerts_count"] == 0
+        assert test_session.query(AlertEvent).count() == 0
+        assert test_session.query(Ranking).count() == len(sample_scrape_data)
+
+    @pytest.mark.asyncio
+    async def test_persist_failure_rolls_back_run(
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+        sample_scrape_data,
+    ) -> None:
+        """Test that a failure while storing rankings leaves no partial snapshot."""
+        use_case = ScrapeRankingsUseCase(test_async_session)
+
+        with mock_scraper(use_case, sample_scrape_data), patch.object(
+            use_case.ranking_repo, "create_from_rows", side_effect=SQLAlchemyError("locked")
+        ):
+            result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        assert result["success"] is False
+        assert test_session.query(Athlete).count() == 0
+        assert [log.status for log in test_session.query(ScrapeLog)] == ["error"]
+
     @pytest.mark.asyncio
     async def test_check_alerts_new_athlete_top_3(
-        self, test_session: Session, test_epreuve: Epreuve, test_admin_user: User
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
     ) -> None:
         """Test alert generation for new athlete in Top 3."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
-        alerts = use_case._check_alerts(
+        alerts = await use_case._check_alerts(
             athlete_id="test_athlete",
             athlete_name="Test Athlete",
             old_rank=None,  # New athlete
@@ -96,16 +214,21 @@ class TestScrapeRankingsUseCase:
         # Should generate critique alert for all users
         assert len(alerts) > 0
         assert all(a["alert_type"] == "critique" for a in alerts)
-        assert all("Top 3" in a["title"] for a in alerts)
+        assert all(a["title"] == "🥇 Podium : Test Athlete" for a in alerts)
+        assert all("entre dans le Top 3" in a["message"] for a in alerts)
 
     @pytest.mark.asyncio
     async def test_check_alerts_exit_podium(
-        self, test_session: Session, test_epreuve: Epreuve, test_admin_user: User
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
     ) -> None:
         """Test alert generation for exiting podium."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
-        alerts = use_case._check_alerts(
+        alerts = await use_case._check_alerts(
             athlete_id="test_athlete",
             athlete_name="Test Athlete",
             old_rank=3,  # Was in Top 3
@@ -120,12 +243,16 @@ class TestScrapeRankingsUseCase:
 
     @pytest.mark.asyncio
     async def test_check_alerts_top_10(
-        self, test_session: Session, test_epreuve: Epreuve, test_admin_user: User
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
     ) -> None:
         """Test alert generation for Top 10 entry."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
-        alerts = use_case._check_alerts(
+        alerts = await use_case._check_alerts(
             athlete_id="test_athlete",
             athlete_name="Test Athlete",
             old_rank=15,
@@ -140,12 +267,16 @@ class TestScrapeRankingsUseCase:
 
     @pytest.mark.asyncio
     async def test_check_alerts_top_20(
-        self, test_session: Session, test_epreuve: Epreuve, test_admin_user: User
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
     ) -> None:
         """Test alert generation for Top 20 entry."""
-        use_case = ScrapeRankingsUseCase(test_session)
+        use_case = ScrapeRankingsUseCase(test_async_session)
 
-        alerts = use_case._check_alerts(
+        alerts = await use_case._check_alerts(
             athlete_id="test_athlete",
             athlete_name="Test Athlete",
             old_rank=25,
@@ -157,3 +288,87 @@ class TestScrapeRankingsUseCase:
         assert len(alerts) > 0
         assert all(a["alert_type"] == "info" for a in alerts)
         assert all("Top 20" in a["title"] for a in alerts)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_is_skipped(
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+    ) -> None:
+        """Test that an identical page skips parsing and persistence."""
+        html = build_bilans_page(20)
+        use_case = ScrapeRankingsUseCase(test_async_session)
+
+        with patch.object(use_case.scraper, "fetch_pages", new=AsyncMock(return_value=[html])):
+            first = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+            with patch.object(use_case.scraper, "parse_pages") as parse_pages:
+                second = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        assert first["success"] is True
+        assert first["unchanged"] is False
+        assert second["success"] is True
+        assert second["unchanged"] is True
+        assert second["rankings_count"] == first["rankings_count"]
+        assert second["alerts_count"] == 0
+        parse_pages.assert_not_called()
+
+        statuses = [log.status for log in test_session.query(ScrapeLog).order_by(ScrapeLog.id)]
+        assert statuses == ["success", "unchanged"]
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_processed(
+        self,
+        test_async_session,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_admin_user: User,
+    ) -> None:
+        """Test that a modified page goes through the full workflow."""
+        use_case = ScrapeRankingsUseCase(test_async_session)
+
+        with patch.object(
+            use_case.scraper, "fetch_pages", new=AsyncMock(return_value=[build_bilans_page(20)])
+        ):
+            await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+        with patch.object(
+            use_case.scraper,
+            "fetch_pages",
+            new=AsyncMock(return_value=[build_bilans_page(20, seed=7)]),
+        ):
+            result = await use_case.execute(epreuve_code=test_epreuve.code, sexe="M")
+
+        assert result["success"] is True
+        assert result["unchanged"] is False
+
+
+@pytest.mark.integration
+class TestReingestArchiveUseCase:
+    """Integration tests for ReingestArchiveUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_replays_archive_into_dated_snapshots(
+        self, test_async_session, test_session: Session, test_epreuve: Epreuve, tmp_path
+    ) -> None:
+        """Test that archived fetches become snapshots dated at their fetch time."""
+        archive = HtmlArchive(tmp_path)
+        day1 = datetime(2026, 10, 1, 2, 0)
+        day2 = datetime(2026, 10, 2, 2, 0)
+        day3 = datetime(2026, 10, 3, 2, 0)
+        for fetched_at, seed in ((day1, 1), (day2, 1), (day3, 2)):
+            archive.store(
+                build_bilans_page(15, seed=seed), test_epreuve.code, "M", 2026, "CA",
+                0, fetched_at, "https://example",
+            )
+
+        use_case = ReingestArchiveUseCase(test_async_session, archive)
+        results = await use_case.execute(archive.fetches())
+
+        assert [r["success"] for r in results] == [True, True, True]
+        assert [r["unchanged"] for r in results] == [False, True, False]
+        snapshot_dates = {
+            r.snapshot_date for r in test_session.query(Ranking).filter_by(sexe="M").all()
+        }
+        assert snapshot_dates == {day1, day3}
+        assert test_session.query(AlertEvent).count() == 0
@@ -0,0 +1,335 @@
+"""Integration tests for the scheduled scraping job."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.infrastructure.database.models import Epreuve, Ranking, ScrapeLog
+from src.infrastructure.database.repositories import SQLAlchemyRunReportRepository
+from src.infrastructure.scheduler import scraping_scheduler
+from src.infrastructure.scheduler.scraping_scheduler import (
+    LAST_RUN_REPORT,
+    PIPELINE_METRICS_REPORT,
+    ScrapingScheduler,
+    build_targets,
+    get_last_run_summary,
+)
+from src.infrastructure.scraper import AthleScraper, ScrapeTarget, ScrapingError
+from tests.fixtures.pages import build_bilans_page
+
+
+@pytest.fixture
+def scheduler_database(monkeypatch, test_async_engine) -> None:
+    """Make the scheduled job use the test database."""
+
+    async def keep_engine() -> None:
+        pass
+
+    monkeypatch.setattr(
+        scraping_scheduler,
+        "new_async_session",
+        lambda: AsyncSession(test_async_engine, expire_on_commit=False),
+    )
+    monkeypatch.setattr(scraping_scheduler, "dispose_async_engine", keep_engine)
+
+
+@pytest.mark.integration
+class TestScheduledScraping:
+    """Integration tests for ScrapingScheduler._scrape_all_active_events."""
+
+    def test_build_targets(self) -> None:
+        """Test that every event is expanded into both rankings lists."""
+        epreuves = [Epreuve(nom="Javelot", code=670), Epreuve(nom="Poids", code=610)]
+
+        assert build_targets(epreuves) == [
+            ScrapeTarget(670, "M"),
+            ScrapeTarget(670, "F"),
+            ScrapeTarget(610, "M"),
+            ScrapeTarget(610, "F"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_scrapes_every_event_and_sexe(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that the job scrapes both sexes of every active event and summarizes the run."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", False)
+        test_session.add_all(
+            [
+                Epreuve(nom="Poids", code=610, actif=True),
+                Epreuve(nom="Disque", code=640, actif=False),
+            ]
+        )
+        test_session.commit()
+        fetched = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            fetched.append((epreuve_code, sexe))
+            await asyncio.sleep(0.01)
+            if (epreuve_code, sexe) == (610, "F"):
+                raise ScrapingError("HTTP 503")
+            return [build_bilans_page(10, seed=epreuve_code)]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+
+        await ScrapingScheduler()._scrape_all_active_events()
+
+        assert sorted(fetched) == [(610, "F"), (610, "M"), (670, "F"), (670, "M")]
+        rankings = test_session.query(Ranking.epreuve_code, Ranking.sexe).distinct().all()
+        assert sorted(rankings) == [(610, "M"), (670, "F"), (670, "M")]
+        summary = get_last_run_summary()
+        assert (summary.targets, summary.stored, len(summary.failures)) == (4, 3, 1)
+        assert summary.failures == {ScrapeTarget(610, "F"): "HTTP 503"}
+        assert set(summary.latencies) == {ScrapeTarget(c, s) for c, s in fetched}
+        assert summary.wall_seconds > 0
+        # Stored for the API, which does not run the scrapes in background mode
+        reports = SQLAlchemyRunReportRepository(test_session)
+        assert reports.get(LAST_RUN_REPORT) == summary.to_dict()
+        metrics = reports.get(PIPELINE_METRICS_REPORT)
+        assert metrics["running"] is False
+        assert [metrics["stages"][s]["items"] for s in ("fetch", "parse", "persist")] == [4, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_adaptive_run_scrapes_likely_changes(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that an adaptive run spends its budget on the list that changes most."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", True)
+        monkeypatch.setattr(settings, "scheduler_runs_per_day", 2)
+        monkeypatch.setattr(settings, "scheduler_daily_list_budget", 2)
+        start = datetime.now() - timedelta(days=10)
+        for day in range(10):
+            for sexe, status in (("M", "success"), ("F", "unchanged")):
+                test_session.add(
+                    ScrapeLog(
+                        scrape_date=start + timedelta(days=day),
+                        epreuve_code=670,
+                        sexe=sexe,
+                        status=status,
+                        results_count=10,
+                        duration_seconds=1.0,
+                    )
+                )
+        test_session.commit()
+        fetched = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            fetched.append((epreuve_code, sexe))
+            return [build_bilans_page(10)]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+
+        await ScrapingScheduler()._scrape_all_active_events()
+
+        assert fetched == [(670, "M")]
+
+    @pytest.mark.asyncio
+    async def test_failing_list_backs_off(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that a list that only ever failed does not take the budget of every run."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", True)
+        monkeypatch.setattr(settings, "scheduler_runs_per_day", 2)
+        monkeypatch.setattr(settings, "scheduler_daily_list_budget", 2)
+        now = datetime.now()
+        for sexe, status, age in (("M", "success", 3), ("F", "error", 1 / 24)):
+            test_session.add(
+                ScrapeLog(
+                    scrape_date=now - timedelta(days=age),
+                    epreuve_code=670,
+                    sexe=sexe,
+                    status=status,
+                    results_count=0,
+                    duration_seconds=1.0,
+                )
+            )
+        test_session.commit()
+        fetched = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            fetched.append((epreuve_code, sexe))
+            return [build_bilans_page(10)]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+
+        await ScrapingScheduler()._scrape_all_active_events()
+
+        # Without the failure, the never scraped F list would be overdue and come first
+        assert fetched == [(670, "M")]
+
+
+@pytest.mark.integration
+class TestAsyncioScheduler:
+    """Integration tests for the asyncio scheduler mode."""
+
+    def test_unknown_mode(self) -> None:
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown scheduler mode"):
+            ScrapingScheduler(mode="threads")
+
+    @pytest.mark.asyncio
+    async def test_start_on_running_loop(self, monkeypatch, scheduler_database) -> None:
+        """Test that the daily job is a coroutine scheduled on the running loop."""
+        monkeypatch.setattr(settings, "scheduler_enabled", True)
+        scheduler = ScrapingScheduler(mode="asyncio")
+
+        scheduler.start()
+        try:
+            assert isinstance(scheduler.scheduler, AsyncIOScheduler)
+            assert scheduler.scheduler._eventloop is asyncio.get_running_loop()
+            job = scheduler.scheduler.get_job("daily_scraping")
+            assert job.func == scheduler._run_scheduled_job
+            heartbeat = scheduler.scheduler.get_job("lease_heartbeat")
+            assert heartbeat.func == scheduler._aheartbeat
+            assert scheduler.get_next_run_time() is not None
+        finally:
+            await scheduler.aclose()
+            await asyncio.sleep(0)
+        assert not scheduler.scheduler.running
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_the_parse_pool_down_off_the_loop(
+        self, monkeypatch, scheduler_database
+    ) -> None:
+        """Test that waiting for the parse pool does not block the event loop."""
+        threads = []
+        monkeypatch.setattr(
+            scraping_scheduler,
+            "shutdown_parse_executor",
+            lambda: threads.append(threading.current_thread()),
+        )
+
+        await ScrapingScheduler(mode="asyncio").aclose()
+
+        assert len(threads) == 1 and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_scrapes_share_the_http_client(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that scheduled and manual scrapes reuse one open HTTP client."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", False)
+        clients = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            clients.append(self.client)
+            return [build_bilans_page(10, seed=len(clients))]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+        scheduler = ScrapingScheduler(mode="asyncio")
+
+        await scheduler._scrape_all_active_events()
+        result = await scheduler.scrape_now(670, "M")
+
+        assert result["success"] is True
+        assert len(clients) == 3
+        assert all(client is clients[0] for client in clients)
+        assert not clients[0].is_closed
+        await scheduler.aclose()
+        assert clients[0].is_closed
+
+    @pytest.mark.asyncio
+    async def test_each_scrape_gets_a_retry_budget(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that a scrape that used up its retry budget does not starve the next ones."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", False)
+        monkeypatch.setattr(settings, "scraping_retry_budget", 3)
+        remaining = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            remaining.append(self.retry_budget.remaining)
+            while self.retry_budget.try_spend():
+                pass
+            return [build_bilans_page(10, seed=len(remaining))]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+        scheduler = ScrapingScheduler(mode="asyncio")
+
+        await scheduler.scrape_now(670, "M")
+        await scheduler.scrape_now(670, "F")
+        await scheduler._scrape_all_active_events()
+
+        # The two lists of the scheduled run share its budget
+        assert remaining == [3, 3, 3, 0]
+        await scheduler.aclose()
+
+    @pytest.mark.asyncio
+    async def test_manual_scrape_job(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that a queued manual scrape reports its stages and stores the rankings."""
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            return [build_bilans_page(10)]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+        scheduler = ScrapingScheduler(mode="asyncio")
+
+        submitted, _ = await scheduler.jobs.submit(ScrapeTarget(670, "M"))
+        job = submitted
+        while not job.finished:
+            await asyncio.sleep(0.01)
+            job = await scheduler.jobs.get(submitted.id)
+
+        assert job.status == "succeeded"
+        assert job.stages == {"fetch": "done", "parse": "done", "persist": "done"}
+        assert job.result["rankings_count"] == 10
+        assert test_session.query(Ranking).count() == 10
+        await scheduler.aclose()
+
+
+@pytest.mark.integration
+class TestSchedulerLease:
+    """Integration tests for the scheduler lease."""
+
+    @pytest.mark.asyncio
+    async def test_one_scheduler_runs_the_scrapes(
+        self, monkeypatch, scheduler_database, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that only the lease holder scrapes, and another takes over on release."""
+        monkeypatch.setattr(settings, "scheduler_adaptive", False)
+        fetched = []
+
+        async def fetch_pages(self, epreuve_code, sexe, annee, categorie) -> list[str]:
+            fetched.append((epreuve_code, sexe))
+            return [build_bilans_page(10)]
+
+        monkeypatch.setattr(AthleScraper, "fetch_pages", fetch_pages)
+        first = ScrapingScheduler(mode="asyncio")
+        second = ScrapingScheduler(mode="asyncio")
+
+        assert await first._aheartbeat() is True
+        assert await second._aheartbeat() is False
+        await second._run_scheduled_job()
+        assert fetched == []
+
+        await first._run_scheduled_job()
+        assert sorted(fetched) == [(670, "F"), (670, "M")]
+
+        await first.aclose()
+        assert first.is_leader is False
+        assert await second._aheartbeat() is True
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_expired_leader_is_replaced(
+        self, monkeypatch, scheduler_database, test_session: Session
+    ) -> None:
+        """Test that a leader that stopped renewing loses the lease."""
+        first = ScrapingScheduler(mode="asyncio")
+        second = ScrapingScheduler(mode="asyncio")
+        monkeypatch.setattr(settings, "scheduler_lease_ttl_seconds", -1.0)
+        assert await first._aheartbeat() is True
+        monkeypatch.setattr(settings, "scheduler_lease_ttl_seconds", 90.0)
+
+        assert await second._aheartbeat() is True
+        assert await first._aheartbeat() is False
+        assert first.is_leader is False
+        await second.aclose()
@@ -0,0 +1,137 @@
+"""Unit tests for the alert engine."""
+
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.entities import RankingRow
+from src.core.services import AlertEngine, diff_snapshots
+from src.infrastructure.database.models import Athlete, Epreuve, Favorite, User
+from src.infrastructure.database.repositories import (
+    SQLAlchemyFavoriteRepository,
+    SQLAlchemyUserRepository,
+)
+from tests.fixtures.legacy_alerts import legacy_check_alerts
+
+RANKS = [None, 0, 1, 2, 3, 4, 9, 10, 11, 19, 20, 21, 35]
+
+
+def per_user(alerts: list[dict]) -> list[dict]:
+    """Expand alert events into the previous one-dict-per-user format."""
+    return [
+        {"user_id": user_id, **{k: v for k, v in alert.items() if k != "user_ids"}}
+        for alert in alerts
+        for user_id in alert["user_ids"]
+    ]
+
+
+@pytest.fixture
+def alert_audience(test_session: Session, test_epreuve: Epreuve, test_athlete: Athlete):
+    """Three active users (two with the test athlete as favorite) and an inactive one."""
+    users = [
+        User(email=f"user{i}@test.com", password_hash="x", role="user", actif=i != 3)
+        for i in range(4)
+    ]
+    test_session.add_all(users)
+    test_session.flush()
+    for user in (users[0], users[2], users[3]):
+        test_session.add(
+            Favorite(
+                user_id=user.id,
+                athlete_id=test_athlete.athlete_id,
+                epreuve_code=test_epreuve.code,
+                added_date=datetime.now(),
+            )
+        )
+    test_session.commit()
+    return users
+
+
+@pytest.mark.unit
+class TestAlertEngine:
+    """Test cases for AlertEngine."""
+
+    def test_matches_per_row_evaluation(
+        self, test_session: Session, test_athlete: Athlete, alert_audience
+    ) -> None:
+        """Test that every rank transition produces the same alerts as before."""
+        user_repo = SQLAlchemyUserRepository(test_session)
+        favorite_repo = SQLAlchemyFavoriteRepository(test_session)
+        engine = AlertEngine.load(user_repo, favorite_repo)
+
+        for old_rank in RANKS:
+            for new_rank in RANKS[1:]:
+                args = (test_athlete.athlete_id, test_athlete.name, old_rank, new_rank, 670, "M")
+                assert per_user(engine.evaluate(*args)) == legacy_check_alerts(
+                    user_repo, favorite_repo, *args
+                ), (old_rank, new_rank)
+
+    def test_evaluate_changes_matches_per_row_evaluation(
+        self, test_session: Session, test_athlete: Athlete, alert_audience
+    ) -> None:
+        """Test that alerts built from a snapshot diff match the per-row ones."""
+        user_repo = SQLAlchemyUserRepository(test_session)
+        favorite_repo = SQLAlchemyFavoriteRepository(test_session)
+        engine = AlertEngine.load(user_repo, favorite_repo)
+        athlete_id = test_athlete.athlete_id
+
+        for old_rank in RANKS:
+            previous = [] if old_rank is None else [(athlete_id, old_rank)]
+            for new_rank in RANKS[1:]:
+                row = RankingRow(new_rank, athlete_id, test_athlete.name, "50m00", 50.0)
+                changes = diff_snapshots(previous, [row])
+                args = (athlete_id, test_athlete.name, old_rank, new_rank, 670, "M")
+                alerts = engine.evaluate_changes(changes, 670, "M")
+                assert per_user(alerts) == legacy_check_alerts(user_repo, favorite_repo, *args), (
+                    old_rank,
+                    new_rank,
+                )
+
+    def test_favorites_only_for_active_users(
+        self, test_session: Session, test_athlete: Athlete, alert_audience
+    ) -> None:
+        """Test that inactive users get no favorite alert."""
+        engine = AlertEngine.load(
+            SQLAlchemyUserRepository(test_session), SQLAlchemyFavoriteRepository(test_session)
+        )
+
+        alerts = engine.evaluate(test_athlete.athlete_id, test_athlete.name, 40, 35, 670, "M")
+
+        assert len(alerts) == 1
+        assert alerts[0]["user_ids"] == [alert_audience[0].id, alert_audience[2].id]
+        assert "Favori" in alerts[0]["title"]
+
+    def test_load_runs_two_queries(
+        self, test_session: Session, test_engine, alert_audience
+    ) -> None:
+        """Test that users and favorites are loaded once, whatever the number of rows."""
+        statements = []
+        event.listen(test_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        engine = AlertEngine.load(
+            SQLAlchemyUserRepository(test_session),
+            SQLAlchemyFavoriteRepository(test_session),
+            epreuve_code=670,
+        )
+        for i in range(200):
+            engine.evaluate(f"athlete_{i}", f"Athlete {i}", i + 5, i + 1, 670, "M")
+
+        assert len(statements) == 2
+
+    def test_favorites_index(
+        self, test_session: Session, test_athlete: Athlete, alert_audience
+    ) -> None:
+        """Test the favorites index and its competition filter."""
+        repo = SQLAlchemyFavoriteRepository(test_session)
+
+        index = repo.get_favorites_index()
+
+        assert index == {
+            (test_athlete.athlete_id, 670): {
+                alert_audience[0].id,
+                alert_audience[2].id,
+                alert_audience[3].id,
+            }
+        }
+        assert repo.get_favorites_index(epreuve_code=999) == {}
@@ -0,0 +1,158 @@
+"""Unit tests for the raw HTML archive."""
+
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from datetime import datetime
+
+from src.infrastructure.scraper import ArchiveReplayScraper, HtmlArchive, ScrapingError
+from src.infrastructure.scraper.athle_scraper import AthleScraper
+from tests.fixtures.pages import build_bilans_page
+
+
+def store_page(
+    archive: HtmlArchive, html: str, fetched_at: datetime, page: int = 0, sexe: str = "M"
+):
+    return archive.store(html, 670, sexe, 2026, "CA", page, fetched_at, f"https://example/{page}")
+
+
+@pytest.mark.unit
+class TestHtmlArchive:
+    """Tests for HtmlArchive."""
+
+    def test_store_and_load_roundtrip(self, tmp_path) -> None:
+        """Test that a stored page is compressed and loads back identically."""
+        archive = HtmlArchive(tmp_path)
+        html = build_bilans_page(200)
+
+        entry = store_page(archive, html, datetime(2026, 10, 1, 2, 0))
+
+        blob_path = archive._blob_path(entry.content_hash)
+        assert blob_path.stat().st_size < len(html.encode("utf-8")) / 3
+        with gzip.open(blob_path, "rt", encoding="utf-8") as f:
+            assert f.read() == html
+        assert archive.load(entry) == html
+
+    def test_identical_pages_share_one_blob(self, tmp_path) -> None:
+        """Test that unchanged pages are indexed again but stored once."""
+        archive = HtmlArchive(tmp_path)
+        html = build_bilans_page(30)
+
+        first = store_page(archive, html, datetime(2026, 10, 1, 2, 0))
+        second = store_page(archive, html, datetime(2026, 10, 2, 2, 0))
+
+        assert first.content_hash == second.content_hash
+        assert len(list((tmp_path / "blobs").rglob("*.html.gz"))) == 1
+        assert len(list(archive.iter_entries())) == 2
+
+    def test_concurrent_stores_of_one_page(self, tmp_path) -> None:
+        """Test that threads archiving the same page all get their index entry."""
+        archive = HtmlArchive(tmp_path)
+        html = build_bilans_page(300)
+        fetched_at = datetime(2026, 10, 1, 2, 0)
+
+        with ThreadPoolExecutor(8) as pool:
+            entries = list(
+                pool.map(lambda page: store_page(archive, html, fetched_at, page), range(16))
+            )
+
+        assert len({entry.content_hash for entry in entries}) == 1
+        assert len(list(archive.iter_entries())) == 16
+        assert [path.name for path in (tmp_path / "blobs").rglob("*.tmp")] == []
+        assert archive.load(entries[0]) == html
+
+    def test_fetches_group_pages_and_filter(self, tmp_path) -> None:
+        """Test grouping of pages by fetch, ordering and filters."""
+        archive = HtmlArchive(tmp_path)
+        day1 = datetime(2026, 10, 1, 2, 0)
+        day2 = datetime(2026, 10, 2, 2, 0)
+        store_page(archive, "<p>day2 page1</p>", day2, page=1)
+        store_page(archive, "<p>day2 page0</p>", day2, page=0)
+        store_page(archive, "<p>day1</p>", day1)
+        store_page(archive, "<p>women</p>", day1, sexe="F")
+
+        fetches = archive.fetches(sexe="M")
+
+        assert [f.fetched_at for f in fetches] == [day1, day2]
+        assert [e.page for e in fetches[1].entries] == [0, 1]
+        assert archive.fetches(sexe="M", since=day2)[0].fetched_at == day2
+        assert archive.fetches(epreuve_code=999) == []
+
+    def test_invalid_index_line_is_skipped(self, tmp_path) -> None:
+        """Test that a truncated index line does not break reading."""
+        archive = HtmlArchive(tmp_path)
+        store_page(archive, "<p>ok</p>", datetime(2026, 10, 1))
+        with open(archive.index_path, "a", encoding="utf-8") as f:
+            f.write('{"epreuve_code": 670, "sexe"\n')
+
+        assert len(list(archive.iter_entries())) == 1
+
+    def test_empty_archive(self, tmp_path) -> None:
+        """Test reading an archive that was never written."""
+        assert HtmlArchive(tmp_path / "missing").fetches() == []
+
+
+@pytest.mark.unit
+class TestScraperArchiving:
+    """Tests for the archiving of fetched pages by AthleScraper."""
+
+    @pytest.mark.asyncio
+    async def test_fetched_pages_are_archived_with_shared_fetch_time(self, tmp_path) -> None:
+        """Test that every page of a list is archived under one fetch."""
+        pages = {
+            page: build_bilans_page(10, seed=page, first_index=page * 10, page_count=3)
+            for page in range(3)
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("frmposition", 0))
+            return httpx.Response(200, text=pages[page])
+
+        archive = HtmlArchive(tmp_path)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AthleScraper(client=client, archive=archive) as scraper:
+            fetched = await scraper.fetch_pages(670, "M")
+        await client.aclose()
+
+        fetches = archive.fetches()
+        assert len(fetches) == 1
+        assert [e.page for e in fetches[0].entries] == [0, 1, 2]
+        assert [archive.load(e) for e in fetches[0].entries] == fetched
+
+    @pytest.mark.asyncio
+    async def test_archiving_disabled(self) -> None:
+        """Test that no archive is used when archiving is disabled."""
+        assert AthleScraper().archive is None
+
+
+@pytest.mark.unit
+class TestArchiveReplayScraper:
+    """Tests for ArchiveReplayScraper."""
+
+    @pytest.mark.asyncio
+    async def test_replays_archived_pages(self, tmp_path) -> None:
+        """Test that archived pages are served and parsed without network."""
+        archive = HtmlArchive(tmp_path)
+        fetched_at = datetime(2026, 10, 1, 2, 0)
+        store_page(archive, build_bilans_page(10, page_count=2), fetched_at, page=0)
+        store_page(archive, build_bilans_page(10, first_index=10, page_count=2), fetched_at, page=1)
+
+        scraper = ArchiveReplayScraper(archive, archive.fetches()[0])
+        rankings = await scraper.scrape_rankings(670, "M")
+
+        assert len(rankings) == 20
+        assert scraper._client is None
+        assert scraper.archive is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_other_list(self, tmp_path) -> None:
+        """Test that replaying a fetch for another list fails."""
+        archive = HtmlArchive(tmp_path)
+        store_page(archive, "<p></p>", datetime(2026, 10, 1))
+
+        scraper = ArchiveReplayScraper(archive, archive.fetches()[0])
+
+        with pytest.raises(ScrapingError):
+            await scraper.fetch_pages(670, "F")
@@ -0,0 +1,133 @@
+"""Unit tests for the async repositories."""
+
+import inspect
+
+import pytest
+from datetime import datetime
+from sqlalchemy.orm import Session
+
+from src.core import interfaces
+from src.infrastructure.database import async_repositories
+from src.infrastructure.database.async_repositories import (
+    AsyncSQLAlchemyAlertRepository,
+    AsyncSQLAlchemyAthleteRepository,
+    AsyncSQLAlchemyEpreuveRepository,
+)
+from src.infrastructure.database.connection import get_async_database_url
+from src.infrastructure.database.models import Athlete, Epreuve, User
+
+
+@pytest.mark.unit
+class TestAsyncRepositories:
+    """Test cases for the async repositories."""
+
+    @pytest.mark.asyncio
+    async def test_reads_committed_data(self, test_async_session, test_epreuve: Epreuve) -> None:
+        """Test that async reads see data written by other connections."""
+        repo = AsyncSQLAlchemyEpreuveRepository(test_async_session)
+
+        epreuve = await repo.get_by_code(test_epreuve.code)
+
+        assert epreuve.nom == "Javelot"
+        assert [e.code for e in await repo.list_active()] == [test_epreuve.code]
+        assert await repo.get_by_code(9999) is None
+
+    @pytest.mark.asyncio
+    async def test_writes_and_autocommit(self, test_async_session, test_session: Session) -> None:
+        """Test that writes are committed unless the caller owns the transaction."""
+        repo = AsyncSQLAlchemyAthleteRepository(test_async_session, autocommit=False)
+        now = datetime.now()
+        rows = [
+            {"athlete_id": f"athlete_{i}", "name": f"Athlete {i}", "first_seen_date": now}
+            for i in range(3)
+        ]
+
+        assert await repo.upsert_bulk(rows) == 3
+        assert test_session.query(Athlete).count() == 0
+        await test_async_session.commit()
+        assert test_session.query(Athlete).count() == 3
+
+    @pytest.mark.asyncio
+    async def test_alerts_are_fully_loaded(
+        self,
+        test_async_session,
+        test_epreuve: Epreuve,
+        test_athlete: Athlete,
+        test_regular_user: User,
+    ) -> None:
+        """Test that returned alerts can be serialized outside of the session I/O."""
+        repo = AsyncSQLAlchemyAlertRepository(test_async_session)
+        await repo.create_bulk(
+            [
+                {
+                    "alert_type": "info",
+                    "athlete_id": test_athlete.athlete_id,
+                    "epreuve_code": test_epreuve.code,
+                    "sexe": "M",
+                    "title": "📊 Top 20",
+                    "message": "entre dans le Top 20",
+                    "old_rank": None,
+                    "new_rank": 18,
+                    "user_ids": [test_regular_user.id],
+                }
+            ]
+        )
+
+        alerts = await repo.get_user_alerts(test_regular_user.id)
+
+        assert [(a.title, a.is_read) for a in alerts] == [("📊 Top 20", False)]
+        assert await repo.count_unread(test_regular_user.id) == 1
+        assert await repo.mark_all_as_read(test_regular_user.id) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "name",
+    [
+        "User",
+        "Epreuve",
+        "Athlete",
+        "Ranking",
+        "Favorite",
+        "Alert",
+        "ScrapeLog",
+        "Lease",
+        "ScrapeJob",
+        "RunReport",
+    ],
+)
+def test_async_repository_matches_interfaces(name: str, test_async_session) -> None:
+    """Test that each async repository implements the async mirror of its interface."""
+    sync_interface = getattr(interfaces, f"{name}Repository")
+    async_interface = getattr(interfaces, f"Async{name}Repository")
+    repo = getattr(async_repositories, f"AsyncSQLAlchemy{name}Repository")(test_async_session)
+
+    assert isinstance(repo, async_interface)
+    assert async_interface.__abstractmethods__ == sync_interface.__abstractmethods__
+    for method in async_interface.__abstractmethods__:
+        sync_parameters = list(inspect.signature(getattr(repo.sync_repository, method)).parameters)
+        assert inspect.iscoroutinefunction(getattr(repo, method))
+        assert list(inspect.signature(getattr(repo, method)).parameters) == sync_parameters[1:]
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseUrl:
+    """Test cases for get_async_database_url."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("sqlite:///./athle_tracker.db", "sqlite+aiosqlite:///./athle_tracker.db"),
+            ("sqlite+aiosqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+            ("postgresql://u:p@db/athle", "postgresql+asyncpg://u:p@db/athle"),
+            ("postgresql+psycopg2://u:p@db/athle", "postgresql+asyncpg://u:p@db/athle"),
+        ],
+    )
+    def test_async_driver(self, url: str, expected: str) -> None:
+        """Test that sync URLs are mapped to their async driver."""
+        assert get_async_database_url(url) == expected
+
+    def test_unknown_backend(self) -> None:
+        """Test that a database without async driver is rejected."""
+        with pytest.raises(ValueError, match="No async driver"):
+            get_async_database_url("mssql+pyodbc://u:p@db/athle")
@@ -0,0 +1,111 @@
+"""Unit tests for database initialization."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import AlertDelivery, AlertEvent, Base
+
+LEGACY_ALERTS_TABLE = """
+CREATE TABLE alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    created_at DATETIME NOT NULL,
+    alert_type VARCHAR(50) NOT NULL,
+    athlete_id VARCHAR(100) NOT NULL,
+    epreuve_code INTEGER NOT NULL,
+    sexe VARCHAR(1) NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    old_rank INTEGER,
+    new_rank INTEGER NOT NULL,
+    is_read BOOLEAN NOT NULL
+)
+"""
+
+
+@pytest.mark.unit
+class TestMigrateLegacyAlerts:
+    """Test cases for the per-user alerts table migration."""
+
+    @pytest.fixture
+    def legacy_engine(self, tmp_path, monkeypatch):
+        """Database holding four legacy alert rows, forming two events."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        monkeypatch.setattr(connection, "engine", engine)
+        with engine.begin() as conn:
+            conn.execute(text(LEGACY_ALERTS_TABLE))
+            conn.execute(
+                text(
+                    "INSERT INTO alerts (user_id, created_at, alert_type, athlete_id, "
+                    "epreuve_code, sexe, title, message, old_rank, new_rank, is_read) "
+                    "VALUES (:user_id, '2026-10-01 02:00:00', 'critique', 'a', 670, 'M', "
+                    "'t', 'm', :old_rank, 1, :is_read)"
+                ),
+                [
+                    {"user_id": 1, "old_rank": None, "is_read": True},
+                    {"user_id": 2, "old_rank": None, "is_read": False},
+                    {"user_id": 1, "old_rank": 5, "is_read": False},
+                    {"user_id": 1, "old_rank": 5, "is_read": True},
+                ],
+            )
+        Base.metadata.create_all(engine)
+        yield engine
+        engine.dispose()
+
+    def test_merges_rows_into_events(self, legacy_engine) -> None:
+        """Test that per-user copies become one event with one delivery per user."""
+        engine = legacy_engine
+
+        connection._migrate_legacy_alerts()
+
+        assert "alerts" not in inspect(engine).get_table_names()
+        with engine.connect() as conn:
+            events = conn.execute(AlertEvent.__table__.select().order_by(AlertEvent.id)).all()
+            deliveries = conn.execute(
+                AlertDelivery.__table__.select().order_by(
+                    AlertDelivery.event_id, AlertDelivery.user_id
+                )
+            ).all()
+        assert [e.old_rank for e in events] == [None, 5]
+        assert [(d.event_id, d.user_id, d.is_read) for d in deliveries] == [
+            (events[0].id, 1, True),
+            (events[0].id, 2, False),
+            (events[1].id, 1, False),
+        ]
+
+    def test_events_numbered_after_existing_ones(self, legacy_engine) -> None:
+        """Test that migrated events take ids after the events already stored."""
+        with legacy_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO alert_events (id, created_at, alert_type, athlete_id, "
+                    "epreuve_code, sexe, title, message, new_rank) "
+                    "VALUES (7, '2026-10-02 02:00:00', 'info', 'b', 670, 'F', 't', 'm', 2)"
+                )
+            )
+
+        connection._migrate_legacy_alerts()
+
+        with legacy_engine.connect() as conn:
+            event_ids = conn.execute(text("SELECT id FROM alert_events ORDER BY id")).scalars()
+            delivery_ids = conn.execute(text("SELECT DISTINCT event_id FROM alert_deliveries"))
+            assert list(event_ids) == [7, 8, 9]
+            assert sorted(row.event_id for row in delivery_ids) == [8, 9]
+
+    def test_mismatch_keeps_legacy_table(self, legacy_engine) -> None:
+        """Test that the migration is rolled back when rows go missing."""
+        with legacy_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TRIGGER drop_user_2 BEFORE INSERT ON alert_deliveries "
+                    "WHEN NEW.user_id = 2 BEGIN SELECT RAISE(IGNORE); END"
+                )
+            )
+
+        with pytest.raises(RuntimeError, match="alerts table kept"):
+            connection._migrate_legacy_alerts()
+
+        with legacy_engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM alerts")).scalar_one() == 4
+            assert conn.execute(text("SELECT COUNT(*) FROM alert_events")).scalar_one() == 0
@@ -0,0 +1,81 @@
+"""Unit tests for the per-host rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.config import settings
+from src.infrastructure.scraper.athle_scraper import AthleScraper
+from src.infrastructure.scraper.rate_limiter import TokenBucket, get_host_limiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_spaced_reservations(self) -> None:
+        """Test that the burst is free and later requests are spaced by 1/rate."""
+        bucket = TokenBucket(rate=2.0, burst=2, clock=FakeClock())
+
+        delays = [bucket.reserve() for _ in range(5)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+    def test_tokens_refill_over_time(self) -> None:
+        """Test that idle time refills the bucket up to the burst size."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now = 10.0
+
+        assert [bucket.reserve() for _ in range(3)] == pytest.approx([0.0, 0.0, 1.0])
+
+    def test_invalid_configuration(self) -> None:
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_share_the_budget(self) -> None:
+        """Test that concurrent callers are spread over time, not serialized by sleeps."""
+        bucket = TokenBucket(rate=50.0, burst=1)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        elapsed = time.monotonic() - start
+
+        # 1 immediate + 5 spaced by 20 ms
+        assert 0.09 <= elapsed < 0.5
+
+
+@pytest.mark.unit
+class TestHostLimiterRegistry:
+    """Tests for the shared per-host limiters."""
+
+    def test_same_host_shares_one_limiter(self) -> None:
+        """Test that every scraper uses the limiter of its host."""
+        assert get_host_limiter("www.athle.fr") is get_host_limiter("www.athle.fr")
+        assert get_host_limiter("www.athle.fr") is not get_host_limiter("example.com")
+        assert AthleScraper().rate_limiter is AthleScraper().rate_limiter
+
+    def test_limiter_uses_settings(self, monkeypatch) -> None:
+        """Test that a new limiter is configured from settings."""
+        monkeypatch.setattr(settings, "scraping_rate_limit", 0.25)
+        monkeypatch.setattr(settings, "scraping_rate_burst", 3)
+
+        limiter = get_host_limiter("limits.example")
+
+        assert (limiter.rate, limiter.burst) == (0.25, 3)
@@ -1,16 +1,34 @@
 """Unit tests for Repositories."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from src.config import settings
+from src.core.entities import RankingRow
+from src.infrastructure.database import repositories
 from src.infrastructure.database.repositories import (
     SQLAlchemyUserRepository,
     SQLAlchemyEpreuveRepository,
     SQLAlchemyAthleteRepository,
     SQLAlchemyRankingRepository,
+    SQLAlchemyAlertRepository,
+    SQLAlchemyLeaseRepository,
+    SQLAlchemyRunReportRepository,
+    SQLAlchemyScrapeJobRepository,
+)
+from src.infrastructure.database.models import (
+    AlertDelivery,
+    AlertEvent,
+    User,
+    Epreuve,
+    Athlete,
+    Ranking,
+    RankingSnapshot,
+    SchedulerLease,
+    ScrapeJobRecord,
 )
-from src.infrastructure.database.models import User, Epreuve, Athlete, Ranking
 
 
 @pytest.mark.unit
@@ -74,6 +92,17 @@ class TestUserRepository:
         user = repo.get_by_id(test_regular_user.id)
         assert user is None
 
+    def test_without_autocommit(self, test_session: Session) -> None:
+        """Test that writes are only flushed when the caller owns the transaction."""
+        repo = SQLAlchemyUserRepository(test_session, autocommit=False)
+
+        user = repo.create({"email": "pending@test.com", "password_hash": "x", "role": "user"})
+
+        assert user.id is not None
+        assert repo.get_by_email("pending@test.com") is user
+        test_session.rollback()
+        assert repo.get_by_email("pending@test.com") is None
+
     def test_list_all(
         self, test_session: Session, test_regular_user: User, test_admin_user: User
     ) -> None:
@@ -131,9 +160,7 @@ class TestEpreuveRepository:
 class TestAthleteRepository:
     """Test cases for SQLAlchemyAthleteRepository."""
 
-    def test_get_by_athlete_id(
-        self, test_session: Session, test_athlete: Athlete
-    ) -> None:
+    def test_get_by_athlete_id(self, test_session: Session, test_athlete: Athlete) -> None:
         """Test get athlete by athlete_id."""
         repo = SQLAlchemyAthleteRepository(test_session)
 
@@ -159,9 +186,7 @@ class TestAthleteRepository:
         assert athlete.id is not None
         assert athlete.athlete_id == "new_athlete"
 
-    def test_get_or_create_existing(
-        self, test_session: Session, test_athlete: Athlete
-    ) -> None:
+    def test_get_or_create_existing(self, test_session: Session, test_athlete: Athlete) -> None:
         """Test get_or_create with existing athlete."""
         repo = SQLAlchemyAthleteRepository(test_session)
 
@@ -192,14 +217,62 @@ class TestAthleteRepository:
         assert athlete.id is not None
         assert athlete.athlete_id == "brand_new_athlete"
 
+    def test_upsert_bulk(self, test_session: Session, test_athlete: Athlete) -> None:
+        """Test that only missing athletes are inserted, once each."""
+        repo = SQLAlchemyAthleteRepository(test_session)
+        seen = datetime(2026, 10, 1)
+
+        inserted = repo.upsert_bulk(
+            [
+                {"athlete_id": test_athlete.athlete_id, "name": "Renamed", "first_seen_date": seen},
+                {"athlete_id": "new_1", "name": "New One", "first_seen_date": seen},
+                {"athlete_id": "new_2", "name": "New Two", "first_seen_date": seen},
+                {"athlete_id": "new_1", "name": "New One", "first_seen_date": seen},
+            ]
+        )
+
+        assert inserted == 2
+        assert test_session.query(Athlete).count() == 3
+        test_session.refresh(test_athlete)
+        assert test_athlete.name == "Test Athlete"
+        new_athlete = repo.get_by_athlete_id("new_1")
+        assert new_athlete.first_seen_date == seen
+        assert new_athlete.created_at is not None
+
+    def test_upsert_bulk_round_trips(self, test_session: Session, test_engine, monkeypatch) -> None:
+        """Test that the number of statements does not grow with the number of rows."""
+        monkeypatch.setattr(repositories, "IN_CLAUSE_CHUNK_SIZE", 100)
+        repo = SQLAlchemyAthleteRepository(test_session)
+        athletes = [
+            {
+                "athlete_id": f"athlete_{i}",
+                "name": f"Athlete {i}",
+                "first_seen_date": datetime.now(),
+            }
+            for i in range(250)
+        ]
+        repo.upsert_bulk(athletes[:50])
+
+        statements = []
+        event.listen(test_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        inserted = repo.upsert_bulk(athletes)
+
+        # 3 chunked SELECTs + 1 executemany INSERT
+        assert sum(s.startswith("SELECT") for s in statements) == 3
+        assert sum(s.startswith("INSERT") for s in statements) == 1
+        assert inserted == 200
+        assert test_session.query(Athlete).count() == 250
+
+    def test_upsert_bulk_empty(self, test_session: Session) -> None:
+        """Test that an empty batch is a no-op."""
+        assert SQLAlchemyAthleteRepository(test_session).upsert_bulk([]) == 0
+
 
 @pytest.mark.unit
 class TestRankingRepository:
     """Test cases for SQLAlchemyRankingRepository."""
 
-    def test_get_latest_by_epreuve(
-        self, test_session: Session, test_ranking: Ranking
-    ) -> None:
+    def test_get_latest_by_epreuve(self, test_session: Session, test_ranking: Ranking) -> None:
         """Test get latest rankings by epreuve."""
         repo = SQLAlchemyRankingRepository(test_session)
 
@@ -254,3 +327,370 @@ class TestRankingRepository:
         rankings = repo.create_bulk(rankings_data)
 
         assert len(rankings) == 5
+
+    def test_create_from_rows(
+        self, test_session: Session, test_epreuve: Epreuve, test_athlete: Athlete
+    ) -> None:
+        """Test storing scraped rows as a snapshot."""
+        repo = SQLAlchemyRankingRepository(test_session)
+        snapshot_date = datetime(2026, 10, 1, 2, 0)
+        rows = [
+            RankingRow(
+                1, test_athlete.athlete_id, test_athlete.name, "58m14", 58.14, "Club", "I-F"
+            ),
+        ]
+
+        created = repo.create_from_rows(rows, snapshot_date, test_epreuve.code, "M")
+
+        assert created == 1
+        latest_date, rankings = repo.get_latest_by_epreuve(test_epreuve.code, "M")
+        assert latest_date == snapshot_date
+        assert (rankings[0].rank, rankings[0].club, rankings[0].departement) == (1, "Club", None)
+        assert repo.create_from_rows([], snapshot_date, test_epreuve.code, "M") == 0
+
+    def test_delta_snapshot_stores_changed_rows(
+        self, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that a delta snapshot stores changed rows and tombstones, and is rebuilt."""
+        repo = SQLAlchemyRankingRepository(test_session)
+        day1, day2 = datetime(2026, 10, 1, 2, 0), datetime(2026, 10, 2, 2, 0)
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a4", "a5"), day1, 670, "M")
+        # a4 left the list, a5 moved up and a6 entered it
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a5", "a6"), day2, 670, "M")
+
+        header = test_session.query(RankingSnapshot).filter_by(snapshot_date=day2).one()
+        assert (header.base_date, header.row_count, header.stored_rows) == (day1, 5, 2)
+        assert header.rank_shifts == "[[5, 5, -1]]"
+        stored = test_session.query(Ranking).filter_by(snapshot_date=day2).all()
+        assert {(r.athlete_id, r.rank, bool(r.removed)) for r in stored} == {
+            ("a4", 0, True),
+            ("a6", 5, False),
+        }
+
+        latest_date, rankings = repo.get_latest_by_epreuve(test_epreuve.code, "M")
+        assert latest_date == day2
+        assert [(r.athlete_id, r.rank) for r in rankings] == [
+            ("a1", 1),
+            ("a2", 2),
+            ("a3", 3),
+            ("a5", 4),
+            ("a6", 5),
+        ]
+        as_of_date, rankings = repo.get_snapshot_as_of(670, "M", datetime(2026, 10, 1, 12, 0))
+        assert as_of_date == day1
+        assert [r.athlete_id for r in rankings] == ["a1", "a2", "a3", "a4", "a5"]
+        assert repo.get_snapshot_as_of(670, "M", datetime(2026, 9, 30)) == (None, [])
+
+    def test_entrant_shifts_carried_over_ranks(
+        self, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that an entrant stores one row and a rank shift for the rows below."""
+        repo = SQLAlchemyRankingRepository(test_session)
+        day1, day2 = datetime(2026, 10, 1, 2, 0), datetime(2026, 10, 2, 2, 0)
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a4", "a5"), day1, 670, "M")
+        repo.create_from_rows(ranking_rows("a0", "a1", "a2", "a3", "a4", "a5"), day2, 670, "M")
+
+        header = test_session.query(RankingSnapshot).filter_by(snapshot_date=day2).one()
+        assert (header.stored_rows, header.rank_shifts) == (1, "[[1, 5, 1]]")
+        _, rankings = repo.get_latest_by_epreuve(test_epreuve.code, "M")
+        assert [(r.athlete_id, r.rank, r.snapshot_date) for r in rankings[:2]] == [
+            ("a0", 1, day2),
+            ("a1", 2, day2),
+        ]
+        assert not test_session.dirty
+        # Rows shared with the rebuilt snapshot are read back with their stored values
+        _, rankings = repo.get_snapshot_as_of(test_epreuve.code, "M", day1)
+        assert [(r.athlete_id, r.rank, r.snapshot_date) for r in rankings[:1]] == [("a1", 1, day1)]
+
+    def test_tied_rank_shifts(self) -> None:
+        """Test that tied rows moving differently are stored instead of encoded."""
+        runs, unencoded = repositories._encode_rank_shifts(
+            [(1, 1, "a"), (2, 3, "b"), (3, 4, "c"), (3, 3, "d"), (5, 5, "e"), (6, 5, "f")]
+        )
+
+        assert runs == [[2, 2, 1], [6, 6, -1]]
+        assert unencoded == {"c"}
+
+    def test_keyframe_interval(
+        self, test_session: Session, test_epreuve: Epreuve, monkeypatch
+    ) -> None:
+        """Test that a keyframe is stored every ranking_keyframe_interval snapshots."""
+        monkeypatch.setattr(settings, "ranking_keyframe_interval", 2)
+        repo = SQLAlchemyRankingRepository(test_session)
+        dates = [datetime(2026, 10, day, 2, 0) for day in (1, 2, 3)]
+        for i, snapshot_date in enumerate(dates):
+            rows = ranking_rows("a1", "a2", "a3", "a4", "a5")
+            rows[-1] = rows[-1]._replace(performance=f"5{i}m00")
+            repo.create_from_rows(rows, snapshot_date, test_epreuve.code, "M")
+
+        headers = test_session.query(RankingSnapshot).order_by(RankingSnapshot.snapshot_date)
+        assert [(h.base_date, h.depth, h.stored_rows) for h in headers] == [
+            (None, 0, 5),
+            (dates[0], 1, 1),
+            (None, 0, 5),
+        ]
+        _, rankings = repo.get_snapshot_as_of(test_epreuve.code, "M", dates[1])
+        assert rankings[-1].performance == "51m00"
+
+    def test_full_storage_mode(
+        self, test_session: Session, test_epreuve: Epreuve, monkeypatch
+    ) -> None:
+        """Test that the full storage mode stores every row of every snapshot."""
+        monkeypatch.setattr(settings, "ranking_storage_mode", "full")
+        repo = SQLAlchemyRankingRepository(test_session)
+        rows = ranking_rows("a1", "a2", "a3")
+        repo.create_from_rows(rows, datetime(2026, 10, 1), test_epreuve.code, "M")
+        repo.create_from_rows(rows, datetime(2026, 10, 2), test_epreuve.code, "M")
+
+        assert test_session.query(Ranking).count() == 6
+
+        monkeypatch.setattr(settings, "ranking_storage_mode", "zip")
+        with pytest.raises(ValueError, match="Unknown ranking storage mode"):
+            repo.create_from_rows(rows, datetime(2026, 10, 3), test_epreuve.code, "M")
+
+    def test_athlete_history_over_deltas(
+        self, test_session: Session, test_epreuve: Epreuve
+    ) -> None:
+        """Test that the history lists the athlete in every snapshot, latest first."""
+        repo = SQLAlchemyRankingRepository(test_session)
+        day1, day2, day3 = (datetime(2026, 10, day, 2, 0) for day in (1, 2, 3))
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a4", "a5"), day1, 670, "M")
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a5", "a6"), day2, 670, "M")
+        repo.create_from_rows(ranking_rows("a1", "a2", "a3", "a5", "a4"), day3, 670, "M")
+
+        history = repo.get_athlete_history("a1", test_epreuve.code, "M")
+        assert [(r.snapshot_date, r.rank) for r in history] == [(day3, 1), (day2, 1), (day1, 1)]
+        history = repo.get_athlete_history("a4", test_epreuve.code, "M")
+        assert [(r.snapshot_date, r.rank) for r in history] == [(day3, 5), (day1, 4)]
+        assert len(repo.get_athlete_history("a1", test_epreuve.code, "M", limit=2)) == 2
+
+        assert repo.get_previous_rank("a5", test_epreuve.code, "M", day2) == 5
+        assert repo.get_previous_rank("a4", test_epreuve.code, "M", day3) == 4
+        assert repo.get_previous_rank("a6", test_epreuve.code, "M", day2) is None
+
+
+def ranking_rows(*athlete_ids: str) -> list[RankingRow]:
+    """Build a scraped list ranking the given athletes ("a<n>") in order."""
+    rows = []
+    for rank, athlete_id in enumerate(athlete_ids, start=1):
+        # Performances belong to the athlete: a rank change alone does not change them
+        number = int(athlete_id[1:])
+        rows.append(
+            RankingRow(rank, athlete_id, athlete_id.upper(), f"{70 - number}m00", 70.0 - number)
+        )
+    return rows
+
+
+@pytest.fixture
+def alert_recipients(test_session: Session, test_admin_user: User, test_regular_user: User):
+    """Two users receiving alerts."""
+    return [test_admin_user.id, test_regular_user.id]
+
+
+def make_alert(athlete: Athlete, epreuve: Epreuve, user_ids: list[int], new_rank: int) -> dict:
+    """Build alert data as produced by the alert engine."""
+    return {
+        "alert_type": "critique",
+        "athlete_id": athlete.athlete_id,
+        "epreuve_code": epreuve.code,
+        "sexe": "M",
+        "title": f"🥇 Podium : {athlete.name}",
+        "message": f"{athlete.name} entre dans le Top 3 (rang {new_rank})",
+        "old_rank": None,
+        "new_rank": new_rank,
+        "user_ids": user_ids,
+    }
+
+
+@pytest.mark.unit
+class TestAlertRepository:
+    """Test cases for AlertRepository."""
+
+    def test_create_bulk_stores_events_once(
+        self,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_athlete: Athlete,
+        alert_recipients,
+    ) -> None:
+        """Test that an alert is stored once with one delivery per recipient."""
+        repo = SQLAlchemyAlertRepository(test_session)
+
+        created = repo.create_bulk(
+            [
+                make_alert(test_athlete, test_epreuve, alert_recipients, 1),
+                make_alert(test_athlete, test_epreuve, alert_recipients[:1], 2),
+            ]
+        )
+
+        assert created == 3
+        assert test_session.query(AlertEvent).count() == 2
+        deliveries = (
+            test_session.query(AlertDelivery)
+            .order_by(AlertDelivery.event_id, AlertDelivery.user_id)
+            .all()
+        )
+        assert [(d.event.new_rank, d.user_id) for d in deliveries] == [
+            (1, alert_recipients[0]),
+            (1, alert_recipients[1]),
+            (2, alert_recipients[0]),
+        ]
+        assert repo.create_bulk([]) == 0
+
+    def test_user_alerts_and_read_state(
+        self,
+        test_session: Session,
+        test_epreuve: Epreuve,
+        test_athlete: Athlete,
+        alert_recipients,
+    ) -> None:
+        """Test listing, counting and marking a user's alerts."""
+        repo = SQLAlchemyAlertRepository(test_session)
+        admin_id, user_id = alert_recipients
+        repo.create_bulk(
+            [make_alert(test_athlete, test_epreuve, alert_recipients, rank) for rank in (1, 2, 3)]
+        )
+
+        alerts = repo.get_user_alerts(user_id)
+        assert [a.title for a in alerts] == [f"🥇 Podium : {test_athlete.name}"] * 3
+        assert [a.message[-2:] for a in alerts] == ["3)", "2)", "1)"]
+        assert repo.count_unread(user_id) == 3
+
+        assert repo.get_user_alert(user_id, alerts[0].id).event.new_rank == 3
+        assert repo.mark_as_read(user_id, alerts[0].id) is True
+        assert repo.mark_as_read(user_id, 10_000) is False
+        assert repo.count_unread(user_id) == 2
+        assert len(repo.get_user_alerts(user_id, is_read=False)) == 2
+
+        assert repo.mark_all_as_read(user_id) == 2
+        assert repo.count_unread(user_id) == 0
+        # Read state is per user
+        assert repo.count_unread(admin_id) == 3
+
+
+@pytest.mark.unit
+class TestLeaseRepository:
+    """Test cases for LeaseRepository."""
+
+    def test_only_one_holder(self, test_session: Session) -> None:
+        """Test that a valid lease is kept by its holder and refused to others."""
+        repo = SQLAlchemyLeaseRepository(test_session)
+
+        assert repo.acquire("scheduler", "a", 60) is True
+        acquired_at = repo.get("scheduler").acquired_at
+        assert repo.acquire("scheduler", "b", 60) is False
+        assert repo.acquire("scheduler", "a", 60) is True
+
+        lease = repo.get("scheduler")
+        assert lease.holder == "a"
+        assert lease.acquired_at == acquired_at
+        assert lease.renewed_at >= acquired_at
+        assert test_session.query(SchedulerLease).count() == 1
+
+    def test_expired_lease_is_taken_over(self, test_session: Session) -> None:
+        """Test that another holder takes an expired lease over."""
+        repo = SQLAlchemyLeaseRepository(test_session)
+        repo.acquire("scheduler", "a", 60)
+        test_session.query(SchedulerLease).update(
+            {"expires_at": datetime.now() - timedelta(seconds=1)}
+        )
+        test_session.commit()
+
+        assert repo.acquire("scheduler", "b", 60) is True
+        assert repo.get("scheduler").holder == "b"
+        assert repo.acquire("scheduler", "a", 60) is False
+
+    def test_release(self, test_session: Session) -> None:
+        """Test that a released lease is free and only its holder can release it."""
+        repo = SQLAlchemyLeaseRepository(test_session)
+        repo.acquire("scheduler", "a", 60)
+
+        assert repo.release("scheduler", "b") is False
+        assert repo.release("scheduler", "a") is True
+        assert repo.get("scheduler") is None
+        assert repo.acquire("scheduler", "b", 60) is True
+
+
+@pytest.mark.unit
+class TestRunReportRepository:
+    """Test cases for RunReportRepository."""
+
+    def test_save_replaces_the_report(self, test_session: Session) -> None:
+        """Test that a report replaces the previous one of the same name."""
+        repo = SQLAlchemyRunReportRepository(test_session)
+        assert repo.get("last_run") is None
+
+        repo.save("last_run", {"targets": 4})
+        repo.save("last_run", {"targets": 2})
+        repo.save("pipeline_metrics", {"running": False})
+
+        assert repo.get("last_run") == {"targets": 2}
+        assert repo.get("pipeline_metrics") == {"running": False}
+
+
+def make_job(job_id: str, active_key: str = "670:M", **values) -> ScrapeJobRecord:
+    """Build a queued job of 670 M."""
+    now = datetime.now()
+    return ScrapeJobRecord(
+        id=job_id,
+        epreuve_code=670,
+        sexe="M",
+        status="queued",
+        active_key=active_key,
+        stages="{}",
+        coalesced=0,
+        submitted_at=values.pop("submitted_at", now),
+        updated_at=values.pop("updated_at", now),
+        **values,
+    )
+
+
+@pytest.mark.unit
+class TestScrapeJobRepository:
+    """Test cases for ScrapeJobRepository."""
+
+    def test_one_job_in_flight_per_list(self, test_session: Session) -> None:
+        """Test that a list submitted while its job is in flight joins that job."""
+        repo = SQLAlchemyScrapeJobRepository(test_session)
+
+        first, created = repo.submit(make_job("a"))
+        assert (first.id, created) == ("a", True)
+        joined, created = repo.submit(make_job("b"))
+        assert (joined.id, joined.coalesced, created) == ("a", 1, False)
+        assert repo.submit(make_job("c", active_key="670:F"))[1] is True
+
+        first.status, first.active_key = "succeeded", None
+        repo.save(first)
+        again, created = repo.submit(make_job("d"))
+        assert (again.id, created) == ("d", True)
+        assert repo.get("a").status == "succeeded"
+        assert test_session.query(ScrapeJobRecord).count() == 3
+
+    def test_save_keeps_the_list_of_a_job_in_flight(self, test_session: Session) -> None:
+        """Test that saving the progress of a running job does not free its list."""
+        repo = SQLAlchemyScrapeJobRepository(test_session)
+        job, _ = repo.submit(make_job("a"))
+
+        job.status, job.stages = "running", '{"fetch": "running"}'
+        repo.save(job)
+
+        stored = repo.get("a")
+        assert (stored.status, stored.stages, stored.active_key) == (
+            "running",
+            '{"fetch": "running"}',
+            "670:M",
+        )
+
+    def test_abandoned_and_finished_jobs(self, test_session: Session) -> None:
+        """Test the stale jobs in flight, and that only recent finished jobs are kept."""
+        repo = SQLAlchemyScrapeJobRepository(test_session)
+        now = datetime.now()
+        for i in range(4):
+            submitted_at = now - timedelta(minutes=10 - i)
+            repo.submit(make_job(f"done{i}", active_key=None, submitted_at=submitted_at))
+        repo.submit(make_job("stale", updated_at=now - timedelta(hours=2)))
+        repo.submit(make_job("live", active_key="670:F"))
+
+        assert [job.id for job in repo.get_abandoned(now - timedelta(hours=1))] == ["stale"]
+        assert repo.delete_finished(keep=2) == 2
+        assert [job.id for job in repo.get_recent(10)] == ["live", "stale", "done3", "done2"]
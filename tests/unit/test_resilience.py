@@ -0,0 +1,216 @@
+"""Unit tests for the scraper circuit breaker and retry budget."""
+
+import asyncio
+
+import httpx
+import pytest
+from datetime import datetime, timezone
+
+from src.config import settings
+from src.infrastructure.scraper import CircuitOpenError, RetryBudgetExhaustedError, ScrapingError
+from src.infrastructure.scraper.athle_scraper import AthleScraper
+from src.infrastructure.scraper.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    get_host_breaker,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record asyncio sleeps instead of waiting."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def make_scraper(handler, **kwargs) -> AthleScraper:
+    return AthleScraper(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold_and_fails_fast(self) -> None:
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, clock=FakeClock())
+
+        for _ in range(3):
+            breaker.before_request()
+            breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_lets_one_probe_through(self) -> None:
+        """Test probing after the cooldown, closing on success."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 61
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test that a failing probe opens the circuit for another cooldown."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60, clock=clock)
+        breaker.open_for(10)
+
+        clock.now = 11
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now = 70
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now = 72
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+@pytest.mark.unit
+class TestRetryHelpers:
+    """Tests for RetryBudget and parse_retry_after."""
+
+    def test_retry_budget(self) -> None:
+        """Test that the budget is spent once per retry."""
+        budget = RetryBudget(2)
+
+        assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+        assert budget.remaining == 0
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("120", 120.0),
+            ("Wed, 14 Oct 2026 10:02:00 GMT", 120.0),
+            ("Wed, 14 Oct 2026 09:00:00 GMT", 0.0),
+            ("soon", None),
+            (None, None),
+        ],
+    )
+    def test_parse_retry_after(self, value, expected) -> None:
+        """Test delay-seconds and HTTP-date forms."""
+        now = datetime(2026, 10, 14, 10, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after(value, now=now) == expected
+
+
+@pytest.mark.unit
+class TestScraperResilience:
+    """Tests for retries, Retry-After and circuit breaking in AthleScraper."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self, sleeps) -> None:
+        """Test that a Retry-After longer than the backoff is waited."""
+        responses = iter(
+            [httpx.Response(503, headers={"Retry-After": "30"}), httpx.Response(200, text="ok")]
+        )
+
+        scraper = make_scraper(lambda request: next(responses))
+
+        assert await scraper.fetch_page(670, "M") == "ok"
+        assert sleeps == [30]
+
+    @pytest.mark.asyncio
+    async def test_excessive_retry_after_gives_up_and_opens_circuit(self, sleeps) -> None:
+        """Test that a Retry-After beyond the limit stops the scrape at once."""
+        scraper = make_scraper(lambda request: httpx.Response(429, headers={"Retry-After": "3600"}))
+
+        with pytest.raises(ScrapingError, match="retry after 3600s"):
+            await scraper.fetch_page(670, "M")
+        with pytest.raises(CircuitOpenError):
+            await scraper.fetch_page(670, "F")
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_requests_for_other_scrapers(
+        self, sleeps, monkeypatch
+    ) -> None:
+        """Test that a down host fails fast for the remaining events of a run."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(502)
+
+        breaker = get_host_breaker("www.athle.fr")
+        monkeypatch.setattr(breaker, "failure_threshold", 3)
+
+        with pytest.raises(ScrapingError):
+            await make_scraper(handler).fetch_page(670, "M")
+        with pytest.raises(CircuitOpenError):
+            await make_scraper(handler).fetch_page(671, "M")
+
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, sleeps) -> None:
+        """Test that 4xx answers are retried but do not count as host failures."""
+        scraper = make_scraper(lambda request: httpx.Response(404))
+
+        with pytest.raises(ScrapingError):
+            await scraper.fetch_page(670, "M")
+
+        assert scraper.circuit_breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_with_budget_shares_the_client(self, sleeps) -> None:
+        """Test that a scraper for a new run gets a fresh budget but the same client."""
+        scraper = make_scraper(lambda request: httpx.Response(404), retry_budget=RetryBudget(1))
+        with pytest.raises(ScrapingError):
+            await scraper.fetch_page(670, "M")
+
+        run = scraper.with_budget()
+
+        assert run.client is scraper.client
+        assert run.circuit_breaker is scraper.circuit_breaker
+        assert run.retry_budget.remaining == settings.scraping_retry_budget
+        assert scraper.retry_budget.remaining == 0
+        await run.aclose()
+        assert not scraper.client.is_closed
+        await scraper.aclose()
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_is_shared_by_the_run(self, sleeps) -> None:
+        """Test that retries stop once the run budget is spent."""
+        scraper = make_scraper(lambda request: httpx.Response(404), retry_budget=RetryBudget(3))
+
+        with pytest.raises(ScrapingError):
+            await scraper.fetch_page(670, "M")
+        with pytest.raises(RetryBudgetExhaustedError):
+            await scraper.fetch_page(671, "M")
+
+        assert len(sleeps) == 3
@@ -0,0 +1,118 @@
+"""Unit tests for batch row decoding."""
+
+import pytest
+from datetime import datetime
+
+from src.core.entities import RankingRow
+from src.infrastructure.scraper import get_table_parser
+from src.infrastructure.scraper.row_decoder import (
+    decode_date,
+    decode_performance,
+    decode_rows,
+)
+from tests.fixtures.legacy_parser import legacy_decode_rows
+from tests.fixtures.pages import list_corpus_pages, load_corpus_page
+
+
+@pytest.mark.unit
+class TestDecodeRows:
+    """Test cases for decode_rows."""
+
+    @pytest.mark.parametrize("page", list_corpus_pages())
+    def test_matches_per_row_decoding(self, page: str) -> None:
+        """Test that batch decoding matches the per-row implementation on the corpus."""
+        rows = get_table_parser("lxml").extract_rows(load_corpus_page(page))
+
+        rankings, _ = decode_rows(rows)
+
+        assert [r._asdict() for r in rankings] == legacy_decode_rows(rows)
+
+    def test_edge_cases_match_per_row_decoding(self) -> None:
+        """Test ex-aequo, filtered rows and fallback performances."""
+        rows = [
+            [
+                "1",
+                "58m14 (RP)",
+                "DUPONT Jean",
+                "Club A",
+                "I-F",
+                "093",
+                "CAM/09",
+                "28/09/25",
+                "Lyon",
+            ],
+            ["-", "58m14", "MARTIN Léo", "Club B", "ARA", "042", "CAM/09", "28/09/25", "Lyon"],
+            ["", "Club B", "Né en 2009"],
+            ["3=", "11.32", "DURAND Paul", "Club C"],
+            ["-", "Club C", "Détail"],
+            ["4", "12.5", "PETIT Noé", "Club D", "H-F", "062", "CAM/09", "05/10/25"],
+            ["x"],
+            ["5", "49m29", ""],
+        ]
+
+        rankings, last_valid_rank = decode_rows(rows)
+        expected = legacy_decode_rows(rows)
+
+        # Undated rows are dated "now", which differs between the two calls
+        assert [{**r._asdict(), "date": None} for r in rankings] == [
+            {**r, "date": None} for r in expected
+        ]
+        assert rankings[0].date == expected[0]["date"] == datetime(2025, 9, 28)
+        assert [r.rank for r in rankings] == [1, 1, 3, 4]
+        assert last_valid_rank == 4
+
+    def test_last_valid_rank_carried_over(self) -> None:
+        """Test that ex-aequo continuity is kept across batches."""
+        rows = [["-", "50m00", "SENCE Robin", "Club", "H-F", "062", "CAM/09", "05/10/25"]]
+
+        rankings, last_valid_rank = decode_rows(rows, last_valid_rank=12)
+
+        assert rankings[0].rank == 12
+        assert last_valid_rank == 12
+
+    def test_missing_date_uses_now(self) -> None:
+        """Test that rows without a valid date are dated now."""
+        rows = [
+            ["1", "50m00", "A", "Club", "I-F", "093", "CAM/09", "not a date"],
+            ["2", "49m00", "B"],
+        ]
+        before = datetime.now()
+
+        rankings, _ = decode_rows(rows)
+
+        assert all(r.date >= before for r in rankings)
+
+    def test_repeated_values_are_interned(self) -> None:
+        """Test that club, ligue and departement strings are shared between rows."""
+        rows = [
+            [str(i), "50m00", f"ATHLETE {i}", "".join(["Club ", "A"]), "I-F", "0" + "93"]
+            for i in range(1, 4)
+        ]
+
+        rankings, _ = decode_rows(rows)
+
+        assert all(isinstance(r, RankingRow) for r in rankings)
+        assert rankings[0].club is rankings[1].club is rankings[2].club
+        assert rankings[0].departement is rankings[2].departement
+
+
+@pytest.mark.unit
+class TestMemoizedDecoders:
+    """Test cases for the memoized column decoders."""
+
+    def test_decode_performance_cached(self) -> None:
+        """Test that repeated performances are decoded once."""
+        decode_performance.cache_clear()
+
+        for _ in range(10):
+            assert decode_performance("47m20 (RP)") == ("47m20", 47.20)
+
+        info = decode_performance.cache_info()
+        assert info.misses == 1
+        assert info.hits == 9
+
+    def test_decode_date(self) -> None:
+        """Test date decoding and invalid values."""
+        assert decode_date("28/09/25") == datetime(2025, 9, 28)
+        assert decode_date("") is None
+        assert decode_date("31/02/25") is None
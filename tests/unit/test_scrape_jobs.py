@@ -0,0 +1,204 @@
+"""Unit tests for the manual scrape job queue."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models import ScrapeJobRecord
+from src.infrastructure.scheduler.scrape_jobs import ScrapeJob, ScrapeJobQueue
+from src.infrastructure.scraper import ScrapeTarget
+
+
+class FakeRunner:
+    """Scrape runner going through the stages when released."""
+
+    def __init__(self, unchanged: bool = False) -> None:
+        self.unchanged = unchanged
+        self.calls: list[tuple[int, str]] = []
+        self.released = asyncio.Event()
+
+    async def __call__(self, epreuve_code: int, sexe: str, on_stage) -> dict:
+        self.calls.append((epreuve_code, sexe))
+        on_stage("fetch")
+        await self.released.wait()
+        if epreuve_code == 999:
+            raise RuntimeError("database is locked")
+        if not self.unchanged:
+            on_stage("parse")
+        on_stage("persist")
+        await asyncio.sleep(0)
+        return {"success": True, "unchanged": self.unchanged, "rankings_count": 3}
+
+
+def make_queue(test_async_engine, runner: FakeRunner, **kwargs) -> ScrapeJobQueue:
+    """Build a queue storing its jobs in the test database."""
+    return ScrapeJobQueue(
+        runner, lambda: AsyncSession(test_async_engine, expire_on_commit=False), **kwargs
+    )
+
+
+async def wait_for(queue: ScrapeJobQueue, job_id: str, status: str, stage=None) -> ScrapeJob:
+    """Poll a job, as a client would, until it reaches a status (and stage)."""
+    for _ in range(200):
+        job = await queue.get(job_id)
+        if job is not None and (job.status, job.stage) == (status, stage):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} never reached {status} {stage}")
+
+
+@pytest.mark.unit
+class TestScrapeJobQueue:
+    """Tests for ScrapeJobQueue."""
+
+    @pytest.mark.asyncio
+    async def test_job_progress_and_result(self, test_async_engine) -> None:
+        """Test that a job reports its stages while running, then its result."""
+        runner = FakeRunner()
+        queue = make_queue(test_async_engine, runner, workers=1)
+
+        job, created = await queue.submit(ScrapeTarget(670, "M"))
+        assert created is True
+        assert job.to_dict()["status"] == "queued"
+
+        stored = await wait_for(queue, job.id, "running", "fetch")
+        assert stored.stages == {"fetch": "running", "parse": "pending", "persist": "pending"}
+
+        runner.released.set()
+        stored = await wait_for(queue, job.id, "succeeded")
+        assert stored.stages == {"fetch": "done", "parse": "done", "persist": "done"}
+        assert stored.result["rankings_count"] == 3
+        assert stored.finished_at is not None
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_list_skips_parse(self, test_async_engine) -> None:
+        """Test that the parse stage is reported as skipped for an unchanged list."""
+        runner = FakeRunner(unchanged=True)
+        runner.released.set()
+        queue = make_queue(test_async_engine, runner, workers=1)
+
+        job, _ = await queue.submit(ScrapeTarget(670, "M"))
+        stored = await wait_for(queue, job.id, "succeeded")
+
+        assert stored.stages == {"fetch": "done", "parse": "skipped", "persist": "done"}
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_identical_targets_are_coalesced(self, test_async_engine) -> None:
+        """Test that a target submitted while its job is in flight joins that job."""
+        runner = FakeRunner()
+        queue = make_queue(test_async_engine, runner, workers=2)
+
+        first, _ = await queue.submit(ScrapeTarget(670, "M"))
+        await wait_for(queue, first.id, "running", "fetch")
+        second, created = await queue.submit(ScrapeTarget(670, "M"))
+        other, other_created = await queue.submit(ScrapeTarget(670, "F"))
+
+        assert second.id == first.id and created is False
+        assert other.id != first.id and other_created is True
+        assert second.coalesced == 1
+
+        runner.released.set()
+        await wait_for(queue, first.id, "succeeded")
+        await wait_for(queue, other.id, "succeeded")
+        assert runner.calls == [(670, "M"), (670, "F")]
+
+        # A finished job is not joined: the list is scraped again
+        again, created = await queue.submit(ScrapeTarget(670, "M"))
+        assert again.id != first.id and created is True
+        assert [job.id for job in await queue.list_jobs()] == [again.id, other.id, first.id]
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_shared_by_processes(self, test_async_engine) -> None:
+        """Test that another process's queue coalesces into and reports a job it does not run."""
+        runner, other_runner = FakeRunner(), FakeRunner()
+        queue = make_queue(test_async_engine, runner, workers=1)
+        other_queue = make_queue(test_async_engine, other_runner, workers=1)
+
+        job, _ = await queue.submit(ScrapeTarget(670, "M"))
+        joined, created = await other_queue.submit(ScrapeTarget(670, "M"))
+        assert joined.id == job.id and created is False
+
+        await wait_for(other_queue, job.id, "running", "fetch")
+        runner.released.set()
+        stored = await wait_for(other_queue, job.id, "succeeded")
+
+        assert stored.coalesced == 1
+        assert (runner.calls, other_runner.calls) == ([(670, "M")], [])
+        await queue.aclose()
+        await other_queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_job(self, test_async_engine) -> None:
+        """Test that an exception of the runner fails the job in its current stage."""
+        runner = FakeRunner()
+        runner.released.set()
+        queue = make_queue(test_async_engine, runner, workers=1)
+
+        job, _ = await queue.submit(ScrapeTarget(999, "M"))
+        stored = await wait_for(queue, job.id, "failed")
+
+        assert stored.result == {"success": False, "error": "database is locked"}
+        assert stored.stages == {"fetch": "failed", "parse": "skipped", "persist": "skipped"}
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_history(self, test_async_engine) -> None:
+        """Test that only the most recent finished jobs are kept."""
+        runner = FakeRunner()
+        runner.released.set()
+        queue = make_queue(test_async_engine, runner, workers=1, history=2)
+
+        jobs = []
+        for code in (1, 2, 3, 4):
+            job, _ = await queue.submit(ScrapeTarget(code, "M"))
+            jobs.append(job)
+            await wait_for(queue, job.id, "succeeded")
+
+        assert await queue.get(jobs[0].id) is None
+        assert [job.id for job in await queue.list_jobs()] == [j.id for j in reversed(jobs[2:])]
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_jobs(self, test_async_engine) -> None:
+        """Test that jobs in flight at shutdown fail and are no longer joined."""
+        queue = make_queue(test_async_engine, FakeRunner(), workers=1)
+        running, _ = await queue.submit(ScrapeTarget(670, "M"))
+        queued, _ = await queue.submit(ScrapeTarget(670, "F"))
+        await wait_for(queue, running.id, "running", "fetch")
+
+        await queue.aclose()
+
+        assert (await queue.get(running.id)).status == "failed"
+        stored = await queue.get(queued.id)
+        assert stored.status == "failed"
+        assert stored.result["error"] == "Scrape cancelled at shutdown"
+        job, created = await queue.submit(ScrapeTarget(670, "M"))
+        assert created is True
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_is_failed(self, test_async_engine, test_session: Session) -> None:
+        """Test that a job in flight left by a stopped process no longer holds its list."""
+        stale = ScrapeJob(ScrapeTarget(670, "M"), status="running").to_record()
+        stale.updated_at = datetime.now() - timedelta(hours=2)
+        test_session.add(stale)
+        test_session.commit()
+        runner = FakeRunner()
+        runner.released.set()
+        queue = make_queue(test_async_engine, runner, workers=1, timeout_seconds=3600)
+
+        job, created = await queue.submit(ScrapeTarget(670, "M"))
+
+        assert created is True and job.id != stale.id
+        abandoned = await queue.get(stale.id)
+        assert abandoned.status == "failed"
+        assert abandoned.result["error"] == "Scrape abandoned by its process"
+        await wait_for(queue, job.id, "succeeded")
+        assert test_session.query(ScrapeJobRecord).count() == 2
+        await queue.aclose()
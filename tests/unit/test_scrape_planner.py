@@ -0,0 +1,116 @@
+"""Unit tests for adaptive scrape planning."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.services import (
+    ListFreshness,
+    estimate_change_rate,
+    freshness_from_history,
+    plan_scrapes,
+)
+
+NOW = datetime(2026, 6, 1, 2, 0)
+
+
+def daily_history(changed: list[bool], end: datetime = NOW) -> list[tuple[datetime, bool]]:
+    """Build one observation per day, the last one at ``end``."""
+    start = end - timedelta(days=len(changed) - 1)
+    return [(start + timedelta(days=i), flag) for i, flag in enumerate(changed)]
+
+
+@pytest.mark.unit
+class TestEstimateChangeRate:
+    """Tests for estimate_change_rate."""
+
+    def test_prior_without_history(self) -> None:
+        """Test that a list without observations gets the prior rate."""
+        assert estimate_change_rate([], NOW, 14.0) == pytest.approx(1 / 7)
+        assert estimate_change_rate(daily_history([True]), NOW, 14.0) == pytest.approx(1 / 7)
+
+    def test_volatile_and_stable_lists(self) -> None:
+        """Test that the rate follows the share of scrapes that found a change."""
+        volatile = estimate_change_rate(daily_history([True] * 30), NOW, 1e9)
+        stable = estimate_change_rate(daily_history([True] + [False] * 29), NOW, 1e9)
+
+        # (1 + 29) changes over (7 + 29) days, and 1 change over 36 days
+        assert volatile == pytest.approx(30 / 36)
+        assert stable == pytest.approx(1 / 36)
+
+    def test_recent_observations_weigh_more(self) -> None:
+        """Test that a list that became active recently gets a higher rate."""
+        waking_up = daily_history([False] * 20 + [True] * 5)
+        going_quiet = daily_history([True] * 5 + [False] * 20)
+
+        assert estimate_change_rate(waking_up, NOW, 3.0) > 3 * estimate_change_rate(
+            going_quiet, NOW, 3.0
+        )
+
+
+@pytest.mark.unit
+class TestPlanScrapes:
+    """Tests for plan_scrapes."""
+
+    def test_overdue_lists_first(self) -> None:
+        """Test that never scraped and overdue lists come before likely changes."""
+        lists = [
+            ListFreshness("volatile", 2.0, NOW - timedelta(hours=12)),
+            ListFreshness("overdue", 0.01, NOW - timedelta(days=9)),
+            ListFreshness("new", 0.1, None),
+        ]
+
+        plan = plan_scrapes(lists, NOW, budget=3, max_interval_days=7, min_probability=0.05)
+
+        assert [f.key for f in plan] == ["new", "overdue", "volatile"]
+
+    def test_budget_goes_to_likely_changes(self) -> None:
+        """Test that the budget is spent on the lists most likely to have changed."""
+        lists = [
+            ListFreshness("stable", 0.02, NOW - timedelta(days=2)),
+            ListFreshness("weekly", 1 / 7, NOW - timedelta(days=2)),
+            ListFreshness("daily", 1.0, NOW - timedelta(hours=6)),
+            ListFreshness("daily_old", 1.0, NOW - timedelta(days=1)),
+        ]
+
+        plan = plan_scrapes(lists, NOW, budget=2, max_interval_days=7, min_probability=0.05)
+
+        assert [f.key for f in plan] == ["daily_old", "weekly"]
+
+    def test_unlikely_changes_are_not_scraped(self) -> None:
+        """Test that lists below the minimum probability are left out despite the budget."""
+        lists = [
+            ListFreshness("stable", 0.01, NOW - timedelta(days=1)),
+            ListFreshness("just_scraped", 1.0, NOW - timedelta(minutes=1)),
+        ]
+
+        assert plan_scrapes(lists, NOW, budget=10, max_interval_days=7, min_probability=0.05) == []
+
+    def test_freshness_from_history(self) -> None:
+        """Test that lists without history are never scraped."""
+        history = {(670, "M"): daily_history([True, False, True])}
+
+        known, unknown = freshness_from_history(history, [(670, "M"), (670, "F")], NOW, 14.0)
+
+        assert known.last_scraped == NOW
+        assert known.change_rate > unknown.change_rate
+        assert unknown.last_scraped is None
+        assert unknown.change_probability(NOW) == 1.0
+
+    def test_failed_scrape_counts_as_last_scrape(self) -> None:
+        """Test that a failed scrape delays the next attempt without being an observation."""
+        history = {(670, "M"): daily_history([True, False, True], end=NOW - timedelta(days=2))}
+        failures = {(670, "M"): NOW - timedelta(hours=1), (670, "F"): NOW - timedelta(days=1)}
+
+        scraped, failing = freshness_from_history(
+            history, [(670, "M"), (670, "F")], NOW, 14.0, failures
+        )
+
+        assert scraped.last_scraped == NOW - timedelta(hours=1)
+        assert scraped.change_rate == pytest.approx(
+            estimate_change_rate(history[(670, "M")], NOW, 14.0)
+        )
+        assert failing.last_scraped == NOW - timedelta(days=1)
+        assert failing.change_rate == pytest.approx(1 / 7)
+        plan = plan_scrapes([failing], NOW, budget=1, max_interval_days=7, min_probability=0.5)
+        assert plan == []
@@ -1,9 +1,26 @@
 """Unit tests for AthleScraper."""
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
 import pytest
-from datetime import datetime
 
+from src.config import Settings, settings
+from src.infrastructure.scraper import (
+    PARSER_BACKENDS,
+    ScrapeTarget,
+    ScrapingError,
+    compute_fingerprint,
+    get_table_parser,
+)
 from src.infrastructure.scraper.athle_scraper import AthleScraper
+from src.infrastructure.scraper.pagination import count_pages
+from src.infrastructure.scraper.parse_pool import get_parse_executor, shutdown_parse_executor
+from tests.fixtures.pages import build_bilans_page, list_corpus_pages, load_corpus_page
+
+FAST_BACKENDS = [name for name in PARSER_BACKENDS if name != "bs4"]
 
 
 @pytest.mark.unit
@@ -67,3 +84,458 @@ class TestAthleScraper:
         result = scraper._parse_ranking_row(None)
 
         assert result is None
+
+
+@pytest.mark.unit
+class TestAthleScraperHttpClient:
+    """Test cases for the pooled HTTP client of AthleScraper."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_scrapes(self) -> None:
+        """Test that successive scrapes share one client."""
+        requests_seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(200, text="<html><body></body></html>")
+
+        scraper = AthleScraper()
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        first_client = scraper.client
+
+        await scraper.scrape_rankings(epreuve_code=670, sexe="M")
+        await scraper.scrape_rankings(epreuve_code=670, sexe="F")
+
+        assert len(requests_seen) == 2
+        assert scraper.client is first_client
+
+        await scraper.aclose()
+        assert first_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_external_client_not_closed(self) -> None:
+        """Test that a caller-provided client is left open on close."""
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+
+        async with AthleScraper(client=client) as scraper:
+            assert scraper.client is client
+
+        assert not client.is_closed
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self) -> None:
+        """Test that a closed scraper lazily opens a new pooled client."""
+        scraper = AthleScraper()
+        first_client = scraper.client
+
+        await scraper.aclose()
+        second_client = scraper.client
+
+        assert second_client is not first_client
+        assert not second_client.is_closed
+        await scraper.aclose()
+
+
+@pytest.mark.unit
+class TestComputeFingerprint:
+    """Test cases for compute_fingerprint."""
+
+    def test_same_table_same_fingerprint(self) -> None:
+        """Test that page chrome and whitespace do not affect the fingerprint."""
+        page = build_bilans_page(10)
+        reformatted = page.replace("<footer>", "<div>Pub</div>\n\n<footer>").replace(
+            "</tr>", "</tr>\n  "
+        )
+
+        assert compute_fingerprint(page) is not None
+        assert compute_fingerprint(page) == compute_fingerprint(reformatted)
+
+    def test_different_table_different_fingerprint(self) -> None:
+        """Test that a ranking change alters the fingerprint."""
+        assert compute_fingerprint(build_bilans_page(10)) != compute_fingerprint(
+            build_bilans_page(11)
+        )
+
+    def test_no_table(self) -> None:
+        """Test pages without a results table."""
+        assert compute_fingerprint("") is None
+        assert compute_fingerprint("<html><body><p>Maintenance</p></body></html>") is None
+
+    def test_fallback_and_nested_tables(self) -> None:
+        """Test the reveal-table fallback and tables nested in the results table."""
+        fallback = build_bilans_page(10, table_attrs='class="reveal-table small"')
+        nested = build_bilans_page(10).replace(
+            "<td>CAM/09</td>", "<td><table><tr><td>CAM/09</td></tr></table></td>", 1
+        )
+
+        assert compute_fingerprint(fallback) is not None
+        assert compute_fingerprint(fallback) != compute_fingerprint(
+            build_bilans_page(11, table_attrs='class="reveal-table small"')
+        )
+        # A change after a nested table is still inside the hashed slice
+        assert compute_fingerprint(nested) != compute_fingerprint(
+            nested.replace("</tr>\n</table>", "</tr><tr><td>1</td></tr>\n</table>")
+        )
+
+
+@pytest.mark.unit
+class TestParserBackends:
+    """Parity tests between the table parser backends and the BeautifulSoup reference."""
+
+    @staticmethod
+    def _parse(html: str, backend: str) -> list:
+        scraper = AthleScraper(parser=get_table_parser(backend))
+        return scraper.parse_page(html)
+
+    @pytest.mark.parametrize("backend", FAST_BACKENDS)
+    @pytest.mark.parametrize("page", list_corpus_pages())
+    def test_parity_on_corpus(self, page: str, backend: str) -> None:
+        """Test that every backend produces the reference row dicts on the corpus."""
+        html = load_corpus_page(page)
+
+        rankings = self._parse(html, backend)
+
+        assert len(rankings) > 0
+        assert rankings == self._parse(html, "bs4")
+
+    @pytest.mark.parametrize("backend", FAST_BACKENDS)
+    @pytest.mark.parametrize(
+        "html",
+        [
+            build_bilans_page(50, table_attrs='id="ctnBilans"', detail_rows=False),
+            build_bilans_page(3),
+        ],
+        ids=["no-detail-rows", "headers-only"],
+    )
+    def test_parity_with_bs4(self, html: str, backend: str) -> None:
+        """Test that backends produce identical row dicts on edge-case pages."""
+        assert self._parse(html, backend) == self._parse(html, "bs4")
+
+    @pytest.mark.parametrize("backend", FAST_BACKENDS)
+    def test_ctnbilans_preferred_over_earlier_reveal_table(self, backend: str) -> None:
+        """Test that ctnBilans wins even when a reveal-table comes first."""
+        decoy = build_bilans_page(5, seed=1, table_attrs='class="reveal-table"')
+        page = build_bilans_page(10, table_attrs='id="ctnBilans"')
+        start = decoy.index('<table class="reveal')
+        decoy_table = decoy[start:decoy.index("</table>", start) + len("</table>")]
+        html = page.replace('<div id="content">', decoy_table, 1)
+
+        rankings = self._parse(html, backend)
+
+        assert len(rankings) == 10
+        assert rankings == self._parse(html, "bs4")
+
+    @pytest.mark.parametrize("backend", FAST_BACKENDS)
+    def test_cell_text_matches_get_text(self, backend: str) -> None:
+        """Test comments, scripts, entities and nested tags in cells."""
+        cells = (
+            "<td> 1 </td><td>58m14 <small>(RP)</small></td>"
+            "<td><a href='#'>DUPONT</a>&nbsp;<b>Jean</b><!-- id --><script>x()</script></td>"
+            "<td>Club<br/>Athlé</td><td>I-F</td><td>093</td><td>CAM/09</td>"
+            "<td><span>28/09/25</span></td><td>Lyon</td>"
+        )
+        html = build_bilans_page(1, detail_rows=False).replace(
+            "<tr class=\"clickable\">", f"<tr>{cells}</tr><tr class=\"clickable\">", 1
+        )
+
+        assert self._parse(html, backend) == self._parse(html, "bs4")
+
+    @pytest.mark.parametrize("backend", list(PARSER_BACKENDS))
+    @pytest.mark.parametrize("html", ["", "<html><body><p>Maintenance</p></body></html>"])
+    def test_no_table(self, html: str, backend: str) -> None:
+        """Test pages without a results table."""
+        assert self._parse(html, backend) == []
+
+    def test_bytes_input(self) -> None:
+        """Test that backends accept the raw response bytes."""
+        html = load_corpus_page("small_30")
+        expected = self._parse(html, "bs4")
+
+        for backend in PARSER_BACKENDS:
+            scraper = AthleScraper(parser=get_table_parser(backend))
+            assert scraper.parse_page(html.encode("utf-8")) == expected
+
+    def test_unknown_backend(self) -> None:
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="Unknown parser backend"):
+            get_table_parser("regex")
+
+    def test_former_backend_setting_name(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the backend is still read from SCRAPING_PARSER_MODE."""
+        monkeypatch.setenv("SCRAPING_PARSER_MODE", "bs4")
+
+        assert Settings().scraping_parser_backend == "bs4"
+
+
+@pytest.mark.unit
+class TestMultiPageFetching:
+    """Test cases for paginated bilans lists."""
+
+    PAGE_SIZE = 14
+
+    def _pages(self, page_count: int) -> list[str]:
+        return [
+            build_bilans_page(
+                self.PAGE_SIZE,
+                first_index=page * self.PAGE_SIZE,
+                page_count=page_count,
+                detail_rows=False,
+            )
+            for page in range(page_count)
+        ]
+
+    def _scraper(
+        self, pages: list[str], in_flight: list[int], max_in_flight: list[int]
+    ) -> AthleScraper:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("frmposition", "0"))
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return httpx.Response(200, text=pages[page])
+
+        return AthleScraper(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    def test_count_pages(self) -> None:
+        """Test page count discovery from pagination links."""
+        assert count_pages(build_bilans_page(5)) == 1
+        assert count_pages(build_bilans_page(5, page_count=4)) == 4
+
+    def test_build_url_page(self) -> None:
+        """Test that only following pages carry frmposition."""
+        scraper = AthleScraper()
+
+        assert "frmposition" not in scraper._build_url(670, "M")
+        assert "frmposition=2" in scraper._build_url(670, "M", page=2)
+
+    @pytest.mark.asyncio
+    async def test_pages_merged_in_order(self) -> None:
+        """Test that all pages are fetched and merged in order with rank continuity."""
+        pages = self._pages(4)
+        scraper = self._scraper(pages, [0], [0])
+
+        fetched = await scraper.fetch_pages(670, "M")
+        rankings = scraper.parse_pages(fetched)
+
+        assert fetched == pages
+        assert len(rankings) == 4 * self.PAGE_SIZE
+        assert [r.name for r in rankings] == [
+            r.name for page in pages for r in scraper.parse_page(page)
+        ]
+        # Row 14 opens page 2 with an ex-aequo "-" and keeps rank 14 from page 1
+        assert rankings[self.PAGE_SIZE - 1].rank == 14
+        assert rankings[self.PAGE_SIZE].rank == 14
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self) -> None:
+        """Test that following pages are fetched concurrently within the limit."""
+        max_in_flight = [0]
+        scraper = self._scraper(self._pages(8), [0], max_in_flight)
+        scraper.page_concurrency = 3
+
+        fetched = await scraper.fetch_pages(670, "M")
+
+        assert len(fetched) == 8
+        assert max_in_flight[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_max_pages(self) -> None:
+        """Test that the number of pages fetched is capped."""
+        scraper = self._scraper(self._pages(8), [0], [0])
+        scraper.max_pages = 2
+
+        fetched = await scraper.fetch_pages(670, "M")
+
+        assert len(fetched) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_cancels_the_others(self) -> None:
+        """Test that a failed page stops the downloads of the other pages."""
+        pages = self._pages(6)
+        cancelled: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("frmposition", "0"))
+            if page == 2:
+                return httpx.Response(404)
+            if page:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return httpx.Response(200, text=pages[page])
+
+        scraper = AthleScraper(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        scraper.max_retries = 1
+        scraper.page_concurrency = 5
+
+        with pytest.raises(ScrapingError):
+            await scraper.fetch_pages(670, "M")
+
+        assert sorted(cancelled) == [1, 3, 4, 5]
+
+
+@pytest.mark.unit
+class TestScrapeMany:
+    """Tests for batch scraping of several rankings lists."""
+
+    def _scraper(self, delays: dict[int, float], in_flight: list[int], max_in_flight: list[int]):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            epreuve_code = int(request.url.params["frmepreuve"])
+            if epreuve_code not in delays:
+                return httpx.Response(404)
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            try:
+                await asyncio.sleep(delays[epreuve_code])
+            finally:
+                in_flight[0] -= 1
+            return httpx.Response(200, text=build_bilans_page(5, seed=epreuve_code))
+
+        scraper = AthleScraper(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        scraper.max_retries = 1
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_outcomes_stream_in_completion_order(self) -> None:
+        """Test that a fast target is yielded before a slow one started earlier."""
+        scraper = self._scraper({670: 0.1, 671: 0.01}, [0], [0])
+        targets = [ScrapeTarget(670, "M"), ScrapeTarget(671, "M")]
+
+        outcomes = [outcome async for outcome in scraper.scrape_many(targets)]
+
+        assert [o.target.epreuve_code for o in outcomes] == [671, 670]
+        assert all(o.success and len(o.rankings) == 5 and len(o.pages) == 1 for o in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self) -> None:
+        """Test that no more targets than the limit run at once."""
+        max_in_flight = [0]
+        scraper = self._scraper({code: 0.02 for code in range(600, 610)}, [0], max_in_flight)
+        targets = [ScrapeTarget(code, sexe) for code in range(600, 610) for sexe in ("M", "F")]
+
+        outcomes = [outcome async for outcome in scraper.scrape_many(targets, concurrency=3)]
+
+        assert len(outcomes) == 20
+        assert max_in_flight[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_error_is_reported_per_target(self) -> None:
+        """Test that one failing target does not stop the batch."""
+        scraper = self._scraper({670: 0.0}, [0], [0])
+        targets = [ScrapeTarget(999, "M"), ScrapeTarget(670, "M")]
+
+        outcomes = {o.target.epreuve_code: o async for o in scraper.scrape_many(targets)}
+
+        assert outcomes[670].success
+        assert not outcomes[999].success
+        assert isinstance(outcomes[999].error, ScrapingError)
+        assert outcomes[999].rankings == []
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_pending_targets(self) -> None:
+        """Test that leaving the loop does not leave downloads running."""
+        in_flight = [0]
+        scraper = self._scraper({670: 0.0, 671: 5.0, 672: 5.0}, in_flight, [0])
+        targets = [ScrapeTarget(code, "M") for code in (670, 671, 672)]
+
+        batch = scraper.scrape_many(targets)
+        outcome = await anext(batch)
+        await batch.aclose()
+
+        assert outcome.target.epreuve_code == 670
+        assert in_flight[0] == 0
+
+
+@pytest.mark.unit
+class TestParseExecutor:
+    """Tests for parsing pages off the event loop."""
+
+    @pytest.fixture(scope="class")
+    def process_pool(self):
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        yield pool
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    async def test_pool_parsing_matches_inline(self, kind, process_pool) -> None:
+        """Test that pool-parsed rankings equal the inline ones."""
+        pages = [
+            build_bilans_page(30, seed=1, page_count=2),
+            build_bilans_page(30, seed=2, first_index=30, page_count=2),
+        ]
+        executor = process_pool if kind == "process" else ThreadPoolExecutor(max_workers=1)
+        scraper = AthleScraper(parse_executor=executor)
+
+        rankings = await scraper.parse_pages_async(pages)
+
+        assert rankings == scraper.parse_pages(pages)
+        assert len(rankings) == 60
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_while_parsing(self) -> None:
+        """Test that other coroutines progress while a large list is parsed."""
+        page = load_corpus_page("large_5000")
+        scraper = AthleScraper(parse_executor=ThreadPoolExecutor(max_workers=1))
+        ticks = 0
+        parsing = True
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while parsing:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+        rankings = await scraper.parse_pages_async([page])
+        parsing = False
+        await ticker_task
+
+        assert len(rankings) > 0
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    async def test_pool_fingerprint_matches_inline(self, kind, process_pool) -> None:
+        """Test that the fingerprint is computed in the pool, with the inline result."""
+        pages = [build_bilans_page(30, seed=1), build_bilans_page(30, seed=2)]
+        executor = process_pool if kind == "process" else ThreadPoolExecutor(max_workers=1)
+        scraper = AthleScraper(parse_executor=executor)
+        submitted = []
+        submit = executor.submit
+
+        def spy(fn, *args, **kwargs):
+            submitted.append(fn)
+            return submit(fn, *args, **kwargs)
+
+        executor.submit = spy
+        try:
+            fingerprint = await scraper.fingerprint_pages_async(pages)
+        finally:
+            del executor.submit
+
+        assert fingerprint == compute_fingerprint(*pages)
+        assert submitted == [compute_fingerprint]
+
+    def test_shared_executor_from_settings(self, monkeypatch) -> None:
+        """Test the executor kinds configured in settings."""
+        monkeypatch.setattr(settings, "scraping_parse_executor", "thread")
+        shutdown_parse_executor()
+        try:
+            assert isinstance(get_parse_executor(), ThreadPoolExecutor)
+            assert get_parse_executor() is get_parse_executor()
+        finally:
+            shutdown_parse_executor()
+
+        monkeypatch.setattr(settings, "scraping_parse_executor", "inline")
+        assert get_parse_executor() is None
+
+        monkeypatch.setattr(settings, "scraping_parse_executor", "gpu")
+        with pytest.raises(ValueError, match="Unknown parse executor"):
+            get_parse_executor()
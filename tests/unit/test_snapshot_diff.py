@@ -0,0 +1,102 @@
+"""Unit tests for the vectorized snapshot diff."""
+
+import pytest
+import numpy as np
+from datetime import datetime
+
+from src.core.entities import RankingRow
+from src.core.services import ThresholdEvent, diff_snapshots
+from src.core.services.snapshot_diff import ABSENT, threshold_event, threshold_events
+
+RANKS = [None, 0, 1, 2, 3, 4, 9, 10, 11, 19, 20, 21, 35]
+
+
+def make_row(athlete_id: str, rank: int) -> RankingRow:
+    """Build a minimal ranking row."""
+    return RankingRow(rank, athlete_id, athlete_id.upper(), "50m00", 50.0, date=datetime.now())
+
+
+@pytest.mark.unit
+class TestThresholdEvents:
+    """Test cases for threshold crossing detection."""
+
+    @pytest.mark.parametrize(
+        "old_rank,new_rank,expected",
+        [
+            (None, 1, ThresholdEvent.ENTER_TOP3),
+            (5, 3, ThresholdEvent.ENTER_TOP3),
+            (2, 1, ThresholdEvent.NONE),
+            (3, 5, ThresholdEvent.EXIT_TOP3),
+            (3, 25, ThresholdEvent.EXIT_TOP3),
+            (15, 8, ThresholdEvent.ENTER_TOP10),
+            (8, 12, ThresholdEvent.EXIT_TOP10),
+            (25, 18, ThresholdEvent.ENTER_TOP20),
+            (18, 30, ThresholdEvent.EXIT_TOP20),
+            (0, 30, ThresholdEvent.NONE),
+            (30, 40, ThresholdEvent.NONE),
+        ],
+    )
+    def test_threshold_event(self, old_rank, new_rank, expected) -> None:
+        """Test single ranking changes."""
+        assert threshold_event(old_rank, new_rank) == expected
+
+    def test_vectorized_matches_scalar(self) -> None:
+        """Test that the array version agrees with the scalar one on every transition."""
+        pairs = [(old, new) for old in RANKS for new in RANKS[1:]]
+        old_ranks = np.array([ABSENT if old is None else old for old, _ in pairs])
+        new_ranks = np.array([new for _, new in pairs])
+
+        events = threshold_events(old_ranks, new_ranks)
+
+        assert [ThresholdEvent(e) for e in events] == [threshold_event(*p) for p in pairs]
+
+
+@pytest.mark.unit
+class TestDiffSnapshots:
+    """Test cases for diff_snapshots."""
+
+    def test_aligns_snapshots(self) -> None:
+        """Test entrants, dropouts, rank changes and crossings."""
+        previous = [("a", 1), ("b", 2), ("c", 3), ("d", 12)]
+        current = [make_row("b", 1), make_row("a", 2), make_row("e", 3), make_row("d", 9)]
+
+        changes = diff_snapshots(previous, current)
+
+        assert len(changes) == 4
+        assert changes.old_ranks.tolist() == [2, 1, ABSENT, 12]
+        assert changes.old_rank(2) is None
+        assert changes.new_entrants.tolist() == [2]
+        assert changes.dropout_ids == ["c"]
+        assert changes.dropout_ranks.tolist() == [3]
+        assert changes.rank_changed.tolist() == [True, True, False, True]
+        assert [ThresholdEvent(e) for e in changes.events] == [
+            ThresholdEvent.NONE,
+            ThresholdEvent.NONE,
+            ThresholdEvent.ENTER_TOP3,
+            ThresholdEvent.ENTER_TOP10,
+        ]
+        assert changes.crossings.tolist() == [2, 3]
+
+    def test_last_previous_rank_wins(self) -> None:
+        """Test that a duplicated athlete keeps its last previous rank."""
+        changes = diff_snapshots([("a", 4), ("a", 7)], [make_row("a", 7)])
+
+        assert changes.old_ranks.tolist() == [7]
+        assert not changes.rank_changed.any()
+
+    def test_empty_previous_snapshot(self) -> None:
+        """Test that every athlete is new on a first scrape."""
+        changes = diff_snapshots([], [make_row("a", 1), make_row("b", 2)])
+
+        assert changes.new_entrants.tolist() == [0, 1]
+        assert changes.dropout_ids == []
+
+    def test_movers(self) -> None:
+        """Test biggest climbers and fallers."""
+        previous = [("a", 10), ("b", 2), ("c", 30), ("d", 4)]
+        current = [make_row("b", 1), make_row("c", 3), make_row("d", 20), make_row("a", 25)]
+
+        climbers, fallers = diff_snapshots(previous, current).movers(limit=1)
+
+        assert climbers == [("c", 30, 3)]
+        assert fallers == [("d", 4, 20)]